@@ -8,11 +8,26 @@ Análisis estático con AST:
 - Calcular puntuación de cumplimiento (0-100)
 - Mostrar violaciones por severidad
 - Soporte de flag --verbose para información detallada
-- Exportación a JSON y HTML (--json, --html)
+- Exportación a JSON y HTML (--json, --html), JSON en streaming (--json-format, --json-compact)
 - Análisis semántico AI con --ai (Fase 5)
+- Solo violaciones nuevas respecto a un informe anterior (--baseline)
+- Modo incremental sobre archivos modificados en git (--changed-since, --staged)
+- Modo vigilancia con re-análisis incremental al guardar (--watch)
+- Servidor de análisis en memoria para editores y hooks (--serve)
+- Servidor Language Server Protocol por stdio para editores (--lsp)
+- Análisis de proyectos empaquetados (.zip, .tar.gz...) sin extraerlos
+- Parada temprana en pipelines (--fail-fast, --max-violations, --time-budget)
+- Estimación por muestreo estratificado en repositorios muy grandes (--sample)
+- Modo lote para monorepos: varios proyectos en un pool de procesos (--batch, --jobs)
+- Verificación de los archivos de un proyecto en varios procesos (--jobs),
+  con afinidad por lenguaje opcional (--language-affinity)
+- Reparto en shards para jobs de CI en paralelo (--shard i/n) y combinación
+  de los informes parciales (gtaa_validator merge)
 """
 
 import click
+import contextlib
+import json
 import sys
 import time
 from datetime import datetime
@@ -28,26 +43,256 @@ except ImportError:
     pass  # python-dotenv es opcional (incluido en extras [ai])
 
 from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.archive import ArchiveError, is_archive, open_archive
+from gtaa_validator.baseline import Baseline
+from gtaa_validator.git_utils import GitError, changed_files as git_changed_files, index_snapshot
 from gtaa_validator.reporters.json_reporter import JsonReporter
 from gtaa_validator.reporters.html_reporter import HtmlReporter
 from gtaa_validator.config import load_config
 from gtaa_validator.logging_config import setup_logging
-from gtaa_validator.models import AnalysisMetrics, get_score_label
-from gtaa_validator.file_utils import safe_relative_path
+from gtaa_validator.models import AnalysisMetrics, Severity, get_score_label
+from gtaa_validator.file_utils import safe_relative_path, use_virtual_files
 
 
-def _run_static_analysis(project_path: Path, verbose: bool, config) -> tuple:
-    """Ejecuta análisis estático y retorna (report, elapsed_seconds)."""
+def _closing(snapshot):
+    """Contexto que cierra el snapshot de archivos virtuales (si lo hay) al salir."""
+    return snapshot if snapshot is not None else contextlib.nullcontext()
+
+
+def _run_static_analysis(project_path: Path, verbose: bool, config,
+                         changed_files=None, cache_path: Path = None,
+                         fail_fast: bool = False, max_violations: int = None,
+                         time_budget: float = None, file_inventory=None,
+                         jobs: int = None, timings_path: Path = None,
+                         schedule: str = "lpt") -> tuple:
+    """
+    Ejecuta análisis estático y retorna (report, elapsed_seconds).
+
+    Con fail_fast o max_violations las violaciones se consumen a medida que
+    aparecen y el análisis se detiene en la primera CRÍTICA o al llegar al
+    límite; con time_budget, al agotarse el tiempo. En los tres casos el
+    informe queda parcial (report.partial_stats). file_inventory limita el
+    análisis a esos archivos (muestra de --sample). Con jobs > 1 los
+    archivos se verifican en varios procesos (analyzers/parallel.py), con
+    la caché de tiempos por archivo de timings_path y el reparto schedule.
+    """
     analyzer = StaticAnalyzer(project_path, verbose=verbose, config=config)
+    analyzer.file_inventory = file_inventory
     if not verbose:
         click.echo("Ejecutando análisis estático...")
     t0 = time.time()
-    report = analyzer.analyze()
+    if jobs and jobs > 1:
+        from gtaa_validator.analyzers.parallel import analyze_parallel
+        report = analyze_parallel(analyzer, jobs, cache_path=timings_path, schedule=schedule)
+        return report, time.time() - t0
+    if not fail_fast and not max_violations:
+        report = analyzer.analyze(changed_files=changed_files, cache_path=cache_path,
+                                  time_budget=time_budget)
+        return report, time.time() - t0
+
+    report = analyzer.new_report()
+    violations = analyzer.iter_violations(changed_files, cache_path, report=report,
+                                          time_budget=time_budget)
+    reason = None
+    for count, violation in enumerate(violations, 1):
+        if fail_fast and violation.severity == Severity.CRITICAL:
+            reason = "fail_fast"
+            break
+        if max_violations and count >= max_violations:
+            reason = "max_violations"
+            break
+    violations.close()
+    if report.partial_stats is not None and reason:
+        report.partial_stats["reason"] = reason
+        if max_violations and len(report.violations) > max_violations:
+            del report.violations[max_violations:]
+            report.calculate_score()
     return report, time.time() - t0
 
 
+def _run_watch(project_path: Path, verbose: bool, config, output_dir: str) -> None:
+    """Análisis inicial y bucle de vigilancia que muestra el delta de cada cambio."""
+    from gtaa_validator.analyzers.watch import WatchSession
+
+    analyzer = StaticAnalyzer(project_path, verbose=verbose, config=config)
+    cache_path = Path(output_dir) / ".cache" / f"incremental_{project_path.name}.json"
+    session = WatchSession(analyzer, cache_path)
+    report = session.start()
+    _display_results(report, project_path, verbose)
+    click.echo(f"\nVigilando {len(session.watcher.files)} archivos (Ctrl+C para salir)...")
+    try:
+        session.watch(lambda delta: _display_watch_delta(delta, project_path))
+    except KeyboardInterrupt:
+        click.echo("\nVigilancia detenida")
+
+
+def _display_watch_delta(delta, project_path: Path) -> None:
+    """Muestra las violaciones nuevas (+) y resueltas (-) tras un cambio."""
+    names = ", ".join(str(safe_relative_path(f, project_path)) for f in delta.changed + delta.removed)
+    click.echo(f"\n[{datetime.now():%H:%M:%S}] {names} "
+               f"(+{len(delta.dependents)} dependiente(s), {delta.seconds * 1000:.0f} ms)")
+    for sign, violations in (("+", delta.added), ("-", delta.resolved)):
+        for violation in violations:
+            location = str(safe_relative_path(violation.file_path, project_path))
+            if violation.line_number:
+                location += f":{violation.line_number}"
+            click.echo(f"  {sign} {violation.severity.value} {violation.violation_type.name} "
+                       f"{location}")
+    if not delta.added and not delta.resolved:
+        click.echo("  Sin cambios en las violaciones")
+    click.echo(f"  Violaciones totales: {delta.total_violations}")
+
+
+def _run_server(project_paths: tuple, socket_path: str, port: int) -> None:
+    """Servidor de análisis (socket Unix o HTTP en localhost) hasta Ctrl+C."""
+    from gtaa_validator.server import RequestError, serve
+
+    if (socket_path is None) == (port is None):
+        click.echo("ERROR: --serve requiere --socket o --port (solo uno)", err=True)
+        sys.exit(1)
+    warm = tuple(Path(p).resolve() for p in project_paths)
+    if warm:
+        click.echo(f"Precargando {len(warm)} proyecto(s)...")
+    try:
+        serve(socket_path=Path(socket_path) if socket_path else None, port=port, warm=warm,
+              on_ready=lambda address: click.echo(f"Servidor escuchando en {address} (Ctrl+C para salir)"))
+    except (RequestError, OSError) as e:
+        click.echo(f"ERROR: {e}", err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        click.echo("\nServidor detenido")
+
+
+def _run_batch(patterns: tuple, jobs: int, output_dir: str, no_report: bool,
+               json_path: str, json_format: str, json_compact: bool) -> int:
+    """Modo lote: un informe por proyecto y un resumen combinado."""
+    from gtaa_validator.batch import analyze_projects, expand_projects
+
+    projects = expand_projects(patterns)
+    if not projects:
+        click.echo("ERROR: --batch no encontró ningún directorio de proyecto", err=True)
+        sys.exit(1)
+    click.echo(f"Lote: {len(projects)} proyecto(s)\n")
+
+    def progress(project: Path, report, error) -> None:
+        if error is not None:
+            click.echo(f"  [ERROR] {project}: {error}")
+        else:
+            click.echo(f"  {project}: {report.score:.1f}/100 ({len(report.violations)} violaciones)")
+
+    start = time.time()
+    result = analyze_projects(projects, jobs=jobs, on_result=progress)
+
+    report_paths = {}
+    if not no_report:
+        date_stamp = datetime.now().strftime("%Y-%m-%d")
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        json_ext = "ndjson" if json_format == "ndjson" else "json"
+        reporter = JsonReporter(output_format=json_format, compact=json_compact)
+        for project, name in result.names().items():
+            if project in result.reports:
+                path = out_dir / f"gtaa_report_{name.replace('/', '_')}_{date_stamp}.{json_ext}"
+                reporter.generate(result.reports[project], path)
+                report_paths[project] = path
+
+    summary = result.summary(report_paths)
+    summary["execution_time_seconds"] = round(time.time() - start, 3)
+    if json_path or not no_report:
+        summary_path = Path(json_path) if json_path else Path(output_dir) / (
+            f"gtaa_batch_summary_{datetime.now().strftime('%Y-%m-%d')}.json")
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+        click.echo(f"\nResumen del lote exportado: {summary_path}")
+
+    click.echo("\n" + "=" * 60)
+    click.echo(f"Lote: {summary['projects'] - summary['failed']} de {summary['projects']} "
+               f"proyecto(s) analizados en {summary['execution_time_seconds']:.2f}s")
+    if summary["average_score"] is not None:
+        click.echo(f"  Puntuación media: {summary['average_score']:.1f}/100 "
+                   f"(mínima {summary['min_score']:.1f})")
+    click.echo(f"  Archivos: {summary['files_analyzed']}  Violaciones: {summary['total_violations']}")
+    for name, count in summary["violations_by_severity"].items():
+        click.echo(f"    {name:<8} {count}")
+    click.echo("=" * 60)
+
+    # Código de salida 1 si algún proyecto falla o tiene violaciones críticas
+    critical = summary["violations_by_severity"]["CRITICAL"]
+    return 1 if critical > 0 or summary["failed"] else 0
+
+
+def _parse_shard(ctx, param, value):
+    """--shard i/n: shard i (desde 1) de n."""
+    if value is None:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        index = count = 0
+    if not 1 <= index <= count:
+        raise click.BadParameter("debe tener la forma i/n con 1 <= i <= n (p. ej. 2/4)")
+    return index, count
+
+
+def _run_shard(project_path: Path, config, shard: tuple, verbose: bool,
+               json_path: str, output_dir: str) -> tuple:
+    """Analiza un shard, muestra su resultado y escribe el parcial para merge."""
+    from gtaa_validator.analyzers.sharding import run_shard
+
+    index, count = shard
+    report, partial = run_shard(StaticAnalyzer(project_path, verbose=verbose, config=config),
+                                index, count)
+    click.echo(f"Shard {index}/{count}: {report.shard_stats['files']} de "
+               f"{report.shard_stats['files_discovered']} archivos")
+    severity_counts = _display_results(report, project_path, verbose)
+
+    if json_path:
+        partial_path = Path(json_path)
+    else:
+        date_stamp = datetime.now().strftime("%Y-%m-%d")
+        partial_path = Path(output_dir) / (
+            f"gtaa_partial_{project_path.name}_{index}of{count}_{date_stamp}.json")
+    partial_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path.write_text(json.dumps(partial, ensure_ascii=False), encoding="utf-8")
+    click.echo(f"\nInforme parcial exportado: {partial_path}")
+    return report, severity_counts
+
+
+def _parse_sample(ctx, param, value):
+    """--sample: número de archivos (entero) o fracción (decimal en (0, 1])."""
+    if value is None:
+        return None
+    try:
+        if any(c in value for c in ".eE"):
+            fraction = float(value)
+            if 0 < fraction <= 1:
+                return fraction
+        elif int(value) >= 1:
+            return int(value)
+    except ValueError:
+        pass
+    raise click.BadParameter("debe ser un número de archivos (p. ej. 200) o una fracción (p. ej. 0.1)")
+
+
+def _display_sample(stats: dict) -> None:
+    """Muestra el tamaño de la muestra y las estimaciones para todo el proyecto."""
+    estimate = stats["estimate"]
+    level = f"IC {stats['confidence']:.0%}"
+
+    def fmt(interval: dict) -> str:
+        return f"{interval['value']:.1f} ({level}: {interval['low']:.1f} - {interval['high']:.1f})"
+
+    click.echo(f"\nMuestreo: {stats['files_sampled']} de {stats['files_discovered']} archivos "
+               f"en {len(stats['strata'])} estrato(s)")
+    click.echo(f"  Puntuación estimada: {fmt(estimate['score'])}")
+    click.echo(f"  Violaciones estimadas: {fmt(estimate['total_violations'])}")
+    for name, interval in estimate["violations_by_severity"].items():
+        click.echo(f"    {name:<8} {fmt(interval)}")
+
+
 def _run_semantic_analysis(
-    project_path: Path, report, provider: str, verbose: bool, max_llm_calls: int
+    project_path: Path, report, provider: str, verbose: bool, max_llm_calls: int,
+    baseline=None, changed_files=None,
 ) -> tuple:
     """Ejecuta análisis semántico AI y retorna (report, semantic_analyzer, elapsed_seconds)."""
     from gtaa_validator.analyzers.semantic_analyzer import SemanticAnalyzer
@@ -58,7 +303,8 @@ def _run_semantic_analysis(
     click.echo(f"Iniciando análisis semántico con {provider_name}...")
 
     semantic = SemanticAnalyzer(
-        project_path, llm_client, verbose=verbose, max_llm_calls=max_llm_calls
+        project_path, llm_client, verbose=verbose, max_llm_calls=max_llm_calls,
+        baseline=baseline, changed_files=changed_files,
     )
     t0 = time.time()
     report = semantic.analyze(report)
@@ -75,6 +321,14 @@ def _run_semantic_analysis(
     return report, semantic, elapsed
 
 
+# Motivos de parada de un análisis parcial (report.partial_stats["reason"])
+_STOP_REASONS = {
+    "fail_fast": "primera violación CRÍTICA, --fail-fast",
+    "max_violations": "límite de --max-violations",
+    "time_budget": "tiempo agotado, --time-budget",
+}
+
+
 def _display_results(report, project_path: Path, verbose: bool) -> dict:
     """Muestra resultados del análisis y retorna severity_counts."""
     if not verbose:
@@ -85,7 +339,31 @@ def _display_results(report, project_path: Path, verbose: bool) -> dict:
     click.echo("=" * 60)
 
     click.echo(f"\nArchivos analizados: {report.files_analyzed}")
+    if report.partial_stats:
+        stats = report.partial_stats
+        coverage = stats["files_analyzed"] / stats["files_discovered"] if stats["files_discovered"] else 1.0
+        click.echo(f"Análisis detenido ({_STOP_REASONS.get(stats.get('reason'), stats.get('reason'))}): "
+                   f"{stats['files_analyzed']} de {stats['files_discovered']} archivos analizados "
+                   f"({coverage:.0%}); el informe es parcial")
+    if report.incremental_stats:
+        click.echo("Modo incremental: solo archivos modificados")
+    if report.parallel_stats:
+        stats = report.parallel_stats
+        click.echo(f"Procesos: {stats['jobs']} (utilización {stats['utilization']:.0%}, "
+                   f"{stats['stolen_tasks']} tarea(s) robada(s))")
+        if verbose:
+            for worker in stats["workers"]:
+                click.echo(f"  Proceso {worker['worker']}: {worker['files']} archivo(s), "
+                           f"{worker['busy_seconds']:.2f}s ocupado ({worker['utilization']:.0%}), "
+                           f"lenguajes: {', '.join(worker['languages']) or '-'}")
+    if verbose and report.prefilter_stats:
+        stats = report.prefilter_stats
+        click.echo(f"Archivos sin parsear (prefiltro): {stats['files_skipped']}")
+        for name, count in sorted(stats["eliminated_by_checker"].items()):
+            click.echo(f"  {name}: {count} archivo(s) descartado(s)")
     click.echo(f"Violaciones totales: {len(report.violations)}")
+    if report.baseline_stats:
+        click.echo(f"Violaciones conocidas suprimidas (baseline): {report.baseline_stats['suppressed']}")
 
     severity_counts = report.get_violation_count_by_severity()
     click.echo("\nViolaciones por severidad:")
@@ -96,6 +374,8 @@ def _display_results(report, project_path: Path, verbose: bool) -> dict:
 
     click.echo(f"\nPuntuación de cumplimiento: {report.score:.1f}/100")
     click.echo(f"Estado: {get_score_label(report.score)}")
+    if report.sample_stats:
+        _display_sample(report.sample_stats)
 
     if verbose and report.violations:
         click.echo("\n" + "=" * 60)
@@ -142,30 +422,47 @@ def _build_metrics(report, semantic, static_secs: float, semantic_secs: float, t
 def _generate_reports(
     report, metrics: AnalysisMetrics,
     json_path: str, html_path: str, output_dir: str, no_report: bool, project_path: Path,
+    json_format: str = "json", json_compact: bool = False,
+    html_mode: str = "auto", html_compress: bool = False, html_shard_by: str = "directory",
 ) -> tuple:
-    """Genera reportes JSON/HTML. Retorna (json_path, html_path) usados."""
+    """
+    Genera reportes JSON/HTML. Retorna (json_path, html_path) usados.
+
+    Con html_mode "sharded" html_path es un directorio (index.html + shards/).
+    """
     # Auto-generación de reportes con fecha y nombre de proyecto
     if not json_path and not html_path and not no_report:
         date_stamp = datetime.now().strftime("%Y-%m-%d")
         project_name = project_path.name
         out_dir = Path(output_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
-        json_path = str(out_dir / f"gtaa_report_{project_name}_{date_stamp}.json")
-        html_path = str(out_dir / f"gtaa_report_{project_name}_{date_stamp}.html")
+        json_ext = "ndjson" if json_format == "ndjson" else "json"
+        json_path = str(out_dir / f"gtaa_report_{project_name}_{date_stamp}.{json_ext}")
+        html_name = f"gtaa_report_{project_name}_{date_stamp}"
+        html_path = str(out_dir / (html_name if html_mode == "sharded" else f"{html_name}.html"))
 
     report.metrics = metrics
 
     if json_path:
         json_out = Path(json_path)
         json_out.parent.mkdir(parents=True, exist_ok=True)
-        JsonReporter().generate(report, json_out)
+        JsonReporter(output_format=json_format, compact=json_compact).generate(report, json_out)
         click.echo(f"\nReporte JSON exportado: {json_path}")
 
     if html_path:
         html_out = Path(html_path)
-        html_out.parent.mkdir(parents=True, exist_ok=True)
-        HtmlReporter().generate(report, html_out)
-        click.echo(f"Reporte HTML exportado: {html_path}")
+        if html_mode == "sharded":
+            stats = HtmlReporter(compress=html_compress).generate_sharded(
+                report, html_out, shard_by=html_shard_by
+            )
+            click.echo(
+                f"Reporte HTML exportado: {html_out / 'index.html'} "
+                f"({stats['written']} páginas escritas, {stats['skipped']} sin cambios)"
+            )
+        else:
+            html_out.parent.mkdir(parents=True, exist_ok=True)
+            HtmlReporter(table_mode=html_mode, compress=html_compress).generate(report, html_out)
+            click.echo(f"Reporte HTML exportado: {html_path}")
 
     return json_path, html_path
 
@@ -194,7 +491,18 @@ def _display_llm_summary(report, semantic) -> None:
 @click.argument('project_path', nargs=-1, required=False)
 @click.option('--verbose', '-v', is_flag=True, help='Activar salida detallada')
 @click.option('--json', 'json_path', type=click.Path(), default=None, help='Exportar reporte JSON al fichero indicado')
+@click.option('--json-format', type=click.Choice(['json', 'ndjson']), default='json',
+              help='Formato del reporte JSON: json (documento único) o ndjson (una violación por línea)')
+@click.option('--json-compact', is_flag=True,
+              help='Reporte JSON compacto, sin indentación (recomendado en CI)')
 @click.option('--html', 'html_path', type=click.Path(), default=None, help='Exportar reporte HTML al fichero indicado')
+@click.option('--html-mode', type=click.Choice(['auto', 'static', 'interactive', 'sharded']), default='auto',
+              help='Tabla HTML: static (filas renderizadas), interactive (datos embebidos con paginación), '
+                   'auto, o sharded (directorio con índice y una página por directorio/archivo)')
+@click.option('--html-shard-by', type=click.Choice(['directory', 'file']), default='directory',
+              help='Con --html-mode sharded: una página por directorio (default) o por archivo')
+@click.option('--html-compress', is_flag=True,
+              help='Embeber los datos de la tabla HTML interactiva comprimidos (gzip+base64)')
 @click.option('--ai', is_flag=True, help='Activar análisis semántico AI')
 @click.option('--provider', type=click.Choice(['gemini', 'mock']), default=None,
               help='Proveedor LLM: gemini (cloud, default si hay API key), mock (heurísticas)')
@@ -208,17 +516,65 @@ def _display_llm_summary(report, semantic) -> None:
               help='Directorio de salida para reportes (default: gtaa-reports/)')
 @click.option('--no-report', is_flag=True,
               help='Desactivar generación automática de reportes')
+@click.option('--baseline', 'baseline_path', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Informe JSON anterior: solo se informan las violaciones nuevas')
+@click.option('--changed-since', 'changed_since', default=None, metavar='REF',
+              help='Solo archivos modificados respecto a una ref de git (rama, tag o commit)')
+@click.option('--staged', is_flag=True,
+              help='Solo archivos con cambios en el índice de git, leídos del propio índice (pre-commit)')
+@click.option('--fail-fast', is_flag=True,
+              help='Detener el análisis en la primera violación CRÍTICA (informe parcial)')
+@click.option('--max-violations', type=click.IntRange(min=1), default=None, metavar='N',
+              help='Detener el análisis al alcanzar N violaciones (informe parcial)')
+@click.option('--time-budget', type=click.FloatRange(min=0, min_open=True), default=None,
+              metavar='SECONDS',
+              help='Tiempo máximo del análisis estático: prioriza tests y Page Objects y '
+                   'entrega un informe parcial al agotarse')
+@click.option('--sample', callback=_parse_sample, default=None, metavar='N|FRACCION',
+              help='Analizar solo una muestra estratificada (N archivos o fracción, p. ej. 0.1) '
+                   'y estimar puntuación y violaciones con intervalos de confianza')
+@click.option('--shard', callback=_parse_shard, default=None, metavar='I/N',
+              help='Analizar solo el shard I de N (reparto por tamaño) y escribir un informe '
+                   'parcial para "gtaa_validator merge"')
+@click.option('--batch', is_flag=True,
+              help='Monorepo: cada PROJECT_PATH (o patrón glob) es un proyecto con su .gtaa.yaml')
+@click.option('--jobs', type=click.IntRange(min=1), default=None, metavar='N',
+              help='Procesos de análisis: en modo --batch, del pool de proyectos (por defecto, '
+                   'uno por CPU); si no, verificar los archivos del proyecto en N procesos')
+@click.option('--language-affinity', is_flag=True,
+              help='Con --jobs N: agrupar los archivos por lenguaje para que cada proceso '
+                   'cargue una sola gramática de tree-sitter')
+@click.option('--watch', is_flag=True,
+              help='Vigilar el proyecto y re-analizar solo los archivos modificados al guardar')
+@click.option('--serve', is_flag=True,
+              help='Servidor de análisis en memoria (editores, hooks); PROJECT_PATH opcional se precarga')
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), default=None,
+              help='Con --serve: escuchar en este socket Unix (una petición JSON por línea)')
+@click.option('--port', type=click.IntRange(0, 65535), default=None,
+              help='Con --serve: escuchar por HTTP en 127.0.0.1:PORT')
+@click.option('--lsp', is_flag=True,
+              help='Servidor Language Server Protocol por stdin/stdout (diagnósticos en el editor)')
 @click.option('--examples-path', 'show_examples', is_flag=True,
               help='Mostrar la ruta a los proyectos de ejemplo incluidos y salir')
-def main(project_path: tuple, verbose: bool, json_path: str, html_path: str, ai: bool, provider: str, config_path: str, max_llm_calls: int, log_file: str, output_dir: str, no_report: bool, show_examples: bool):
+def main(project_path: tuple, verbose: bool, json_path: str, json_format: str, json_compact: bool, html_path: str, html_mode: str, html_shard_by: str, html_compress: bool, ai: bool, provider: str, config_path: str, max_llm_calls: int, log_file: str, output_dir: str, no_report: bool, baseline_path: str, changed_since: str, staged: bool, fail_fast: bool, max_violations: int, time_budget: float, sample, shard, batch: bool, jobs: int, language_affinity: bool, watch: bool, serve: bool, socket_path: str, port: int, lsp: bool, show_examples: bool):
     """
     Valida el cumplimiento de la arquitectura gTAA en un proyecto de test automation.
 
-    PROJECT_PATH: Ruta al directorio raíz del proyecto de test a analizar.
+    PROJECT_PATH: Ruta al directorio raíz del proyecto de test a analizar, o a
+    un archivo .zip / .tar / .tar.gz / .tgz / .tar.bz2 / .tar.xz con el proyecto.
 
     Ejemplo:
         python -m gtaa_validator ./mi-proyecto-selenium
         python -m gtaa_validator ./mi-proyecto-selenium --verbose
+        python -m gtaa_validator ./mi-proyecto-selenium --baseline gtaa-reports/anterior.json
+        python -m gtaa_validator ./mi-proyecto-selenium --changed-since origin/main
+        python -m gtaa_validator ./suite-snapshot.tar.gz
+        python -m gtaa_validator ./mi-proyecto-selenium --jobs 8
+        python -m gtaa_validator ./mi-proyecto-mixto --jobs 4 --language-affinity
+        python -m gtaa_validator --batch 'services/*/tests' --jobs 8
+        python -m gtaa_validator ./mi-proyecto-selenium --shard 2/4
+        python -m gtaa_validator merge gtaa-reports/gtaa_partial_*.json
+        python -m gtaa_validator --serve --socket /tmp/gtaa.sock
     """
     # --examples-path: mostrar ruta a ejemplos y salir
     if show_examples:
@@ -234,6 +590,17 @@ def main(project_path: tuple, verbose: bool, json_path: str, html_path: str, ai:
         click.echo(f"  python -m gtaa_validator {examples_dir / 'bad_project'} --verbose")
         return
 
+    if lsp:
+        # stdout es el canal del protocolo: el log va a stderr o al fichero
+        from gtaa_validator.lsp import run_stdio
+        setup_logging(verbose=verbose, log_file=log_file)
+        sys.exit(run_stdio())
+
+    if serve:
+        setup_logging(verbose=verbose, log_file=log_file)
+        _run_server((" ".join(project_path),) if project_path else (), socket_path, port)
+        return 0
+
     # Validar que se proporcionó un path
     if not project_path:
         click.echo("ERROR: Se requiere PROJECT_PATH. Usa --help para ver opciones.", err=True)
@@ -245,29 +612,153 @@ def main(project_path: tuple, verbose: bool, json_path: str, html_path: str, ai:
         log_file = "logs/gtaa_debug.log"
     setup_logging(verbose=verbose, log_file=log_file)
 
+    if batch:
+        if (ai or baseline_path or changed_since or staged or watch or sample is not None
+                or fail_fast or max_violations or time_budget or html_path or config_path
+                or shard is not None):
+            click.echo("ERROR: --batch no se puede combinar con --ai, --baseline, --changed-since, "
+                       "--staged, --watch, --sample, --shard, --fail-fast, --max-violations, "
+                       "--time-budget, --html ni --config", err=True)
+            sys.exit(1)
+        click.echo("=== gTAA AI Validator ===")
+        return _run_batch(project_path, jobs, output_dir, no_report, json_path,
+                          json_format, json_compact)
+
     # Unir partes del path (soporta rutas con espacios sin comillas)
     project_path = Path(" ".join(project_path)).resolve()
 
     click.echo("=== gTAA AI Validator ===")
     click.echo(f"Analizando proyecto: {project_path}\n")
 
-    if not project_path.is_dir():
+    config = load_config(Path(config_path).parent) if config_path else None
+
+    # Proyecto empaquetado: se analiza en memoria, sin extraerlo
+    archive = None
+    if project_path.is_file() and is_archive(project_path):
+        if watch or changed_since or staged:
+            click.echo("ERROR: un archivo comprimido no se puede combinar con --watch, "
+                       "--changed-since ni --staged", err=True)
+            sys.exit(1)
+        try:
+            archive = open_archive(project_path, config=config)
+        except ArchiveError as e:
+            click.echo(f"ERROR: {e}", err=True)
+            sys.exit(1)
+        click.echo(f"Archivo comprimido: {len(archive.files)} de {archive.members} "
+                   f"entrada(s) analizables")
+        project_path, config = archive.root, archive.config
+    elif not project_path.is_dir():
         click.echo(f"ERROR: {project_path} no es un directorio válido", err=True)
         sys.exit(1)
 
-    config = load_config(Path(config_path).parent) if config_path else None
-    total_start = time.time()
+    baseline = None
+    if baseline_path:
+        try:
+            baseline = Baseline.load(Path(baseline_path))
+        except ValueError as e:
+            click.echo(f"ERROR: {e}", err=True)
+            sys.exit(1)
+
+    if sample is not None and (watch or changed_since or staged):
+        click.echo("ERROR: --sample no se puede combinar con --watch, --changed-since "
+                   "ni --staged", err=True)
+        sys.exit(1)
 
-    # Análisis estático
-    report, static_secs = _run_static_analysis(project_path, verbose, config)
+    if shard is not None and (watch or changed_since or staged or sample is not None or ai
+                              or baseline or fail_fast or max_violations or time_budget or html_path):
+        click.echo("ERROR: --shard no se puede combinar con --watch, --changed-since, --staged, "
+                   "--sample, --ai, --baseline, --fail-fast, --max-violations, --time-budget "
+                   "ni --html (el HTML se genera con merge)", err=True)
+        sys.exit(1)
+
+    if jobs and jobs > 1 and (watch or changed_since or staged or archive or fail_fast
+                              or max_violations or time_budget or shard is not None):
+        click.echo("ERROR: --jobs no se puede combinar con --watch, --changed-since, --staged, "
+                   "--shard, --fail-fast, --max-violations, --time-budget ni con un archivo "
+                   "comprimido", err=True)
+        sys.exit(1)
+
+    if language_affinity and not (jobs and jobs > 1):
+        click.echo("ERROR: --language-affinity requiere --jobs N con N > 1", err=True)
+        sys.exit(1)
 
-    # Análisis semántico AI (opcional)
-    semantic = None
-    semantic_secs = 0.0
-    if ai:
-        report, semantic, semantic_secs = _run_semantic_analysis(
-            project_path, report, provider, verbose, max_llm_calls
-        )
+    if watch:
+        if ai or changed_since or staged or baseline:
+            click.echo("ERROR: --watch no se puede combinar con --ai, --baseline, "
+                       "--changed-since ni --staged", err=True)
+            sys.exit(1)
+        _run_watch(project_path, verbose, config, output_dir)
+        return 0
+
+    # Modo incremental: archivos modificados según git
+    changed = None
+    cache_path = None
+    snapshot = None
+    if changed_since or staged:
+        try:
+            changed = git_changed_files(project_path, since=changed_since, staged=staged)
+            if staged:
+                # Analizar el contenido del índice, no el del árbol de trabajo
+                snapshot = index_snapshot(project_path)
+        except GitError as e:
+            click.echo(f"ERROR: {e}", err=True)
+            sys.exit(1)
+        suffix = "_staged" if staged else ""
+        cache_path = Path(output_dir) / ".cache" / f"incremental_{project_path.name}{suffix}.json"
+        click.echo(f"Archivos modificados: {len(changed)}")
+
+    if archive is not None:
+        snapshot = archive.files
+
+    # Varios procesos: caché de tiempos por archivo para planificar la siguiente ejecución
+    timings_path = None
+    if jobs and jobs > 1:
+        timings_path = Path(output_dir) / ".cache" / f"timings_{project_path.name}.json"
+
+    if shard is not None:
+        # Reparto en shards: el informe combinado lo genera "gtaa_validator merge"
+        with _closing(snapshot), use_virtual_files(snapshot):
+            _, severity_counts = _run_shard(project_path, config, shard, verbose,
+                                            json_path, output_dir)
+        return 1 if severity_counts['CRITICAL'] > 0 else 0
+
+    total_start = time.time()
+
+    # El snapshot (proceso git cat-file o archivo comprimido) se cierra también si algo falla
+    with _closing(snapshot), use_virtual_files(snapshot):
+        # Muestreo: solo se analiza una muestra estratificada del inventario
+        plan = None
+        if sample is not None:
+            from gtaa_validator.analyzers.sampling import draw_sample
+            plan = draw_sample(StaticAnalyzer(project_path, config=config), sample)
+            click.echo(f"Muestra: {len(plan.files)} de {plan.population} archivos")
+
+        # Análisis estático
+        report, static_secs = _run_static_analysis(project_path, verbose, config, changed, cache_path,
+                                                   fail_fast=fail_fast, max_violations=max_violations,
+                                                   time_budget=time_budget,
+                                                   file_inventory=plan.files if plan else None,
+                                                   jobs=jobs, timings_path=timings_path,
+                                                   schedule="language" if language_affinity else "lpt")
+        if report.incremental_stats is not None:
+            report.incremental_stats["since"] = changed_since
+            report.incremental_stats["staged"] = staged
+
+        # Suprimir violaciones conocidas antes del análisis AI y de los reportes
+        if baseline:
+            baseline.apply(report)
+
+        # Análisis semántico AI (opcional)
+        semantic = None
+        semantic_secs = 0.0
+        if ai:
+            report, semantic, semantic_secs = _run_semantic_analysis(
+                project_path, report, provider, verbose, max_llm_calls, baseline, changed
+            )
+
+        # Extrapolar la muestra con las violaciones finales (tras baseline y AI)
+        if plan is not None:
+            report.sample_stats = plan.estimate(report)
 
     # Resultados
     severity_counts = _display_results(report, project_path, verbose)
@@ -276,7 +767,9 @@ def main(project_path: tuple, verbose: bool, json_path: str, html_path: str, ai:
     metrics = _build_metrics(report, semantic, static_secs, semantic_secs, total_start)
 
     # Reportes
-    _generate_reports(report, metrics, json_path, html_path, output_dir, no_report, project_path)
+    _generate_reports(report, metrics, json_path, html_path, output_dir, no_report, project_path,
+                      json_format=json_format, json_compact=json_compact,
+                      html_mode=html_mode, html_compress=html_compress, html_shard_by=html_shard_by)
 
     # Actualizar métricas con tiempo de generación de reportes
     metrics.report_generation_seconds = time.time() - total_start - static_secs - semantic_secs
@@ -295,5 +788,66 @@ def main(project_path: tuple, verbose: bool, json_path: str, html_path: str, ai:
     return 1 if severity_counts['CRITICAL'] > 0 else 0
 
 
+@click.command(name="merge")
+@click.argument('partials', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--project-root', type=click.Path(file_okay=False), default=None,
+              help='Raíz del proyecto (por defecto, el directorio actual o su subdirectorio '
+                   'con el nombre del proyecto)')
+@click.option('--verbose', '-v', is_flag=True, help='Activar salida detallada')
+@click.option('--json', 'json_path', type=click.Path(), default=None, help='Exportar reporte JSON al fichero indicado')
+@click.option('--html', 'html_path', type=click.Path(), default=None, help='Exportar reporte HTML al fichero indicado')
+@click.option('--output-dir', type=click.Path(), default='gtaa-reports',
+              help='Directorio para reportes auto-generados (por defecto: gtaa-reports/)')
+@click.option('--no-report', is_flag=True, help='No generar reportes automáticos')
+def merge(partials: tuple, project_root: str, verbose: bool, json_path: str, html_path: str,
+          output_dir: str, no_report: bool):
+    """
+    Combina los informes parciales de --shard en el informe del proyecto completo.
+
+    PARTIALS: Ficheros JSON escritos por cada shard (todos los de 1/n a n/n).
+
+    Ejemplo:
+        python -m gtaa_validator merge gtaa-reports/gtaa_partial_*.json --html informe.html
+    """
+    from gtaa_validator.analyzers.sharding import ShardError, merge_partials
+
+    setup_logging(verbose=verbose)
+    total_start = time.time()
+    documents = []
+    for path in partials:
+        try:
+            documents.append(json.loads(Path(path).read_text(encoding="utf-8")))
+        except (OSError, ValueError) as e:
+            click.echo(f"ERROR: no se pudo leer {path}: {e}", err=True)
+            sys.exit(1)
+
+    if project_root:
+        root = Path(project_root).resolve()
+    else:
+        name = documents[0].get("metadata", {}).get("project_path", "")
+        root = Path.cwd() if Path.cwd().name == name else Path.cwd() / name
+
+    try:
+        report = merge_partials(documents, root)
+    except ShardError as e:
+        click.echo(f"ERROR: {e}", err=True)
+        sys.exit(1)
+
+    click.echo("=== gTAA AI Validator ===")
+    click.echo(f"Combinando {len(documents)} informe(s) parcial(es) de: {report.project_path.name}")
+    severity_counts = _display_results(report, report.project_path, verbose)
+
+    metrics = _build_metrics(report, None, report.execution_time_seconds, 0.0, total_start)
+    _generate_reports(report, metrics, json_path, html_path, output_dir, no_report, report.project_path)
+    return 1 if severity_counts['CRITICAL'] > 0 else 0
+
+
+def cli():
+    """Punto de entrada: subcomando merge o análisis de un proyecto (main)."""
+    if sys.argv[1:2] == ["merge"]:
+        return merge(sys.argv[2:], prog_name="gtaa_validator merge")
+    return main()
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(cli())
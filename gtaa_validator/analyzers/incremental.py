@@ -0,0 +1,114 @@
+"""
+Caché de resúmenes por archivo para el análisis incremental.
+
+En modo incremental (--changed-since / --staged) solo se verifican los
+archivos modificados, pero algunas reglas dependen de todo el proyecto:
+localizadores duplicados entre Page Objects (AdaptationChecker) y step
+patterns duplicados (BDDChecker.check_project). Para no releer ni parsear
+los archivos sin cambios, cada checker guarda un resumen JSON de lo que un
+archivo aporta a ese estado compartido y lo "reproduce" en ejecuciones
+posteriores.
+
+Cada entrada se valida con (mtime_ns, tamaño) del archivo, o con el id del
+blob al leer del índice de git (file_signature): si el archivo cambió, el
+resumen se descarta y se recalcula. La caché completa se invalida
+al cambiar la versión del validador o los tipos excluidos.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from gtaa_validator.file_utils import file_signature
+
+logger = logging.getLogger(__name__)
+
+# Versión del formato del fichero de caché
+CACHE_FORMAT = 1
+
+
+class SummaryCache:
+    """
+    Resúmenes por archivo (clave → valor JSON) persistidos entre ejecuciones.
+
+    Atributos:
+        project_path: Directorio raíz del proyecto (las claves son rutas relativas)
+        cache_path: Fichero JSON de la caché (None: solo en memoria)
+        hits: Consultas resueltas desde la caché
+        misses: Consultas que obligaron a recalcular el resumen
+    """
+
+    def __init__(self, project_path: Path, cache_path: Optional[Path] = None,
+                 config_key: str = ""):
+        self.project_path = Path(project_path).resolve()
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.config_key = config_key
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        if self.cache_path:
+            self._load()
+
+    def lookup(self, file_path: Path, key: str) -> Optional[Any]:
+        """Resumen guardado para el archivo, o None si falta o el archivo cambió."""
+        entry = self._entries.get(self._key(file_path))
+        if entry is not None and key in entry["data"] and entry["stat"] == file_signature(file_path):
+            self.hits += 1
+            return entry["data"][key]
+        self.misses += 1
+        return None
+
+    def store(self, file_path: Path, key: str, value: Any) -> None:
+        """Guardar el resumen del archivo en su estado actual en disco."""
+        stat = file_signature(file_path)
+        if stat is None:
+            return
+        name = self._key(file_path)
+        entry = self._entries.get(name)
+        if entry is None or entry["stat"] != stat:
+            entry = self._entries[name] = {"stat": stat, "data": {}}
+        entry["data"][key] = value
+        self._dirty = True
+
+    def save(self) -> None:
+        """Escribir la caché si cambió (escritura atómica)."""
+        if not self.cache_path or not self._dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            tmp_path.write_text(json.dumps({
+                "format": CACHE_FORMAT,
+                "config": self.config_key,
+                "files": self._entries,
+            }, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("No se pudo guardar la caché incremental %s: %s", self.cache_path, e)
+
+    def to_dict(self) -> dict:
+        """Estadísticas de la caché para el informe."""
+        return {"summary_hits": self.hits, "summary_misses": self.misses}
+
+    def _load(self) -> None:
+        """Cargar la caché (ignorada si no existe, está corrupta o es de otra configuración)."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (isinstance(data, dict) and data.get("format") == CACHE_FORMAT
+                and data.get("config") == self.config_key and isinstance(data.get("files"), dict)):
+            self._entries = data["files"]
+        else:
+            logger.debug("Caché incremental descartada (formato o configuración distintos)")
+
+    def _key(self, file_path: Path) -> str:
+        try:
+            return Path(file_path).relative_to(self.project_path).as_posix()
+        except ValueError:
+            return Path(file_path).as_posix()
+
@@ -0,0 +1,419 @@
+"""
+Análisis de un proyecto con varios procesos (--jobs N sin --batch).
+
+Los archivos se verifican en procesos trabajadores; el proceso principal
+ejecuta las verificaciones de proyecto (estructura, step patterns
+duplicados), reparte el trabajo y junta los resultados en el orden de un
+análisis secuencial. Los localizadores duplicados se resuelven al final
+como en el merge de shards (AdaptationChecker.reduce_duplicate_locators),
+así que el informe es el mismo que con un solo proceso.
+
+Planificación: el tiempo total lo marca el último trabajador en terminar, y
+un archivo enorme que se empieza al final alarga la cola. Cada archivo
+tiene un coste estimado: su tiempo de la ejecución anterior (caché de
+tiempos, validada con la firma del archivo) o, si no lo hay, una estimación
+por tamaño y lenguaje escalada con la relación real/estimado de los
+archivos que sí tienen historial. Los archivos se asignan de mayor a menor
+coste (LPT) a la cola del trabajador con menos carga; cada trabajador toma
+de su cola el más costoso y, si la vacía, roba el más barato pendiente de
+la cola más cargada (work stealing), lo que corrige los errores de
+estimación sin renunciar al orden LPT.
+
+Afinidad por lenguaje (schedule="language"): en un repositorio mixto el
+orden LPT mezcla .py, .java, .ts y .cs en cada cola, y cada trabajador acaba
+cargando todas las gramáticas de tree-sitter. Con afinidad los archivos se
+agrupan por gramática (TreeSitterBaseParser.LANGUAGE_EXTENSIONS; Python y
+Gherkin forman su propio grupo) y cada grupo recibe trabajadores en
+proporción a su coste; si hay menos trabajadores que grupos, los grupos
+enteros se reparten por LPT. Dentro de cada grupo la asignación sigue
+siendo LPT, y un trabajador sin trabajo roba primero a quien comparte su
+gramática. "round_robin" (archivo i al trabajador i % N, sin robo) queda
+como referencia para el benchmark.
+
+Las colas viven en el proceso principal: cada trabajador tiene a lo sumo
+PREFETCH tareas enviadas, y el resto se puede robar. Report.parallel_stats
+recoge de cada trabajador la utilización (tiempo ocupado frente al total),
+los grupos de lenguaje que ha verificado, las gramáticas de tree-sitter
+cargadas en el proceso (TreeSitterBaseParser.loaded_grammars) y el pico de
+memoria.
+"""
+
+import heapq
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from gtaa_validator.analyzers.incremental import SummaryCache
+from gtaa_validator.checkers.adaptation_checker import AdaptationChecker
+from gtaa_validator.checkers.file_facts import language_key
+from gtaa_validator.file_utils import file_size
+from gtaa_validator.models import Report, Violation, ViolationType
+from gtaa_validator.parsers.treesitter_base import TreeSitterBaseParser
+
+try:
+    import resource
+except ImportError:  # Windows: sin pico de memoria por proceso
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Coste estimado sin historial: segundos fijos por archivo más segundos por
+# byte según el lenguaje (medidos sobre los proyectos de ejemplo)
+FILE_OVERHEAD_SECONDS = 0.0002
+SECONDS_PER_BYTE = {"py": 2.3e-6, "java": 1.4e-6, "js": 1.6e-6, "cs": 1.4e-6, "feature": 0.8e-6}
+DEFAULT_SECONDS_PER_BYTE = 2.0e-6
+
+# Tareas enviadas a cada trabajador por adelantado (el resto se puede robar)
+PREFETCH = 2
+
+# Clave de la caché de tiempos por archivo
+TIMING_KEY = "timing"
+
+# Estrategias de reparto entre trabajadores
+SCHEDULES = ("lpt", "language", "round_robin")
+
+
+def language_group(file_path: Path) -> str:
+    """Gramática de tree-sitter que necesita el archivo, o su lenguaje si no usa tree-sitter."""
+    extension = file_path.suffix.lower()
+    return TreeSitterBaseParser.get_language_for_extension(extension) or language_key(extension)
+
+
+def estimate_costs(files: List[Path], timings: Optional[SummaryCache] = None) -> Tuple[Dict[Path, float], int]:
+    """
+    Coste estimado (segundos) de verificar cada archivo.
+
+    Returns:
+        (coste por archivo, número de archivos con tiempo histórico)
+    """
+    static = {
+        f: FILE_OVERHEAD_SECONDS + file_size(f) * SECONDS_PER_BYTE.get(
+            language_key(f.suffix), DEFAULT_SECONDS_PER_BYTE)
+        for f in files
+    }
+    history = {}
+    if timings is not None:
+        for f in files:
+            seconds = timings.lookup(f, TIMING_KEY)
+            if seconds is not None:
+                history[f] = seconds
+
+    # La máquina actual puede ser más rápida o más lenta que la de referencia
+    scale = 1.0
+    estimated = sum(static[f] for f in history)
+    if history and estimated > 0:
+        scale = sum(history.values()) / estimated
+    costs = {f: history.get(f, static[f] * scale) for f in files}
+    return costs, len(history)
+
+
+class WorkStealingScheduler:
+    """
+    Colas por trabajador con asignación LPT y robo de trabajo.
+
+    Atributos:
+        queues: Cola de cada trabajador, de mayor a menor coste
+        remaining: Coste pendiente en la cola de cada trabajador
+        groups: Grupos de lenguaje asignados a cada trabajador (schedule="language")
+        stolen: Tareas robadas de la cola de otro trabajador
+    """
+
+    def __init__(self, costs: Dict[Path, float], workers: int, schedule: str = "lpt"):
+        if schedule not in SCHEDULES:
+            raise ValueError(f"Planificación desconocida: {schedule}")
+        self.costs = costs
+        self.schedule = schedule
+        self.queues: List[Deque[Path]] = [deque() for _ in range(workers)]
+        self.remaining = [0.0] * workers
+        self.groups: List[Set[str]] = [set() for _ in range(workers)]
+        self.stolen = 0
+        if schedule == "round_robin":
+            for index, file_path in enumerate(sorted(costs)):
+                self._push(index % workers, file_path)
+        elif schedule == "language":
+            self._assign_by_language()
+        else:
+            self._assign(self._largest_first(costs), range(workers))
+
+    def _largest_first(self, files) -> List[Path]:
+        return sorted(files, key=lambda f: (-self.costs[f], f))
+
+    def _assign(self, files: List[Path], workers) -> None:
+        """Asignación LPT: cada archivo, al trabajador (de workers) con menos carga."""
+        heap = [(self.remaining[worker], worker) for worker in workers]
+        heapq.heapify(heap)
+        for file_path in files:
+            load, worker = heapq.heappop(heap)
+            self._push(worker, file_path)
+            heapq.heappush(heap, (load + self.costs[file_path], worker))
+
+    def _assign_by_language(self) -> None:
+        """Cada grupo de lenguaje, a sus propios trabajadores; LPT dentro del grupo."""
+        by_group: Dict[str, List[Path]] = {}
+        for file_path in self.costs:
+            by_group.setdefault(language_group(file_path), []).append(file_path)
+        group_cost = {g: sum(self.costs[f] for f in files) for g, files in by_group.items()}
+        order = sorted(by_group, key=lambda g: (-group_cost[g], g))
+        count = len(self.queues)
+
+        if count < len(order):
+            # Menos trabajadores que grupos: grupos enteros por LPT
+            heap = [(0.0, worker) for worker in range(count)]
+            for group in order:
+                load, worker = heapq.heappop(heap)
+                self.groups[worker].add(group)
+                self._assign(self._largest_first(by_group[group]), [worker])
+                heapq.heappush(heap, (load + group_cost[group], worker))
+            return
+
+        # Un trabajador por grupo y el resto, uno a uno, al grupo con más coste por trabajador
+        allotted = {group: 1 for group in order}
+        for _ in range(count - len(order)):
+            busiest = max(order, key=lambda g: group_cost[g] / allotted[g])
+            allotted[busiest] += 1
+        worker = 0
+        for group in order:
+            members = range(worker, worker + allotted[group])
+            for member in members:
+                self.groups[member].add(group)
+            self._assign(self._largest_first(by_group[group]), members)
+            worker += allotted[group]
+
+    def _push(self, worker: int, file_path: Path) -> None:
+        self.queues[worker].append(file_path)
+        self.remaining[worker] += self.costs[file_path]
+
+    def next_task(self, worker: int, steal: bool = True) -> Optional[Path]:
+        """Siguiente archivo para el trabajador: el más costoso de su cola o uno robado."""
+        own = self.queues[worker]
+        if own:
+            file_path = own.popleft()
+            self.remaining[worker] -= self.costs[file_path]
+            return file_path
+        victim = self._victim(worker) if steal and self.schedule != "round_robin" else None
+        if victim is None:
+            return None
+        file_path = self.queues[victim].pop()
+        self.remaining[victim] -= self.costs[file_path]
+        self.stolen += 1
+        return file_path
+
+    def _victim(self, thief: int) -> Optional[int]:
+        """Trabajador del que robar: el de más coste pendiente, antes si comparte gramática."""
+        candidates = [w for w, q in enumerate(self.queues) if q and w != thief]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda w: (bool(self.groups[w] & self.groups[thief]),
+                                              self.remaining[w], -w))
+
+
+def analyze_parallel(analyzer, jobs: int, cache_path: Optional[Path] = None,
+                     schedule: str = "lpt", start_method: Optional[str] = None) -> Report:
+    """
+    Analizar el proyecto verificando los archivos en jobs procesos.
+
+    Args:
+        analyzer: StaticAnalyzer del proyecto (inventario y configuración)
+        jobs: Número de procesos trabajadores
+        cache_path: Fichero de la caché de tiempos por archivo (opcional);
+            se lee para estimar costes y se actualiza con los medidos
+        schedule: Reparto entre trabajadores (SCHEDULES): "lpt", "language"
+            (afinidad por gramática) o "round_robin"
+        start_method: Método de arranque de multiprocessing (por defecto, el
+            de la plataforma); "spawn" da procesos sin gramáticas heredadas
+
+    Returns:
+        Report equivalente al del análisis secuencial, con parallel_stats
+    """
+    start_time = time.time()
+    report = analyzer.new_report()
+
+    # Verificaciones de proyecto en el proceso principal (como iter_violations)
+    for checker in analyzer.checkers:
+        try:
+            report.violations.extend(
+                v for v in checker.check_project(analyzer.project_path)
+                if v.violation_type not in analyzer.excluded_types
+            )
+        except Exception as e:
+            logger.warning("[%s] Error en verificación de proyecto: %s", checker.name, e)
+
+    files = analyzer._inventory()
+    timings = SummaryCache(analyzer.project_path, cache_path, analyzer._cache_config_key()) \
+        if cache_path else None
+    costs, historical = estimate_costs(files, timings)
+    scheduler = WorkStealingScheduler(costs, max(1, min(jobs, len(files))), schedule)
+    results, workers, wall = _run_workers(analyzer, scheduler, start_method)
+
+    # Resultados en el orden del análisis secuencial
+    candidates: List[Violation] = []
+    for file_path in files:
+        candidates.extend(v for v in results[file_path][0] if _is_candidate(v))
+    resolved = AdaptationChecker.reduce_duplicate_locators(candidates)
+    position = 0
+    for file_path in files:
+        violations, elapsed = results[file_path]
+        for violation in violations:
+            if violation.violation_type in analyzer.excluded_types:
+                continue
+            if not _is_candidate(violation):
+                report.violations.append(violation)
+                continue
+            if position in resolved:
+                report.violations.append(resolved[position])
+            position += 1
+        if timings is not None:
+            timings.store(file_path, TIMING_KEY, round(elapsed, 6))
+    report.files_analyzed = len(files)
+    if timings is not None:
+        timings.save()
+
+    report.prefilter_stats = _merge_prefilter([w.pop("prefilter") for w in workers])
+    busy = sum(w["busy_seconds"] for w in workers)
+    report.parallel_stats = {
+        "jobs": len(workers),
+        "schedule": schedule,
+        "files_with_history": historical,
+        "stolen_tasks": scheduler.stolen,
+        "wall_seconds": round(wall, 3),
+        "utilization": round(busy / (wall * len(workers)), 3) if wall > 0 and workers else 0.0,
+        "workers": workers,
+    }
+    report.calculate_score()
+    report.execution_time_seconds = time.time() - start_time
+    logger.info("Análisis paralelo: %d archivos en %d procesos, utilización %.0f%%",
+                len(files), len(workers), report.parallel_stats["utilization"] * 100)
+    return report
+
+
+def _run_workers(analyzer, scheduler: WorkStealingScheduler, start_method: Optional[str] = None) -> tuple:
+    """Lanzar los trabajadores y repartir las tareas hasta vaciar las colas."""
+    pending = sum(len(q) for q in scheduler.queues)
+    if not pending:
+        return {}, [], 0.0
+    context = multiprocessing.get_context(start_method)
+    results_queue = context.Queue()
+    count = len(scheduler.queues)
+    task_queues = [context.Queue() for _ in range(count)]
+    processes = [
+        context.Process(target=_worker_main, daemon=True,
+                        args=(worker, str(analyzer.project_path), analyzer.config,
+                              task_queues[worker], results_queue))
+        for worker in range(count)
+    ]
+    for process in processes:
+        process.start()
+
+    results: Dict[Path, Tuple[List[Violation], float]] = {}
+    wall_start = time.monotonic()
+
+    def dispatch(worker: int, steal: bool = True) -> None:
+        file_path = scheduler.next_task(worker, steal)
+        if file_path is not None:
+            task_queues[worker].put(str(file_path))
+
+    try:
+        # Reparto inicial solo desde la cola propia: robar es para quien se queda sin trabajo
+        for _ in range(PREFETCH):
+            for worker in range(count):
+                dispatch(worker, steal=False)
+        while len(results) < pending:
+            try:
+                worker, path, violations, elapsed = results_queue.get(timeout=1.0)
+            except queue.Empty:
+                if any(p.exitcode not in (None, 0) for p in processes):
+                    raise RuntimeError("Un proceso de análisis terminó de forma inesperada")
+                continue
+            results[Path(path)] = (violations, elapsed)
+            dispatch(worker)
+        wall = time.monotonic() - wall_start
+
+        for task_queue in task_queues:
+            task_queue.put(None)
+        stats = {}
+        while len(stats) < count:
+            worker, worker_stats = results_queue.get(timeout=30)
+            stats[worker] = worker_stats
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+    workers = [{"worker": worker, **stats[worker]} for worker in range(count)]
+    for entry in workers:
+        entry["utilization"] = round(entry["busy_seconds"] / wall, 3) if wall > 0 else 0.0
+    return results, workers, wall
+
+
+def _worker_main(worker: int, project_path: str, config, tasks, results) -> None:
+    """Proceso trabajador: verifica archivos hasta recibir None."""
+    from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+
+    analyzer = StaticAnalyzer(Path(project_path), config=config)
+    analyzer.prefilter.reset_stats()
+    for checker in analyzer.checkers:
+        # Localizadores: candidatas, que resuelve el proceso principal
+        checker.shard_filter = _owns_nothing
+    files = 0
+    busy = 0.0
+    languages: Set[str] = set()
+    while True:
+        path = tasks.get()
+        if path is None:
+            break
+        languages.add(language_group(Path(path)))
+        started = time.perf_counter()
+        violations = analyzer._check_file(Path(path))
+        elapsed = time.perf_counter() - started
+        files += 1
+        busy += elapsed
+        results.put((worker, path, violations, elapsed))
+    results.put((worker, {
+        "pid": os.getpid(),
+        "files": files,
+        "busy_seconds": round(busy, 3),
+        "languages": sorted(languages),
+        "grammars": sorted(TreeSitterBaseParser.loaded_grammars),
+        "max_rss_kb": _max_rss_kb(),
+        "prefilter": analyzer.prefilter.to_dict(),
+    }))
+
+
+def _max_rss_kb() -> Optional[int]:
+    """Pico de memoria residente del proceso en KB (None si la plataforma no lo da)."""
+    # Linux: VmHWM es del proceso actual; ru_maxrss conserva el pico del padre tras exec
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS da bytes; Linux, KB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _owns_nothing(file_path: Path) -> bool:
+    return False
+
+
+def _is_candidate(violation: Violation) -> bool:
+    return violation.violation_type is ViolationType.DUPLICATE_LOCATOR
+
+
+def _merge_prefilter(stats: List[dict]) -> dict:
+    """Sumar las estadísticas del prefiltro de todos los trabajadores."""
+    eliminated: Dict[str, int] = {}
+    for entry in stats:
+        for name, count in entry["eliminated_by_checker"].items():
+            eliminated[name] = eliminated.get(name, 0) + count
+    return {"files_skipped": sum(e["files_skipped"] for e in stats), "eliminated_by_checker": eliminated}
@@ -0,0 +1,110 @@
+"""
+Prefiltro por palabras clave para StaticAnalyzer.
+
+Antes de parsear un archivo se busca en su código fuente alguno de los
+disparadores (TRIGGER_PATTERNS) de las reglas activas de cada checker. Si
+ningún disparador aparece, ese checker no puede emitir violaciones en el
+archivo y se omite; si no queda ningún checker, el archivo no se parsea ni
+se clasifica.
+
+Los disparadores de todos los checkers de un lenguaje se compilan en una
+única regex combinada: en el caso habitual de descarte basta un solo
+recorrido del texto. Solo cuando la regex combinada encuentra algo se
+consulta la regex de cada checker (que se detiene en la primera aparición).
+
+Los disparadores son condiciones necesarias, no suficientes: el prefiltro
+nunca cambia el resultado del análisis, solo evita trabajo inútil.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from gtaa_validator.checkers.base import BaseChecker
+
+# Regex que nunca coincide (checker sin reglas por archivo para un lenguaje)
+_NEVER = re.compile(r"(?!)")
+
+
+class TriggerPrefilter:
+    """
+    Descarta checkers (y archivos completos) cuyos disparadores no aparecen.
+
+    Atributos:
+        checkers: Checkers activos del análisis
+        files_skipped: Archivos que no se parsearon porque ningún checker aplicaba
+        eliminated: Archivos descartados por checker (nombre → recuento)
+    """
+
+    def __init__(self, checkers: Sequence[BaseChecker]):
+        self.checkers = list(checkers)
+        self.files_skipped = 0
+        self.eliminated: Dict[str, int] = {c.name: 0 for c in self.checkers}
+        # lenguaje → (regex combinada, {checker → regex o None si no se prefiltra})
+        self._compiled: Dict[str, Tuple[Pattern, Dict[str, Optional[Pattern]]]] = {}
+
+    def select(self, language: str, source: str,
+               applicable: Sequence[BaseChecker]) -> List[BaseChecker]:
+        """
+        Filtrar los checkers aplicables a un archivo según su código fuente.
+
+        Args:
+            language: Clave de lenguaje del archivo (ver file_facts.language_key)
+            source: Código fuente del archivo
+            applicable: Checkers cuyo can_check() aceptó el archivo
+
+        Returns:
+            Checkers que pueden emitir violaciones en el archivo
+        """
+        combined, per_checker = self._patterns_for(language)
+
+        always = any(per_checker.get(c.name) is None for c in applicable)
+        if not always and combined.search(source) is None:
+            selected: List[BaseChecker] = []
+        else:
+            selected = [
+                c for c in applicable
+                if per_checker.get(c.name) is None or per_checker[c.name].search(source)
+            ]
+
+        for checker in applicable:
+            if checker not in selected:
+                self.eliminated[checker.name] = self.eliminated.get(checker.name, 0) + 1
+        if applicable and not selected:
+            self.files_skipped += 1
+
+        return selected
+
+    def reset_stats(self) -> None:
+        """Reiniciar los recuentos (al comenzar un nuevo análisis)."""
+        self.files_skipped = 0
+        self.eliminated = {c.name: 0 for c in self.checkers}
+
+    def to_dict(self) -> dict:
+        """Estadísticas del prefiltro para el informe."""
+        return {
+            "files_skipped": self.files_skipped,
+            "eliminated_by_checker": {
+                name: count for name, count in self.eliminated.items() if count
+            },
+        }
+
+    def _patterns_for(self, language: str) -> Tuple[Pattern, Dict[str, Optional[Pattern]]]:
+        """Compilar (una vez por lenguaje) la regex combinada y las de cada checker."""
+        if language in self._compiled:
+            return self._compiled[language]
+
+        per_checker: Dict[str, Optional[Pattern]] = {}
+        fragments: List[str] = []
+        for checker in self.checkers:
+            patterns = checker.get_trigger_patterns(language)
+            if patterns is None:
+                per_checker[checker.name] = None
+            elif not patterns:
+                per_checker[checker.name] = _NEVER
+            else:
+                per_checker[checker.name] = re.compile("|".join(patterns))
+                fragments.extend(patterns)
+
+        combined = re.compile("|".join(dict.fromkeys(fragments))) if fragments else _NEVER
+        self._compiled[language] = (combined, per_checker)
+        return combined, per_checker
@@ -0,0 +1,212 @@
+"""
+Muestreo estadístico para estimar la puntuación de repositorios muy grandes (--sample).
+
+En lugar de verificar todos los archivos, se analiza una muestra
+estratificada y se extrapolan los recuentos de violaciones y la puntuación
+con intervalos de confianza.
+
+Estratos: lenguaje (language_key) x clasificación por ruta
+(FileClassifier.classify_path), p. ej. "py/test" o "java/page_object". El
+tamaño de muestra se reparte de forma proporcional (al menos un archivo por
+estrato si hay sitio) y dentro de cada estrato se eligen los archivos por un
+hash de su ruta relativa: la misma semilla elige los mismos archivos en
+cada ejecución, lo que estabiliza las series temporales.
+
+Estimación (muestreo aleatorio estratificado sin reposición): para cada
+métrica por archivo (violaciones por severidad y penalización) el total es
+sum(N_h * media_h) y su varianza sum(N_h^2 * (1 - n_h/N_h) * s_h^2 / n_h).
+La puntuación se deriva de la penalización total como en
+Report.calculate_score. Las violaciones de proyecto (estructura) no se
+extrapolan. Las reglas entre archivos (localizadores y steps duplicados)
+solo ven los archivos de la muestra, así que tienden a infraestimarse.
+"""
+
+import hashlib
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Union
+
+from gtaa_validator.checkers.file_facts import language_key
+from gtaa_validator.models import Report
+
+# Nivel de confianza por defecto de los intervalos
+DEFAULT_CONFIDENCE = 0.95
+
+_SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+
+@dataclass
+class SamplePlan:
+    """
+    Muestra estratificada de los archivos de un proyecto.
+
+    Atributos:
+        project_path: Raíz del proyecto
+        files: Archivos de la muestra, en orden (inventario del análisis)
+        strata: Estrato -> todos los archivos del estrato (población)
+        sampled: Estrato -> archivos de la muestra en el estrato
+    """
+    project_path: Path
+    files: List[Path] = field(default_factory=list)
+    strata: Dict[str, List[Path]] = field(default_factory=dict)
+    sampled: Dict[str, List[Path]] = field(default_factory=dict)
+
+    @property
+    def population(self) -> int:
+        return sum(len(files) for files in self.strata.values())
+
+    def estimate(self, report: Report, confidence: float = DEFAULT_CONFIDENCE) -> dict:
+        """
+        Extrapolar recuentos y puntuación de la muestra a todo el proyecto.
+
+        Args:
+            report: Informe del análisis de la muestra (tras baseline o AI, si los hay)
+            confidence: Nivel de confianza de los intervalos
+
+        Returns:
+            Diccionario para Report.sample_stats: tamaños de población y
+            muestra por estrato y estimaciones con intervalo {value, low, high}
+        """
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        by_file = report.violations_by_file()
+        metrics = {name: {} for name in (*_SEVERITIES, "total", "penalty")}
+        for files in self.sampled.values():
+            for file_path in files:
+                violations = by_file.get(file_path, ())
+                for name in _SEVERITIES:
+                    metrics[name][file_path] = sum(1 for v in violations if v.severity.name == name)
+                metrics["total"][file_path] = len(violations)
+                metrics["penalty"][file_path] = sum(v.severity.get_score_penalty() for v in violations)
+
+        # Violaciones fuera de la muestra (proyecto/estructura): se suman tal cual
+        sampled_files = set(self.files)
+        fixed = {name: 0 for name in metrics}
+        for file_path, violations in by_file.items():
+            if file_path in sampled_files:
+                continue
+            for violation in violations:
+                fixed[violation.severity.name] += 1
+                fixed["total"] += 1
+                fixed["penalty"] += violation.severity.get_score_penalty()
+
+        totals = {name: self._total(values, fixed[name], z) for name, values in metrics.items()}
+        value, low, high = totals["penalty"]
+        return {
+            "files_discovered": self.population,
+            "files_sampled": len(self.files),
+            "confidence": confidence,
+            "strata": {
+                name: {"files": len(files), "sampled": len(self.sampled.get(name, ()))}
+                for name, files in sorted(self.strata.items())
+            },
+            "estimate": {
+                "score": _interval(max(0.0, 100.0 - value), max(0.0, 100.0 - high),
+                                   max(0.0, 100.0 - low)),
+                "total_violations": _interval(*totals["total"]),
+                "violations_by_severity": {name: _interval(*totals[name]) for name in _SEVERITIES},
+            },
+        }
+
+    def _total(self, values: Dict[Path, int], fixed: int, z: float) -> tuple:
+        """(estimación, límite inferior, límite superior) del total de una métrica."""
+        pooled = _variance(list(values.values()))
+        pooled_mean = sum(values.values()) / len(values) if values else 0.0
+        total = variance = 0.0
+        observed = fixed
+        for name, population in self.strata.items():
+            sample = [values[f] for f in self.sampled.get(name, ())]
+            n, big_n = len(sample), len(population)
+            if not sample:
+                # Estrato sin muestra (muestra menor que el número de estratos):
+                # se supone como la media del resto de la muestra
+                total += big_n * pooled_mean
+                variance += big_n ** 2 * pooled
+                continue
+            observed += sum(sample)
+            total += big_n * sum(sample) / n
+            # Con un solo archivo en el estrato, varianza conjunta de la muestra
+            s2 = _variance(sample) if n > 1 else pooled
+            variance += big_n ** 2 * (1 - n / big_n) * s2 / n
+        total += fixed
+        margin = z * math.sqrt(variance)
+        # Lo observado en la muestra es seguro: el límite inferior no baja de ahí
+        return total, max(float(observed), total - margin), total + margin
+
+
+def draw_sample(analyzer, size: Union[int, float], seed: int = 0) -> SamplePlan:
+    """
+    Elegir una muestra estratificada de los archivos del proyecto.
+
+    Args:
+        analyzer: StaticAnalyzer del proyecto (descubrimiento y clasificador)
+        size: Número de archivos (int) o fracción del total (float en (0, 1])
+        seed: Semilla de la selección dentro de cada estrato
+
+    Returns:
+        SamplePlan con la muestra (inventario para analyzer.file_inventory)
+    """
+    plan = SamplePlan(analyzer.project_path)
+    for file_path in analyzer._discover_python_files():
+        relative = analyzer._get_relative_path(file_path)
+        stratum = f"{language_key(file_path.suffix)}/{analyzer.classifier.classify_path(relative)}"
+        plan.strata.setdefault(stratum, []).append(file_path)
+
+    population = plan.population
+    wanted = math.ceil(size * population) if isinstance(size, float) else size
+    allocation = _allocate(min(wanted, population), {k: len(v) for k, v in plan.strata.items()})
+    for name, count in allocation.items():
+        if count:
+            ranked = sorted(plan.strata[name], key=lambda f: _rank(f, analyzer.project_path, seed))
+            plan.sampled[name] = sorted(ranked[:count])
+    plan.files = sorted(f for files in plan.sampled.values() for f in files)
+    return plan
+
+
+def _allocate(size: int, strata: Dict[str, int]) -> Dict[str, int]:
+    """Reparto proporcional (restos mayores), con al menos 1 por estrato si cabe."""
+    allocation = {name: 0 for name in strata}
+    if size <= 0:
+        return allocation
+    # Estratos grandes primero (y por nombre, para que el reparto sea estable)
+    order = sorted(strata, key=lambda name: (-strata[name], name))
+    if size <= len(strata):
+        for name in order[:size]:
+            allocation[name] = 1
+        return allocation
+
+    population = sum(strata.values())
+    quotas = {name: size * strata[name] / population for name in order}
+    for name in order:
+        allocation[name] = int(quotas[name])
+    leftover = size - sum(allocation.values())
+    for name in sorted(order, key=lambda name: (-(quotas[name] % 1), name))[:leftover]:
+        allocation[name] += 1
+    # Estratos vacíos: un archivo, a costa del estrato con más asignados
+    for name in order:
+        if allocation[name] == 0:
+            donor = max(order, key=lambda other: allocation[other])
+            allocation[donor] -= 1
+            allocation[name] = 1
+    return allocation
+
+
+def _rank(file_path: Path, project_path: Path, seed: int) -> str:
+    try:
+        relative = file_path.relative_to(project_path).as_posix()
+    except ValueError:
+        relative = file_path.as_posix()
+    return hashlib.sha1(f"{seed}:{relative}".encode("utf-8")).hexdigest()
+
+
+def _variance(values: List[int]) -> float:
+    """Cuasivarianza (n - 1); 0 con menos de dos valores."""
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+
+def _interval(value: float, low: float, high: float) -> dict:
+    return {"value": round(value, 1), "low": round(low, 1), "high": round(high, 1)}
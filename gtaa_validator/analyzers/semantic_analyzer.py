@@ -20,14 +20,16 @@ import ast
 import logging
 import re
 from pathlib import Path
-from typing import Any, List, Set
+from typing import Any, List, Optional, Set
 
+from gtaa_validator.baseline import Baseline
 from gtaa_validator.models import Report, Violation, ViolationType
 from gtaa_validator.llm.client import MockLLMClient
 from gtaa_validator.llm.api_client import APILLMClient, RateLimitError
 from gtaa_validator.llm.protocol import LLMClientProtocol
 from gtaa_validator.file_classifier import FileClassifier
 from gtaa_validator.config import EXCLUDED_DIRS
+from gtaa_validator.file_utils import find_files, read_file_safe
 
 logger = logging.getLogger(__name__)
 
@@ -61,12 +63,18 @@ class SemanticAnalyzer:
         llm_client: LLMClientProtocol,
         verbose: bool = False,
         max_llm_calls: int = None,
+        baseline: Optional[Baseline] = None,
+        changed_files: Optional[Set[Path]] = None,
     ):
         self.project_path = project_path
         self.llm_client = llm_client
         self.verbose = verbose
         self.classifier = FileClassifier()
         self.max_llm_calls = max_llm_calls
+        # Violaciones semánticas ya conocidas: no se añaden ni se enriquecen
+        self.baseline = baseline
+        # Modo incremental: solo se analizan semánticamente los archivos modificados
+        self.changed_files = changed_files
 
         # Tracking de proveedor usado
         self._initial_provider = self._get_provider_name(llm_client)
@@ -158,6 +166,8 @@ class SemanticAnalyzer:
 
         # Descubrir archivos Python y filtrar candidatos
         all_python_files = self._discover_python_files()
+        if self.changed_files is not None:
+            all_python_files = [f for f in all_python_files if f in self.changed_files]
         candidate_files = self._filter_candidate_files(all_python_files, files_with_violations)
 
         logger.info("[Semantic] Archivos candidatos: %d/%d",
@@ -166,9 +176,8 @@ class SemanticAnalyzer:
 
         # Fase 1: Detectar nuevas violaciones semánticas (solo en candidatos)
         for file_path in candidate_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = read_file_safe(file_path)
+            if not content:
                 continue
 
             # Clasificar archivo para contextualizar el análisis LLM
@@ -208,6 +217,8 @@ class SemanticAnalyzer:
                     message=raw.get("message", ""),
                     code_snippet=raw.get("code_snippet"),
                 )
+                if self.baseline and self.baseline.is_known(violation, self.project_path):
+                    continue
                 report.violations.append(violation)
 
         # Fase 2: Enriquecer violaciones existentes con sugerencias AI
@@ -215,9 +226,8 @@ class SemanticAnalyzer:
             if violation.ai_suggestion:
                 continue  # Ya enriquecida
 
-            try:
-                content = violation.file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = read_file_safe(violation.file_path)
+            if not content:
                 continue
 
             # Verificar límite de llamadas antes de llamar al LLM
@@ -233,6 +243,8 @@ class SemanticAnalyzer:
 
         # Recalcular score con las nuevas violaciones
         report.calculate_score()
+        if self.baseline:
+            report.baseline_stats = self.baseline.to_dict()
 
         # Guardar info del proveedor en el reporte
         report.llm_provider_info = self.get_provider_info()
@@ -269,12 +281,8 @@ class SemanticAnalyzer:
                 continue
 
             # Verificar patrones sospechosos
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                if self._has_suspicious_patterns(content):
-                    candidates.append(file_path)
-            except (OSError, UnicodeDecodeError):
-                continue
+            if self._has_suspicious_patterns(read_file_safe(file_path)):
+                candidates.append(file_path)
 
         return candidates
 
@@ -299,7 +307,7 @@ class SemanticAnalyzer:
     def _discover_python_files(self) -> List[Path]:
         """Descubre archivos Python excluyendo directorios irrelevantes."""
         files = []
-        for py_file in self.project_path.rglob("*.py"):
+        for py_file in find_files(self.project_path, ".py"):
             if any(excluded in py_file.parts for excluded in EXCLUDED_DIRS):
                 continue
             files.append(py_file)
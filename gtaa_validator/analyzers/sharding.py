@@ -0,0 +1,260 @@
+"""
+Reparto del análisis en shards para jobs de CI en paralelo (--shard i/n y merge).
+
+Cada job analiza una parte del inventario y escribe un informe parcial;
+"gtaa_validator merge" combina los parciales en el informe que habría dado
+un análisis completo: mismas violaciones y misma puntuación.
+
+Reparto: todos los jobs descubren el mismo inventario y lo dividen igual,
+sin coordinarse. Los archivos se asignan de mayor a menor tamaño al shard
+con menos bytes acumulados (LPT), así que los shards quedan equilibrados
+y el reparto solo depende de rutas y tamaños.
+
+Reducciones entre archivos: los localizadores y step patterns duplicados
+dependen de todo el proyecto y no se pueden decidir dentro de un shard.
+En modo shard (StaticAnalyzer.shard_filter) cada Page Object informa la
+primera aparición de cada localizador como candidata (marcada "deferred" en
+el parcial) y cada shard guarda los step patterns de sus step files. El
+merge recorre los archivos en el orden de un análisis completo y resuelve
+candidatas y duplicados con las mismas funciones que los checkers
+(AdaptationChecker.reduce_duplicate_locators,
+BDDChecker.duplicate_step_violations). Las violaciones de proyecto
+(estructura de directorios) son iguales en todos los shards: se toman del 1.
+
+Los parciales guardan además la función contenedora de cada violación
+("function"), para que las huellas del informe combinado sean las de un
+análisis completo.
+"""
+
+import hashlib
+import heapq
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from gtaa_validator.checkers.adaptation_checker import AdaptationChecker
+from gtaa_validator.checkers.bdd_checker import BDDChecker
+from gtaa_validator.file_utils import file_size
+from gtaa_validator.models import Report, Severity, Violation, ViolationType
+
+# Versión del formato de los informes parciales
+PARTIAL_FORMAT = 1
+
+
+class ShardError(Exception):
+    """Parciales incompletos, repetidos o de análisis distintos."""
+
+
+def partition(files: List[Path], count: int,
+              size: Callable[[Path], int] = file_size) -> List[List[Path]]:
+    """
+    Repartir archivos en count shards equilibrados por tamaño (LPT).
+
+    Determinista: empates por ruta y por número de shard. Cada shard
+    conserva el orden de ruta de un análisis completo.
+    """
+    heap = [(0, 0, index) for index in range(count)]
+    shards: List[List[Path]] = [[] for _ in range(count)]
+    for file_path in sorted(files, key=lambda f: (-size(f), f)):
+        load, assigned, index = heapq.heappop(heap)
+        shards[index].append(file_path)
+        heapq.heappush(heap, (load + size(file_path), assigned + 1, index))
+    return [sorted(shard) for shard in shards]
+
+
+def run_shard(analyzer, index: int, count: int) -> Tuple[Report, dict]:
+    """
+    Analizar el shard index (1..count) del proyecto.
+
+    Args:
+        analyzer: StaticAnalyzer del proyecto (se fija su inventario)
+        index: Número de shard, desde 1
+        count: Número total de shards
+
+    Returns:
+        (report, partial): informe del shard sin las candidatas a
+        duplicado (para mostrarlo) y documento JSON del parcial para merge
+    """
+    inventory = analyzer._inventory()
+    shards = partition(inventory, count)
+    owner = {f: number for number, files in enumerate(shards, 1) for f in files}
+
+    analyzer.file_inventory = shards[index - 1]
+    # Los step files fuera del inventario (ignore_paths...) los aporta el shard 1
+    analyzer.shard_filter = lambda f: owner.get(f, 1) == index
+    report = analyzer.analyze()
+
+    root = report.project_path
+    records = [_record(v, root) for v in report.violations]
+    report.violations = [v for v in report.violations if not _is_candidate(v)]
+    report.calculate_score()
+    report.shard_stats = {
+        "index": index,
+        "count": count,
+        "files": len(shards[index - 1]),
+        "files_discovered": len(inventory),
+    }
+
+    step_patterns = {}
+    for checker in analyzer.checkers:
+        if isinstance(checker, BDDChecker):
+            step_patterns = {
+                _relative(f, root): patterns
+                for f, patterns in checker.file_step_patterns.items() if patterns
+            }
+
+    partial = report.to_dict()
+    partial["metadata"]["shard"] = {
+        **report.shard_stats,
+        "format": PARTIAL_FORMAT,
+        "config": analyzer._cache_config_key(),
+        "inventory": _inventory_digest(inventory, root),
+        "step_patterns": step_patterns,
+    }
+    partial["violations"] = records
+    return report, partial
+
+
+def merge_partials(partials: List[dict], project_path: Path) -> Report:
+    """
+    Combinar los parciales de todos los shards en el informe completo.
+
+    Args:
+        partials: Documentos JSON de los shards 1..n (en cualquier orden)
+        project_path: Raíz del proyecto a la que se refieren las rutas relativas
+
+    Returns:
+        Report equivalente al de un análisis completo
+
+    Raises:
+        ShardError: Si faltan shards, hay repetidos o no son del mismo análisis
+    """
+    shards = _validate(partials)
+    root = Path(project_path).resolve()
+
+    project_violations: List[Violation] = []
+    by_file: Dict[Path, List[Tuple[Violation, bool]]] = defaultdict(list)
+    step_files: Dict[Path, List[str]] = {}
+    for number, partial in enumerate(shards, 1):
+        for record in partial["violations"]:
+            violation = _violation(record, root)
+            if violation.file_path == root:
+                # Violaciones de proyecto: idénticas en todos los shards
+                if number == 1:
+                    project_violations.append(violation)
+                continue
+            by_file[violation.file_path].append((violation, bool(record.get("deferred"))))
+        for relative, patterns in partial["metadata"]["shard"]["step_patterns"].items():
+            step_files[root / relative] = patterns
+
+    files = sorted(by_file)
+    candidates = [v for f in files for v, deferred in by_file[f] if deferred]
+    resolved = AdaptationChecker.reduce_duplicate_locators(candidates)
+
+    step_registry: Dict[str, List[Path]] = {}
+    for file_path in sorted(step_files):
+        for pattern in step_files[file_path]:
+            step_registry.setdefault(pattern, []).append(file_path)
+
+    violations = project_violations + BDDChecker.duplicate_step_violations(step_registry)
+    position = 0
+    for file_path in files:
+        for violation, deferred in by_file[file_path]:
+            if not deferred:
+                violations.append(violation)
+                continue
+            if position in resolved:
+                violations.append(resolved[position])
+            position += 1
+
+    report = Report(
+        project_path=root,
+        violations=violations,
+        files_analyzed=sum(p["summary"]["files_analyzed"] for p in shards),
+        validator_version=shards[0]["metadata"]["validator_version"],
+        # Los shards se ejecutan en paralelo: el tiempo total es el del más lento
+        execution_time_seconds=max(p["metadata"]["execution_time_seconds"] for p in shards),
+    )
+    report.shard_stats = {
+        "count": len(shards),
+        "shards": [
+            {
+                "index": p["metadata"]["shard"]["index"],
+                "files_analyzed": p["summary"]["files_analyzed"],
+                "execution_time_seconds": p["metadata"]["execution_time_seconds"],
+            }
+            for p in shards
+        ],
+    }
+    report.calculate_score()
+    return report
+
+
+def _validate(partials: List[dict]) -> List[dict]:
+    """Parciales ordenados por shard, comprobando que forman un análisis completo."""
+    if not partials:
+        raise ShardError("No se indicó ningún informe parcial")
+    shards = []
+    for partial in partials:
+        shard = partial.get("metadata", {}).get("shard") if isinstance(partial, dict) else None
+        if not isinstance(shard, dict) or shard.get("format") != PARTIAL_FORMAT:
+            raise ShardError("Uno de los ficheros no es un informe parcial de --shard")
+        shards.append(partial)
+
+    first = shards[0]["metadata"]
+    count = first["shard"]["count"]
+    for partial in shards:
+        metadata = partial["metadata"]
+        for key in ("count", "config", "inventory"):
+            if metadata["shard"][key] != first["shard"][key]:
+                raise ShardError(f"Los parciales no son del mismo análisis (difiere '{key}')")
+        if metadata["project_path"] != first["project_path"]:
+            raise ShardError("Los parciales son de proyectos distintos")
+
+    indexes = sorted(p["metadata"]["shard"]["index"] for p in shards)
+    if indexes != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)) - set(indexes))
+        repeated = sorted({i for i in indexes if indexes.count(i) > 1})
+        problems = ([f"faltan {missing}"] if missing else []) + (
+            [f"repetidos {repeated}"] if repeated else [])
+        raise ShardError(f"Se esperaban los shards 1..{count}: {', '.join(problems)}")
+    return sorted(shards, key=lambda p: p["metadata"]["shard"]["index"])
+
+
+def _is_candidate(violation: Violation) -> bool:
+    """En modo shard, todas las DUPLICATE_LOCATOR son candidatas para el merge."""
+    return violation.violation_type is ViolationType.DUPLICATE_LOCATOR
+
+
+def _record(violation: Violation, root: Path) -> dict:
+    record = violation.to_dict(project_path=root)
+    record["function"] = violation.function_name
+    if _is_candidate(violation):
+        record["deferred"] = True
+    return record
+
+
+def _violation(record: dict, root: Path) -> Violation:
+    return Violation(
+        violation_type=ViolationType[record["type"]],
+        severity=Severity(record["severity"]),
+        file_path=root / record["file"],
+        line_number=record["line"],
+        message=record["message"],
+        code_snippet=record["code_snippet"],
+        recommendation=record["recommendation"],
+        ai_suggestion=record.get("ai_suggestion"),
+        function_name=record.get("function"),
+    )
+
+
+def _relative(file_path: Path, root: Path) -> str:
+    return file_path.relative_to(root).as_posix()
+
+
+def _inventory_digest(files: List[Path], root: Path) -> str:
+    """Huella del inventario (rutas y tamaños): todos los shards deben ver el mismo."""
+    digest = hashlib.sha1()
+    for file_path in files:
+        digest.update(f"{_relative(file_path, root)}\0{file_size(file_path)}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
@@ -17,6 +17,17 @@ Responsabilidades principales:
 Fase 9+: Los checkers son ahora agnósticos al lenguaje usando ParseResult.
 Los mismos checkers funcionan para Python, Java, JavaScript/TypeScript y C#.
 
+Modo incremental: analyze(changed_files=...) solo verifica los archivos
+indicados; el estado entre archivos (localizadores duplicados, step patterns)
+de los demás se reconstruye desde una SummaryCache sin releerlos. Con
+tree_cache, los archivos Java/JS/TS/C# ya parseados se reparsean a partir
+de su árbol anterior.
+
+Análisis parcial: iter_violations() entrega las violaciones por archivo a
+medida que aparecen, y con time_budget los archivos se verifican por
+prioridad (prioritize) hasta agotar el tiempo. Si el análisis no termina,
+Report.partial_stats indica qué parte del proyecto cubre el informe.
+
 Uso:
     analyzer = StaticAnalyzer(project_path)
     report = analyzer.analyze()
@@ -27,22 +38,42 @@ import fnmatch
 import logging
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Optional, Set
 
-from gtaa_validator.models import Report, Violation
+from gtaa_validator import __version__
+from gtaa_validator.models import Report, Violation, ViolationType
 from gtaa_validator.checkers.base import BaseChecker
 from gtaa_validator.checkers.definition_checker import DefinitionChecker
 from gtaa_validator.checkers.structure_checker import StructureChecker
 from gtaa_validator.checkers.adaptation_checker import AdaptationChecker
 from gtaa_validator.checkers.quality_checker import QualityChecker
 from gtaa_validator.checkers.bdd_checker import BDDChecker
+from gtaa_validator.analyzers.incremental import SummaryCache
+from gtaa_validator.analyzers.prefilter import TriggerPrefilter
+from gtaa_validator.checkers.file_facts import build_file_facts, language_key
 from gtaa_validator.file_classifier import FileClassifier
 from gtaa_validator.config import ProjectConfig, load_config, EXCLUDED_DIRS
-from gtaa_validator.parsers.treesitter_base import ParseResult, get_parser_for_file
-from gtaa_validator.file_utils import read_file_safe
+from gtaa_validator.parsers.treesitter_base import (
+    ParseResult, TreeCache, TreeSitterBaseParser, get_parser_for_file,
+)
+from gtaa_validator.file_utils import file_size, find_files, read_file_safe
 
 logger = logging.getLogger(__name__)
 
+# Extensiones analizables (Fase 9: multi-lang)
+ANALYZABLE_EXTENSIONS = (
+    ".py",                                  # Python
+    ".feature",                             # Gherkin/BDD
+    ".java",                                # Java
+    ".js", ".ts", ".jsx", ".tsx",           # JavaScript/TypeScript
+    ".mjs", ".cjs",                         # ES modules
+    ".cs",                                  # C#
+)
+
+# Orden de los archivos en un análisis con presupuesto de tiempo
+# (FileClassifier.classify_path)
+PRIORITY_BY_CATEGORY = {"test": 0, "page_object": 1, "feature": 2, "other": 3}
+
 
 class StaticAnalyzer:
     """
@@ -60,6 +91,14 @@ class StaticAnalyzer:
         project_path: Directorio raíz del proyecto a analizar
         checkers: Lista de instancias de checkers a ejecutar
         verbose: Si se debe imprimir información detallada del progreso
+        summary_cache: Caché de resúmenes reutilizada entre análisis (modo
+            vigilancia); si es None, cada analyze() crea la suya
+        file_inventory: Lista de archivos ya descubierta (modo vigilancia);
+            si es None, cada analyze() recorre el proyecto
+        tree_cache: Árboles tree-sitter de la ejecución anterior (modos
+            vigilancia, servidor y LSP) para reparsear de forma incremental
+        shard_filter: Modo shard (ver analyzers/sharding.py): archivos que
+            aporta este shard; los duplicados entre archivos se difieren a merge
     """
 
     def __init__(self, project_path: Path, verbose: bool = False,
@@ -76,7 +115,13 @@ class StaticAnalyzer:
         self.verbose = verbose
         self.config = config if config is not None else load_config(self.project_path)
         self.classifier = FileClassifier()
+        self.excluded_types = self._resolve_excluded_types()
         self.checkers: List[BaseChecker] = self._initialize_checkers()
+        self.prefilter = TriggerPrefilter(self.checkers)
+        self.summary_cache: Optional[SummaryCache] = None
+        self.file_inventory: Optional[List[Path]] = None
+        self.tree_cache: Optional[TreeCache] = None
+        self.shard_filter: Optional[Callable[[Path], bool]] = None
 
     def _initialize_checkers(self) -> List[BaseChecker]:
         """
@@ -85,10 +130,14 @@ class StaticAnalyzer:
         Fase 9+: Los checkers son agnósticos al lenguaje.
         Funcionan con Python, Java, JavaScript/TypeScript y C#.
 
+        Los checkers cuyos tipos de violación están todos excluidos por
+        exclude_checks se descartan; el resto recibe los tipos excluidos
+        para saltarse las sub-verificaciones correspondientes.
+
         Returns:
             Lista de instancias de checkers inicializados
         """
-        checkers = [
+        candidates = [
             DefinitionChecker(),   # ADAPTATION_IN_DEFINITION (all langs)
             StructureChecker(),    # Directory structure (Python only)
             AdaptationChecker(),   # Page Object violations (all langs)
@@ -96,18 +145,56 @@ class StaticAnalyzer:
             BDDChecker(),          # BDD/Gherkin (Python + .feature)
         ]
 
+        checkers = []
+        for checker in candidates:
+            checker.set_excluded_types(self.excluded_types)
+            if checker.is_fully_excluded():
+                logger.debug("[%s] Omitido: todos sus tipos están en exclude_checks", checker.name)
+                continue
+            checkers.append(checker)
+
         logger.debug("Inicializados %d checkers: %s",
                      len(checkers), ", ".join(c.name for c in checkers))
 
         return checkers
 
-    def analyze(self) -> Report:
+    def _resolve_excluded_types(self) -> FrozenSet[ViolationType]:
+        """
+        Convertir exclude_checks de la configuración en tipos de violación.
+
+        Los nombres desconocidos se ignoran con un aviso.
+
+        Returns:
+            Conjunto de ViolationType excluidos
+        """
+        excluded = set()
+        for name in self.config.exclude_checks:
+            try:
+                excluded.add(ViolationType[str(name).strip().upper()])
+            except KeyError:
+                logger.warning("exclude_checks: tipo de violación desconocido '%s'", name)
+        return frozenset(excluded)
+
+    def analyze(self, changed_files: Optional[Iterable[Path]] = None,
+                cache_path: Optional[Path] = None,
+                time_budget: Optional[float] = None) -> Report:
         """
         Realizar el análisis estático completo del proyecto.
 
         Este es el punto de entrada principal para el análisis estático.
         Orquesta todo el proceso de verificación y devuelve un Report.
 
+        Args:
+            changed_files: Modo incremental: solo se verifican estos archivos y
+                el informe se limita a ellos (más las violaciones de proyecto
+                sin archivo concreto, como la estructura de directorios)
+            cache_path: Fichero de la caché de resúmenes por archivo. En modo
+                completo solo se rellena; en modo incremental evita releer
+                los archivos sin cambios
+            time_budget: Segundos disponibles: los archivos se verifican por
+                prioridad (ver prioritize) y el análisis se detiene al
+                agotarse el tiempo, con un informe parcial
+
         Returns:
             Objeto Report conteniendo todas las violaciones y metadatos
 
@@ -117,54 +204,249 @@ class StaticAnalyzer:
             print(f"Encontradas {len(report.violations)} violaciones")
             print(f"Puntuación: {report.score}/100")
         """
-        start_time = time.time()
+        report = self.new_report()
+        for _ in self.iter_violations(changed_files, cache_path, report=report,
+                                      time_budget=time_budget):
+            pass
+        return report
 
-        logger.info("Iniciando análisis estático de: %s", self.project_path)
+    def new_report(self) -> Report:
+        """Report vacío del proyecto, para rellenarlo con iter_violations()."""
+        return Report(project_path=self.project_path, violations=[], files_analyzed=0)
 
-        # Inicializar informe
-        report = Report(
-            project_path=self.project_path,
-            violations=[],
-            files_analyzed=0
-        )
+    def iter_violations(self, changed_files: Optional[Iterable[Path]] = None,
+                        cache_path: Optional[Path] = None,
+                        report: Optional[Report] = None,
+                        time_budget: Optional[float] = None) -> Iterator[Violation]:
+        """
+        Analizar el proyecto entregando las violaciones a medida que aparecen.
 
-        # Ejecutar verificaciones a nivel de proyecto (ej. estructura de directorios)
-        for checker in self.checkers:
-            try:
-                project_violations = checker.check_project(self.project_path)
-                if project_violations:
-                    report.violations.extend(project_violations)
-                    logger.debug("[%s] %d violación(es) a nivel de proyecto",
-                                 checker.name, len(project_violations))
-            except Exception as e:
-                logger.warning("[%s] Error en verificación de proyecto: %s", checker.name, e)
+        Primero las de proyecto (estructura de directorios) y después las de
+        cada archivo al terminar de verificarlo, en el orden de analyze().
+        El llamador puede dejar de consumir en cualquier momento (p. ej. a la
+        primera violación crítica) y el resto del proyecto no se analiza.
 
-        # Descubrir todos los archivos Python
-        python_files = self._discover_python_files()
+        Args:
+            changed_files: Modo incremental (ver analyze)
+            cache_path: Fichero de la caché de resúmenes (ver analyze)
+            report: Report que se va rellenando (violaciones, archivos
+                analizados, estadísticas). Al agotar o cerrar el generador
+                queda con su puntuación; si se cerró antes de terminar,
+                partial_stats indica los archivos analizados y descubiertos
+            time_budget: Segundos disponibles (ver analyze); al agotarse el
+                generador termina con partial_stats["reason"] = "time_budget"
+
+        Yields:
+            Violaciones del informe, ya filtradas por exclude_checks
+        """
+        start_time = time.time()
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
 
-        py_count = sum(1 for f in python_files if f.suffix == ".py")
-        feature_count = sum(1 for f in python_files if f.suffix == ".feature")
-        extra = f" + {feature_count} .feature" if feature_count else ""
-        logger.debug("Encontrados %d archivos Python%s", py_count, extra)
+        logger.info("Iniciando análisis estático de: %s", self.project_path)
 
-        # Analizar cada archivo con los checkers aplicables
-        for file_path in python_files:
-            logger.debug("Verificando: %s", self._get_relative_path(file_path))
+        if report is None:
+            report = self.new_report()
+        self.prefilter.reset_stats()
 
-            file_violations = self._check_file(file_path)
-            report.violations.extend(file_violations)
-            report.files_analyzed += 1
+        incremental = changed_files is not None
+        cache = self.summary_cache
+        if cache is None and (incremental or cache_path):
+            cache = SummaryCache(self.project_path, cache_path, self._cache_config_key())
+        for checker in self.checkers:
+            checker.summary_cache = cache
+            checker.shard_filter = self.shard_filter
+
+        # Archivos a verificar y, en modo incremental, archivos cuyo estado
+        # entre archivos hay que reconstruir (en el orden de un análisis completo)
+        if incremental:
+            targets = sorted({
+                Path(f).resolve() for f in changed_files
+                if self._is_analyzable(Path(f).resolve())
+            })
+            logger.debug("Modo incremental: %d archivo(s) modificado(s)", len(targets))
+        else:
+            targets = None
+
+        def accept(violations: List[Violation]) -> List[Violation]:
+            # Red de seguridad: ningún tipo excluido llega al informe; en modo
+            # incremental, solo los archivos modificados y el propio proyecto
+            accepted = [
+                v for v in violations
+                if v.violation_type not in self.excluded_types
+                and (not incremental or v.file_path in target_set or v.file_path == self.project_path)
+            ]
+            report.violations.extend(accepted)
+            return accepted
+
+        completed = False
+        stop_reason = None
+        target_set: Set[Path] = set(targets or ())
+        try:
+            # Inventario antes de las violaciones de proyecto: si el consumidor se
+            # detiene en una de ellas, partial_stats debe indicar la cobertura real
+            if incremental:
+                if any(c.can_check(f) for c in self._cross_file_checkers() for f in targets):
+                    python_files = self._inventory()
+                else:
+                    python_files = targets
+            else:
+                targets = python_files = self._inventory()
+                target_set = set(targets)
+
+                py_count = sum(1 for f in python_files if f.suffix == ".py")
+                feature_count = sum(1 for f in python_files if f.suffix == ".feature")
+                extra = f" + {feature_count} .feature" if feature_count else ""
+                logger.debug("Encontrados %d archivos Python%s", py_count, extra)
+
+            # Ejecutar verificaciones a nivel de proyecto (ej. estructura de directorios)
+            project_violations = []
+            for checker in self.checkers:
+                try:
+                    violations = checker.check_project(self.project_path)
+                    if violations:
+                        project_violations.extend(violations)
+                        logger.debug("[%s] %d violación(es) a nivel de proyecto",
+                                     checker.name, len(violations))
+                except Exception as e:
+                    logger.warning("[%s] Error en verificación de proyecto: %s", checker.name, e)
+            yield from accept(project_violations)
+
+            if deadline is not None:
+                python_files = self.prioritize(python_files)
+
+            # Analizar cada archivo con los checkers aplicables
+            for file_path in python_files:
+                if deadline is not None and time.monotonic() >= deadline:
+                    stop_reason = "time_budget"
+                    logger.info("Presupuesto de tiempo agotado tras %d archivo(s)",
+                                report.files_analyzed)
+                    break
+                if file_path not in target_set:
+                    self._replay_file(file_path, cache)
+                    continue
+
+                logger.debug("Verificando: %s", self._get_relative_path(file_path))
+
+                file_violations = self._check_file(file_path)
+                report.files_analyzed += 1
+                if cache is not None:
+                    self._store_summaries(file_path, cache)
+                yield from accept(file_violations)
+            completed = stop_reason is None
+        finally:
+            report.prefilter_stats = self.prefilter.to_dict()
+            logger.debug("Prefiltro: %d archivo(s) sin parsear, descartes por checker: %s",
+                         self.prefilter.files_skipped,
+                         report.prefilter_stats["eliminated_by_checker"])
+
+            if incremental:
+                report.incremental_stats = {"changed_files": len(targets), **cache.to_dict()}
+            if cache is not None:
+                cache.save()
+            if not completed:
+                report.partial_stats = {
+                    "files_analyzed": report.files_analyzed,
+                    "files_discovered": len(target_set),
+                }
+                if stop_reason:
+                    report.partial_stats["reason"] = stop_reason
+
+            # Calcular puntuación basada en violaciones
+            report.calculate_score()
+
+            # Registrar tiempo de ejecución
+            report.execution_time_seconds = time.time() - start_time
+
+            logger.info("Análisis completado: %d archivos, %d violaciones, %.1f/100",
+                        report.files_analyzed, len(report.violations), report.score)
+
+    def prioritize(self, files: List[Path]) -> List[Path]:
+        """
+        Ordenar archivos por valor estimado, para un análisis con tiempo limitado.
+
+        Primero los tests, luego los Page Objects (concentran las reglas gTAA),
+        los .feature y el resto; dentro de cada grupo, los más grandes antes
+        (más código, más riesgo). Solo usa la ruta y el tamaño, sin leer los
+        archivos. El estado entre archivos sigue siendo correcto, pero en
+        reglas como localizadores duplicados la violación puede recaer en
+        otro archivo de la pareja que en el orden alfabético.
+        """
+        def key(file_path: Path):
+            category = self.classifier.classify_path(self._get_relative_path(file_path))
+            return PRIORITY_BY_CATEGORY[category], -file_size(file_path), file_path
+
+        return sorted(files, key=key)
+
+    def _cross_file_checkers(self) -> List[BaseChecker]:
+        """Checkers que acumulan estado entre archivos."""
+        return [c for c in self.checkers if c.CROSS_FILE_STATE]
+
+    def _cache_config_key(self) -> str:
+        """Lo que invalida todos los resúmenes: versión y tipos excluidos."""
+        return "|".join([__version__, *sorted(t.name for t in self.excluded_types)])
+
+    def _store_summaries(self, file_path: Path, cache: SummaryCache) -> None:
+        """Guardar lo que el archivo recién verificado aportó al estado entre archivos."""
+        checkers = [c for c in self._cross_file_checkers() if c.can_check(file_path)]
+        if not checkers:
+            return
+        summaries = {}
+        for checker in checkers:
+            summary = checker.file_summary(file_path)
+            if summary is not None:
+                summaries[checker.name] = summary
+        cache.store(file_path, "checks", summaries)
+
+    def _replay_file(self, file_path: Path, cache: SummaryCache) -> None:
+        """
+        Reconstruir el estado entre archivos de un archivo sin cambios.
 
-        # Calcular puntuación basada en violaciones
-        report.calculate_score()
+        Con resumen válido en caché no se lee el archivo; si falta, se
+        verifica con los checkers implicados (descartando sus violaciones)
+        y se guarda el resumen para la próxima ejecución.
+        """
+        checkers = [c for c in self._cross_file_checkers() if c.can_check(file_path)]
+        if not checkers:
+            return
+        summaries = cache.lookup(file_path, "checks")
+        if summaries is None:
+            self._check_file(file_path, checkers)
+            self._store_summaries(file_path, cache)
+            return
+        for checker in checkers:
+            if checker.name in summaries:
+                checker.replay_summary(file_path, summaries[checker.name])
+
+    def _is_analyzable(self, file_path: Path) -> bool:
+        """
+        True si el archivo entraría en el descubrimiento de un análisis completo.
+
+        Extensión soportada, dentro del proyecto, fuera de EXCLUDED_DIRS y no
+        ignorado por ignore_paths de la configuración.
+        """
+        if file_path.suffix not in ANALYZABLE_EXTENSIONS:
+            return False
+        try:
+            relative = file_path.relative_to(self.project_path)
+        except ValueError:
+            return False
 
-        # Registrar tiempo de ejecución
-        report.execution_time_seconds = time.time() - start_time
+        # Verificar si el archivo está en un directorio excluido
+        if any(excluded in file_path.parts for excluded in EXCLUDED_DIRS):
+            return False
 
-        logger.info("Análisis completado: %d archivos, %d violaciones, %.1f/100",
-                    report.files_analyzed, len(report.violations), report.score)
+        # Filtrar por ignore_paths de la configuración
+        relative_str = str(relative).replace("\\", "/")
+        return not any(
+            fnmatch.fnmatch(relative_str, pattern)
+            for pattern in self.config.ignore_paths
+        )
 
-        return report
+    def _inventory(self) -> List[Path]:
+        """Archivos del proyecto: el inventario fijado o un descubrimiento nuevo."""
+        if self.file_inventory is not None:
+            return self.file_inventory
+        return self._discover_python_files()
 
     def _discover_python_files(self) -> List[Path]:
         """
@@ -176,54 +458,37 @@ class StaticAnalyzer:
         Returns:
             Lista de objetos Path para todos los archivos encontrados
         """
-        # Directorios a excluir del análisis (definidos en config.EXCLUDED_DIRS)
-
-        # Extensiones a buscar (Fase 9: multi-lang)
-        extensions = (
-            "*.py",                           # Python
-            "*.feature",                      # Gherkin/BDD
-            "*.java",                         # Java
-            "*.js", "*.ts", "*.jsx", "*.tsx", # JavaScript/TypeScript
-            "*.mjs", "*.cjs",                 # ES modules
-            "*.cs",                           # C#
-        )
-
-        found_files = []
-
-        for ext in extensions:
-            for file_path in self.project_path.rglob(ext):
-                # Verificar si el archivo está en un directorio excluido
-                should_exclude = any(
-                    excluded in file_path.parts
-                    for excluded in EXCLUDED_DIRS
-                )
-
-                if not should_exclude:
-                    # Filtrar por ignore_paths de la configuración
-                    relative_str = str(file_path.relative_to(self.project_path)).replace("\\", "/")
-                    ignored = any(
-                        fnmatch.fnmatch(relative_str, pattern)
-                        for pattern in self.config.ignore_paths
-                    )
-                    if not ignored:
-                        found_files.append(file_path)
+        # Directorios excluidos (config.EXCLUDED_DIRS) e ignore_paths: ver _is_analyzable
+        found_files = [
+            file_path
+            for ext in ANALYZABLE_EXTENSIONS
+            for file_path in find_files(self.project_path, ext)
+            if self._is_analyzable(file_path)
+        ]
 
         # Ordenar para un orden consistente
         found_files.sort()
 
         return found_files
 
-    def _check_file(self, file_path: Path) -> List[Violation]:
+    def _check_file(self, file_path: Path,
+                    checkers: Optional[List[BaseChecker]] = None) -> List[Violation]:
         """
         Ejecutar todos los checkers aplicables sobre un único archivo.
 
-        Parsea el archivo una sola vez usando el parser apropiado y pasa
-        el ParseResult a todos los checkers, evitando parseo redundante.
+        Antes de parsear, el prefiltro descarta los checkers cuyos
+        disparadores no aparecen en el código; si no queda ninguno, el
+        archivo no se parsea.
+
+        Lee y parsea el archivo una sola vez y construye un FileFacts
+        (líneas, funciones de test, Page Objects, setup/teardown, lenguaje)
+        que se comparte con todos los checkers, evitando trabajo redundante.
 
         Fase 9+: Usa ParseResult unificado para todos los lenguajes.
 
         Args:
             file_path: Ruta al archivo a verificar
+            checkers: Subconjunto de checkers a ejecutar (por defecto, todos)
 
         Returns:
             Lista de todas las violaciones encontradas por todos los checkers
@@ -231,23 +496,30 @@ class StaticAnalyzer:
         violations = []
 
         # Determinar qué checkers aplican a este archivo
-        applicable = [c for c in self.checkers if c.can_check(file_path)]
+        applicable = [c for c in (checkers or self.checkers) if c.can_check(file_path)]
         if not applicable:
             return violations
 
         # Parsear archivo una sola vez usando el parser apropiado
         parse_result: Optional[ParseResult] = None
-        source_code = ""
         file_type = "unknown"
 
-        try:
-            source_code = read_file_safe(file_path)
-            if not source_code:
-                return violations
+        source_code = read_file_safe(file_path)
+        if not source_code:
+            return violations
+
+        applicable = self.prefilter.select(
+            language_key(file_path.suffix), source_code, applicable
+        )
+        if not applicable:
+            return violations
 
+        try:
             # Obtener parser apropiado para el lenguaje
             parser = get_parser_for_file(file_path)
-            if parser:
+            if parser and self.tree_cache is not None and isinstance(parser, TreeSitterBaseParser):
+                parse_result = parser.parse(source_code, cache=self.tree_cache, document=file_path)
+            elif parser:
                 parse_result = parser.parse(source_code)
 
             # Clasificar archivo (funciona con ParseResult o AST legacy)
@@ -264,13 +536,16 @@ class StaticAnalyzer:
                                  self._get_relative_path(file_path), file_type, fw_info, bdd_info)
 
         except (SyntaxError, Exception):
-            # Si el parseo falla, dejar que los checkers individuales lo manejen
+            # Si el parseo falla, los checkers reciben facts sin ParseResult
             pass
 
+        facts = build_file_facts(file_path, source_code, parse_result, file_type)
+
         for checker in applicable:
             try:
-                # Pasar ParseResult a los checkers (soportan tanto ParseResult como AST legacy)
-                checker_violations = checker.check(file_path, parse_result, file_type=file_type)
+                checker_violations = checker.check(
+                    file_path, parse_result, file_type=file_type, facts=facts
+                )
                 violations.extend(checker_violations)
 
                 if checker_violations:
@@ -280,6 +555,12 @@ class StaticAnalyzer:
                 # No fallar si un checker individual falla
                 logger.warning("[%s] Error: %s", checker.name, e)
 
+        # Función contenedora de cada violación (forma parte de su huella)
+        for violation in violations:
+            if (violation.line_number and violation.function_name is None
+                    and violation.file_path == file_path):
+                violation.function_name = facts.enclosing_function(violation.line_number)
+
         return violations
 
     def _get_relative_path(self, file_path: Path) -> Path:
@@ -308,4 +589,5 @@ class StaticAnalyzer:
             "project_path": str(self.project_path),
             "checker_count": len(self.checkers),
             "checkers": [c.name for c in self.checkers],
+            "excluded_checks": sorted(t.name for t in self.excluded_types),
         }
@@ -0,0 +1,227 @@
+"""
+Modo vigilancia (--watch): re-análisis incremental al guardar archivos.
+
+El StaticAnalyzer se mantiene en memoria entre ejecuciones (parsers,
+inventario de archivos, caché de resúmenes por archivo y árboles tree-sitter
+para reparsear de forma incremental), y un vigilante por sondeo detecta los
+archivos modificados, nuevos o borrados comparando su firma (mtime_ns,
+tamaño).
+
+En cada cambio solo se verifican los archivos modificados y sus
+dependientes por reglas entre archivos (BaseChecker.related_files): los
+Page Objects que comparten localizadores y los archivos de steps que
+comparten step patterns, tanto antes como después del cambio. El resultado
+es un delta de violaciones nuevas y resueltas, comparadas por huella
+(Violation.fingerprint), así que desplazar código no genera ruido.
+
+Se usa sondeo y no inotify para no añadir dependencias y funcionar igual
+en Linux, macOS y Windows.
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from gtaa_validator.analyzers.incremental import SummaryCache
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.file_utils import file_signature
+from gtaa_validator.models import Report, Violation
+from gtaa_validator.parsers.treesitter_base import TreeCache
+
+logger = logging.getLogger(__name__)
+
+# Intervalo entre sondeos del sistema de archivos (segundos)
+WATCH_INTERVAL = 0.5
+
+
+@dataclass
+class WatchDelta:
+    """
+    Cambios en las violaciones tras un re-análisis incremental.
+
+    Atributos:
+        changed: Archivos modificados o nuevos que se verificaron
+        removed: Archivos borrados
+        dependents: Archivos verificados por compartir estado con los modificados
+        added: Violaciones nuevas
+        resolved: Violaciones que ya no aparecen
+        total_violations: Violaciones del proyecto tras el cambio
+        seconds: Duración del re-análisis
+    """
+    changed: List[Path]
+    removed: List[Path] = field(default_factory=list)
+    dependents: List[Path] = field(default_factory=list)
+    added: List[Violation] = field(default_factory=list)
+    resolved: List[Violation] = field(default_factory=list)
+    total_violations: int = 0
+    seconds: float = 0.0
+
+
+class PollingWatcher:
+    """
+    Detecta cambios en los archivos comparando firmas entre sondeos.
+
+    Args:
+        discover: Función que devuelve los archivos a vigilar
+    """
+
+    def __init__(self, discover: Callable[[], List[Path]]):
+        self._discover = discover
+        self._signatures: Dict[Path, object] = {}
+
+    @property
+    def files(self) -> List[Path]:
+        """Archivos vigilados en el último sondeo, ordenados."""
+        return sorted(self._signatures)
+
+    def scan(self) -> Tuple[Set[Path], Set[Path]]:
+        """Sondear el proyecto y devolver (modificados o nuevos, borrados)."""
+        current = {}
+        for file_path in self._discover():
+            signature = file_signature(file_path)
+            if signature is not None:
+                current[file_path] = signature
+        changed = {path for path, sig in current.items() if self._signatures.get(path) != sig}
+        removed = set(self._signatures) - set(current)
+        self._signatures = current
+        return changed, removed
+
+
+class WatchSession:
+    """
+    Análisis mantenido en memoria que se actualiza con cada cambio.
+
+    Args:
+        analyzer: Analizador estático del proyecto (se reutiliza entre cambios)
+        cache_path: Fichero de la caché de resúmenes (None: solo en memoria)
+    """
+
+    def __init__(self, analyzer: StaticAnalyzer, cache_path: Optional[Path] = None):
+        self.analyzer = analyzer
+        self.project_path = analyzer.project_path
+        analyzer.summary_cache = SummaryCache(
+            self.project_path, cache_path, analyzer._cache_config_key()
+        )
+        analyzer.tree_cache = TreeCache()
+        self.watcher = PollingWatcher(analyzer._discover_python_files)
+        self._violations: Dict[Path, List[Violation]] = {}
+
+    @property
+    def violation_count(self) -> int:
+        """Violaciones actuales del proyecto."""
+        return sum(len(group) for group in self._violations.values())
+
+    def start(self) -> Report:
+        """Análisis completo inicial; prepara el inventario y la caché."""
+        self.watcher.scan()
+        self.analyzer.file_inventory = self.watcher.files
+        report = self.analyzer.analyze()
+        self._violations = _group_by_file(report.violations)
+        return report
+
+    def poll(self) -> Optional[WatchDelta]:
+        """Sondear cambios y re-analizar; None si no cambió nada."""
+        changed, removed = self.watcher.scan()
+        if not changed and not removed:
+            return None
+        return self.refresh(changed, removed)
+
+    def refresh(self, changed: Set[Path], removed: Set[Path] = frozenset()) -> WatchDelta:
+        """
+        Re-verificar los archivos modificados y sus dependientes.
+
+        Args:
+            changed: Archivos modificados o nuevos
+            removed: Archivos borrados
+        """
+        start = time.perf_counter()
+        changed, removed = set(changed), set(removed)
+        self.analyzer.file_inventory = self.watcher.files
+
+        # Dependientes según el estado anterior (p. ej. quien duplicaba un
+        # localizador que se acaba de quitar) ...
+        dependents = self._related(changed | removed) - changed - removed
+        report = self.analyzer.analyze(changed_files=changed | dependents)
+
+        # ... y según el nuevo (quien pasa a duplicar un localizador añadido)
+        extra = self._related(changed) - changed - removed - dependents
+        if extra:
+            dependents |= extra
+            report = self.analyzer.analyze(changed_files=changed | dependents)
+
+        new_violations = _group_by_file(report.violations)
+        before: List[Violation] = []
+        after: List[Violation] = []
+        for file_path in changed | removed | dependents | {self.project_path}:
+            before.extend(self._violations.pop(file_path, ()))
+            group = new_violations.get(file_path)
+            if group:
+                self._violations[file_path] = group
+                after.extend(group)
+
+        delta = WatchDelta(
+            changed=sorted(changed),
+            removed=sorted(removed),
+            dependents=sorted(dependents),
+            added=_unmatched(after, before, self.project_path),
+            resolved=_unmatched(before, after, self.project_path),
+            total_violations=self.violation_count,
+            seconds=time.perf_counter() - start,
+        )
+        logger.debug("Watch: %d modificado(s), %d dependiente(s), +%d/-%d en %.3fs",
+                     len(delta.changed), len(delta.dependents),
+                     len(delta.added), len(delta.resolved), delta.seconds)
+        return delta
+
+    def watch(self, on_delta: Callable[[WatchDelta], None],
+              interval: float = WATCH_INTERVAL, cycles: Optional[int] = None) -> None:
+        """
+        Bucle de vigilancia (hasta Ctrl+C, o cycles sondeos si se indica).
+
+        Args:
+            on_delta: Se llama con cada delta de violaciones
+            interval: Segundos entre sondeos
+            cycles: Número máximo de sondeos (None: sin límite)
+        """
+        try:
+            while cycles is None or cycles > 0:
+                time.sleep(interval)
+                delta = self.poll()
+                if delta is not None:
+                    on_delta(delta)
+                if cycles is not None:
+                    cycles -= 1
+        finally:
+            self.analyzer.summary_cache.save()
+
+    def _related(self, files: Set[Path]) -> Set[Path]:
+        """Archivos que comparten estado entre archivos con alguno de files."""
+        related: Set[Path] = set()
+        for checker in self.analyzer.checkers:
+            for file_path in files:
+                related |= checker.related_files(file_path)
+        return related
+
+
+def _group_by_file(violations: List[Violation]) -> Dict[Path, List[Violation]]:
+    groups: Dict[Path, List[Violation]] = {}
+    for violation in violations:
+        groups.setdefault(violation.file_path, []).append(violation)
+    return groups
+
+
+def _unmatched(violations: List[Violation], others: List[Violation],
+               project_path: Path) -> List[Violation]:
+    """Violaciones sin pareja (por huella, con multiplicidad) en others."""
+    remaining = Counter(v.fingerprint(project_path) for v in others)
+    unmatched = []
+    for violation in violations:
+        fingerprint = violation.fingerprint(project_path)
+        if remaining[fingerprint] > 0:
+            remaining[fingerprint] -= 1
+        else:
+            unmatched.append(violation)
+    return unmatched
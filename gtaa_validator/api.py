@@ -0,0 +1,111 @@
+"""
+API de análisis en memoria para gTAA Validator.
+
+Analiza contenido que no está en disco: pares (ruta virtual, código) que
+pueden venir de memoria, de un archivo comprimido, de git o de un editor.
+Nada se lee ni se escribe en el sistema de archivos: el contenido se
+expone a StaticAnalyzer como VirtualFiles (file_utils) y la configuración
+se pasa explícitamente en lugar de leer .gtaa.yaml.
+
+Uso:
+    from gtaa_validator.api import analyze_batch, analyze_source
+
+    violations = analyze_source("tests/test_login.py", codigo)
+
+    report = analyze_batch([
+        ("pages/login_page.py", codigo_page),
+        ("tests/test_login.py", codigo_test),
+    ])
+    print(report.score)
+
+Las rutas relativas se cuelgan de una raíz virtual (VIRTUAL_ROOT por
+defecto), que es el project_path del Report: to_dict() y los reportes
+muestran de nuevo las rutas relativas.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, List, Mapping, Optional, Tuple, Union
+
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.config import ProjectConfig
+from gtaa_validator.file_utils import VirtualFiles, use_virtual_files
+from gtaa_validator.models import Report, Violation
+
+# Raíz virtual por defecto de las rutas relativas
+VIRTUAL_ROOT = Path("/gtaa-virtual")
+
+# Contenido de entrada: ruta virtual -> código (texto o bytes UTF-8)
+Sources = Union[Mapping[Union[str, Path], Union[str, bytes]],
+                Iterable[Tuple[Union[str, Path], Union[str, bytes]]]]
+
+
+def analyze_batch(sources: Sources, root: Union[str, Path] = VIRTUAL_ROOT,
+                  config: Optional[ProjectConfig] = None) -> Report:
+    """
+    Analizar un conjunto de archivos en memoria como un proyecto.
+
+    Las reglas entre archivos (localizadores duplicados, steps BDD
+    duplicados) y las de estructura de directorios se aplican sobre el
+    conjunto, igual que en un análisis de disco.
+
+    Args:
+        sources: Pares (ruta, código) o un diccionario ruta -> código; se
+            acepta cualquier iterable (p. ej. un generador)
+        root: Raíz virtual del proyecto (las rutas relativas cuelgan de ella)
+        config: Configuración del proyecto (por defecto, sin restricciones)
+
+    Returns:
+        Report con las violaciones de todos los archivos
+
+    Raises:
+        ValueError: Si una ruta absoluta queda fuera de root
+    """
+    root = Path(root).resolve()
+    files = VirtualFiles.from_contents(_collect(sources, root))
+    analyzer = StaticAnalyzer(root, config=config if config is not None else ProjectConfig())
+    with use_virtual_files(files):
+        return analyzer.analyze()
+
+
+def analyze_source(path: Union[str, Path], source: Union[str, bytes],
+                   root: Union[str, Path] = VIRTUAL_ROOT,
+                   config: Optional[ProjectConfig] = None) -> List[Violation]:
+    """
+    Analizar un único archivo en memoria.
+
+    Solo se devuelven las violaciones del propio archivo (sin las de
+    estructura de directorios, que no tienen sentido para un archivo suelto).
+
+    Args:
+        path: Ruta virtual del archivo; su extensión y su nombre deciden el
+            lenguaje y la clasificación (p. ej. "tests/test_login.py")
+        source: Código fuente (texto o bytes UTF-8)
+        root: Raíz virtual del proyecto
+        config: Configuración del proyecto (por defecto, sin restricciones)
+
+    Returns:
+        Violaciones encontradas en el archivo
+    """
+    root = Path(root).resolve()
+    file_path = _virtual_path(path, root)
+    report = analyze_batch([(file_path, source)], root=root, config=config)
+    return [v for v in report.violations if v.file_path == file_path]
+
+
+def _collect(sources: Sources, root: Path) -> dict:
+    """Ruta absoluta virtual -> contenido (el último gana si una ruta se repite)."""
+    items = sources.items() if isinstance(sources, Mapping) else sources
+    return {_virtual_path(path, root): source for path, source in items}
+
+
+def _virtual_path(path: Union[str, Path], root: Path) -> Path:
+    path = Path(path)
+    if not path.is_absolute():
+        path = root / path
+    # Normalizar sin tocar el disco ("..", ".")
+    path = Path(os.path.normpath(path))
+    if root not in path.parents:
+        raise ValueError(f"{path} no pertenece a la raíz virtual {root}")
+    return path
+
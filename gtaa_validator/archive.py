@@ -0,0 +1,343 @@
+"""
+Análisis de proyectos empaquetados (.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz)
+sin extraerlos a disco.
+
+open_archive() recorre las entradas del archivo comprimido y expone las
+analizables como VirtualFiles (file_utils) bajo una raíz virtual: el
+StaticAnalyzer las descubre y lee como si fueran archivos del proyecto,
+sin escribir nada en disco.
+
+Las entradas se filtran por su nombre antes de leer su contenido:
+extensión analizable, EXCLUDED_DIRS, ignore_paths del .gtaa.yaml y
+MAX_FILE_SIZE_BYTES. Si todas cuelgan de un único directorio (el caso
+habitual de `tar czf suite.tgz suite/`), ese directorio es la raíz del
+proyecto, y su .gtaa.yaml (si lo hay) es la configuración.
+
+El contenido se lee con buffering acotado:
+- .zip y .tar sin comprimir permiten acceso aleatorio: cada entrada se lee
+  al analizarla y no se guarda nada en memoria.
+- Los tar comprimidos solo se pueden recorrer en orden, así que se leen en
+  una pasada y se conservan en memoria solo las entradas seleccionadas, con
+  un límite total de MAX_BUFFERED_BYTES.
+"""
+
+import fnmatch
+import hashlib
+import logging
+import posixpath
+import tarfile
+import threading
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional, Tuple
+
+from gtaa_validator.analyzers.static_analyzer import ANALYZABLE_EXTENSIONS
+from gtaa_validator.api import VIRTUAL_ROOT
+from gtaa_validator.config import EXCLUDED_DIRS, ProjectConfig, parse_config
+from gtaa_validator.file_utils import MAX_FILE_SIZE_BYTES, VirtualFiles
+
+logger = logging.getLogger(__name__)
+
+# Extensiones reconocidas como archivo comprimido (de más a menos específica)
+ARCHIVE_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tbz2", ".txz", ".tar", ".zip")
+
+# Límite de contenido en memoria al recorrer un tar comprimido: 512 MB
+MAX_BUFFERED_BYTES = 512 * 1024 * 1024
+
+CONFIG_NAME = ".gtaa.yaml"
+
+
+class ArchiveError(Exception):
+    """Archivo comprimido ilegible, con formato no soportado o demasiado grande."""
+
+
+@dataclass
+class ArchiveSnapshot:
+    """
+    Proyecto leído de un archivo comprimido.
+
+    Atributos:
+        root: Raíz virtual del proyecto (project_path del análisis)
+        config: Configuración: la indicada o el .gtaa.yaml del archivo
+        files: Entradas analizables como archivos virtuales (cerrar al terminar)
+        members: Entradas regulares del archivo
+        skipped: Entradas descartadas (extensión, directorio excluido,
+            ignore_paths o tamaño)
+    """
+    root: Path
+    config: ProjectConfig
+    files: VirtualFiles
+    members: int = 0
+    skipped: int = 0
+
+    def close(self) -> None:
+        self.files.close()
+
+
+def is_archive(path: Path) -> bool:
+    """True si la extensión de la ruta es la de un archivo comprimido soportado."""
+    return _archive_suffix(path) is not None
+
+
+def open_archive(archive_path: Path, config: Optional[ProjectConfig] = None,
+                 max_buffered: int = MAX_BUFFERED_BYTES) -> ArchiveSnapshot:
+    """
+    Abrir un archivo comprimido como proyecto virtual.
+
+    Args:
+        archive_path: Ruta al .zip / .tar[.gz|.bz2|.xz]
+        config: Configuración a aplicar; si es None se usa el .gtaa.yaml de
+            la raíz del archivo (o la configuración por defecto)
+        max_buffered: Límite de bytes en memoria para tar comprimidos
+
+    Returns:
+        ArchiveSnapshot con la raíz virtual, la configuración y los archivos
+
+    Raises:
+        ArchiveError: Si el archivo no se puede leer o supera max_buffered
+    """
+    archive_path = Path(archive_path)
+    suffix = _archive_suffix(archive_path)
+    if suffix is None:
+        raise ArchiveError(f"Formato de archivo no soportado: {archive_path.name}")
+    root = VIRTUAL_ROOT / archive_path.name[:-len(suffix)]
+
+    try:
+        if suffix == ".zip":
+            reader = _ZipReader(archive_path)
+        elif suffix == ".tar":
+            reader = _TarReader(archive_path)
+        else:
+            reader = _StreamedTarReader(archive_path, max_buffered)
+    except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as e:
+        raise ArchiveError(f"No se pudo leer {archive_path}: {e}") from e
+
+    try:
+        prefix = _common_prefix(reader.names)
+        if config is None:
+            config_member = reader.names.get(posixpath.join(prefix, CONFIG_NAME))
+            config = ProjectConfig()
+            if config_member is not None:
+                data = reader.load(config_member)
+                if data is not None:
+                    config = parse_config(data.decode("utf-8", errors="replace"),
+                                          f"{archive_path}:{CONFIG_NAME}")
+
+        selected: Dict[Path, Tuple[object, str]] = {}
+        for name, member in reader.names.items():
+            relative = name[len(prefix) + 1:] if prefix else name
+            if _is_analyzable(relative, config) and reader.size(member) <= MAX_FILE_SIZE_BYTES:
+                selected[root / relative] = (member, reader.signature(member))
+            elif not relative.endswith(CONFIG_NAME):
+                logger.debug("Entrada descartada: %s", name)
+        reader.retain(member for member, _ in selected.values())
+    except Exception:
+        reader.close()
+        raise
+
+    def load(file_path: Path) -> Optional[bytes]:
+        entry = selected.get(file_path)
+        return reader.load(entry[0]) if entry else None
+
+    files = VirtualFiles({path: sig for path, (_, sig) in selected.items()}, load, close=reader.close,
+                         sizes={path: reader.size(member) for path, (member, _) in selected.items()})
+    logger.debug("Archivo %s: %d de %d entrada(s) analizables",
+                 archive_path, len(selected), reader.members)
+    return ArchiveSnapshot(root, config, files, members=reader.members,
+                           skipped=reader.members - len(selected))
+
+
+def _archive_suffix(path: Path) -> Optional[str]:
+    name = Path(path).name.lower()
+    return next((s for s in ARCHIVE_SUFFIXES if name.endswith(s) and len(name) > len(s)), None)
+
+
+def _normalize_name(name: str) -> Optional[str]:
+    """Nombre de entrada normalizado (sin "./"), o None si sale de la raíz."""
+    name = posixpath.normpath(name.replace("\\", "/"))
+    if name.startswith(("/", "../")) or name in (".", ".."):
+        return None
+    return name
+
+
+def _common_prefix(names: Dict[str, object]) -> str:
+    """Directorio del que cuelgan todas las entradas ("" si no hay uno único)."""
+    tops = {name.split("/", 1)[0] for name in names}
+    if len(tops) == 1 and all("/" in name for name in names):
+        return tops.pop()
+    return ""
+
+
+def _is_analyzable(relative: str, config: ProjectConfig) -> bool:
+    """Mismo filtro que el descubrimiento de StaticAnalyzer, sobre el nombre de la entrada."""
+    path = PurePosixPath(relative)
+    if path.suffix not in ANALYZABLE_EXTENSIONS:
+        return False
+    if any(excluded in path.parts for excluded in EXCLUDED_DIRS):
+        return False
+    return not any(fnmatch.fnmatch(relative, pattern) for pattern in config.ignore_paths)
+
+
+def _wanted(relative: str) -> bool:
+    """
+    Entradas que puede hacer falta leer: .gtaa.yaml o analizables por
+    extensión fuera de EXCLUDED_DIRS.
+
+    relative es el nombre sin el directorio raíz del archivo, como en
+    _is_analyzable. Solo ignore_paths tiene que esperar a la configuración;
+    node_modules/, venv/ o build/ se descartan antes de leer su contenido y
+    no cuentan en el límite de memoria de los tar comprimidos.
+    """
+    path = PurePosixPath(relative)
+    if path.name == CONFIG_NAME:
+        return True
+    if path.suffix not in ANALYZABLE_EXTENSIONS:
+        return False
+    return not any(excluded in path.parts[:-1] for excluded in EXCLUDED_DIRS)
+
+
+class _ZipReader:
+    """Entradas de un .zip, leídas bajo demanda (acceso aleatorio)."""
+
+    def __init__(self, archive_path: Path):
+        self._zip = zipfile.ZipFile(archive_path)
+        self._lock = threading.Lock()
+        self.names: Dict[str, zipfile.ZipInfo] = {}
+        self.members = 0
+        for info in self._zip.infolist():
+            if info.is_dir():
+                continue
+            self.members += 1
+            name = _normalize_name(info.filename)
+            if name is not None:
+                self.names[name] = info
+
+    def size(self, info: zipfile.ZipInfo) -> int:
+        return info.file_size
+
+    def signature(self, info: zipfile.ZipInfo) -> str:
+        return f"{info.CRC:08x}:{info.file_size}"
+
+    def retain(self, members) -> None:
+        pass
+
+    def load(self, info: zipfile.ZipInfo) -> Optional[bytes]:
+        with self._lock:
+            try:
+                return self._zip.read(info)
+            except (OSError, zipfile.BadZipFile) as e:
+                logger.warning("No se pudo leer %s: %s", info.filename, e)
+                return None
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class _TarReader:
+    """Entradas de un .tar sin comprimir, leídas bajo demanda (acceso aleatorio)."""
+
+    def __init__(self, archive_path: Path):
+        self._tar = tarfile.open(archive_path, "r:")
+        self._lock = threading.Lock()
+        self.names: Dict[str, tarfile.TarInfo] = {}
+        self.members = 0
+        for member in self._tar:
+            if not member.isfile():
+                continue
+            self.members += 1
+            name = _normalize_name(member.name)
+            if name is not None:
+                self.names[name] = member
+        # No conservar la lista de TarInfo de todo el archivo
+        self._tar.members = []
+
+    def size(self, member: tarfile.TarInfo) -> int:
+        return member.size
+
+    def signature(self, member: tarfile.TarInfo) -> str:
+        return f"{member.chksum:x}:{member.size}:{member.mtime}"
+
+    def retain(self, members) -> None:
+        pass
+
+    def load(self, member: tarfile.TarInfo) -> Optional[bytes]:
+        with self._lock:
+            try:
+                return self._tar.extractfile(member).read()
+            except (OSError, tarfile.TarError) as e:
+                logger.warning("No se pudo leer %s: %s", member.name, e)
+                return None
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+class _StreamedTarReader:
+    """
+    Entradas de un tar comprimido, leídas en una sola pasada.
+
+    Se registran los nombres de todas las entradas regulares (el directorio
+    raíz se calcula sobre el mismo conjunto que con .zip y .tar), pero solo
+    se guarda en memoria el contenido de las que pueden analizarse (por
+    extensión, EXCLUDED_DIRS y tamaño); retain() libera después las que la
+    configuración descarta.
+
+    El directorio raíz definitivo solo se conoce al final: durante la pasada
+    los nombres se evalúan sin el primer directorio mientras todas las
+    entradas cuelguen de él. Si después aparece otra, el prefijo pasa a ser
+    "" y se libera lo guardado que con el nombre completo queda excluido.
+    """
+
+    def __init__(self, archive_path: Path, max_buffered: int):
+        self.names: Dict[str, str] = {}
+        self.members = 0
+        self._data: Dict[str, bytes] = {}
+        self._sizes: Dict[str, int] = {}
+        buffered = 0
+        prefix = None
+        with tarfile.open(archive_path, "r|*") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                self.members += 1
+                name = _normalize_name(member.name)
+                if name is None:
+                    continue
+                self.names[name] = name
+                self._sizes[name] = member.size
+
+                # Prefijo común provisional (ver _common_prefix)
+                top, separator, rest = name.partition("/")
+                if prefix is None:
+                    prefix = top if separator else ""
+                elif prefix and (top != prefix or not separator):
+                    prefix = ""
+                    # Sin directorio raíz: liberar lo que ya no se puede analizar
+                    for kept in [n for n in self._data if not _wanted(n)]:
+                        buffered -= len(self._data.pop(kept))
+                if not _wanted(rest if prefix else name) or member.size > MAX_FILE_SIZE_BYTES:
+                    continue
+                buffered += member.size
+                if buffered > max_buffered:
+                    raise ArchiveError(
+                        f"{archive_path.name}: el contenido analizable supera "
+                        f"{max_buffered // (1024 * 1024)} MB en memoria; extráelo antes de analizarlo"
+                    )
+                self._data[name] = tar.extractfile(member).read()
+
+    def size(self, name: str) -> int:
+        return self._sizes[name]
+
+    def signature(self, name: str) -> str:
+        return hashlib.sha1(self._data.get(name, b"")).hexdigest()
+
+    def retain(self, names) -> None:
+        keep = set(names)
+        self._data = {name: data for name, data in self._data.items() if name in keep}
+
+    def load(self, name: str) -> Optional[bytes]:
+        return self._data.get(name)
+
+    def close(self) -> None:
+        self._data = {}
@@ -0,0 +1,137 @@
+"""
+Baseline de violaciones conocidas para gTAA Validator (--baseline).
+
+Un proyecto legacy puede arrastrar miles de violaciones aceptadas. Con un
+informe JSON anterior como baseline, solo se informan las violaciones
+nuevas: las conocidas se suprimen antes del enriquecimiento AI, de la
+generación de reportes y del cálculo del código de salida.
+
+Las violaciones se comparan por su huella (Violation.fingerprint): tipo,
+archivo, fragmento de código normalizado y función contenedora. La huella no
+incluye el número de línea, así que mover código no "crea" violaciones.
+
+Las huellas se guardan con su multiplicidad: si el baseline tenía una
+violación y ahora hay dos idénticas, la segunda se informa como nueva.
+
+Los informes anteriores a las huellas no guardan la función contenedora:
+sus violaciones van a un segundo multiconjunto con huellas sin función, y
+una violación actual que no está en el primero se busca ahí con su huella
+sin función.
+"""
+
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from gtaa_validator.file_utils import safe_relative_path
+from gtaa_validator.models import Report, Violation, violation_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class Baseline:
+    """
+    Conjunto (multiconjunto) de huellas de violaciones ya conocidas.
+
+    Atributos:
+        source: Fichero del que se cargó el baseline (None si se creó en memoria)
+        known: Número de violaciones del baseline
+        suppressed: Violaciones suprimidas hasta el momento
+    """
+
+    def __init__(self, fingerprints: Iterable[str], source: Optional[Path] = None,
+                 legacy_fingerprints: Iterable[str] = ()):
+        self._remaining = Counter(fingerprints)
+        # Informes sin campo "fingerprint": huellas sin función contenedora
+        self._legacy = Counter(legacy_fingerprints)
+        self.source = source
+        self.known = sum(self._remaining.values()) + sum(self._legacy.values())
+        self.suppressed = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "Baseline":
+        """
+        Cargar un baseline desde un informe JSON o NDJSON de gTAA Validator.
+
+        Las violaciones de informes anteriores sin campo "fingerprint" se
+        recalculan a partir de sus campos, sin función contenedora (el
+        informe no la guardaba), y se comparan sin ella.
+
+        Raises:
+            ValueError: Si el fichero no es un informe de gTAA Validator
+        """
+        path = Path(path)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            raise ValueError(f"No se pudo leer el baseline {path}: {e}") from e
+
+        try:
+            document = json.loads(text)
+            records = document.get("violations") if isinstance(document, dict) else None
+        except ValueError:
+            # NDJSON: cabecera con metadata/summary y una violación por línea
+            try:
+                records = [json.loads(line) for line in text.splitlines()[1:] if line.strip()]
+            except ValueError:
+                records = None
+
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            raise ValueError(f"El baseline {path} no es un informe JSON de gTAA Validator")
+
+        baseline = cls((r["fingerprint"] for r in records if r.get("fingerprint")), source=path,
+                       legacy_fingerprints=(_legacy_record_fingerprint(r)
+                                            for r in records if not r.get("fingerprint")))
+        logger.info("Baseline cargado: %s (%d violaciones conocidas)", path, baseline.known)
+        return baseline
+
+    def is_known(self, violation: Violation, project_path: Optional[Path] = None) -> bool:
+        """Comprobar si la violación está en el baseline (consume una aparición)."""
+        fingerprint = violation.fingerprint(project_path)
+        if self._remaining[fingerprint] > 0:
+            self._remaining[fingerprint] -= 1
+        elif self._legacy and self._legacy[_legacy_fingerprint(violation, project_path)] > 0:
+            self._legacy[_legacy_fingerprint(violation, project_path)] -= 1
+        else:
+            return False
+        self.suppressed += 1
+        return True
+
+    def filter(self, violations: Iterable[Violation],
+               project_path: Optional[Path] = None) -> List[Violation]:
+        """Devolver solo las violaciones nuevas (no presentes en el baseline)."""
+        return [v for v in violations if not self.is_known(v, project_path)]
+
+    def apply(self, report: Report) -> Report:
+        """Suprimir del informe las violaciones conocidas y recalcular la puntuación."""
+        report.violations = self.filter(report.violations, report.project_path)
+        report.baseline_stats = self.to_dict()
+        report.calculate_score()
+        return report
+
+    def to_dict(self) -> dict:
+        """Estadísticas del baseline para el informe."""
+        return {
+            "file": self.source.name if self.source else None,
+            "known_violations": self.known,
+            "suppressed": self.suppressed,
+        }
+
+
+def _legacy_record_fingerprint(record: dict) -> str:
+    """Huella sin función de una violación serializada por un informe anterior."""
+    return violation_fingerprint(
+        str(record.get("type", "")), str(record.get("file", "")),
+        record.get("code_snippet"), str(record.get("message", "")), None,
+    )
+
+
+def _legacy_fingerprint(violation: Violation, project_path: Optional[Path] = None) -> str:
+    """Huella sin función de una violación actual, comparable con los informes anteriores."""
+    file_display = safe_relative_path(violation.file_path, project_path) if project_path else violation.file_path
+    return violation_fingerprint(
+        violation.violation_type.name, Path(file_display).as_posix(),
+        violation.code_snippet, violation.message, None,
+    )
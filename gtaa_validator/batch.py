@@ -0,0 +1,171 @@
+"""
+Modo lote para monorepos (--batch): muchos proyectos en un único proceso de CLI.
+
+Cada proyecto (raíz con su propio .gtaa.yaml) es una tarea de un
+ProcessPoolExecutor compartido. Los procesos del pool se crean una vez y
+cargan al arrancar los parsers de todos los lenguajes (gramáticas
+tree-sitter incluidas), así que cada proyecto no paga el arranque de Python,
+las importaciones ni la carga de gramáticas: solo su análisis.
+
+Dentro de un proyecto los archivos se siguen verificando en orden en el
+mismo proceso, porque las reglas entre archivos (localizadores y steps
+duplicados) acumulan estado de todo el proyecto.
+
+El resultado es un Report por proyecto (los errores de un proyecto no
+detienen el lote) y un resumen combinado (BatchResult.summary).
+"""
+
+import glob
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from gtaa_validator.analyzers.static_analyzer import ANALYZABLE_EXTENSIONS, StaticAnalyzer
+from gtaa_validator.models import Report, get_score_label
+
+logger = logging.getLogger(__name__)
+
+_SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+
+@dataclass
+class BatchResult:
+    """
+    Resultado de un análisis por lotes.
+
+    Atributos:
+        projects: Raíces de los proyectos, en el orden solicitado
+        reports: Proyecto -> Report de los proyectos analizados
+        errors: Proyecto -> mensaje de error de los que fallaron
+    """
+    projects: List[Path] = field(default_factory=list)
+    reports: Dict[Path, Report] = field(default_factory=dict)
+    errors: Dict[Path, str] = field(default_factory=dict)
+
+    def names(self) -> Dict[Path, str]:
+        """Nombre de cada proyecto: su ruta relativa al directorio común."""
+        if not self.projects:
+            return {}
+        if len(self.projects) == 1:
+            return {self.projects[0]: self.projects[0].name}
+        base = Path(os.path.commonpath([str(p) for p in self.projects]))
+        return {p: p.relative_to(base).as_posix() or p.name for p in self.projects}
+
+    def summary(self, report_paths: Optional[Dict[Path, Path]] = None) -> dict:
+        """
+        Resumen combinado del lote y detalle por proyecto.
+
+        Args:
+            report_paths: Proyecto -> reporte JSON escrito (se incluye en el detalle)
+        """
+        names = self.names()
+        report_paths = report_paths or {}
+        by_severity = {name: 0 for name in _SEVERITIES}
+        details = []
+        for project in self.projects:
+            if project in self.errors:
+                details.append({"project": names[project], "error": self.errors[project]})
+                continue
+            report = self.reports[project]
+            summary = report.summary_dict()
+            for name, count in summary["violations_by_severity"].items():
+                by_severity[name] += count
+            detail = {"project": names[project], **summary, "label": get_score_label(report.score)}
+            if project in report_paths:
+                detail["report"] = str(report_paths[project])
+            details.append(detail)
+
+        scores = [self.reports[p].score for p in self.projects if p in self.reports]
+        return {
+            "projects": len(self.projects),
+            "failed": len(self.errors),
+            "files_analyzed": sum(r.files_analyzed for r in self.reports.values()),
+            "total_violations": sum(by_severity.values()),
+            "violations_by_severity": by_severity,
+            "average_score": round(sum(scores) / len(scores), 1) if scores else None,
+            "min_score": min(scores) if scores else None,
+            "details": details,
+        }
+
+
+def expand_projects(patterns: Iterable[str]) -> List[Path]:
+    """
+    Raíces de proyecto a partir de rutas o patrones glob ("services/*/tests").
+
+    Solo se conservan directorios; sin duplicados y en orden alfabético.
+    """
+    projects = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            path = Path(match).resolve()
+            if path.is_dir():
+                projects.add(path)
+            else:
+                logger.warning("Lote: %s no es un directorio, se omite", match)
+    return sorted(projects)
+
+
+def analyze_projects(projects: List[Path], jobs: Optional[int] = None,
+                     on_result: Optional[Callable[[Path, Optional[Report], Optional[str]], None]] = None,
+                     ) -> BatchResult:
+    """
+    Analizar varios proyectos en un pool de procesos compartido.
+
+    Args:
+        projects: Raíces de los proyectos (cada uno con su .gtaa.yaml, si lo tiene)
+        jobs: Procesos del pool (por defecto, os.cpu_count()); con 1 se
+            analiza en el propio proceso
+        on_result: Llamada al terminar cada proyecto con (proyecto, report, error)
+
+    Returns:
+        BatchResult con los informes y errores por proyecto
+    """
+    result = BatchResult(projects=list(projects))
+    jobs = min(jobs or os.cpu_count() or 1, max(len(projects), 1))
+
+    def record(project: Path, report: Optional[Report], error: Optional[str]) -> None:
+        if report is not None:
+            result.reports[project] = report
+        else:
+            result.errors[project] = error
+            logger.warning("Lote: error analizando %s: %s", project, error)
+        if on_result is not None:
+            on_result(project, report, error)
+
+    if jobs == 1:
+        for project in projects:
+            try:
+                record(project, _analyze_project(str(project)), None)
+            except Exception as e:
+                record(project, None, str(e))
+        return result
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker) as pool:
+        futures = {pool.submit(_analyze_project, str(p)): p for p in projects}
+        for future in as_completed(futures):
+            project = futures[future]
+            try:
+                record(project, future.result(), None)
+            except Exception as e:
+                record(project, None, str(e))
+    return result
+
+
+def _analyze_project(project_path: str) -> Report:
+    """Tarea del pool: análisis estático completo de un proyecto."""
+    return StaticAnalyzer(Path(project_path)).analyze()
+
+
+def _warm_worker() -> None:
+    """Inicializador del pool: cargar una vez los parsers de todos los lenguajes."""
+    from gtaa_validator.parsers.treesitter_base import get_parser_for_file
+
+    for extension in ANALYZABLE_EXTENSIONS:
+        try:
+            get_parser_for_file(Path(f"warm{extension}"))
+        except Exception as e:  # gramática no instalada: se notará al analizar
+            logger.debug("Lote: parser %s no disponible: %s", extension, e)
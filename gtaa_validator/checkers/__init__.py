@@ -6,6 +6,7 @@ Each checker is responsible for detecting specific types of gTAA violations.
 
 Checkers use the Strategy Pattern:
 - base.py: Abstract base class defining the checker interface
+- file_facts.py: Per-file facts computed once and shared by all checkers
 - definition_checker.py: Detects violations in the Definition layer (test files)
 - structure_checker.py: Validates project structure
 - adaptation_checker.py: Validates Page Objects
@@ -16,6 +17,7 @@ All checkers inherit from BaseChecker and implement the check() method.
 """
 
 from gtaa_validator.checkers.base import BaseChecker
+from gtaa_validator.checkers.file_facts import FileFacts, build_file_facts
 from gtaa_validator.checkers.definition_checker import DefinitionChecker
 from gtaa_validator.checkers.structure_checker import StructureChecker
 from gtaa_validator.checkers.adaptation_checker import AdaptationChecker
@@ -24,6 +26,8 @@ from gtaa_validator.checkers.bdd_checker import BDDChecker
 
 __all__ = [
     "BaseChecker",
+    "FileFacts",
+    "build_file_facts",
     "DefinitionChecker",
     "StructureChecker",
     "AdaptationChecker",
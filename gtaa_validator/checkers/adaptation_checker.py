@@ -21,13 +21,13 @@ import ast
 import logging
 import re
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Set
+from typing import List, Dict, Optional, Union, Set, Tuple
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
 from gtaa_validator.checkers.base import BaseChecker
-from gtaa_validator.file_utils import read_file_safe
+from gtaa_validator.checkers.file_facts import FileFacts, resolve_file_facts
 from gtaa_validator.models import Violation, ViolationType, Severity
 from gtaa_validator.parsers.treesitter_base import (
     ParseResult, ParsedClass, ParsedFunction, ParsedCall, ParsedImport
@@ -47,6 +47,13 @@ class AdaptationChecker(BaseChecker):
     Soporta: Python, Java, JavaScript/TypeScript, C#
     """
 
+    VIOLATION_TYPES = frozenset({
+        ViolationType.FORBIDDEN_IMPORT,
+        ViolationType.ASSERTION_IN_POM,
+        ViolationType.BUSINESS_LOGIC_IN_POM,
+        ViolationType.DUPLICATE_LOCATOR,
+    })
+
     # Módulos prohibidos en Page Objects por lenguaje
     FORBIDDEN_MODULES_PYTHON: Set[str] = {"pytest", "unittest"}
     FORBIDDEN_MODULES_JAVA: Set[str] = {"org.junit", "org.testng", "org.junit.jupiter", "org.assertj"}
@@ -68,6 +75,11 @@ class AdaptationChecker(BaseChecker):
         "IsNull", "IsNotNull", "That", "Throws",
     }
 
+    # Además de los métodos anteriores, cuentan como aserción las llamadas con
+    # estos prefijos o sobre estos objetos (_find_assertion_calls_in_method)
+    ASSERTION_PREFIXES: Tuple[str, ...] = ("assert", "verify")
+    ASSERTION_OBJECTS: Set[str] = {"Assert", "Assertions", "expect"}
+
     # Patrones regex para extraer valores de selectores de localizadores
     LOCATOR_PATTERNS = [
         re.compile(r'By\.\w+,\s*["\']([^"\']+)["\']'),
@@ -80,10 +92,31 @@ class AdaptationChecker(BaseChecker):
         re.compile(r'cy\.get\(["\']([^"\']+)["\']'),
     ]
 
+    # Prefiltro: condiciones necesarias sobre el código fuente por regla
+    TRIGGER_PATTERNS = {
+        ViolationType.FORBIDDEN_IMPORT: tuple(sorted(map(re.escape, (
+            FORBIDDEN_MODULES_PYTHON | FORBIDDEN_MODULES_JAVA
+            | FORBIDDEN_MODULES_JS | FORBIDDEN_MODULES_CSHARP
+        )))),
+        # Los mismos predicados que la regla: métodos, prefijos y objetos de aserción
+        ViolationType.ASSERTION_IN_POM: tuple(sorted(map(re.escape, (
+            ASSERTION_METHODS_PYTHON | ASSERTION_METHODS_JAVA
+            | ASSERTION_METHODS_JS | ASSERTION_METHODS_CSHARP
+            | set(ASSERTION_PREFIXES) | ASSERTION_OBJECTS
+        )))),
+        ViolationType.BUSINESS_LOGIC_IN_POM: (r"\b(?:if|for|while|switch)\b",),
+        ViolationType.DUPLICATE_LOCATOR: tuple(p.pattern for p in LOCATOR_PATTERNS),
+    }
+
+    # Los localizadores duplicados dependen de los Page Objects ya vistos
+    CROSS_FILE_STATE = True
+
     def __init__(self):
         super().__init__()
         # Rastrea localizador → lista de archivos, se reinicia por cada ejecución de análisis
         self._locator_registry: Dict[str, List[Path]] = defaultdict(list)
+        # Localizadores registrados por cada archivo (resumen para el modo incremental)
+        self._file_locators: Dict[Path, List[str]] = {}
 
     def can_check(self, file_path: Path) -> bool:
         """
@@ -124,7 +157,8 @@ class AdaptationChecker(BaseChecker):
 
     def check(self, file_path: Path,
               tree_or_result: Optional[Union[ast.Module, ParseResult]] = None,
-              file_type: str = "unknown") -> List[Violation]:
+              file_type: str = "unknown",
+              facts: Optional[FileFacts] = None) -> List[Violation]:
         """
         Verificar un archivo de Page Object en busca de violaciones.
 
@@ -138,38 +172,24 @@ class AdaptationChecker(BaseChecker):
             file_path: Ruta al archivo a verificar
             tree_or_result: AST (Python legacy) o ParseResult (multi-lang)
             file_type: Clasificación del archivo
+            facts: Hechos precalculados del archivo (opcional)
         """
         violations: List[Violation] = []
-        extension = file_path.suffix.lower()
 
         try:
-            source_code = read_file_safe(file_path)
-            if not source_code:
+            facts = resolve_file_facts(file_path, tree_or_result, facts, file_type)
+            if facts is None or facts.parse_result is None:
                 return violations
-            lines = source_code.splitlines()
-
-            # Obtener ParseResult
-            if isinstance(tree_or_result, ParseResult):
-                result = tree_or_result
-            elif isinstance(tree_or_result, ast.Module):
-                # Legacy Python AST - convertir a ParseResult
-                from gtaa_validator.parsers.python_parser import PythonParser
-                parser = PythonParser()
-                result = parser.parse(source_code)
-            else:
-                # Sin resultado previo - parsear
-                from gtaa_validator.parsers.treesitter_base import get_parser_for_file
-                parser = get_parser_for_file(file_path)
-                if parser:
-                    result = parser.parse(source_code)
-                else:
-                    return violations
-
-            # Ejecutar verificaciones
-            violations.extend(self._check_forbidden_imports(file_path, result, lines, extension))
-            violations.extend(self._check_assertions(file_path, result, lines, extension))
-            violations.extend(self._check_business_logic(file_path, source_code, lines, extension))
-            violations.extend(self._check_duplicate_locators(file_path, source_code))
+
+            # Ejecutar verificaciones (omitiendo las excluidas por configuración)
+            if self.is_rule_enabled(ViolationType.FORBIDDEN_IMPORT):
+                violations.extend(self._check_forbidden_imports(file_path, facts))
+            if self.is_rule_enabled(ViolationType.ASSERTION_IN_POM):
+                violations.extend(self._check_assertions(file_path, facts))
+            if self.is_rule_enabled(ViolationType.BUSINESS_LOGIC_IN_POM):
+                violations.extend(self._check_business_logic(file_path, facts))
+            if self.is_rule_enabled(ViolationType.DUPLICATE_LOCATOR):
+                violations.extend(self._check_duplicate_locators(file_path, facts.source))
 
         except SyntaxError:
             pass
@@ -182,14 +202,12 @@ class AdaptationChecker(BaseChecker):
     # Sub-verificaciones
     # ------------------------------------------------------------------
 
-    def _check_forbidden_imports(
-        self, file_path: Path, result: ParseResult, lines: List[str], extension: str
-    ) -> List[Violation]:
+    def _check_forbidden_imports(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar imports de frameworks de test en archivos de Page Object."""
         violations: List[Violation] = []
-        forbidden_modules = self._get_forbidden_modules(extension)
+        forbidden_modules = self._get_forbidden_modules(facts.extension)
 
-        for imp in result.imports:
+        for imp in facts.parse_result.imports:
             root_module = imp.module.split(".")[0]
 
             # Verificar si el import es de un módulo prohibido
@@ -201,7 +219,7 @@ class AdaptationChecker(BaseChecker):
             )
 
             if is_forbidden:
-                snippet = lines[imp.line - 1].strip() if imp.line <= len(lines) else f"import {imp.module}"
+                snippet = facts.snippet(imp.line, f"import {imp.module}")
                 violations.append(
                     Violation(
                         violation_type=ViolationType.FORBIDDEN_IMPORT,
@@ -219,25 +237,20 @@ class AdaptationChecker(BaseChecker):
 
         return violations
 
-    def _check_assertions(
-        self, file_path: Path, result: ParseResult, lines: List[str], extension: str
-    ) -> List[Violation]:
+    def _check_assertions(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar aserciones dentro de métodos de Page Object."""
         violations: List[Violation] = []
-        assertion_methods = self._get_assertion_methods(extension)
-
-        for cls in result.classes:
-            if not cls.is_page_object:
-                continue
+        assertion_methods = self._get_assertion_methods(facts.extension)
 
+        for cls in facts.page_object_classes:
             for method in cls.methods:
                 # Buscar llamadas a métodos de aserción dentro de este método
                 assertion_calls = self._find_assertion_calls_in_method(
-                    method, result.calls, assertion_methods
+                    method, facts.parse_result.calls, assertion_methods
                 )
 
                 for call in assertion_calls:
-                    snippet = lines[call.line - 1].strip() if call.line <= len(lines) else call.full_text
+                    snippet = facts.snippet(call.line, call.full_text)
                     violations.append(
                         Violation(
                             violation_type=ViolationType.ASSERTION_IN_POM,
@@ -255,35 +268,28 @@ class AdaptationChecker(BaseChecker):
                     )
 
         # Para Python, también detectar sentencias 'assert' (no son llamadas)
-        if extension == ".py":
-            try:
-                tree = ast.parse("\n".join(lines))
-                visitor = _AssertionVisitor(file_path)
-                visitor.visit(tree)
-                violations.extend(visitor.violations)
-            except SyntaxError:
-                pass
+        tree = facts.python_ast
+        if tree is not None:
+            visitor = _AssertionVisitor(file_path)
+            visitor.visit(tree)
+            violations.extend(visitor.violations)
 
         return violations
 
-    def _check_business_logic(
-        self, file_path: Path, source_code: str, lines: List[str], extension: str
-    ) -> List[Violation]:
+    def _check_business_logic(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar lógica de negocio compleja en Page Objects."""
         violations: List[Violation] = []
 
         # Para Python, usar AST para detección precisa
-        if extension == ".py":
-            try:
-                tree = ast.parse(source_code)
+        if facts.extension == ".py":
+            tree = facts.python_ast
+            if tree is not None:
                 visitor = _BusinessLogicVisitor(file_path)
                 visitor.visit(tree)
                 violations.extend(visitor.violations)
-            except SyntaxError:
-                pass
         else:
             # Para otros lenguajes, usar detección basada en regex/patrones
-            violations.extend(self._check_business_logic_regex(file_path, source_code, lines))
+            violations.extend(self._check_business_logic_regex(file_path, facts.source, facts.lines))
 
         return violations
 
@@ -324,37 +330,114 @@ class AdaptationChecker(BaseChecker):
     def _check_duplicate_locators(
         self, file_path: Path, source_code: str
     ) -> List[Violation]:
-        """Detectar cadenas de localizador que aparecen en múltiples archivos de Page Object."""
+        """
+        Detectar cadenas de localizador que aparecen en múltiples archivos de Page Object.
+
+        En modo shard cada primera aparición de un localizador en el archivo
+        se devuelve como candidata; reduce_duplicate_locators() decide en el
+        merge cuáles son duplicados.
+        """
         violations: List[Violation] = []
+        registered = self._file_locators[file_path] = []
+        deferred = self.shard_filter is not None
 
         for pattern in self.LOCATOR_PATTERNS:
             for match in pattern.finditer(source_code):
                 locator = match.group(1)
                 existing = self._locator_registry[locator]
 
-                if existing and file_path not in existing:
+                if (existing or deferred) and file_path not in existing:
                     line_number = source_code[: match.start()].count("\n") + 1
-                    other_names = ", ".join(f.name for f in existing)
                     violations.append(
-                        Violation(
-                            violation_type=ViolationType.DUPLICATE_LOCATOR,
-                            severity=Severity.MEDIUM,
-                            file_path=file_path,
-                            line_number=line_number,
-                            message=(
-                                f"El localizador '{locator}' está duplicado entre Page Objects. "
-                                f"También se encuentra en: {other_names}. "
-                                f"Considere centralizar los localizadores en una página base o repositorio."
-                            ),
-                            code_snippet=locator,
-                        )
+                        self._duplicate_locator(file_path, line_number, locator, existing)
                     )
 
                 if file_path not in existing:
                     existing.append(file_path)
+                    registered.append(locator)
 
         return violations
 
+    @staticmethod
+    def _duplicate_locator(file_path: Path, line_number: int, locator: str,
+                           existing: List[Path]) -> Violation:
+        other_names = ", ".join(f.name for f in existing)
+        return Violation(
+            violation_type=ViolationType.DUPLICATE_LOCATOR,
+            severity=Severity.MEDIUM,
+            file_path=file_path,
+            line_number=line_number,
+            message=(
+                f"El localizador '{locator}' está duplicado entre Page Objects. "
+                f"También se encuentra en: {other_names}. "
+                f"Considere centralizar los localizadores en una página base o repositorio."
+            ),
+            code_snippet=locator,
+        )
+
+    @classmethod
+    def reduce_duplicate_locators(cls, candidates: List[Violation]) -> Dict[int, Violation]:
+        """
+        Resolver las candidatas de los shards como lo haría un análisis completo.
+
+        Args:
+            candidates: Candidatas DUPLICATE_LOCATOR de todos los shards, en el
+                orden de cada archivo
+
+        Returns:
+            Posición en candidates -> violación definitiva (las que no están
+            en el diccionario no son duplicados)
+        """
+        by_file: Dict[Path, List[int]] = defaultdict(list)
+        for position, candidate in enumerate(candidates):
+            by_file[candidate.file_path].append(position)
+
+        registry: Dict[str, List[Path]] = defaultdict(list)
+        resolved: Dict[int, Violation] = {}
+        for file_path in sorted(by_file):
+            for position in by_file[file_path]:
+                candidate = candidates[position]
+                existing = registry[candidate.code_snippet]
+                if existing:
+                    violation = cls._duplicate_locator(
+                        file_path, candidate.line_number, candidate.code_snippet, existing
+                    )
+                    violation.function_name = candidate.function_name
+                    resolved[position] = violation
+                existing.append(file_path)
+        return resolved
+
+    def file_summary(self, file_path: Path) -> Optional[List[str]]:
+        """Localizadores que el archivo añadió al registro en su última verificación."""
+        return self._file_locators.get(file_path)
+
+    def replay_summary(self, file_path: Path, summary: List[str]) -> None:
+        """Registrar los localizadores de un archivo sin cambios, sin releerlo."""
+        if not self.is_rule_enabled(ViolationType.DUPLICATE_LOCATOR):
+            return
+        registered = self._file_locators[file_path] = []
+        for locator in summary:
+            existing = self._locator_registry[locator]
+            if file_path not in existing:
+                existing.append(file_path)
+                registered.append(locator)
+
+    def related_files(self, file_path: Path) -> Set[Path]:
+        """Page Objects que comparten algún localizador con el archivo."""
+        related = {
+            other
+            for locator in self._file_locators.get(file_path, ())
+            for other in self._locator_registry.get(locator, ())
+        }
+        related.discard(file_path)
+        return related
+
+    def check_project(self, project_path: Path) -> List[Violation]:
+        """Reiniciar el registro de localizadores al comenzar cada análisis."""
+        self._locator_registry.clear()
+        self._file_locators.clear()
+        return []
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -384,9 +467,8 @@ class AdaptationChecker(BaseChecker):
             if method.line_start <= call.line <= method.line_end:
                 # Verificar si es una llamada a método de aserción
                 if (call.method_name in assertion_methods or
-                    call.method_name.startswith("assert") or
-                    call.method_name.startswith("verify") or
-                    call.object_name in {"Assert", "Assertions", "expect"}):
+                    call.method_name.startswith(self.ASSERTION_PREFIXES) or
+                    call.object_name in self.ASSERTION_OBJECTS):
                     assertion_calls.append(call)
 
         return assertion_calls
@@ -16,11 +16,17 @@ from __future__ import annotations
 import ast
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
-from gtaa_validator.models import Violation
+from gtaa_validator.models import Violation, ViolationType
+
+from gtaa_validator.checkers.file_facts import (
+    JS_EXTENSIONS, is_test_function, language_key
+)
 
 if TYPE_CHECKING:
+    from gtaa_validator.analyzers.incremental import SummaryCache
+    from gtaa_validator.checkers.file_facts import FileFacts
     from gtaa_validator.parsers.treesitter_base import ParseResult, ParsedFunction
 
 
@@ -45,14 +51,84 @@ class BaseChecker(ABC):
                 return violations
     """
 
+    # Tipos de violación que este checker puede emitir. StaticAnalyzer lo usa
+    # para podar checkers completos cuando exclude_checks los excluye todos.
+    VIOLATION_TYPES: FrozenSet[ViolationType] = frozenset()
+
+    # Fragmentos regex que deben aparecer en el código fuente para que cada
+    # tipo de violación pueda dispararse (condición necesaria, no suficiente).
+    # El prefiltro de StaticAnalyzer omite el checker si ninguno aparece.
+    # Vacío: el checker no admite prefiltro y se ejecuta siempre.
+    TRIGGER_PATTERNS: Dict[ViolationType, Tuple[str, ...]] = {}
+
+    # True si check() acumula estado entre archivos (ej. localizadores ya
+    # vistos). En modo incremental, StaticAnalyzer reconstruye ese estado
+    # para los archivos sin cambios con file_summary()/replay_summary().
+    CROSS_FILE_STATE: bool = False
+
     def __init__(self):
         """Inicializar el checker."""
         self.name = self.__class__.__name__
+        self.excluded_types: FrozenSet[ViolationType] = frozenset()
+        # Caché de resúmenes por archivo (la asigna StaticAnalyzer en modo incremental)
+        self.summary_cache: Optional[SummaryCache] = None
+        # Modo shard (--shard): las reducciones entre archivos (duplicados) se
+        # difieren a merge; indica qué archivos aporta este shard
+        self.shard_filter: Optional[Callable[[Path], bool]] = None
+
+    def set_excluded_types(self, excluded: Iterable[ViolationType]) -> None:
+        """
+        Configurar los tipos de violación excluidos (exclude_checks de .gtaa.yaml).
+
+        Las sub-verificaciones cuyos tipos estén excluidos no se ejecutan.
+
+        Args:
+            excluded: Tipos de violación a no calcular
+        """
+        self.excluded_types = frozenset(excluded)
+
+    def is_rule_enabled(self, violation_type: ViolationType) -> bool:
+        """True si el tipo de violación no está excluido por configuración."""
+        return violation_type not in self.excluded_types
+
+    def is_fully_excluded(self) -> bool:
+        """True si todos los tipos que puede emitir el checker están excluidos."""
+        return bool(self.VIOLATION_TYPES) and self.VIOLATION_TYPES <= self.excluded_types
+
+    def get_trigger_patterns(self, language: str) -> Optional[Tuple[str, ...]]:
+        """
+        Fragmentos regex de disparo de las reglas activas para un lenguaje.
+
+        Args:
+            language: Clave de lenguaje del archivo ("py", "java", "js", "cs", "feature")
+
+        Returns:
+            Tupla de fragmentos (vacía si ninguna regla activa analiza archivos
+            de ese lenguaje), o None si alguna regla activa no declara
+            disparadores y el checker debe ejecutarse siempre
+        """
+        if not self.TRIGGER_PATTERNS:
+            return None
+
+        patterns: List[str] = []
+        for vtype in sorted(self.VIOLATION_TYPES, key=lambda t: t.name):
+            if not self.is_rule_enabled(vtype) or not self._rule_applies_to(vtype, language):
+                continue
+            if vtype not in self.TRIGGER_PATTERNS:
+                return None
+            patterns.extend(self.TRIGGER_PATTERNS[vtype])
+
+        return tuple(dict.fromkeys(patterns))
+
+    def _rule_applies_to(self, violation_type: ViolationType, language: str) -> bool:
+        """True si la regla puede dispararse en archivos del lenguaje dado."""
+        return True
 
     @abstractmethod
     def check(self, file_path: Path,
               tree: Optional[Union[ast.Module, ParseResult]] = None,
-              file_type: str = "unknown") -> List[Violation]:
+              file_type: str = "unknown",
+              facts: Optional[FileFacts] = None) -> List[Violation]:
         """
         Verificar un archivo en busca de violaciones gTAA.
 
@@ -66,6 +142,9 @@ class BaseChecker(ABC):
                   el archivo de nuevo.
             file_type: Clasificación del archivo ('api', 'ui' o 'unknown').
                   Los checkers pueden usar esto para saltar reglas no aplicables.
+            facts: Hechos precalculados del archivo (líneas, tests, Page Objects...).
+                  StaticAnalyzer los construye una vez por archivo; si es None el
+                  checker los calcula por su cuenta.
 
         Returns:
             Lista de objetos Violation encontrados en el archivo (lista vacía si no hay violaciones)
@@ -75,6 +154,33 @@ class BaseChecker(ABC):
         """
         pass
 
+    def file_summary(self, file_path: Path) -> Optional[Any]:
+        """
+        Aportación del archivo al estado entre archivos en la última check().
+
+        Solo para checkers con CROSS_FILE_STATE. Debe ser serializable a JSON.
+
+        Returns:
+            Resumen del archivo, o None si no aportó nada
+        """
+        return None
+
+    def replay_summary(self, file_path: Path, summary: Any) -> None:
+        """
+        Incorporar al estado entre archivos un resumen guardado, sin verificar el archivo.
+
+        Equivale a lo que check() habría acumulado para ese archivo.
+        """
+
+    def related_files(self, file_path: Path) -> Set[Path]:
+        """
+        Archivos cuyas violaciones dependen del archivo por el estado entre archivos.
+
+        Lo usa el modo vigilancia (--watch) para volver a verificar, junto a un
+        archivo modificado, los que comparten con él localizadores o steps.
+        """
+        return set()
+
     def check_project(self, project_path: Path) -> List[Violation]:
         """
         Verificar violaciones a nivel de proyecto (ej. estructura de directorios ausente).
@@ -111,7 +217,7 @@ class BaseChecker(ABC):
         return file_path.suffix == ".py"
 
     # Extensiones JS/TS compartidas por todos los checkers
-    _JS_EXTENSIONS = frozenset({".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"})
+    _JS_EXTENSIONS = JS_EXTENSIONS
 
     # Extensiones soportadas por el análisis multilenguaje
     _SUPPORTED_EXTENSIONS = frozenset(
@@ -156,17 +262,7 @@ class BaseChecker(ABC):
 
     def _is_test_function(self, func: ParsedFunction, extension: str) -> bool:
         """Determina si una función/método es un test (multilenguaje)."""
-        if extension == ".py":
-            return func.name.startswith("test_")
-        if extension == ".java":
-            test_annotations = {"Test", "ParameterizedTest", "RepeatedTest"}
-            return any(d in test_annotations for d in func.decorators)
-        if extension == ".cs":
-            test_attributes = {"Test", "Fact", "Theory", "TestMethod"}
-            return any(d in test_attributes for d in func.decorators)
-        if extension in self._JS_EXTENSIONS:
-            return func.name in {"it", "test"} or func.name.startswith("test")
-        return False
+        return is_test_function(func, extension)
 
     @staticmethod
     def _get_config_for_extension(extension: str, config_map: dict):
@@ -179,9 +275,7 @@ class BaseChecker(ABC):
         Returns:
             El valor correspondiente al lenguaje, o config_map["default"] si existe, o set().
         """
-        ext = extension.lstrip(".")
-        if ext in ("js", "ts", "jsx", "tsx", "mjs", "cjs"):
-            ext = "js"
+        ext = language_key(extension)
         return config_map.get(ext, config_map.get("default", set()))
 
     def __repr__(self) -> str:
@@ -17,12 +17,13 @@ import ast
 import logging
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import Callable, List, Optional, Dict, Set
 
 from gtaa_validator.checkers.base import BaseChecker
-from gtaa_validator.file_utils import read_file_safe
+from gtaa_validator.checkers.file_facts import FileFacts
+from gtaa_validator.file_utils import find_files, read_file_safe
 from gtaa_validator.models import Violation, ViolationType, Severity
-from gtaa_validator.parsers.gherkin_parser import GherkinParser
+from gtaa_validator.parsers.gherkin_parser import GherkinFeature, GherkinParser
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,24 @@ class BDDChecker(BaseChecker):
     - DUPLICATE_STEP_PATTERN: misma regex en múltiples step files
     """
 
+    VIOLATION_TYPES = frozenset({
+        ViolationType.GHERKIN_IMPLEMENTATION_DETAIL,
+        ViolationType.STEP_DEF_DIRECT_BROWSER_CALL,
+        ViolationType.STEP_DEF_TOO_COMPLEX,
+        ViolationType.MISSING_THEN_STEP,
+        ViolationType.DUPLICATE_STEP_PATTERN,
+    })
+
+    # Tipos por clase de archivo (si todos están excluidos, el archivo se omite)
+    _FEATURE_TYPES = frozenset({
+        ViolationType.GHERKIN_IMPLEMENTATION_DETAIL,
+        ViolationType.MISSING_THEN_STEP,
+    })
+    _STEP_DEF_TYPES = frozenset({
+        ViolationType.STEP_DEF_DIRECT_BROWSER_CALL,
+        ViolationType.STEP_DEF_TOO_COMPLEX,
+    })
+
     # Patrones técnicos que no deberían aparecer en archivos .feature
     IMPLEMENTATION_PATTERNS = [
         re.compile(r'//[\w\[\]@=\'"\.]+'),            # XPath
@@ -55,6 +74,26 @@ class BDDChecker(BaseChecker):
         re.compile(r'<[\w/]+>'),                        # HTML tags
     ]
 
+    # Categoría y ancla de cada patrón de IMPLEMENTATION_PATTERNS (mismo orden):
+    # (grupo, etiqueta, primeros caracteres, resto del ancla). Los primeros
+    # caracteres son literales distintos por categoría, así que en cada
+    # posición solo puede empezar una; el resto es un prefijo lineal del
+    # patrón (sin cuantificadores anidados ni contiguos). SELECT/INSERT
+    # incluyen las variantes Unicode que IGNORECASE equipara a S e I.
+    IMPLEMENTATION_CATEGORIES = [
+        ("xpath", "XPath", "/", r'/[\w\[\]@=\'"\.]'),
+        ("css_prefix", "selector CSS", "c", r'ss='),
+        ("css_id", "ID CSS", "#", r'[\w-]'),
+        ("css_class", "clase CSS", ".", r'[\w-]'),
+        ("selenium_by", "Selenium By", "B", r'y\.\w'),
+        ("data_attribute", "atributo data-", "[", r'data-[\w-]'),
+        ("url", "URL", "h", r'ttps?://\S'),
+        ("sql_select", "SQL", "Ss\u017f", r'(?i:ELECT)\s'),
+        ("sql_insert", "SQL", "Ii\u0130\u0131", r'(?i:NSERT)\s'),
+        ("localhost", "localhost", "l", r'ocalhost:\d'),
+        ("html_tag", "etiqueta HTML", "<", r'[\w/]'),
+    ]
+
     # Métodos de Selenium/Playwright que indican llamadas directas
     BROWSER_METHODS = {
         # Selenium
@@ -72,51 +111,125 @@ class BDDChecker(BaseChecker):
     # Umbral de líneas para step definitions complejas
     MAX_STEP_LINES = 15
 
+    # Prefiltro: condiciones necesarias sobre el código fuente por regla.
+    # DUPLICATE_STEP_PATTERN solo se evalúa en check_project().
+    TRIGGER_PATTERNS = {
+        ViolationType.GHERKIN_IMPLEMENTATION_DETAIL: tuple(
+            f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else p.pattern
+            for p in IMPLEMENTATION_PATTERNS
+        ),
+        ViolationType.MISSING_THEN_STEP: ("(?i:scenario)",),
+        ViolationType.STEP_DEF_DIRECT_BROWSER_CALL: tuple(sorted(BROWSER_METHODS)),
+        ViolationType.STEP_DEF_TOO_COMPLEX: ("(?i:given|when|then|step)",),
+        ViolationType.DUPLICATE_STEP_PATTERN: (),
+    }
+
     def __init__(self):
         super().__init__()
         self._parser = GherkinParser()
+        self._detail_scanner = _ImplementationDetailScanner(
+            self.IMPLEMENTATION_CATEGORIES, self.IMPLEMENTATION_PATTERNS,
+            confirmers={"sql_select": _match_sql_select},
+        )
         self._step_patterns: Dict[str, List[Path]] = {}  # pattern → [files]
+        # Step patterns de cada step file leído en check_project (modo shard)
+        self.file_step_patterns: Dict[Path, List[str]] = {}
 
     def can_check(self, file_path: Path) -> bool:
         """Verificar archivos .feature y step definitions Python."""
         if file_path.suffix == ".feature":
-            return True
+            return not self._FEATURE_TYPES <= self.excluded_types
         if file_path.suffix == ".py":
-            return self._is_step_definition_path(file_path)
+            return (
+                not self._STEP_DEF_TYPES <= self.excluded_types
+                and self._is_step_definition_path(file_path)
+            )
         return False
 
+    def _rule_applies_to(self, violation_type: ViolationType, language: str) -> bool:
+        """Reglas de .feature solo para Gherkin; las de step definitions solo para Python."""
+        if violation_type in self._FEATURE_TYPES:
+            return language == "feature"
+        if violation_type in self._STEP_DEF_TYPES:
+            return language == "py"
+        return True
+
     def check(self, file_path: Path, tree: Optional[ast.Module] = None,
-              file_type: str = "unknown") -> List[Violation]:
+              file_type: str = "unknown",
+              facts: Optional[FileFacts] = None) -> List[Violation]:
         """
         Verificar un archivo BDD en busca de violaciones.
 
         Para .feature: GHERKIN_IMPLEMENTATION_DETAIL, MISSING_THEN_STEP
         Para step defs: STEP_DEF_DIRECT_BROWSER_CALL, STEP_DEF_TOO_COMPLEX
+
+        Si se reciben facts, se reutilizan su contenido y su AST de Python
+        en lugar de releer y reparsear el archivo.
         """
         if file_path.suffix == ".feature":
-            return self._check_feature_file(file_path)
+            return self._check_feature_file(file_path, facts)
         else:
-            return self._check_step_definition(file_path, tree)
+            if facts is not None:
+                tree = facts.python_ast
+            elif not isinstance(tree, ast.Module):
+                # ParseResult u otro resultado no-AST: reparsear con ast
+                tree = None
+            return self._check_step_definition(file_path, tree, facts)
+
+    def related_files(self, file_path: Path) -> Set[Path]:
+        """Archivos de steps que comparten algún step pattern con el archivo."""
+        related = {
+            other
+            for files in self._step_patterns.values() if file_path in files
+            for other in files
+        }
+        related.discard(file_path)
+        return related
 
     def check_project(self, project_path: Path) -> List[Violation]:
         """
         Verificación a nivel de proyecto: detectar step patterns duplicados.
 
-        Escanea todos los archivos de step definitions y detecta decoradores
-        @given/@when/@then con la misma regex en múltiples archivos.
+        Escanea todos los archivos de step definitions (en orden de ruta) y
+        detecta decoradores @given/@when/@then con la misma regex en
+        múltiples archivos. En modo shard solo se leen los archivos del
+        shard y los duplicados los calcula el merge.
         """
         self._step_patterns = {}
+        self.file_step_patterns = {}
         violations = []
 
-        # Recolectar patterns de todos los step files
-        step_files = list(project_path.rglob("*.py"))
+        if not self.is_rule_enabled(ViolationType.DUPLICATE_STEP_PATTERN):
+            return violations
+
+        # Recolectar patterns de todos los step files (desde la caché
+        # incremental si el archivo no cambió desde la última ejecución)
+        step_files = sorted(find_files(project_path, ".py"))
         for py_file in step_files:
             if not self._is_step_definition_path(py_file):
                 continue
-            self._collect_step_patterns(py_file)
+            if self.shard_filter is not None and not self.shard_filter(py_file):
+                continue
+            patterns = None
+            if self.summary_cache is not None:
+                patterns = self.summary_cache.lookup(py_file, "step_patterns")
+            if patterns is None:
+                patterns = self._read_step_patterns(py_file)
+                if self.summary_cache is not None:
+                    self.summary_cache.store(py_file, "step_patterns", patterns)
+            self.file_step_patterns[py_file] = patterns
+            for pattern in patterns:
+                self._step_patterns.setdefault(pattern, []).append(py_file)
+
+        if self.shard_filter is not None:
+            return violations
+        return self.duplicate_step_violations(self._step_patterns)
 
-        # Detectar duplicados
-        for pattern, files in self._step_patterns.items():
+    @staticmethod
+    def duplicate_step_violations(step_patterns: Dict[str, List[Path]]) -> List[Violation]:
+        """Violaciones DUPLICATE_STEP_PATTERN a partir de pattern -> archivos (en orden)."""
+        violations = []
+        for pattern, files in step_patterns.items():
             if len(files) > 1:
                 # Reportar en el segundo archivo (el duplicado)
                 for dup_file in files[1:]:
@@ -129,87 +242,84 @@ class BDDChecker(BaseChecker):
                             f"También definido en: {files[0]}"
                         ),
                     ))
-
         return violations
 
     # --- Verificación de archivos .feature ---
 
-    def _check_feature_file(self, file_path: Path) -> List[Violation]:
+    def _check_feature_file(self, file_path: Path,
+                            facts: Optional[FileFacts] = None) -> List[Violation]:
         """Verificar un archivo .feature en busca de violaciones."""
         violations = []
 
-        feature = self._parser.parse_file(file_path)
-        if feature is None:
+        content = facts.source if facts is not None else read_file_safe(file_path)
+        if not content:
             return violations
 
-        # Leer contenido para regex
-        content = read_file_safe(file_path)
-        if not content:
+        feature = self._parser.parse(content)
+        if feature is None:
             return violations
 
-        lines = content.splitlines()
+        lines = facts.lines if facts is not None else content.splitlines()
 
         # 1. GHERKIN_IMPLEMENTATION_DETAIL: buscar detalles técnicos en steps
-        for scenario in feature.scenarios:
-            for step in scenario.steps:
-                for pattern in self.IMPLEMENTATION_PATTERNS:
-                    if pattern.search(step.text):
-                        violations.append(Violation(
-                            violation_type=ViolationType.GHERKIN_IMPLEMENTATION_DETAIL,
-                            severity=Severity.HIGH,
-                            file_path=file_path,
-                            line_number=step.line,
-                            message=(
-                                f"El step '{step.keyword} {step.text}' contiene "
-                                "detalles de implementación que deberían estar en step definitions"
-                            ),
-                            code_snippet=lines[step.line - 1].strip() if step.line <= len(lines) else "",
-                        ))
-                        break  # Un match por step es suficiente
-
-        # También verificar Background
-        if feature.background:
-            for step in feature.background.steps:
-                for pattern in self.IMPLEMENTATION_PATTERNS:
-                    if pattern.search(step.text):
-                        violations.append(Violation(
-                            violation_type=ViolationType.GHERKIN_IMPLEMENTATION_DETAIL,
-                            severity=Severity.HIGH,
-                            file_path=file_path,
-                            line_number=step.line,
-                            message=(
-                                f"El step '{step.keyword} {step.text}' contiene "
-                                "detalles de implementación que deberían estar en step definitions"
-                            ),
-                            code_snippet=lines[step.line - 1].strip() if step.line <= len(lines) else "",
-                        ))
-                        break
+        if self.is_rule_enabled(ViolationType.GHERKIN_IMPLEMENTATION_DETAIL):
+            violations.extend(self._check_implementation_details(file_path, feature, lines))
 
         # 2. MISSING_THEN_STEP: scenarios sin verificación
-        for scenario in feature.scenarios:
-            if not scenario.has_then and len(scenario.steps) > 0:
-                violations.append(Violation(
-                    violation_type=ViolationType.MISSING_THEN_STEP,
-                    severity=Severity.MEDIUM,
-                    file_path=file_path,
-                    line_number=scenario.line,
-                    message=(
-                        f"El Scenario '{scenario.name}' no tiene step Then "
-                        "(sin verificación de resultado)"
-                    ),
-                    code_snippet=lines[scenario.line - 1].strip() if scenario.line <= len(lines) else "",
-                ))
+        if self.is_rule_enabled(ViolationType.MISSING_THEN_STEP):
+            for scenario in feature.scenarios:
+                if not scenario.has_then and len(scenario.steps) > 0:
+                    violations.append(Violation(
+                        violation_type=ViolationType.MISSING_THEN_STEP,
+                        severity=Severity.MEDIUM,
+                        file_path=file_path,
+                        line_number=scenario.line,
+                        message=(
+                            f"El Scenario '{scenario.name}' no tiene step Then "
+                            "(sin verificación de resultado)"
+                        ),
+                        code_snippet=lines[scenario.line - 1].strip() if scenario.line <= len(lines) else "",
+                    ))
+
+        return violations
+
+    def _check_implementation_details(self, file_path: Path, feature: GherkinFeature,
+                                      lines: List[str]) -> List[Violation]:
+        """Detectar detalles técnicos en los steps de Scenarios y Background."""
+        violations = []
+
+        steps = [step for scenario in feature.scenarios for step in scenario.steps]
+        if feature.background:
+            steps.extend(feature.background.steps)
+
+        for step in steps:
+            categories = self._detail_scanner.scan(step.text)
+            if not categories:
+                continue
+            violations.append(Violation(
+                violation_type=ViolationType.GHERKIN_IMPLEMENTATION_DETAIL,
+                severity=Severity.HIGH,
+                file_path=file_path,
+                line_number=step.line,
+                message=(
+                    f"El step '{step.keyword} {step.text}' contiene "
+                    f"detalles de implementación ({', '.join(categories)}) "
+                    "que deberían estar en step definitions"
+                ),
+                code_snippet=lines[step.line - 1].strip() if step.line <= len(lines) else "",
+            ))
 
         return violations
 
     # --- Verificación de step definitions ---
 
     def _check_step_definition(self, file_path: Path,
-                               tree: Optional[ast.Module] = None) -> List[Violation]:
+                               tree: Optional[ast.Module] = None,
+                               facts: Optional[FileFacts] = None) -> List[Violation]:
         """Verificar step definitions en busca de violaciones."""
         violations = []
 
-        source_code = read_file_safe(file_path)
+        source_code = facts.source if facts is not None else read_file_safe(file_path)
         if not source_code:
             return violations
 
@@ -219,7 +329,7 @@ class BDDChecker(BaseChecker):
             except SyntaxError:
                 return violations
 
-        lines = source_code.splitlines()
+        lines = facts.lines if facts is not None else source_code.splitlines()
 
         for node in ast.walk(tree):
             if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -230,11 +340,13 @@ class BDDChecker(BaseChecker):
                 continue
 
             # 1. STEP_DEF_DIRECT_BROWSER_CALL
-            browser_violations = self._check_browser_calls_in_step(node, file_path, lines)
-            violations.extend(browser_violations)
+            if self.is_rule_enabled(ViolationType.STEP_DEF_DIRECT_BROWSER_CALL):
+                browser_violations = self._check_browser_calls_in_step(node, file_path, lines)
+                violations.extend(browser_violations)
 
             # 2. STEP_DEF_TOO_COMPLEX
-            if hasattr(node, "end_lineno") and node.end_lineno:
+            if (self.is_rule_enabled(ViolationType.STEP_DEF_TOO_COMPLEX)
+                    and hasattr(node, "end_lineno") and node.end_lineno):
                 func_lines = node.end_lineno - node.lineno + 1
                 if func_lines > self.MAX_STEP_LINES:
                     line_text = lines[node.lineno - 1].strip() if node.lineno <= len(lines) else ""
@@ -333,16 +445,17 @@ class BDDChecker(BaseChecker):
             return self._get_object_name(node.value)
         return ""
 
-    def _collect_step_patterns(self, file_path: Path):
-        """Recolectar step patterns de un archivo para detección de duplicados."""
+    def _read_step_patterns(self, file_path: Path) -> List[str]:
+        """Step patterns definidos en un archivo, en orden (para detectar duplicados)."""
+        patterns: List[str] = []
         try:
             source = read_file_safe(file_path)
             if not source:
-                return
+                return patterns
             tree = ast.parse(source)
         except Exception as e:
             logger.debug("Error parsing step patterns from %s: %s", file_path, e)
-            return
+            return patterns
 
         for node in ast.walk(tree):
             if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -355,7 +468,108 @@ class BDDChecker(BaseChecker):
                 if isinstance(decorator, ast.Call) and decorator.args:
                     arg = decorator.args[0]
                     if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                        pattern = arg.value
-                        if pattern not in self._step_patterns:
-                            self._step_patterns[pattern] = []
-                        self._step_patterns[pattern].append(file_path)
+                        patterns.append(arg.value)
+
+        return patterns
+
+
+class _ImplementationDetailScanner:
+    """
+    Escáner combinado de detalles de implementación en texto de steps.
+
+    Compila las anclas de todas las categorías en una única regex y recorre
+    cada línea una sola vez. Cada alternativa empieza por un carácter
+    literal, consume solo ese carácter y marca su categoría con un grupo
+    vacío con nombre; así re puede saltar directamente a los caracteres
+    candidatos y ninguna coincidencia oculta a otra que empiece después.
+    Cuando un ancla coincide, el patrón completo de su categoría se confirma
+    desde esa misma posición, por lo que el resultado equivale a ejecutar
+    search() con cada patrón por separado.
+
+    Seguro frente a ReDoS por construcción: las anclas son lineales, cada
+    confirmación parte de una posición donde el prefijo literal ya coincidió
+    y el patrón SQL (con repeticiones contiguas que se solapan) se confirma
+    con un recorrido lineal en lugar de con backtracking.
+    """
+
+    def __init__(self, categories, patterns, confirmers=None):
+        confirmers = confirmers or {}
+        self._labels: Dict[str, str] = {}
+        self._confirm: Dict[str, Callable[[str, int], object]] = {}
+        self._group_of: Dict[str, str] = {}
+        alternatives = []
+        for (group, label, first_chars, rest), pattern in zip(categories, patterns):
+            self._labels[group] = label
+            self._confirm[group] = confirmers.get(group, pattern.match)
+            for i, char in enumerate(first_chars):
+                name = f"{group}_{i}"
+                self._group_of[name] = group
+                alternatives.append(f"{re.escape(char)}(?P<{name}>)(?={rest})")
+        self._scanner = re.compile("|".join(alternatives))
+
+    def scan(self, text: str) -> List[str]:
+        """Etiquetas de las categorías presentes en el texto (sin repetir, en orden)."""
+        found: Set[str] = set()
+        for match in self._scanner.finditer(text):
+            group = self._group_of[match.lastgroup]
+            if group in found:
+                continue
+            if self._confirm[group](text, match.start()):
+                found.add(group)
+                if len(found) == len(self._labels):
+                    break
+
+        return list(dict.fromkeys(
+            label for group, label in self._labels.items() if group in found
+        ))
+
+
+_FROM_RE = re.compile(r"FROM", re.IGNORECASE)
+_SPACE_FROM_RE = re.compile(r"\sFROM", re.IGNORECASE)
+_NON_SPACE_RE = re.compile(r"\S")
+_SELECT_LEN = len("SELECT")
+_SQL_MAX_BODY = 500
+
+
+def _match_sql_select(text: str, pos: int) -> bool:
+    """
+    Equivalente lineal de re.match(r'(?i)SELECT\\s+.{1,500}\\s+FROM', text, pos).
+
+    El cuerpo (.{1,500}) va del primer carácter no blanco tras SELECT al
+    último no blanco antes de un FROM precedido de blanco: debe medir como
+    mucho 500 caracteres y no contener saltos de línea. Eso equivale a que
+    el FROM empiece antes del primer no blanco situado a 500 caracteres del
+    cuerpo o tras el primer salto de línea. Si todo el hueco es blanco
+    basta con que tenga algún carácter interior que no sea salto de línea.
+
+    Cada búsqueda está acotada a la ventana de 500 caracteres salvo la del
+    bloque de blancos que la cierra, así que el coste total es lineal.
+    """
+    gap_start = pos + _SELECT_LEN
+    if gap_start >= len(text) or not text[gap_start].isspace():
+        return False
+
+    match = _NON_SPACE_RE.search(text, gap_start)
+    if match is None:
+        return False
+    body_start = match.start()
+
+    # Hueco completamente blanco: SELECT <blancos> FROM
+    if _FROM_RE.match(text, body_start):
+        if any(c != "\n" for c in text[gap_start + 1:body_start - 1]):
+            return True
+
+    # Límite para el inicio del FROM: primer no blanco tras un salto de línea
+    # del cuerpo o, si no lo hay, primer no blanco a partir de la ventana.
+    window_end = body_start + _SQL_MAX_BODY
+    limit = None
+    newline = text.find("\n", body_start, window_end)
+    if newline != -1:
+        match = _NON_SPACE_RE.search(text, newline + 1, window_end)
+        if match is not None:
+            limit = match.start()
+    if limit is None:
+        match = _NON_SPACE_RE.search(text, window_end)
+        limit = match.start() if match is not None else len(text)
+
+    return _SPACE_FROM_RE.search(text, body_start, limit + len("FROM")) is not None
@@ -16,16 +16,17 @@ Soporta: Python, Java, JavaScript/TypeScript, C#
 
 import ast
 import logging
+import re
 from pathlib import Path
 from typing import List, Optional, Set, Union
 
 logger = logging.getLogger(__name__)
 
 from gtaa_validator.checkers.base import BaseChecker
-from gtaa_validator.file_utils import read_file_safe
+from gtaa_validator.checkers.file_facts import FileFacts, resolve_file_facts
 from gtaa_validator.models import Violation, ViolationType, Severity
 from gtaa_validator.parsers.treesitter_base import (
-    ParseResult, ParsedClass, ParsedFunction, ParsedCall
+    ParseResult, ParsedFunction, ParsedCall
 )
 
 
@@ -54,6 +55,8 @@ class DefinitionChecker(BaseChecker):
         });
     """
 
+    VIOLATION_TYPES = frozenset({ViolationType.ADAPTATION_IN_DEFINITION})
+
     # --- Python: Selenium/Playwright methods ---
     BROWSER_METHODS_PYTHON: Set[str] = {
         # Selenium
@@ -97,6 +100,14 @@ class DefinitionChecker(BaseChecker):
     BROWSER_OBJECTS_JS: Set[str] = {"page", "browser", "context", "cy"}
     BROWSER_OBJECTS_CSHARP: Set[str] = {"driver", "_driver", "Driver", "WebDriver"}
 
+    # Prefiltro: toda violación exige que aparezca el nombre de un objeto browser
+    TRIGGER_PATTERNS = {
+        ViolationType.ADAPTATION_IN_DEFINITION: tuple(sorted(map(re.escape, (
+            BROWSER_OBJECTS_PYTHON | BROWSER_OBJECTS_JAVA
+            | BROWSER_OBJECTS_JS | BROWSER_OBJECTS_CSHARP
+        )))),
+    }
+
     def __init__(self):
         """Inicializar el DefinitionChecker."""
         super().__init__()
@@ -107,7 +118,8 @@ class DefinitionChecker(BaseChecker):
 
     def check(self, file_path: Path,
               tree_or_result: Optional[Union[ast.Module, ParseResult]] = None,
-              file_type: str = "unknown") -> List[Violation]:
+              file_type: str = "unknown",
+              facts: Optional[FileFacts] = None) -> List[Violation]:
         """
         Verificar un archivo de test en busca de violaciones ADAPTATION_IN_DEFINITION.
 
@@ -115,6 +127,7 @@ class DefinitionChecker(BaseChecker):
             file_path: Ruta al archivo de test a verificar
             tree_or_result: AST (Python legacy) o ParseResult (multi-lang)
             file_type: Clasificación del archivo ('api', 'ui' o 'unknown')
+            facts: Hechos precalculados del archivo (opcional)
 
         Returns:
             Lista de objetos Violation
@@ -124,35 +137,14 @@ class DefinitionChecker(BaseChecker):
             return []
 
         violations: List[Violation] = []
-        extension = file_path.suffix.lower()
 
         try:
-            source_code = read_file_safe(file_path)
-            if not source_code:
+            facts = resolve_file_facts(file_path, tree_or_result, facts, file_type)
+            if facts is None or facts.parse_result is None:
                 return violations
-            lines = source_code.splitlines()
-
-            # Obtener ParseResult
-            if isinstance(tree_or_result, ParseResult):
-                result = tree_or_result
-            elif isinstance(tree_or_result, ast.Module):
-                # Legacy Python AST - convertir a ParseResult
-                from gtaa_validator.parsers.python_parser import PythonParser
-                parser = PythonParser()
-                result = parser.parse(source_code)
-            else:
-                # Sin resultado previo - parsear
-                from gtaa_validator.parsers.treesitter_base import get_parser_for_file
-                parser = get_parser_for_file(file_path)
-                if parser:
-                    result = parser.parse(source_code)
-                else:
-                    return violations
 
             # Detectar llamadas a browser API en funciones de test
-            violations.extend(self._check_browser_calls(
-                file_path, result, lines, extension
-            ))
+            violations.extend(self._check_browser_calls(file_path, facts))
 
         except SyntaxError:
             pass
@@ -161,98 +153,65 @@ class DefinitionChecker(BaseChecker):
 
         return violations
 
-    def _check_browser_calls(
-        self, file_path: Path, result: ParseResult, lines: List[str], extension: str
-    ) -> List[Violation]:
+    def _check_browser_calls(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar llamadas directas a browser API en funciones de test."""
         violations: List[Violation] = []
+        result = facts.parse_result
 
-        browser_methods = self._get_browser_methods(extension)
-        browser_objects = self._get_browser_objects(extension)
+        browser_methods = self._get_browser_methods(facts.extension)
+        browser_objects = self._get_browser_objects(facts.extension)
 
         # Para JS/TS: los tests son callbacks, no funciones nombradas.
         # Si can_check() retorna True, sabemos que es un archivo de test.
         # En archivos de test JS/TS, cualquier llamada a browser API es violación.
-        if extension in {".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"}:
+        if facts.language == "js":
             for call in result.calls:
-                # Verificar si es una llamada a browser API
-                is_browser_method = call.method_name in browser_methods
-                is_browser_object = call.object_name in browser_objects
-
-                if is_browser_method and is_browser_object:
-                    snippet = lines[call.line - 1].strip() if call.line <= len(lines) else call.full_text
-                    violations.append(
-                        Violation(
-                            violation_type=ViolationType.ADAPTATION_IN_DEFINITION,
-                            severity=Severity.CRITICAL,
-                            file_path=file_path,
-                            line_number=call.line,
-                            message=(
-                                f"El código de test llama directamente a {call.object_name}.{call.method_name}() "
-                                f"en lugar de usar un método de Page Object. "
-                                f"Según gTAA, la capa de Definición (tests) solo debe llamar "
-                                f"a la capa de Adaptación (Page Objects), no a las APIs del navegador directamente."
-                            ),
-                            code_snippet=snippet,
-                            recommendation=ViolationType.ADAPTATION_IN_DEFINITION.get_recommendation()
-                        )
-                    )
+                if call.method_name in browser_methods and call.object_name in browser_objects:
+                    violations.append(self._make_violation(file_path, call, facts))
             return violations
 
-        # Verificar funciones de nivel superior (Python)
-        for func in result.functions:
-            if self._is_test_function(func, extension):
-                violations.extend(self._check_function_for_browser_calls(
-                    file_path, func, result.calls, lines, browser_methods, browser_objects
-                ))
-
-        # Verificar métodos de clase (Java, C#, Python class-based)
-        for cls in result.classes:
-            for method in cls.methods:
-                if self._is_test_function(method, extension):
-                    violations.extend(self._check_function_for_browser_calls(
-                        file_path, method, result.calls, lines, browser_methods, browser_objects
-                    ))
+        # Funciones de nivel superior (Python) y métodos de clase (Java, C#, Python)
+        for func in facts.test_functions:
+            violations.extend(self._check_function_for_browser_calls(
+                file_path, func, facts, browser_methods, browser_objects
+            ))
 
         return violations
 
     def _check_function_for_browser_calls(
-        self, file_path: Path, func: ParsedFunction, all_calls: List[ParsedCall],
-        lines: List[str], browser_methods: Set[str], browser_objects: Set[str]
+        self, file_path: Path, func: ParsedFunction, facts: FileFacts,
+        browser_methods: Set[str], browser_objects: Set[str]
     ) -> List[Violation]:
         """Verificar una función de test por llamadas a browser API."""
         violations = []
 
-        for call in all_calls:
+        for call in facts.parse_result.calls:
             # Verificar si la llamada está dentro de la función
             if not (func.line_start <= call.line <= func.line_end):
                 continue
 
-            # Verificar si es una llamada a browser API
-            is_browser_method = call.method_name in browser_methods
-            is_browser_object = call.object_name in browser_objects
-
-            if is_browser_method and is_browser_object:
-                snippet = lines[call.line - 1].strip() if call.line <= len(lines) else call.full_text
-                violations.append(
-                    Violation(
-                        violation_type=ViolationType.ADAPTATION_IN_DEFINITION,
-                        severity=Severity.CRITICAL,
-                        file_path=file_path,
-                        line_number=call.line,
-                        message=(
-                            f"El código de test llama directamente a {call.object_name}.{call.method_name}() "
-                            f"en lugar de usar un método de Page Object. "
-                            f"Según gTAA, la capa de Definición (tests) solo debe llamar "
-                            f"a la capa de Adaptación (Page Objects), no a las APIs del navegador directamente."
-                        ),
-                        code_snippet=snippet,
-                        recommendation=ViolationType.ADAPTATION_IN_DEFINITION.get_recommendation()
-                    )
-                )
+            if call.method_name in browser_methods and call.object_name in browser_objects:
+                violations.append(self._make_violation(file_path, call, facts))
 
         return violations
 
+    def _make_violation(self, file_path: Path, call: ParsedCall, facts: FileFacts) -> Violation:
+        """Construye la violación ADAPTATION_IN_DEFINITION para una llamada."""
+        return Violation(
+            violation_type=ViolationType.ADAPTATION_IN_DEFINITION,
+            severity=Severity.CRITICAL,
+            file_path=file_path,
+            line_number=call.line,
+            message=(
+                f"El código de test llama directamente a {call.object_name}.{call.method_name}() "
+                f"en lugar de usar un método de Page Object. "
+                f"Según gTAA, la capa de Definición (tests) solo debe llamar "
+                f"a la capa de Adaptación (Page Objects), no a las APIs del navegador directamente."
+            ),
+            code_snippet=facts.snippet(call.line, call.full_text),
+            recommendation=ViolationType.ADAPTATION_IN_DEFINITION.get_recommendation()
+        )
+
     def _get_browser_methods(self, extension: str) -> Set[str]:
         """Obtiene los métodos de browser API para un lenguaje."""
         return self._get_config_for_extension(extension, {
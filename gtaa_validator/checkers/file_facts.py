@@ -0,0 +1,223 @@
+"""
+Hechos precalculados por archivo para los checkers de gTAA Validator.
+
+StaticAnalyzer lee y parsea cada archivo una sola vez y construye un FileFacts
+con todo lo que los checkers necesitan: líneas, funciones de test, clases
+Page Object, métodos de setup/teardown y la clave de lenguaje usada para
+elegir la configuración por lenguaje. Así cada checker deja de repetir el
+split de líneas, la búsqueda de tests y el parseo AST de Python.
+
+Los checkers siguen aceptando llamadas sin FileFacts (uso directo en tests o
+scripts): en ese caso lo construyen ellos mismos con build_file_facts().
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from gtaa_validator.file_utils import read_file_safe
+from gtaa_validator.parsers.treesitter_base import (
+    ParseResult, ParsedClass, ParsedFunction, get_parser_for_file
+)
+
+# Extensiones JS/TS (comparten configuración bajo la clave "js")
+JS_EXTENSIONS = frozenset({".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"})
+
+# Anotaciones/atributos que marcan un método de test
+_TEST_ANNOTATIONS_JAVA = frozenset({"Test", "ParameterizedTest", "RepeatedTest"})
+_TEST_ATTRIBUTES_CSHARP = frozenset({"Test", "Fact", "Theory", "TestMethod"})
+
+# Nombres de métodos de setup/teardown (Python unittest/pytest, JS hooks)
+_SETUP_TEARDOWN_NAMES = frozenset({
+    "setUp", "tearDown", "setUpClass", "tearDownClass",
+    "setup_method", "teardown_method", "setup_class", "teardown_class",
+    "setup_function", "teardown_function", "setup_module", "teardown_module",
+    "beforeEach", "afterEach", "beforeAll", "afterAll", "before", "after",
+})
+
+# Anotaciones/atributos de setup/teardown (JUnit, TestNG, NUnit, MSTest, SpecFlow)
+_SETUP_TEARDOWN_DECORATORS = frozenset({
+    "BeforeEach", "AfterEach", "BeforeAll", "AfterAll",
+    "Before", "After", "BeforeClass", "AfterClass",
+    "BeforeMethod", "AfterMethod", "BeforeSuite", "AfterSuite",
+    "SetUp", "TearDown", "OneTimeSetUp", "OneTimeTearDown",
+    "TestInitialize", "TestCleanup", "ClassInitialize", "ClassCleanup",
+    "BeforeScenario", "AfterScenario",
+})
+
+
+def language_key(extension: str) -> str:
+    """Normaliza una extensión a la clave de lenguaje ("py", "java", "js", "cs")."""
+    ext = extension.lower().lstrip(".")
+    if f".{ext}" in JS_EXTENSIONS:
+        return "js"
+    return ext
+
+
+def is_test_function(func: ParsedFunction, extension: str) -> bool:
+    """Determina si una función/método es un test (multilenguaje)."""
+    if extension == ".py":
+        return func.name.startswith("test_")
+    if extension == ".java":
+        return any(d in _TEST_ANNOTATIONS_JAVA for d in func.decorators)
+    if extension == ".cs":
+        return any(d in _TEST_ATTRIBUTES_CSHARP for d in func.decorators)
+    if extension in JS_EXTENSIONS:
+        return func.name in {"it", "test"} or func.name.startswith("test")
+    return False
+
+
+def is_setup_teardown(func: ParsedFunction) -> bool:
+    """Determina si una función/método es de setup o teardown (multilenguaje)."""
+    return (
+        func.name in _SETUP_TEARDOWN_NAMES
+        or any(d in _SETUP_TEARDOWN_DECORATORS for d in func.decorators)
+    )
+
+
+@dataclass
+class FileFacts:
+    """
+    Hechos de un archivo calculados una sola vez y compartidos por los checkers.
+
+    Atributos:
+        file_path: Ruta al archivo
+        source: Código fuente completo
+        lines: source.splitlines()
+        extension: Extensión en minúsculas (ej: ".py")
+        language: Clave de lenguaje para configuración ("py", "java", "js", "cs")
+        parse_result: ParseResult del parser del lenguaje (None si no aplica)
+        file_type: Clasificación del archivo ('api', 'ui', 'page_object', ...)
+        test_functions: Funciones y métodos de test (top-level primero)
+        page_object_classes: Clases marcadas como Page Object por el parser
+        setup_teardown_methods: Funciones/métodos de setup y teardown
+    """
+    file_path: Path
+    source: str
+    lines: List[str]
+    extension: str
+    language: str
+    parse_result: Optional[ParseResult] = None
+    file_type: str = "unknown"
+    test_functions: List[ParsedFunction] = field(default_factory=list)
+    page_object_classes: List[ParsedClass] = field(default_factory=list)
+    setup_teardown_methods: List[ParsedFunction] = field(default_factory=list)
+
+    @cached_property
+    def python_ast(self) -> Optional[ast.Module]:
+        """AST de Python (solo .py), parseado bajo demanda una única vez."""
+        if self.extension != ".py":
+            return None
+        try:
+            return ast.parse(self.source)
+        except SyntaxError:
+            return None
+
+    @cached_property
+    def function_spans(self) -> List[Tuple[int, int, str]]:
+        """(línea inicial, línea final, nombre) de funciones y métodos ("Clase.metodo")."""
+        if self.parse_result is None:
+            return []
+        spans = [(f.line_start, f.line_end, f.name) for f in self.parse_result.functions]
+        for cls in self.parse_result.classes:
+            spans.extend((m.line_start, m.line_end, f"{cls.name}.{m.name}") for m in cls.methods)
+        return spans
+
+    def enclosing_function(self, line: int) -> Optional[str]:
+        """Función o método más interno que contiene la línea (None si ninguno)."""
+        best: Optional[Tuple[int, str]] = None
+        for start, end, name in self.function_spans:
+            if start <= line <= end and (best is None or start >= best[0]):
+                best = (start, name)
+        return best[1] if best else None
+
+    def snippet(self, line: int, default: str = "") -> str:
+        """Línea indicada (1-indexed) sin espacios, o default si está fuera de rango."""
+        if 1 <= line <= len(self.lines):
+            return self.lines[line - 1].strip()
+        return default
+
+
+def build_file_facts(file_path: Path, source: str,
+                     parse_result: Optional[ParseResult] = None,
+                     file_type: str = "unknown") -> FileFacts:
+    """
+    Construye los FileFacts de un archivo a partir de su código fuente.
+
+    Args:
+        file_path: Ruta al archivo
+        source: Código fuente ya leído
+        parse_result: ParseResult previo (si None no se extraen funciones/clases)
+        file_type: Clasificación del archivo
+
+    Returns:
+        FileFacts con los datos derivados
+    """
+    extension = file_path.suffix.lower()
+    facts = FileFacts(
+        file_path=file_path,
+        source=source,
+        lines=source.splitlines(),
+        extension=extension,
+        language=language_key(extension),
+        parse_result=parse_result,
+        file_type=file_type,
+    )
+
+    if parse_result is None:
+        return facts
+
+    for func in parse_result.functions:
+        if is_test_function(func, extension):
+            facts.test_functions.append(func)
+        elif is_setup_teardown(func):
+            facts.setup_teardown_methods.append(func)
+
+    for cls in parse_result.classes:
+        if cls.is_page_object:
+            facts.page_object_classes.append(cls)
+        for method in cls.methods:
+            if is_test_function(method, extension):
+                facts.test_functions.append(method)
+            elif is_setup_teardown(method):
+                facts.setup_teardown_methods.append(method)
+
+    return facts
+
+
+def resolve_file_facts(file_path: Path,
+                       tree_or_result: Optional[object] = None,
+                       facts: Optional[FileFacts] = None,
+                       file_type: str = "unknown") -> Optional[FileFacts]:
+    """
+    Devuelve los FileFacts recibidos o los construye para uso directo de un checker.
+
+    Sin facts previos: lee el archivo, reutiliza el ParseResult si se recibió
+    uno, convierte un AST legacy de Python con PythonParser o parsea con el
+    parser del lenguaje.
+
+    Returns:
+        FileFacts, o None si el archivo está vacío o no se puede leer
+    """
+    if facts is not None:
+        return facts
+
+    source = read_file_safe(file_path)
+    if not source:
+        return None
+
+    if isinstance(tree_or_result, ParseResult):
+        result = tree_or_result
+    elif isinstance(tree_or_result, ast.Module):
+        # Legacy Python AST - convertir a ParseResult
+        from gtaa_validator.parsers.python_parser import PythonParser
+        result = PythonParser().parse(source)
+    else:
+        parser = get_parser_for_file(file_path)
+        result = parser.parse(source) if parser else None
+
+    return build_file_facts(file_path, source, result, file_type)
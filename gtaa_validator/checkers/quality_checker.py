@@ -19,16 +19,18 @@ Soporta: Python, Java, JavaScript/TypeScript, C#
 import ast
 import logging
 import re
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Optional, Union, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 from gtaa_validator.checkers.base import BaseChecker
-from gtaa_validator.file_utils import read_file_safe
+from gtaa_validator.checkers.file_facts import FileFacts, resolve_file_facts
 from gtaa_validator.models import Violation, ViolationType, Severity
 from gtaa_validator.parsers.treesitter_base import (
-    ParseResult, ParsedFunction, ParsedString
+    ParseResult, ParsedString
 )
 
 
@@ -49,6 +51,22 @@ class QualityChecker(BaseChecker):
     Soporta: Python, Java, JavaScript/TypeScript, C#
     """
 
+    VIOLATION_TYPES = frozenset({
+        ViolationType.HARDCODED_TEST_DATA,
+        ViolationType.LONG_TEST_FUNCTION,
+        ViolationType.POOR_TEST_NAMING,
+        ViolationType.BROAD_EXCEPTION_HANDLING,
+        ViolationType.HARDCODED_CONFIGURATION,
+        ViolationType.SHARED_MUTABLE_STATE,
+    })
+
+    # Tipos que requieren el AST de Python
+    _PYTHON_AST_TYPES = frozenset({
+        ViolationType.BROAD_EXCEPTION_HANDLING,
+        ViolationType.HARDCODED_CONFIGURATION,
+        ViolationType.SHARED_MUTABLE_STATE,
+    })
+
     # Patrones regex para datos hardcodeados
     EMAIL_PATTERN = re.compile(
         r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
@@ -78,15 +96,71 @@ class QualityChecker(BaseChecker):
     SLEEP_PATTERN = re.compile(r"time\.sleep\s*\(\s*\d|Thread\.sleep\s*\(\s*\d|sleep\s*\(\s*\d")
     ABSOLUTE_PATH_PATTERN = re.compile(r'["\'][A-Z]:\\|["\']/home/|["\']/usr/|["\']/tmp/')
 
+    # Escáneres combinados: una sola pasada por texto, la categoría de cada
+    # coincidencia se obtiene del grupo con nombre (match.lastgroup).
+    # - Datos (sobre el valor de cada string): el orden de las alternativas
+    #   es la prioridad del mensaje (email > URL > teléfono).
+    # - Configuración (sobre el código fuente completo): las coincidencias se
+    #   asignan a su línea por offset. Los espacios de sleep() no cruzan
+    #   saltos de línea para conservar la semántica línea a línea, y basta
+    #   "sleep" porque las variantes time.sleep/Thread.sleep lo contienen.
+    HARDCODED_DATA_SCANNER = re.compile(
+        f"(?P<email>{EMAIL_PATTERN.pattern})"
+        f"|(?P<url>{URL_PATTERN.pattern})"
+        f"|(?P<phone>{PHONE_PATTERN.pattern})"
+    )
+    _INLINE_SPACE = r"[^\S\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]"
+    HARDCODED_CONFIG_SCANNER = re.compile(
+        r"https?://(?:localhost|127\.0\.0\.1)(?P<localhost>)[:\d/]"
+        rf"|sleep(?P<sleep>){_INLINE_SPACE}*\({_INLINE_SPACE}*\d"
+        r"|[\"'](?P<absolute_path>)(?:[A-Z]:\\|/home/|/usr/|/tmp/)"
+    )
+
+    _DATA_PRIORITY = {"email": 0, "url": 1, "phone": 2}
+    _DATA_MESSAGES = {
+        "email": "Email hardcodeado encontrado: '{value}'. Los datos de test deben externalizarse.",
+        "url": "URL hardcodeada encontrada: '{value}'. Los datos de test deben externalizarse.",
+        "phone": "Teléfono hardcodeado encontrado: '{value}'. Los datos de test deben externalizarse.",
+        "password": "Posible contraseña/secreto hardcodeado. Los datos de test deben externalizarse.",
+    }
+    _CONFIG_MESSAGES = (
+        ("localhost", "URL localhost hardcodeada. Externalizar en configuración o fixtures."),
+        ("sleep", "sleep() hardcodeado. Usar esperas condicionales o configuración centralizada."),
+        ("absolute_path", "Path absoluto hardcodeado. Usar paths relativos o configuración."),
+    )
+
     MAX_TEST_LINES = 50
 
+    # Prefiltro: condiciones necesarias sobre el código fuente por regla.
+    # Las reglas de funciones de test exigen algún marcador de test
+    # (test_, @Test, [Fact], [Theory], it(...), describe(...)).
+    _TEST_MARKERS = (r"(?i:test)", "Fact", "Theory", r"\bit\b", "describe")
+    TRIGGER_PATTERNS = {
+        ViolationType.HARDCODED_TEST_DATA: (
+            "@", "https?://", PHONE_PATTERN.pattern,
+            "(?i:" + "|".join(sorted(PASSWORD_KEYWORDS)) + ")",
+        ),
+        ViolationType.LONG_TEST_FUNCTION: _TEST_MARKERS,
+        ViolationType.POOR_TEST_NAMING: _TEST_MARKERS,
+        ViolationType.BROAD_EXCEPTION_HANDLING: ("except",),
+        ViolationType.HARDCODED_CONFIGURATION: (
+            LOCALHOST_PATTERN.pattern, SLEEP_PATTERN.pattern, ABSOLUTE_PATH_PATTERN.pattern,
+        ),
+        ViolationType.SHARED_MUTABLE_STATE: (r"[\[{]", "list", "dict", "set", "global"),
+    }
+
     def can_check(self, file_path: Path) -> bool:
         """True para archivos de test en cualquier lenguaje soportado."""
         return self._is_test_file(file_path)
 
+    def _rule_applies_to(self, violation_type: ViolationType, language: str) -> bool:
+        """Las reglas basadas en AST de Python solo aplican a archivos .py."""
+        return language == "py" or violation_type not in self._PYTHON_AST_TYPES
+
     def check(self, file_path: Path,
               tree_or_result: Optional[Union[ast.Module, ParseResult]] = None,
-              file_type: str = "unknown") -> List[Violation]:
+              file_type: str = "unknown",
+              facts: Optional[FileFacts] = None) -> List[Violation]:
         """
         Verificar un archivo de test en busca de violaciones de calidad.
 
@@ -94,47 +168,35 @@ class QualityChecker(BaseChecker):
             file_path: Ruta al archivo a verificar
             tree_or_result: AST (Python legacy) o ParseResult (multi-lang)
             file_type: Clasificación del archivo
+            facts: Hechos precalculados del archivo (opcional)
         """
         violations: List[Violation] = []
-        extension = file_path.suffix.lower()
 
         try:
-            source_code = read_file_safe(file_path)
-            if not source_code:
+            facts = resolve_file_facts(file_path, tree_or_result, facts, file_type)
+            if facts is None or facts.parse_result is None:
                 return violations
-            lines = source_code.splitlines()
-
-            # Obtener ParseResult
-            if isinstance(tree_or_result, ParseResult):
-                result = tree_or_result
-            elif isinstance(tree_or_result, ast.Module):
-                # Legacy Python AST - convertir a ParseResult
-                from gtaa_validator.parsers.python_parser import PythonParser
-                parser = PythonParser()
-                result = parser.parse(source_code)
-            else:
-                # Sin resultado previo - parsear
-                from gtaa_validator.parsers.treesitter_base import get_parser_for_file
-                parser = get_parser_for_file(file_path)
-                if parser:
-                    result = parser.parse(source_code)
-                else:
-                    return violations
 
             # Verificaciones agnósticas al lenguaje
-            violations.extend(self._check_hardcoded_data(file_path, result, lines, extension))
-            violations.extend(self._check_long_functions(file_path, result, lines, extension))
-            violations.extend(self._check_test_naming(file_path, result, lines, extension))
-
-            # Verificaciones específicas de Python (requieren AST)
-            if extension == ".py":
-                try:
-                    tree = ast.parse(source_code)
+            if self.is_rule_enabled(ViolationType.HARDCODED_TEST_DATA):
+                violations.extend(self._check_hardcoded_data(file_path, facts))
+            if self.is_rule_enabled(ViolationType.LONG_TEST_FUNCTION):
+                violations.extend(self._check_long_functions(file_path, facts))
+            if self.is_rule_enabled(ViolationType.POOR_TEST_NAMING):
+                violations.extend(self._check_test_naming(file_path, facts))
+
+            # Verificaciones específicas de Python (requieren AST).
+            # Si todas están excluidas no se llega a parsear el AST.
+            if self._PYTHON_AST_TYPES <= self.excluded_types:
+                return violations
+            tree = facts.python_ast
+            if tree is not None:
+                if self.is_rule_enabled(ViolationType.BROAD_EXCEPTION_HANDLING):
                     violations.extend(self._check_broad_exception_handling(file_path, tree))
-                    violations.extend(self._check_hardcoded_configuration(file_path, source_code))
+                if self.is_rule_enabled(ViolationType.HARDCODED_CONFIGURATION):
+                    violations.extend(self._check_hardcoded_configuration(file_path, facts.source))
+                if self.is_rule_enabled(ViolationType.SHARED_MUTABLE_STATE):
                     violations.extend(self._check_shared_mutable_state(file_path, tree))
-                except SyntaxError:
-                    pass
 
         except SyntaxError:
             pass
@@ -147,15 +209,15 @@ class QualityChecker(BaseChecker):
     # Sub-verificaciones (agnósticas al lenguaje)
     # ------------------------------------------------------------------
 
-    def _check_hardcoded_data(
-        self, file_path: Path, result: ParseResult, lines: List[str], extension: str
-    ) -> List[Violation]:
+    def _check_hardcoded_data(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar datos de test hardcodeados usando ParseResult.strings."""
         violations: List[Violation] = []
+        result = facts.parse_result
+        lines = facts.lines
 
         # Para JS/TS: el archivo entero es un archivo de test (ya pasó can_check)
         # Verificar todas las cadenas en el archivo
-        if extension in {".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"}:
+        if facts.language == "js":
             for s in result.strings:
                 # Ignorar cadenas muy cortas
                 if len(s.value) < 5:
@@ -168,14 +230,16 @@ class QualityChecker(BaseChecker):
 
             return violations
 
-        # Para otros lenguajes: verificar solo strings dentro de funciones de test
-        test_functions = self._get_test_functions(result, extension)
-        test_ranges = [(f.line_start, f.line_end) for f in test_functions]
+        # Para otros lenguajes: verificar solo strings dentro de funciones de test.
+        # Los rangos se fusionan y ordenan para ubicar cada string por bisección.
+        starts, ends = _merge_ranges(
+            (f.line_start, f.line_end) for f in facts.test_functions
+        )
 
         for s in result.strings:
             # Verificar si el string está dentro de una función de test
-            in_test = any(start <= s.line <= end for start, end in test_ranges)
-            if not in_test:
+            index = bisect_right(starts, s.line) - 1
+            if index < 0 or s.line > ends[index]:
                 continue
 
             # Ignorar cadenas muy cortas
@@ -193,58 +257,50 @@ class QualityChecker(BaseChecker):
         self, file_path: Path, s: ParsedString, lines: List[str]
     ) -> Optional[Violation]:
         """Verifica si un string contiene datos hardcodeados."""
-        snippet = lines[s.line - 1].strip() if s.line <= len(lines) else f'"{s.value}"'
-
-        if self.EMAIL_PATTERN.search(s.value):
-            return Violation(
-                violation_type=ViolationType.HARDCODED_TEST_DATA,
-                severity=Severity.HIGH,
-                file_path=file_path,
-                line_number=s.line,
-                message=f"Email hardcodeado encontrado: '{s.value}'. Los datos de test deben externalizarse.",
-                code_snippet=snippet,
-            )
+        kind = self._classify_hardcoded_value(s.value)
+        if kind is None:
+            return None
 
-        if self.URL_PATTERN.search(s.value):
-            return Violation(
-                violation_type=ViolationType.HARDCODED_TEST_DATA,
-                severity=Severity.HIGH,
-                file_path=file_path,
-                line_number=s.line,
-                message=f"URL hardcodeada encontrada: '{s.value}'. Los datos de test deben externalizarse.",
-                code_snippet=snippet,
-            )
-
-        if self.PHONE_PATTERN.search(s.value):
-            return Violation(
-                violation_type=ViolationType.HARDCODED_TEST_DATA,
-                severity=Severity.HIGH,
-                file_path=file_path,
-                line_number=s.line,
-                message=f"Teléfono hardcodeado encontrado: '{s.value}'. Los datos de test deben externalizarse.",
-                code_snippet=snippet,
-            )
-
-        if any(kw in s.value.lower() for kw in self.PASSWORD_KEYWORDS):
-            return Violation(
-                violation_type=ViolationType.HARDCODED_TEST_DATA,
-                severity=Severity.HIGH,
-                file_path=file_path,
-                line_number=s.line,
-                message="Posible contraseña/secreto hardcodeado. Los datos de test deben externalizarse.",
-                code_snippet=snippet,
-            )
-
-        return None
+        snippet = lines[s.line - 1].strip() if s.line <= len(lines) else f'"{s.value}"'
+        return Violation(
+            violation_type=ViolationType.HARDCODED_TEST_DATA,
+            severity=Severity.HIGH,
+            file_path=file_path,
+            line_number=s.line,
+            message=self._DATA_MESSAGES[kind].format(value=s.value),
+            code_snippet=snippet,
+        )
+
+    def _classify_hardcoded_value(self, value: str) -> Optional[str]:
+        """
+        Categoría de dato hardcodeado de mayor prioridad presente en un string.
 
-    def _check_long_functions(
-        self, file_path: Path, result: ParseResult, lines: List[str], extension: str
-    ) -> List[Violation]:
+        En cada posición el escáner devuelve la primera alternativa que
+        coincide (la de mayor prioridad); se avanza posición a posición hasta
+        encontrar un email o agotar el texto.
+        """
+        best = None
+        match = self.HARDCODED_DATA_SCANNER.search(value)
+        while match is not None:
+            kind = match.lastgroup
+            if best is None or self._DATA_PRIORITY[kind] < self._DATA_PRIORITY[best]:
+                best = kind
+                if kind == "email":
+                    break
+            match = self.HARDCODED_DATA_SCANNER.search(value, match.start() + 1)
+
+        if best is None:
+            lowered = value.lower()
+            if any(kw in lowered for kw in self.PASSWORD_KEYWORDS):
+                best = "password"
+        return best
+
+    def _check_long_functions(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar funciones de test demasiado largas."""
         violations: List[Violation] = []
-        test_functions = self._get_test_functions(result, extension)
+        lines = facts.lines
 
-        for func in test_functions:
+        for func in facts.test_functions:
             length = func.line_end - func.line_start + 1
             if length > self.MAX_TEST_LINES:
                 snippet = lines[func.line_start - 1].strip() if func.line_start <= len(lines) else f"def {func.name}(...)"
@@ -265,14 +321,14 @@ class QualityChecker(BaseChecker):
 
         return violations
 
-    def _check_test_naming(
-        self, file_path: Path, result: ParseResult, lines: List[str], extension: str
-    ) -> List[Violation]:
+    def _check_test_naming(self, file_path: Path, facts: FileFacts) -> List[Violation]:
         """Detectar nombres de test genéricos."""
         violations: List[Violation] = []
+        result = facts.parse_result
+        lines = facts.lines
 
         # Para JS/TS: verificar argumentos de llamadas a test(), it(), describe()
-        if extension in {".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"}:
+        if facts.language == "js":
             for call in result.calls:
                 # Verificar si es una llamada a test/it/describe
                 if call.method_name not in {"test", "it", "describe"}:
@@ -302,10 +358,9 @@ class QualityChecker(BaseChecker):
             return violations
 
         # Para otros lenguajes: verificar nombres de funciones de test
-        test_functions = self._get_test_functions(result, extension)
-        pattern = self._get_generic_name_pattern(extension)
+        pattern = self._get_generic_name_pattern(facts.extension)
 
-        for func in test_functions:
+        for func in facts.test_functions:
             if pattern and pattern.match(func.name):
                 snippet = lines[func.line_start - 1].strip() if func.line_start <= len(lines) else func.name
                 violations.append(
@@ -367,46 +422,32 @@ class QualityChecker(BaseChecker):
         """Detectar configuración hardcodeada (localhost URLs, sleeps, paths absolutos)."""
         violations: List[Violation] = []
 
-        for i, line in enumerate(source_code.splitlines(), start=1):
-            stripped = line.strip()
+        # Una pasada del escáner sobre todo el fuente; cada coincidencia se
+        # asigna a su línea buscando su offset entre los inicios de línea.
+        lines = source_code.splitlines(keepends=True)
+        line_starts = list(accumulate(map(len, lines), initial=0))
+        hits: Dict[int, Set[str]] = {}
+        for match in self.HARDCODED_CONFIG_SCANNER.finditer(source_code):
+            index = bisect_right(line_starts, match.start()) - 1
+            hits.setdefault(index, set()).add(match.lastgroup)
+
+        for index in sorted(hits):
+            stripped = lines[index].strip()
             if stripped.startswith("#") or stripped.startswith("//"):
                 continue
 
-            if self.LOCALHOST_PATTERN.search(line):
-                violations.append(
-                    Violation(
-                        violation_type=ViolationType.HARDCODED_CONFIGURATION,
-                        severity=Severity.HIGH,
-                        file_path=file_path,
-                        line_number=i,
-                        message="URL localhost hardcodeada. Externalizar en configuración o fixtures.",
-                        code_snippet=stripped,
-                    )
-                )
-
-            if self.SLEEP_PATTERN.search(line):
-                violations.append(
-                    Violation(
-                        violation_type=ViolationType.HARDCODED_CONFIGURATION,
-                        severity=Severity.HIGH,
-                        file_path=file_path,
-                        line_number=i,
-                        message="sleep() hardcodeado. Usar esperas condicionales o configuración centralizada.",
-                        code_snippet=stripped,
-                    )
-                )
-
-            if self.ABSOLUTE_PATH_PATTERN.search(line):
-                violations.append(
-                    Violation(
-                        violation_type=ViolationType.HARDCODED_CONFIGURATION,
-                        severity=Severity.HIGH,
-                        file_path=file_path,
-                        line_number=i,
-                        message="Path absoluto hardcodeado. Usar paths relativos o configuración.",
-                        code_snippet=stripped,
+            for kind, message in self._CONFIG_MESSAGES:
+                if kind in hits[index]:
+                    violations.append(
+                        Violation(
+                            violation_type=ViolationType.HARDCODED_CONFIGURATION,
+                            severity=Severity.HIGH,
+                            file_path=file_path,
+                            line_number=index + 1,
+                            message=message,
+                            code_snippet=stripped,
+                        )
                     )
-                )
 
         return violations
 
@@ -474,23 +515,6 @@ class QualityChecker(BaseChecker):
     # Helpers
     # ------------------------------------------------------------------
 
-    def _get_test_functions(self, result: ParseResult, extension: str) -> List[ParsedFunction]:
-        """Obtiene todas las funciones de test del ParseResult."""
-        test_functions = []
-
-        # Funciones de nivel superior
-        for func in result.functions:
-            if self._is_test_function(func, extension):
-                test_functions.append(func)
-
-        # Métodos de clase
-        for cls in result.classes:
-            for method in cls.methods:
-                if self._is_test_function(method, extension):
-                    test_functions.append(method)
-
-        return test_functions
-
     def _get_generic_name_pattern(self, extension: str):
         """Obtiene el patrón de nombres genéricos para un lenguaje."""
         return self._get_config_for_extension(extension, {
@@ -498,3 +522,16 @@ class QualityChecker(BaseChecker):
             "js": self.GENERIC_NAME_PATTERNS_JS, "cs": self.GENERIC_NAME_PATTERNS_CSHARP,
             "default": None,
         })
+
+
+def _merge_ranges(ranges: Iterable[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    """Fusionar rangos de líneas solapados; devuelve (inicios, finales) ordenados."""
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in sorted(ranges):
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
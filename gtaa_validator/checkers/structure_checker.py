@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import List, Optional
 
 from gtaa_validator.checkers.base import BaseChecker
+from gtaa_validator.file_utils import subdir_names
 from gtaa_validator.models import Violation, ViolationType, Severity
 
 
@@ -31,6 +32,8 @@ class StructureChecker(BaseChecker):
     Si falta alguno, reporta una violación MISSING_LAYER_STRUCTURE.
     """
 
+    VIOLATION_TYPES = frozenset({ViolationType.MISSING_LAYER_STRUCTURE})
+
     # Nombres de directorio aceptables para cada capa
     TEST_DIR_NAMES = {"tests", "test"}
     PAGE_DIR_NAMES = {"pages", "page_objects", "pom"}
@@ -40,7 +43,7 @@ class StructureChecker(BaseChecker):
         return False
 
     def check(self, file_path: Path, tree: Optional[ast.Module] = None,
-              file_type: str = "unknown") -> List[Violation]:
+              file_type: str = "unknown", facts=None) -> List[Violation]:
         """No se usa — StructureChecker solo implementa check_project()."""
         return []
 
@@ -58,7 +61,7 @@ class StructureChecker(BaseChecker):
             Lista con 0 o 1 violación
         """
         try:
-            subdirs = {d.name.lower() for d in project_path.iterdir() if d.is_dir()}
+            subdirs = {name.lower() for name in subdir_names(project_path)}
         except OSError:
             return []
 
@@ -60,16 +60,37 @@ def load_config(project_path: Path) -> ProjectConfig:
     if not config_path.exists():
         return ProjectConfig()
 
+    try:
+        text = config_path.read_text(encoding="utf-8")
+    except Exception as e:
+        logger.warning("Error leyendo config %s: %s", config_path, e)
+        return ProjectConfig()
+    return parse_config(text, config_path)
+
+
+def parse_config(text: str, origin: object = ".gtaa.yaml") -> ProjectConfig:
+    """
+    Construye un ProjectConfig a partir del contenido YAML de un .gtaa.yaml.
+
+    Permite cargar la configuración de proyectos que no están en disco
+    (p. ej. dentro de un archivo comprimido).
+
+    Args:
+        text: Contenido del archivo de configuración
+        origin: Procedencia del contenido, solo para los mensajes de log
+
+    Returns:
+        ProjectConfig con la configuración cargada o defaults
+    """
     try:
         import yaml
     except ImportError:
         return ProjectConfig()
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.safe_load(text)
     except Exception as e:
-        logger.warning("Error leyendo config %s: %s", config_path, e)
+        logger.warning("Error leyendo config %s: %s", origin, e)
         return ProjectConfig()
 
     if not isinstance(data, dict):
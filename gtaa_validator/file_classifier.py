@@ -336,6 +336,26 @@ class FileClassifier:
 
         return False
 
+    def classify_path(self, file_path: Path) -> str:
+        """
+        Clasificación aproximada solo por la ruta, sin leer el archivo.
+
+        Args:
+            file_path: Ruta relativa a la raíz del proyecto (los directorios
+                por encima del proyecto no deben influir)
+
+        Returns:
+            'feature', 'test', 'page_object' u 'other'
+        """
+        extension = file_path.suffix
+        if extension == ".feature":
+            return "feature"
+        if self._is_test_file_path(file_path, extension):
+            return "test"
+        if self._is_page_object_path(file_path):
+            return "page_object"
+        return "other"
+
     def _is_page_object_path(self, file_path: Path) -> bool:
         """Detecta si la ruta indica un Page Object."""
         parts_lower = [p.lower() for p in file_path.parts]
@@ -3,10 +3,21 @@ Utilidades de lectura segura de archivos.
 
 Implementa limite de tamano para prevenir DoS por archivos extremadamente
 grandes (SEC-05).
+
+Tambien ofrece un sistema de archivos en memoria (VirtualFiles) que, activo
+con use_virtual_files(), sustituye al disco en read_file_safe y en el
+descubrimiento de archivos (find_files, subdir_names). Lo usa --staged para
+analizar el contenido del indice de git sin ficheros temporales; en modo
+overlay se superpone al disco (el servidor analiza asi el contenido aun no
+guardado de un editor).
 """
 
+import contextlib
+import hashlib
 import logging
+import threading
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +35,9 @@ def read_file_safe(file_path: Path, max_size: int = MAX_FILE_SIZE_BYTES) -> str:
     Returns:
         Contenido del archivo como string, o string vacio si excede el limite.
     """
+    if _virtual_files is not None and file_path in _virtual_files:
+        return _virtual_files.read(file_path, max_size)
+
     # Verificar tamano antes de leer (si el archivo existe en disco)
     try:
         size = file_path.stat().st_size
@@ -60,3 +74,176 @@ def safe_relative_path(file_path: Path, base_path: Path) -> Path:
         return file_path.relative_to(base_path)
     except ValueError:
         return file_path
+
+
+class VirtualFiles:
+    """Archivos en memoria que sustituyen al disco mientras estan activos.
+
+    Cada archivo (ruta absoluta) tiene una firma que identifica su contenido
+    (p. ej. el id del blob de git) y un cargador que devuelve sus bytes bajo
+    demanda, de modo que solo se leen los archivos que realmente se analizan.
+
+    Args:
+        signatures: Ruta absoluta -> firma del contenido.
+        loader: Funcion que devuelve los bytes del archivo (None si no existe).
+        close: Funcion opcional que libera los recursos del cargador.
+        overlay: Si es True, los archivos se superponen al disco en lugar de
+            sustituirlo (el resto de archivos se sigue leyendo del disco).
+        sizes: Tamano en bytes de cada archivo, si se conoce sin leerlo.
+    """
+
+    def __init__(self, signatures: Dict[Path, str],
+                 loader: Callable[[Path], Optional[bytes]],
+                 close: Optional[Callable[[], None]] = None,
+                 overlay: bool = False,
+                 sizes: Optional[Dict[Path, int]] = None):
+        self._signatures = signatures
+        self._loader = loader
+        self._close = close
+        self.overlay = overlay
+        self._sizes = sizes or {}
+
+    @classmethod
+    def from_contents(cls, contents: Dict[Path, Union[str, bytes]],
+                      overlay: bool = False) -> "VirtualFiles":
+        """Crear archivos virtuales a partir de su contenido completo."""
+        data = {
+            Path(path): value.encode("utf-8") if isinstance(value, str) else value
+            for path, value in contents.items()
+        }
+        signatures = {path: hashlib.sha1(value).hexdigest() for path, value in data.items()}
+        sizes = {path: len(value) for path, value in data.items()}
+        return cls(signatures, data.get, overlay=overlay, sizes=sizes)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._signatures
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(sorted(self._signatures))
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, file_path: Path) -> Optional[str]:
+        """Firma del contenido del archivo, o None si no es virtual."""
+        return self._signatures.get(file_path)
+
+    def size(self, file_path: Path) -> Optional[int]:
+        """Tamano del archivo en bytes, o None si no se conoce."""
+        return self._sizes.get(file_path)
+
+    def read(self, file_path: Path, max_size: int = MAX_FILE_SIZE_BYTES) -> str:
+        """Contenido del archivo, con el mismo limite de tamano que read_file_safe."""
+        data = self._loader(file_path)
+        if data is None:
+            logger.debug("Archivo virtual no disponible: %s", file_path)
+            return ""
+        if len(data) > max_size:
+            logger.warning(
+                "Archivo omitido por tamano: %s (%d bytes > %d bytes limite)",
+                file_path, len(data), max_size
+            )
+            return ""
+        return data.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Liberar los recursos del cargador (p. ej. el proceso de git)."""
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> "VirtualFiles":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Archivos virtuales activos (None: se lee del disco)
+_virtual_files: Optional[VirtualFiles] = None
+
+# Son globales al proceso: un bloque use_virtual_files() a la vez (reentrante
+# para los bloques anidados del mismo hilo)
+_virtual_files_lock = threading.RLock()
+
+
+@contextlib.contextmanager
+def use_virtual_files(files: Optional[VirtualFiles]) -> Iterator[Optional[VirtualFiles]]:
+    """
+    Activar unos archivos virtuales mientras dure el bloque (None: disco).
+
+    Los bloques de hilos distintos se ejecutan de uno en uno; un análisis que
+    deba leer del disco sin interferencias también se envuelve con None.
+    """
+    global _virtual_files
+    with _virtual_files_lock:
+        previous = _virtual_files
+        _virtual_files = files
+        try:
+            yield files
+        finally:
+            _virtual_files = previous
+
+
+def active_virtual_files() -> Optional[VirtualFiles]:
+    """Archivos virtuales activos, o None si se lee del disco."""
+    return _virtual_files
+
+
+def find_files(root: Path, suffix: str) -> Iterator[Path]:
+    """Equivalente a root.rglob(f"*{suffix}") que respeta los archivos virtuales."""
+    files = _virtual_files
+    if files is None or files.overlay:
+        for file_path in root.rglob(f"*{suffix}"):
+            if files is None or file_path not in files:
+                yield file_path
+        if files is None:
+            return
+    for file_path in files:
+        if file_path.suffix == suffix and root in file_path.parents:
+            yield file_path
+
+
+def subdir_names(root: Path) -> List[str]:
+    """Nombres de los subdirectorios inmediatos de root (disco o archivos virtuales)."""
+    files = _virtual_files
+    if files is None:
+        return [d.name for d in root.iterdir() if d.is_dir()]
+    names = {
+        file_path.relative_to(root).parts[0]
+        for file_path in files
+        if root in file_path.parents and len(file_path.relative_to(root).parts) > 1
+    }
+    if files.overlay:
+        names.update(d.name for d in root.iterdir() if d.is_dir())
+    return sorted(names)
+
+
+def file_signature(file_path: Path) -> Optional[Union[str, List[int]]]:
+    """Identidad del contenido actual del archivo para validar caches.
+
+    Firma del archivo virtual si esta activo; si no, [mtime_ns, tamano] del
+    disco. None si el archivo no existe.
+    """
+    if _virtual_files is not None:
+        signature = _virtual_files.signature(file_path)
+        if signature is not None or not _virtual_files.overlay:
+            return signature
+    try:
+        st = Path(file_path).stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def file_size(file_path: Path) -> int:
+    """Tamano en bytes del archivo (virtual o de disco); 0 si no se conoce.
+
+    No lee el contenido: sirve para estimar el coste de analizar el archivo.
+    """
+    if _virtual_files is not None and file_path in _virtual_files:
+        return _virtual_files.size(file_path) or 0
+    try:
+        return Path(file_path).stat().st_size
+    except OSError:
+        return 0
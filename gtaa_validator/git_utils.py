@@ -0,0 +1,200 @@
+"""
+Consulta de archivos modificados con git para el modo incremental.
+
+--changed-since REF compara el árbol de trabajo con REF (git diff) y añade
+los archivos nuevos aún no versionados; --staged se limita al índice
+(git diff --cached). Solo se usa el git local: no hay acceso a red.
+
+Con --staged el contenido se lee del propio índice (index_snapshot): lo que
+se analiza es exactamente lo que se va a commitear, aunque el árbol de
+trabajo tenga cambios sin añadir. Los blobs se leen bajo demanda a través de
+un único proceso `git cat-file --batch`, sin ficheros temporales.
+"""
+
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from gtaa_validator.file_utils import VirtualFiles
+
+logger = logging.getLogger(__name__)
+
+# Tiempo máximo por comando git (segundos)
+GIT_TIMEOUT = 60
+
+
+class GitError(Exception):
+    """Error al consultar git (no es un repositorio, ref inexistente, git ausente)."""
+
+
+def changed_files(project_path: Path, since: Optional[str] = None,
+                  staged: bool = False) -> Set[Path]:
+    """
+    Archivos modificados dentro de project_path.
+
+    Args:
+        project_path: Directorio del proyecto (puede ser un subdirectorio del repositorio)
+        since: Ref de git con la que comparar (rama, tag o commit)
+        staged: Solo cambios en el índice; con since, índice frente a esa ref
+
+    Returns:
+        Rutas absolutas de los archivos modificados que siguen existiendo
+        (en el índice con staged; en disco en otro caso)
+
+    Raises:
+        GitError: Si git no está disponible, la ruta no es un repositorio o la ref no existe
+    """
+    project_path = Path(project_path).resolve()
+    if since is not None and (not since or since.startswith("-")):
+        # Una ref que empieza por "-" se interpretaría como opción de git
+        raise GitError(f"Ref de git no válida: {since!r}")
+
+    # --diff-filter=d: los archivos borrados no se analizan
+    diff = ["diff", "--name-only", "-z", "--relative", "--diff-filter=d"]
+    if staged:
+        diff.append("--cached")
+    if since:
+        diff.append(since)
+    names = _run_git(project_path, diff + ["--"])
+
+    if not staged:
+        names += _run_git(project_path, ["ls-files", "--others", "--exclude-standard", "-z"])
+
+    files = {project_path / name for name in names}
+    if staged:
+        return files
+    return {path for path in files if path.is_file()}
+
+
+def index_snapshot(project_path: Path) -> VirtualFiles:
+    """
+    Archivos del índice de git bajo project_path como archivos virtuales.
+
+    La lista y los ids de los blobs salen de un único `git ls-files -s`; el
+    contenido se lee al analizar cada archivo con un GitObjectReader. Se
+    omiten enlaces simbólicos, submódulos y archivos con conflictos.
+    Cerrar el resultado (o usarlo como context manager) termina el proceso.
+
+    Raises:
+        GitError: Si git no está disponible o la ruta no es un repositorio
+    """
+    project_path = Path(project_path).resolve()
+    oids: Dict[Path, str] = {}
+    for record in _run_git(project_path, ["ls-files", "-s", "-z"]):
+        info, _, name = record.partition("\t")
+        mode, oid, stage = info.split()
+        if mode.startswith("100") and stage == "0":
+            oids[project_path / name] = oid
+
+    reader = GitObjectReader(project_path)
+
+    def load(file_path: Path) -> Optional[bytes]:
+        oid = oids.get(file_path)
+        return reader.read(oid) if oid else None
+
+    logger.debug("Índice de git: %d archivo(s)", len(oids))
+    return VirtualFiles(oids, load, close=reader.close)
+
+
+class GitObjectReader:
+    """
+    Lector de objetos de git con un proceso `git cat-file --batch` persistente.
+
+    El proceso se arranca en la primera lectura y atiende todas las
+    peticiones por su entrada/salida estándar, sin un proceso por archivo.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """
+        Contenido del objeto (id de blob o "<ref>:<ruta>"), o None si no existe.
+
+        Raises:
+            GitError: Si el proceso de git termina inesperadamente
+        """
+        if not spec or "\n" in spec:
+            return None
+        with self._lock:
+            process = self._start()
+            try:
+                process.stdin.write(spec.encode("utf-8") + b"\n")
+                process.stdin.flush()
+                header = process.stdout.readline()
+                if not header:
+                    raise GitError("git cat-file terminó inesperadamente")
+                fields = header.split()
+                if len(fields) != 3:
+                    # "<spec> missing" / "<spec> ambiguous"
+                    return None
+                size = int(fields[2])
+                data = process.stdout.read(size)
+                process.stdout.read(1)  # salto de línea final
+            except (OSError, ValueError) as e:
+                self._terminate()
+                raise GitError(f"Error leyendo {spec} con git cat-file: {e}") from e
+        if fields[1] != b"blob" or len(data) != size:
+            return None
+        return data
+
+    def close(self) -> None:
+        """Terminar el proceso de git (idempotente)."""
+        with self._lock:
+            self._terminate()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None:
+            try:
+                self._process = subprocess.Popen(
+                    ["git", "-C", str(self.repo_path), "cat-file", "--batch"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError as e:
+                raise GitError("git no está instalado o no está en el PATH") from e
+        return self._process
+
+    def _terminate(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=GIT_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+
+
+def _run_git(cwd: Path, args: List[str]) -> List[str]:
+    """Ejecutar git en cwd y devolver las rutas de su salida separada por NUL."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(cwd), *args],
+            capture_output=True, timeout=GIT_TIMEOUT, check=False,
+        )
+    except FileNotFoundError as e:
+        raise GitError("git no está instalado o no está en el PATH") from e
+    except subprocess.TimeoutExpired as e:
+        raise GitError(f"git {args[0]} superó el tiempo máximo ({GIT_TIMEOUT}s)") from e
+
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", errors="replace").strip()
+        raise GitError(f"git {args[0]} falló: {message}")
+
+    output = result.stdout.decode("utf-8", errors="surrogateescape")
+    names = [name for name in output.split("\0") if name]
+    logger.debug("git %s: %d archivo(s)", " ".join(args), len(names))
+    return names
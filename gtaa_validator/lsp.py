@@ -0,0 +1,305 @@
+"""
+Servidor Language Server Protocol (--lsp) para ver las violaciones en el editor.
+
+Habla JSON-RPC por stdin/stdout con el framing de LSP (cabecera
+Content-Length), sin dependencias externas. Cada documento abierto se
+analiza con su texto en memoria (didOpen/didChange) a través del
+AnalysisService del servidor de análisis: el mismo StaticAnalyzer del
+proyecto se reutiliza entre ediciones y el estado entre archivos
+(localizadores duplicados, step patterns) sale de su caché de resúmenes en
+memoria, el índice del proyecto, así que solo se re-verifica el documento
+editado.
+
+Los cambios se agrupan con un retardo (DEBOUNCE_SECONDS): mientras se
+escribe solo se analiza la última versión de cada documento. Los documentos
+abiertos se superponen al disco, de modo que las reglas entre archivos ven
+también el contenido sin guardar de los demás.
+
+Las violaciones de proyecto (estructura de directorios) no tienen documento
+y no se publican.
+"""
+
+import json
+import logging
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from gtaa_validator import __version__
+from gtaa_validator.models import Severity, Violation
+from gtaa_validator.server import AnalysisService, RequestError
+
+logger = logging.getLogger(__name__)
+
+# Espera tras la última edición antes de analizar (segundos)
+DEBOUNCE_SECONDS = 0.3
+
+# Severidad gTAA -> DiagnosticSeverity de LSP (1 Error, 2 Warning, 3 Information, 4 Hint)
+DIAGNOSTIC_SEVERITY = {
+    Severity.CRITICAL: 1,
+    Severity.HIGH: 2,
+    Severity.MEDIUM: 3,
+    Severity.LOW: 4,
+}
+
+# Códigos de error JSON-RPC
+METHOD_NOT_FOUND = -32601
+INVALID_REQUEST = -32600
+INVALID_PARAMS = -32602
+
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """Leer un mensaje con framing LSP; None al final del flujo."""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii", errors="replace").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        return None
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def write_message(stream: BinaryIO, message: dict) -> None:
+    """Escribir un mensaje con framing LSP."""
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Optional[Path]:
+    """Ruta local de una URI file://, o None si no es un archivo."""
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    # url2pathname ya decodifica los %XX (decodificar antes convertiría %2520 en un espacio)
+    return Path(url2pathname(parsed.path)).resolve()
+
+
+def to_diagnostic(violation: Violation) -> dict:
+    """Diagnóstico LSP de una violación (línea completa; líneas LSP empiezan en 0)."""
+    line = max((violation.line_number or 1) - 1, 0)
+    return {
+        "range": {"start": {"line": line, "character": 0},
+                  "end": {"line": line + 1, "character": 0}},
+        "severity": DIAGNOSTIC_SEVERITY.get(violation.severity, 2),
+        "code": violation.violation_type.name,
+        "source": "gtaa",
+        "message": f"{violation.message}\n{violation.recommendation}".strip(),
+    }
+
+
+class LanguageServer:
+    """
+    Estado de la sesión LSP: documentos abiertos, análisis pendientes y salida.
+
+    Args:
+        send: Función que envía un mensaje al cliente
+        service: Servicio de análisis (uno nuevo si es None)
+        debounce: Segundos de espera antes de analizar (None: análisis inmediato)
+    """
+
+    def __init__(self, send: Callable[[dict], None],
+                 service: Optional[AnalysisService] = None,
+                 debounce: Optional[float] = DEBOUNCE_SECONDS):
+        self._send = send
+        self.service = service or AnalysisService()
+        self.debounce = debounce
+        self.root: Optional[Path] = None
+        self.documents: Dict[str, str] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+        self.shutdown_requested = False
+
+    def handle(self, message: dict) -> None:
+        """Atender un mensaje (petición o notificación) del cliente."""
+        method = message.get("method")
+        params = message.get("params") or {}
+        is_request = "id" in message
+
+        handler = getattr(self, "_on_" + str(method).replace("/", "_").replace("$", "_"), None)
+        if handler is None:
+            if is_request:
+                self._reply_error(message["id"], METHOD_NOT_FOUND, f"Método no soportado: {method}")
+            return
+        if self.shutdown_requested and method not in ("exit", "shutdown"):
+            if is_request:
+                self._reply_error(message["id"], INVALID_REQUEST, "El servidor se está cerrando")
+            return
+        try:
+            result = handler(params)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            # Parámetros mal formados: error para las peticiones; las notificaciones se ignoran
+            logger.warning("LSP: parámetros inválidos en %s: %r", method, e)
+            if is_request:
+                self._reply_error(message["id"], INVALID_PARAMS, f"Parámetros inválidos para {method}")
+            return
+        if is_request:
+            self._send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    # --- Ciclo de vida ---
+
+    def _on_initialize(self, params: dict) -> dict:
+        folders = params.get("workspaceFolders") or []
+        root_uri = params.get("rootUri") or (folders[0]["uri"] if folders else None)
+        if root_uri:
+            self.root = uri_to_path(root_uri)
+        elif params.get("rootPath"):
+            self.root = Path(params["rootPath"]).resolve()
+        return {
+            "capabilities": {
+                # 1: sincronización completa (el cliente envía el texto entero)
+                "textDocumentSync": {"openClose": True, "change": 1, "save": True},
+            },
+            "serverInfo": {"name": "gtaa-validator", "version": __version__},
+        }
+
+    def _on_initialized(self, params: dict) -> None:
+        return None
+
+    def _on_shutdown(self, params: dict) -> None:
+        self.shutdown_requested = True
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        return None
+
+    def _on_exit(self, params: dict) -> None:
+        self.shutdown_requested = True
+        return None
+
+    # --- Documentos ---
+
+    def _on_textDocument_didOpen(self, params: dict) -> None:
+        document = params["textDocument"]
+        self.documents[document["uri"]] = document.get("text", "")
+        self.schedule(document["uri"])
+
+    def _on_textDocument_didChange(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        changes = params.get("contentChanges") or []
+        if uri not in self.documents or not changes:
+            return
+        # Sincronización completa: el último cambio trae el texto entero
+        self.documents[uri] = changes[-1]["text"]
+        self.schedule(uri)
+
+    def _on_textDocument_didSave(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        if "text" in params:
+            self.documents[uri] = params["text"]
+        if uri in self.documents:
+            self.schedule(uri)
+
+    def _on_textDocument_didClose(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        with self._lock:
+            timer = self._timers.pop(uri, None)
+        if timer is not None:
+            timer.cancel()
+        self._publish(uri, [])
+
+    def _on_workspace_didChangeConfiguration(self, params: dict) -> None:
+        return None
+
+    # --- Análisis ---
+
+    def schedule(self, uri: str) -> None:
+        """Programar el análisis del documento (reinicia el retardo si ya estaba pendiente)."""
+        if self.debounce is None:
+            self.analyze(uri)
+            return
+        with self._lock:
+            previous = self._timers.pop(uri, None)
+            if previous is not None:
+                previous.cancel()
+            timer = threading.Timer(self.debounce, self._run_scheduled, (uri,))
+            timer.daemon = True
+            self._timers[uri] = timer
+        timer.start()
+
+    def _run_scheduled(self, uri: str) -> None:
+        with self._lock:
+            # Solo el temporizador vigente se retira (puede haber otro ya programado)
+            if self._timers.get(uri) is threading.current_thread():
+                del self._timers[uri]
+        self.analyze(uri)
+
+    def analyze(self, uri: str) -> None:
+        """Analizar el documento con su texto en memoria y publicar sus diagnósticos."""
+        text = self.documents.get(uri)
+        file_path = uri_to_path(uri)
+        if text is None or file_path is None:
+            return
+        root = self.root or file_path.parent
+        try:
+            report = self.service.analyze_file(root, file_path, self._open_documents(root))
+        except RequestError as e:
+            logger.debug("LSP: %s no se analiza: %s", uri, e)
+            return
+        except Exception:
+            logger.exception("LSP: error analizando %s", uri)
+            return
+        if self.documents.get(uri) != text:
+            return  # el documento cambió durante el análisis; viene otro en camino
+        self._publish(uri, [to_diagnostic(v) for v in report.violations if v.file_path == file_path])
+
+    def _open_documents(self, root: Path) -> Dict[Path, str]:
+        """Documentos abiertos dentro del proyecto (se superponen al disco)."""
+        documents = {}
+        for uri, text in list(self.documents.items()):
+            path = uri_to_path(uri)
+            if path is not None and root in path.parents:
+                documents[path] = text
+        return documents
+
+    def _publish(self, uri: str, diagnostics: List[dict]) -> None:
+        self._send({
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": diagnostics},
+        })
+
+    def _reply_error(self, request_id, code: int, message: str) -> None:
+        self._send({"jsonrpc": "2.0", "id": request_id,
+                    "error": {"code": code, "message": message}})
+
+
+def run_stdio(stdin: BinaryIO = None, stdout: BinaryIO = None) -> int:
+    """
+    Atender un cliente LSP por stdin/stdout hasta recibir exit.
+
+    Returns:
+        Código de salida: 0 si se recibió shutdown antes de exit, 1 si no
+    """
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    write_lock = threading.Lock()
+
+    def send(message: dict) -> None:
+        with write_lock:
+            write_message(stdout, message)
+
+    server = LanguageServer(send)
+    while True:
+        try:
+            message = read_message(stdin)
+        except ValueError as e:
+            logger.warning("LSP: mensaje inválido: %s", e)
+            continue
+        if message is None:
+            return 1
+        if message.get("method") == "exit":
+            return 0 if server.shutdown_requested else 1
+        server.handle(message)
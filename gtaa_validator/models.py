@@ -10,10 +10,12 @@ Este módulo define las estructuras de datos principales usadas en el proceso de
 Estos modelos son utilizados por analizadores, checkers y reportadores.
 """
 
+import hashlib
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
 from gtaa_validator import __version__
@@ -316,6 +318,39 @@ class ViolationType(Enum):
         }
         return recommendations[self]
 
+    def get_checker(self) -> str:
+        """Devuelve el nombre del checker (o analizador) que detecta esta violación."""
+        checkers = {
+            ViolationType.ADAPTATION_IN_DEFINITION: "DefinitionChecker",
+            ViolationType.MISSING_LAYER_STRUCTURE: "StructureChecker",
+            ViolationType.ASSERTION_IN_POM: "AdaptationChecker",
+            ViolationType.FORBIDDEN_IMPORT: "AdaptationChecker",
+            ViolationType.BUSINESS_LOGIC_IN_POM: "AdaptationChecker",
+            ViolationType.DUPLICATE_LOCATOR: "AdaptationChecker",
+            ViolationType.HARDCODED_TEST_DATA: "QualityChecker",
+            ViolationType.LONG_TEST_FUNCTION: "QualityChecker",
+            ViolationType.POOR_TEST_NAMING: "QualityChecker",
+            ViolationType.BROAD_EXCEPTION_HANDLING: "QualityChecker",
+            ViolationType.HARDCODED_CONFIGURATION: "QualityChecker",
+            ViolationType.SHARED_MUTABLE_STATE: "QualityChecker",
+
+            # Semánticas (Fase 5-6)
+            ViolationType.UNCLEAR_TEST_PURPOSE: "SemanticAnalyzer",
+            ViolationType.PAGE_OBJECT_DOES_TOO_MUCH: "SemanticAnalyzer",
+            ViolationType.IMPLICIT_TEST_DEPENDENCY: "SemanticAnalyzer",
+            ViolationType.MISSING_WAIT_STRATEGY: "SemanticAnalyzer",
+            ViolationType.MISSING_AAA_STRUCTURE: "SemanticAnalyzer",
+            ViolationType.MIXED_ABSTRACTION_LEVEL: "SemanticAnalyzer",
+
+            # BDD/Gherkin (Fase 8)
+            ViolationType.GHERKIN_IMPLEMENTATION_DETAIL: "BDDChecker",
+            ViolationType.STEP_DEF_DIRECT_BROWSER_CALL: "BDDChecker",
+            ViolationType.STEP_DEF_TOO_COMPLEX: "BDDChecker",
+            ViolationType.MISSING_THEN_STEP: "BDDChecker",
+            ViolationType.DUPLICATE_STEP_PATTERN: "BDDChecker",
+        }
+        return checkers[self]
+
 
 @dataclass
 class Violation:
@@ -331,6 +366,8 @@ class Violation:
         code_snippet: Fragmento de código opcional mostrando la violación
         recommendation: Cómo corregir esta violación
         ai_suggestion: Sugerencia generada por análisis semántico LLM (opcional)
+        function_name: Función o método que contiene la violación (opcional,
+                       lo rellena StaticAnalyzer); forma parte de la huella
     """
     violation_type: ViolationType
     severity: Severity
@@ -340,6 +377,7 @@ class Violation:
     code_snippet: Optional[str] = None
     recommendation: str = ""
     ai_suggestion: Optional[str] = None
+    function_name: Optional[str] = None
 
     def __post_init__(self):
         """
@@ -375,8 +413,45 @@ class Violation:
             "code_snippet": self.code_snippet,
             "recommendation": self.recommendation,
             "ai_suggestion": self.ai_suggestion,
+            "fingerprint": self.fingerprint(project_path),
         }
 
+    def fingerprint(self, project_path: Optional[Path] = None) -> str:
+        """
+        Huella estable de la violación (ver violation_fingerprint).
+
+        No depende del número de línea: sobrevive a desplazamientos del código.
+        """
+        file_display = safe_relative_path(self.file_path, project_path) if project_path else self.file_path
+        return violation_fingerprint(
+            self.violation_type.name, Path(file_display).as_posix(),
+            self.code_snippet, self.message, self.function_name,
+        )
+
+
+# Números en mensajes (longitudes, líneas): se enmascaran en la huella
+_DIGITS = re.compile(r"\d+")
+
+
+def violation_fingerprint(type_name: str, file: str, code_snippet: Optional[str],
+                          message: str, function_name: Optional[str]) -> str:
+    """
+    Calcular la huella de una violación a partir de sus campos.
+
+    Combina tipo, archivo (ruta relativa con "/"), fragmento de código con
+    espacios normalizados y función contenedora. Sin fragmento se usa el
+    mensaje con los números enmascarados (suelen ser longitudes o líneas).
+
+    Returns:
+        16 caracteres hexadecimales
+    """
+    if code_snippet:
+        content = " ".join(code_snippet.split())
+    else:
+        content = _DIGITS.sub("#", message or "")
+    key = "\x1f".join((type_name, file.replace("\\", "/"), content, function_name or ""))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
 
 @dataclass
 class AnalysisMetrics:
@@ -418,6 +493,120 @@ class AnalysisMetrics:
         return result
 
 
+class ViolationIndex:
+    """
+    Agregados de una lista de violaciones, mantenidos al añadir.
+
+    Vistas agrupadas por severidad, tipo, archivo y checker; recuentos y
+    penalización total se derivan de los grupos por severidad (como mucho
+    cuatro). Cada grupo conserva el orden de la lista original. Se asume que
+    severidad, tipo y archivo de una violación no cambian tras añadirla.
+    """
+
+    def __init__(self, violations: Iterable[Violation] = ()):
+        self.by_severity: Dict[Severity, List[Violation]] = {}
+        self.by_type: Dict[ViolationType, List[Violation]] = {}
+        self.by_file: Dict[Path, List[Violation]] = {}
+        self.by_checker: Dict[str, List[Violation]] = {}
+        # Grupos de la última violación añadida (por clave): los checkers
+        # emiten en ráfagas del mismo tipo y archivo, y así se evita hashear
+        # enums y rutas en cada append
+        self._last_severity = self._last_type = self._last_file = None
+        self._type_groups: Dict[ViolationType, tuple] = {}
+        for violation in violations:
+            self.add(violation)
+
+    def add(self, violation: Violation) -> None:
+        """Incorporar una violación a todos los agregados."""
+        last = self._last_severity
+        if last is None or last[0] is not violation.severity:
+            group = self.by_severity.setdefault(violation.severity, [])
+            last = self._last_severity = (violation.severity, group)
+        last[1].append(violation)
+
+        last = self._last_type
+        if last is None or last[0] is not violation.violation_type:
+            vtype = violation.violation_type
+            last = self._type_groups.get(vtype)
+            if last is None:
+                last = self._type_groups[vtype] = (
+                    vtype,
+                    self.by_type.setdefault(vtype, []),
+                    self.by_checker.setdefault(vtype.get_checker(), []),
+                )
+            self._last_type = last
+        last[1].append(violation)
+        last[2].append(violation)
+
+        last = self._last_file
+        if last is None or last[0] is not violation.file_path:
+            group = self.by_file.setdefault(violation.file_path, [])
+            last = self._last_file = (violation.file_path, group)
+        last[1].append(violation)
+
+    def severity_count(self, severity: Severity) -> int:
+        """Número de violaciones de una severidad."""
+        return len(self.by_severity.get(severity, ()))
+
+    @property
+    def total_penalty(self) -> int:
+        """Suma de penalizaciones de todas las violaciones."""
+        return sum(s.get_score_penalty() * len(vs) for s, vs in self.by_severity.items())
+
+
+class ViolationList(list):
+    """
+    Lista de violaciones que mantiene su ViolationIndex al día.
+
+    append/extend/+= actualizan los agregados de forma incremental; el resto
+    de mutaciones (insert, remove, sort, asignación por índice...) son raras
+    y reconstruyen el índice completo.
+    """
+
+    def __init__(self, iterable: Iterable[Violation] = ()):
+        super().__init__(iterable)
+        self.index = ViolationIndex(self)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def append(self, violation: Violation) -> None:
+        super().append(violation)
+        self.index.add(violation)
+
+    def extend(self, violations: Iterable[Violation]) -> None:
+        violations = list(violations)
+        super().extend(violations)
+        for violation in violations:
+            self.index.add(violation)
+
+    def __iadd__(self, violations: Iterable[Violation]):
+        self.extend(violations)
+        return self
+
+    def _reindex(self) -> None:
+        self.index = ViolationIndex(self)
+
+
+def _reindexing(name: str):
+    """Envolver un método mutador de list para que reconstruya el índice."""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._reindex()
+        return self if name == "__imul__" else result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ("insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__imul__"):
+    setattr(ViolationList, _name, _reindexing(_name))
+del _name
+
+
 @dataclass
 class Report:
     """
@@ -433,6 +622,20 @@ class Report:
         execution_time_seconds: Tiempo empleado en el análisis
         llm_provider_info: Información del proveedor LLM usado (solo con --ai)
         metrics: Métricas de rendimiento del análisis (opcional)
+        prefilter_stats: Archivos descartados por el prefiltro de disparadores (opcional)
+        baseline_stats: Violaciones conocidas suprimidas por --baseline (opcional)
+        incremental_stats: Archivos modificados y uso de caché en modo incremental (opcional)
+        partial_stats: Análisis detenido antes de terminar: motivo y archivos
+            analizados frente a descubiertos (opcional)
+        sample_stats: Modo muestreo: muestra por estrato y estimación
+            extrapolada de puntuación y recuentos con intervalos (opcional)
+        shard_stats: Modo shard: shard y archivos del informe parcial, o
+            shards combinados por merge (opcional)
+        parallel_stats: Análisis con varios procesos: planificación y
+            utilización de cada trabajador (opcional)
+
+    violations se guarda siempre como ViolationList (también al reasignarla),
+    de modo que score, recuentos y vistas agrupadas no recorren la lista.
     """
     project_path: Path
     violations: List[Violation] = field(default_factory=list)
@@ -443,6 +646,18 @@ class Report:
     execution_time_seconds: float = 0.0
     llm_provider_info: Optional[dict] = None
     metrics: Optional[AnalysisMetrics] = None
+    prefilter_stats: Optional[dict] = None
+    baseline_stats: Optional[dict] = None
+    incremental_stats: Optional[dict] = None
+    partial_stats: Optional[dict] = None
+    sample_stats: Optional[dict] = None
+    shard_stats: Optional[dict] = None
+    parallel_stats: Optional[dict] = None
+
+    def __setattr__(self, name, value):
+        if name == "violations" and not isinstance(value, ViolationList):
+            value = ViolationList(value)
+        super().__setattr__(name, value)
 
     def calculate_score(self) -> float:
         """
@@ -451,30 +666,38 @@ class Report:
         Fórmula: Comenzar en 100, restar penalización por cada violación.
         La puntuación mínima es 0.
         """
-        total_penalty = sum(v.severity.get_score_penalty() for v in self.violations)
-        score = max(0.0, 100.0 - total_penalty)
+        score = max(0.0, 100.0 - self.violations.index.total_penalty)
         self.score = score
         return score
 
     def get_violations_by_severity(self, severity: Severity) -> List[Violation]:
         """Obtener todas las violaciones de un nivel de severidad específico."""
-        return [v for v in self.violations if v.severity == severity]
+        return list(self.violations.index.by_severity.get(severity, ()))
 
     def get_violation_count_by_severity(self) -> dict:
         """Devolver el recuento de violaciones agrupadas por severidad."""
+        index = self.violations.index
         return {
-            "CRITICAL": len(self.get_violations_by_severity(Severity.CRITICAL)),
-            "HIGH": len(self.get_violations_by_severity(Severity.HIGH)),
-            "MEDIUM": len(self.get_violations_by_severity(Severity.MEDIUM)),
-            "LOW": len(self.get_violations_by_severity(Severity.LOW)),
+            "CRITICAL": index.severity_count(Severity.CRITICAL),
+            "HIGH": index.severity_count(Severity.HIGH),
+            "MEDIUM": index.severity_count(Severity.MEDIUM),
+            "LOW": index.severity_count(Severity.LOW),
         }
 
-    def to_dict(self) -> dict:
-        """Convertir informe a diccionario para serialización JSON.
+    def violations_by_type(self) -> Dict[ViolationType, List[Violation]]:
+        """Vista agrupada por tipo (orden de primera aparición). No modificar."""
+        return self.violations.index.by_type
 
-        Las rutas se relativizan respecto a project_path para no exponer
-        rutas absolutas del sistema de archivos del usuario (SEC-03).
-        """
+    def violations_by_file(self) -> Dict[Path, List[Violation]]:
+        """Vista agrupada por archivo (orden de primera aparición). No modificar."""
+        return self.violations.index.by_file
+
+    def violations_by_checker(self) -> Dict[str, List[Violation]]:
+        """Vista agrupada por checker (ViolationType.get_checker). No modificar."""
+        return self.violations.index.by_checker
+
+    def metadata_dict(self) -> dict:
+        """Sección metadata del informe (ver to_dict)."""
         # Usar solo el nombre del directorio, no la ruta absoluta
         metadata = {
             "project_path": self.project_path.name,
@@ -490,13 +713,53 @@ class Report:
         if self.metrics:
             metadata["metrics"] = self.metrics.to_dict()
 
+        # Añadir estadísticas del prefiltro si están disponibles
+        if self.prefilter_stats:
+            metadata["prefilter"] = self.prefilter_stats
+
+        # Añadir estadísticas del baseline si se usó
+        if self.baseline_stats:
+            metadata["baseline"] = self.baseline_stats
+
+        # Añadir estadísticas del modo incremental si se usó
+        if self.incremental_stats:
+            metadata["incremental"] = self.incremental_stats
+
+        # Análisis parcial: qué parte del proyecto cubre el informe
+        if self.partial_stats:
+            metadata["partial"] = self.partial_stats
+
+        # Muestreo: estimaciones para todo el proyecto
+        if self.sample_stats:
+            metadata["sample"] = self.sample_stats
+
+        # Shards: informe parcial de un shard o combinación de varios
+        if self.shard_stats:
+            metadata["shard"] = self.shard_stats
+
+        # Análisis con varios procesos: utilización de los trabajadores
+        if self.parallel_stats:
+            metadata["parallel"] = self.parallel_stats
+
+        return metadata
+
+    def summary_dict(self) -> dict:
+        """Sección summary del informe (ver to_dict)."""
+        return {
+            "files_analyzed": self.files_analyzed,
+            "total_violations": len(self.violations),
+            "violations_by_severity": self.get_violation_count_by_severity(),
+            "score": self.score,
+        }
+
+    def to_dict(self) -> dict:
+        """Convertir informe a diccionario para serialización JSON.
+
+        Las rutas se relativizan respecto a project_path para no exponer
+        rutas absolutas del sistema de archivos del usuario (SEC-03).
+        """
         return {
-            "metadata": metadata,
-            "summary": {
-                "files_analyzed": self.files_analyzed,
-                "total_violations": len(self.violations),
-                "violations_by_severity": self.get_violation_count_by_severity(),
-                "score": self.score,
-            },
+            "metadata": self.metadata_dict(),
+            "summary": self.summary_dict(),
             "violations": [v.to_dict(project_path=self.project_path) for v in self.violations]
         }
@@ -7,7 +7,7 @@ para análisis de violaciones gTAA.
 Fase 9: Soporte multilenguaje.
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from tree_sitter import Node
 
 from gtaa_validator.parsers.treesitter_base import (
@@ -52,20 +52,29 @@ class CSharpParser(TreeSitterBaseParser):
     def __init__(self):
         super().__init__("c_sharp")
 
-    def extract_imports(self, root: Node, source: str) -> List[ParsedImport]:
-        """Extrae using directives de C#."""
-        imports = []
-
-        for node in self.find_nodes_by_type(root, "using_directive"):
-            # Extraer el namespace
-            namespace = self._extract_namespace(node, source)
-            if namespace:
-                imports.append(ParsedImport(
-                    module=namespace,
-                    line=self.get_node_line(node),
-                ))
+    def node_extractors(self) -> Dict[str, List[Tuple[str, Callable[[Node, bytes], Any]]]]:
+        """Usings, clases, llamadas y strings de C# (sin funciones de nivel superior)."""
+        return {
+            "imports": [("using_directive", self._parse_using)],
+            "classes": [("class_declaration", self._parse_class)],
+            # C# 9+ soporta top-level statements, pero son raros en test automation
+            "functions": [],
+            "calls": [("invocation_expression", self._parse_call)],
+            # String literals regulares e interpolated strings
+            "strings": [("string_literal", self._parse_string),
+                        ("interpolated_string_expression", self._parse_interpolated_string)],
+        }
 
-        return imports
+    def _parse_using(self, node: Node, source: str) -> Optional[ParsedImport]:
+        """Parsea un using directive de C#."""
+        # Extraer el namespace
+        namespace = self._extract_namespace(node, source)
+        if not namespace:
+            return None
+        return ParsedImport(
+            module=namespace,
+            line=self.get_node_line(node),
+        )
 
     def _extract_namespace(self, using_node: Node, source: str) -> Optional[str]:
         """Extrae el namespace de un using directive."""
@@ -85,17 +94,6 @@ class CSharpParser(TreeSitterBaseParser):
 
         return None
 
-    def extract_classes(self, root: Node, source: str) -> List[ParsedClass]:
-        """Extrae clases de C#."""
-        classes = []
-
-        for class_node in self.find_nodes_by_type(root, "class_declaration"):
-            parsed_class = self._parse_class(class_node, source)
-            if parsed_class:
-                classes.append(parsed_class)
-
-        return classes
-
     def _parse_class(self, class_node: Node, source: str) -> Optional[ParsedClass]:
         """Parsea una declaración de clase C#."""
         # Obtener nombre
@@ -123,10 +121,17 @@ class CSharpParser(TreeSitterBaseParser):
         methods = []
         body = self.find_child_by_type(class_node, "declaration_list")
         if body:
-            for method_node in self.find_children_by_type(body, "method_declaration"):
-                method = self._parse_method(method_node, source)
-                if method:
-                    methods.append(method)
+            # attribute_list hermanos inmediatamente anteriores a cada método, en un solo recorrido
+            attribute_lists: List[Node] = []
+            for child in body.children:
+                if child.type == "method_declaration":
+                    method = self._parse_method(child, source, attribute_lists[::-1])
+                    if method:
+                        methods.append(method)
+                if child.type == "attribute_list":
+                    attribute_lists.append(child)
+                else:
+                    attribute_lists = []
 
         return ParsedClass(
             name=class_name,
@@ -137,8 +142,17 @@ class CSharpParser(TreeSitterBaseParser):
             is_page_object=is_page_object,
         )
 
-    def _parse_method(self, method_node: Node, source: str) -> Optional[ParsedFunction]:
-        """Parsea una declaración de método C#."""
+    def _parse_method(self, method_node: Node, source: str,
+                      preceding: Optional[List[Node]] = None) -> Optional[ParsedFunction]:
+        """
+        Parsea una declaración de método C#.
+
+        Args:
+            method_node: Nodo method_declaration
+            source: Código fuente
+            preceding: attribute_list hermanos anteriores al método, del más
+                cercano al más lejano (si None, se buscan en el padre)
+        """
         # Obtener nombre
         name_node = self.find_child_by_type(method_node, "identifier")
         if not name_node:
@@ -147,7 +161,7 @@ class CSharpParser(TreeSitterBaseParser):
         method_name = self.get_node_text(name_node, source)
 
         # Obtener atributos/decoradores
-        decorators = self._extract_attributes(method_node, source)
+        decorators = self._extract_attributes(method_node, source, preceding)
 
         # Detectar si es async
         is_async = any(
@@ -167,7 +181,8 @@ class CSharpParser(TreeSitterBaseParser):
             is_async=is_async,
         )
 
-    def _extract_attributes(self, node: Node, source: str) -> List[str]:
+    def _extract_attributes(self, node: Node, source: str,
+                            preceding: Optional[List[Node]] = None) -> List[str]:
         """Extrae atributos ([Test], [SetUp], etc.) de un nodo."""
         attributes = []
 
@@ -180,20 +195,22 @@ class CSharpParser(TreeSitterBaseParser):
                         attributes.append(self.get_node_text(name_node, source))
 
         # También buscar en el padre (los atributos pueden estar antes del método)
-        if node.parent:
-            idx = node.parent.children.index(node) if node in node.parent.children else -1
-            if idx > 0:
+        if preceding is None:
+            preceding = []
+            if node.parent:
+                siblings = node.parent.children
+                idx = siblings.index(node) if node in siblings else -1
                 for i in range(idx - 1, -1, -1):
-                    sibling = node.parent.children[i]
-                    if sibling.type == "attribute_list":
-                        for attr in self.find_children_by_type(sibling, "attribute"):
-                            name_node = self.find_child_by_type(attr, "identifier")
-                            if name_node:
-                                attr_name = self.get_node_text(name_node, source)
-                                if attr_name not in attributes:
-                                    attributes.append(attr_name)
-                    else:
+                    if siblings[i].type != "attribute_list":
                         break
+                    preceding.append(siblings[i])
+        for sibling in preceding:
+            for attr in self.find_children_by_type(sibling, "attribute"):
+                name_node = self.find_child_by_type(attr, "identifier")
+                if name_node:
+                    attr_name = self.get_node_text(name_node, source)
+                    if attr_name not in attributes:
+                        attributes.append(attr_name)
 
         return attributes
 
@@ -208,22 +225,6 @@ class CSharpParser(TreeSitterBaseParser):
                     parameters.append(self.get_node_text(name_node, source))
         return parameters
 
-    def extract_top_level_functions(self, root: Node, source: str) -> List[ParsedFunction]:
-        """C# tradicionalmente no tiene funciones top-level (antes de C# 9)."""
-        # C# 9+ soporta top-level statements, pero son raros en test automation
-        return []
-
-    def extract_calls(self, root: Node, source: str) -> List[ParsedCall]:
-        """Extrae llamadas a métodos de C#."""
-        calls = []
-
-        for call_node in self.find_nodes_by_type(root, "invocation_expression"):
-            call = self._parse_call(call_node, source)
-            if call:
-                calls.append(call)
-
-        return calls
-
     def _parse_call(self, call_node: Node, source: str) -> Optional[ParsedCall]:
         """Parsea una llamada a método C#."""
         full_text = self.get_node_text(call_node, source)
@@ -266,34 +267,28 @@ class CSharpParser(TreeSitterBaseParser):
 
         return None
 
-    def extract_strings(self, root: Node, source: str) -> List[ParsedString]:
-        """Extrae strings literales de C#."""
-        strings = []
-
-        # String literals regulares
-        for string_node in self.find_nodes_by_type(root, "string_literal"):
-            value = self.get_node_text(string_node, source)
-            # Quitar comillas
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            elif value.startswith('@"') and value.endswith('"'):
-                value = value[2:-1]
-            strings.append(ParsedString(
-                value=value,
-                line=self.get_node_line(string_node),
-            ))
-
-        # Interpolated strings
-        for interp_node in self.find_nodes_by_type(root, "interpolated_string_expression"):
-            value = self.get_node_text(interp_node, source)
-            if value.startswith('$"') and value.endswith('"'):
-                value = value[2:-1]
-            strings.append(ParsedString(
-                value=value,
-                line=self.get_node_line(interp_node),
-            ))
-
-        return strings
+    def _parse_string(self, string_node: Node, source: str) -> ParsedString:
+        """Parsea un string literal regular de C#."""
+        value = self.get_node_text(string_node, source)
+        # Quitar comillas
+        if value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        elif value.startswith('@"') and value.endswith('"'):
+            value = value[2:-1]
+        return ParsedString(
+            value=value,
+            line=self.get_node_line(string_node),
+        )
+
+    def _parse_interpolated_string(self, interp_node: Node, source: str) -> ParsedString:
+        """Parsea un interpolated string de C#."""
+        value = self.get_node_text(interp_node, source)
+        if value.startswith('$"') and value.endswith('"'):
+            value = value[2:-1]
+        return ParsedString(
+            value=value,
+            line=self.get_node_line(interp_node),
+        )
 
     # --- Utilidades específicas de C# ---
 
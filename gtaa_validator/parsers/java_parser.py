@@ -7,7 +7,7 @@ para análisis de violaciones gTAA.
 Fase 9: Soporte multilenguaje.
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from tree_sitter import Node
 
 from gtaa_validator.parsers.treesitter_base import (
@@ -42,32 +42,26 @@ class JavaParser(TreeSitterBaseParser):
     def __init__(self):
         super().__init__("java")
 
-    def extract_imports(self, root: Node, source: str) -> List[ParsedImport]:
-        """Extrae import statements de Java."""
-        imports = []
-
-        for node in self.find_nodes_by_type(root, "import_declaration"):
-            # Extraer el nombre del paquete/clase importado
-            scoped_id = self.find_child_by_type(node, "scoped_identifier")
-            if scoped_id:
-                module = self.get_node_text(scoped_id, source)
-                imports.append(ParsedImport(
-                    module=module,
-                    line=self.get_node_line(node),
-                ))
-
-        return imports
-
-    def extract_classes(self, root: Node, source: str) -> List[ParsedClass]:
-        """Extrae clases y sus métodos de Java."""
-        classes = []
-
-        for class_node in self.find_nodes_by_type(root, "class_declaration"):
-            parsed_class = self._parse_class(class_node, source)
-            if parsed_class:
-                classes.append(parsed_class)
-
-        return classes
+    def node_extractors(self) -> Dict[str, List[Tuple[str, Callable[[Node, bytes], Any]]]]:
+        """Imports, clases, llamadas y strings de Java (sin funciones de nivel superior)."""
+        return {
+            "imports": [("import_declaration", self._parse_import)],
+            "classes": [("class_declaration", self._parse_class)],
+            "functions": [],
+            "calls": [("method_invocation", self._parse_method_call)],
+            "strings": [("string_literal", self._parse_string)],
+        }
+
+    def _parse_import(self, node: Node, source: str) -> Optional[ParsedImport]:
+        """Parsea un import statement de Java."""
+        # Extraer el nombre del paquete/clase importado
+        scoped_id = self.find_child_by_type(node, "scoped_identifier")
+        if not scoped_id:
+            return None
+        return ParsedImport(
+            module=self.get_node_text(scoped_id, source),
+            line=self.get_node_line(node),
+        )
 
     def _parse_class(self, class_node: Node, source: str) -> Optional[ParsedClass]:
         """Parsea una declaración de clase Java."""
@@ -97,10 +91,17 @@ class JavaParser(TreeSitterBaseParser):
         methods = []
         body = self.find_child_by_type(class_node, "class_body")
         if body:
-            for method_node in self.find_children_by_type(body, "method_declaration"):
-                method = self._parse_method(method_node, source)
-                if method:
-                    methods.append(method)
+            # Anotaciones sueltas del cuerpo que preceden a cada método, en un solo recorrido
+            preceding: List[str] = []
+            for child in body.children:
+                if child.type == "method_declaration":
+                    method = self._parse_method(child, source, preceding)
+                    if method:
+                        methods.append(method)
+                elif child.type in ("annotation", "marker_annotation"):
+                    ann_name = self.find_child_by_type(child, "identifier")
+                    if ann_name:
+                        preceding.append(self.get_node_text(ann_name, source))
 
         return ParsedClass(
             name=class_name,
@@ -111,8 +112,17 @@ class JavaParser(TreeSitterBaseParser):
             is_page_object=is_page_object,
         )
 
-    def _parse_method(self, method_node: Node, source: str) -> Optional[ParsedFunction]:
-        """Parsea una declaración de método Java."""
+    def _parse_method(self, method_node: Node, source: str,
+                      preceding: Optional[List[str]] = None) -> Optional[ParsedFunction]:
+        """
+        Parsea una declaración de método Java.
+
+        Args:
+            method_node: Nodo method_declaration
+            source: Código fuente
+            preceding: Anotaciones sueltas que preceden al método en el cuerpo
+                de la clase (si None, se buscan entre sus hermanos)
+        """
         # Obtener nombre del método
         name_node = self.find_child_by_type(method_node, "identifier")
         if not name_node:
@@ -121,27 +131,18 @@ class JavaParser(TreeSitterBaseParser):
         method_name = self.get_node_text(name_node, source)
 
         # Obtener anotaciones/decoradores
-        decorators = []
         # Las anotaciones están antes del método en el padre
-        parent = method_node.parent
-        if parent:
-            for sibling in parent.children:
+        if preceding is None:
+            preceding = []
+            parent = method_node.parent
+            for sibling in (parent.children if parent else []):
+                if sibling == method_node:
+                    break
                 if sibling.type == "annotation" or sibling.type == "marker_annotation":
-                    # Extraer nombre de la anotación
                     ann_name = self.find_child_by_type(sibling, "identifier")
                     if ann_name:
-                        decorators.append(self.get_node_text(ann_name, source))
-                if sibling == method_node:
-                    break
-
-        # También buscar anotaciones directamente asociadas
-        for i, child in enumerate(method_node.parent.children if method_node.parent else []):
-            if child == method_node and i > 0:
-                prev = method_node.parent.children[i - 1]
-                if prev.type in ("annotation", "marker_annotation"):
-                    ann_name = self.find_child_by_type(prev, "identifier")
-                    if ann_name and self.get_node_text(ann_name, source) not in decorators:
-                        decorators.append(self.get_node_text(ann_name, source))
+                        preceding.append(self.get_node_text(ann_name, source))
+        decorators = list(preceding)
 
         # Buscar modifiers que contienen anotaciones
         modifiers = self.find_child_by_type(method_node, "modifiers")
@@ -176,21 +177,6 @@ class JavaParser(TreeSitterBaseParser):
             parameters=parameters,
         )
 
-    def extract_top_level_functions(self, root: Node, source: str) -> List[ParsedFunction]:
-        """Java no tiene funciones de nivel superior, retorna lista vacía."""
-        return []
-
-    def extract_calls(self, root: Node, source: str) -> List[ParsedCall]:
-        """Extrae llamadas a métodos de Java."""
-        calls = []
-
-        for call_node in self.find_nodes_by_type(root, "method_invocation"):
-            call = self._parse_method_call(call_node, source)
-            if call:
-                calls.append(call)
-
-        return calls
-
     def _parse_method_call(self, call_node: Node, source: str) -> Optional[ParsedCall]:
         """Parsea una llamada a método Java."""
         full_text = self.get_node_text(call_node, source)
@@ -238,21 +224,16 @@ class JavaParser(TreeSitterBaseParser):
 
         return None
 
-    def extract_strings(self, root: Node, source: str) -> List[ParsedString]:
-        """Extrae strings literales de Java."""
-        strings = []
-
-        for string_node in self.find_nodes_by_type(root, "string_literal"):
-            value = self.get_node_text(string_node, source)
-            # Quitar comillas
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            strings.append(ParsedString(
-                value=value,
-                line=self.get_node_line(string_node),
-            ))
-
-        return strings
+    def _parse_string(self, string_node: Node, source: str) -> ParsedString:
+        """Parsea un string literal de Java."""
+        value = self.get_node_text(string_node, source)
+        # Quitar comillas
+        if value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        return ParsedString(
+            value=value,
+            line=self.get_node_line(string_node),
+        )
 
     # --- Utilidades específicas de Java ---
 
@@ -7,7 +7,7 @@ para análisis de violaciones gTAA.
 Fase 9: Soporte multilenguaje.
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from tree_sitter import Node
 
 from gtaa_validator.parsers.treesitter_base import (
@@ -47,34 +47,44 @@ class JSParser(TreeSitterBaseParser):
         """
         super().__init__(language)
 
-    def extract_imports(self, root: Node, source: str) -> List[ParsedImport]:
-        """Extrae imports de JavaScript/TypeScript."""
-        imports = []
-
-        # ES6 imports: import X from 'module'
-        for node in self.find_nodes_by_type(root, "import_statement"):
-            module = self._extract_import_source(node, source)
-            if module:
-                imports.append(ParsedImport(
-                    module=module,
-                    line=self.get_node_line(node),
-                ))
-
-        # CommonJS require: const X = require('module')
-        for node in self.find_nodes_by_type(root, "call_expression"):
-            func = self.find_child_by_type(node, "identifier")
-            if func and self.get_node_text(func, source) == "require":
-                args = self.find_child_by_type(node, "arguments")
-                if args:
-                    string_node = self.find_child_by_type(args, "string")
-                    if string_node:
-                        module = self.get_node_text(string_node, source).strip("'\"")
-                        imports.append(ParsedImport(
-                            module=module,
-                            line=self.get_node_line(node),
-                        ))
-
-        return imports
+    def node_extractors(self) -> Dict[str, List[Tuple[str, Callable[[Node, bytes], Any]]]]:
+        """Imports (ES6 y require), clases, funciones, llamadas y strings de JS/TS."""
+        return {
+            # ES6 imports: import X from 'module'; CommonJS: const X = require('module')
+            "imports": [("import_statement", self._parse_import),
+                        ("call_expression", self._parse_require)],
+            # También class expressions: const X = class {}
+            "classes": [("class_declaration", self._parse_class),
+                        ("class", self._parse_class)],
+            # function foo() {} y arrow functions asignadas: const foo = () => {}
+            "functions": [("function_declaration", self._parse_function),
+                          ("variable_declarator", self._parse_arrow_declarator)],
+            "calls": [("call_expression", self._parse_call)],
+            # String literals y template literals
+            "strings": [("string", self._parse_string),
+                        ("template_string", self._parse_template_string)],
+        }
+
+    def _parse_import(self, node: Node, source: str) -> Optional[ParsedImport]:
+        """Parsea un import ES6."""
+        module = self._extract_import_source(node, source)
+        if not module:
+            return None
+        return ParsedImport(module=module, line=self.get_node_line(node))
+
+    def _parse_require(self, node: Node, source: str) -> Optional[ParsedImport]:
+        """Parsea una llamada require('module') como import; None si es otra llamada."""
+        func = self.find_child_by_type(node, "identifier")
+        if not func or self.get_node_text(func, source) != "require":
+            return None
+        args = self.find_child_by_type(node, "arguments")
+        string_node = self.find_child_by_type(args, "string") if args else None
+        if not string_node:
+            return None
+        return ParsedImport(
+            module=self.get_node_text(string_node, source).strip("'\""),
+            line=self.get_node_line(node),
+        )
 
     def _extract_import_source(self, import_node: Node, source: str) -> Optional[str]:
         """Extrae el módulo de un import statement."""
@@ -84,23 +94,6 @@ class JSParser(TreeSitterBaseParser):
             return self.get_node_text(string_node, source).strip("'\"")
         return None
 
-    def extract_classes(self, root: Node, source: str) -> List[ParsedClass]:
-        """Extrae clases de JavaScript/TypeScript."""
-        classes = []
-
-        for class_node in self.find_nodes_by_type(root, "class_declaration"):
-            parsed_class = self._parse_class(class_node, source)
-            if parsed_class:
-                classes.append(parsed_class)
-
-        # También class expressions: const X = class {}
-        for class_node in self.find_nodes_by_type(root, "class"):
-            parsed_class = self._parse_class(class_node, source)
-            if parsed_class:
-                classes.append(parsed_class)
-
-        return classes
-
     def _parse_class(self, class_node: Node, source: str) -> Optional[ParsedClass]:
         """Parsea una declaración de clase JS/TS."""
         # Obtener nombre
@@ -170,27 +163,15 @@ class JSParser(TreeSitterBaseParser):
             is_async=is_async,
         )
 
-    def extract_top_level_functions(self, root: Node, source: str) -> List[ParsedFunction]:
-        """Extrae funciones de nivel superior de JS/TS."""
-        functions = []
-
-        # Function declarations: function foo() {}
-        for func_node in self.find_nodes_by_type(root, "function_declaration"):
-            func = self._parse_function(func_node, source)
-            if func:
-                functions.append(func)
-
-        # Arrow functions asignadas: const foo = () => {}
-        for var_decl in self.find_nodes_by_type(root, "variable_declarator"):
-            init = self.find_child_by_type(var_decl, "arrow_function")
-            if init:
-                name_node = self.find_child_by_type(var_decl, "identifier")
-                if name_node:
-                    func = self._parse_arrow_function(init, source, self.get_node_text(name_node, source))
-                    if func:
-                        functions.append(func)
-
-        return functions
+    def _parse_arrow_declarator(self, var_decl: Node, source: str) -> Optional[ParsedFunction]:
+        """Parsea const foo = () => {}; None si el declarador no es una arrow function."""
+        init = self.find_child_by_type(var_decl, "arrow_function")
+        if not init:
+            return None
+        name_node = self.find_child_by_type(var_decl, "identifier")
+        if not name_node:
+            return None
+        return self._parse_arrow_function(init, source, self.get_node_text(name_node, source))
 
     def _parse_function(self, func_node: Node, source: str) -> Optional[ParsedFunction]:
         """Parsea una declaración de función JS/TS."""
@@ -239,17 +220,6 @@ class JSParser(TreeSitterBaseParser):
                         parameters.append(self.get_node_text(id_node, source))
         return parameters
 
-    def extract_calls(self, root: Node, source: str) -> List[ParsedCall]:
-        """Extrae llamadas a funciones/métodos de JS/TS."""
-        calls = []
-
-        for call_node in self.find_nodes_by_type(root, "call_expression"):
-            call = self._parse_call(call_node, source)
-            if call:
-                calls.append(call)
-
-        return calls
-
     def _parse_call(self, call_node: Node, source: str) -> Optional[ParsedCall]:
         """Parsea una llamada a función/método."""
         full_text = self.get_node_text(call_node, source)
@@ -292,33 +262,27 @@ class JSParser(TreeSitterBaseParser):
 
         return None
 
-    def extract_strings(self, root: Node, source: str) -> List[ParsedString]:
-        """Extrae strings literales de JS/TS."""
-        strings = []
-
-        # String literals
-        for string_node in self.find_nodes_by_type(root, "string"):
-            value = self.get_node_text(string_node, source)
-            # Quitar comillas
-            if (value.startswith('"') and value.endswith('"')) or \
-               (value.startswith("'") and value.endswith("'")):
-                value = value[1:-1]
-            strings.append(ParsedString(
-                value=value,
-                line=self.get_node_line(string_node),
-            ))
-
-        # Template literals
-        for template_node in self.find_nodes_by_type(root, "template_string"):
-            value = self.get_node_text(template_node, source)
-            if value.startswith("`") and value.endswith("`"):
-                value = value[1:-1]
-            strings.append(ParsedString(
-                value=value,
-                line=self.get_node_line(template_node),
-            ))
-
-        return strings
+    def _parse_string(self, string_node: Node, source: str) -> ParsedString:
+        """Parsea un string literal de JS/TS."""
+        value = self.get_node_text(string_node, source)
+        # Quitar comillas
+        if (value.startswith('"') and value.endswith('"')) or \
+           (value.startswith("'") and value.endswith("'")):
+            value = value[1:-1]
+        return ParsedString(
+            value=value,
+            line=self.get_node_line(string_node),
+        )
+
+    def _parse_template_string(self, template_node: Node, source: str) -> ParsedString:
+        """Parsea un template literal de JS/TS."""
+        value = self.get_node_text(template_node, source)
+        if value.startswith("`") and value.endswith("`"):
+            value = value[1:-1]
+        return ParsedString(
+            value=value,
+            line=self.get_node_line(template_node),
+        )
 
     # --- Utilidades específicas de JS/TS ---
 
@@ -5,11 +5,21 @@ Proporciona estructuras de datos comunes y métodos base para extraer
 información de código fuente en Java, JavaScript/TypeScript y C#.
 
 Fase 9: Soporte multilenguaje.
+
+Reparseo incremental: con una TreeCache (modos --watch, --serve y --lsp) se
+guarda el árbol anterior de cada documento. Al reparsear, la edición se
+calcula (prefijo y sufijo comunes), se aplica con tree.edit y tree-sitter
+reutiliza el árbol anterior. La extracción es nodo a nodo
+(node_extractors), así que solo se vuelven a extraer los nodos que tocan la
+edición o los rangos cuya estructura cambió (changed_ranges); el resto de
+elementos se reutiliza, desplazando sus líneas.
 """
 
+import dataclasses
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Hashable, List, Optional, Dict, Any, Set, Tuple, Union
 from abc import ABC, abstractmethod
 
 from gtaa_validator.file_utils import read_file_safe
@@ -91,6 +101,9 @@ class TreeSitterBaseParser(ABC):
         "c_sharp": [".cs"],
     }
 
+    # Gramáticas cargadas en este proceso (estadísticas de los procesos de --jobs)
+    loaded_grammars: Set[str] = set()
+
     def __init__(self, language: str):
         """
         Inicializa el parser para un lenguaje específico.
@@ -103,6 +116,7 @@ class TreeSitterBaseParser(ABC):
 
     def _create_parser(self, language: str) -> Parser:
         """Crea el parser tree-sitter para el lenguaje especificado."""
+        TreeSitterBaseParser.loaded_grammars.add(language)
         if language == "c_sharp":
             # C# usa paquete separado
             import tree_sitter_c_sharp as tscs
@@ -112,38 +126,112 @@ class TreeSitterBaseParser(ABC):
             from tree_sitter_language_pack import get_parser
             return get_parser(language)
 
-    def parse(self, source: str) -> ParseResult:
+    def parse(self, source: str, cache: Optional["TreeCache"] = None,
+              document: Optional[Hashable] = None) -> ParseResult:
         """
         Parsea código fuente y extrae información estructurada.
 
         Args:
             source: Código fuente como string
+            cache: Árboles anteriores por documento; si contiene document, el
+                reparseo y la extracción son incrementales
+            document: Clave del documento en la caché (p. ej. su ruta)
 
         Returns:
             ParseResult con imports, clases, funciones, llamadas y strings
         """
         result = ParseResult(language=self.language)
+        use_cache = cache is not None and document is not None
 
         try:
-            tree = self._parser.parse(bytes(source, "utf-8"))
+            data = bytes(source, "utf-8")
+            previous = cache.get((self.language, document)) if use_cache else None
+            if previous is not None and previous.data == data:
+                cache.unchanged_parses += 1
+                return previous.result
+
+            nodes = None
+            if previous is not None:
+                tree, nodes = self._parse_incremental(data, previous)
+                cache.incremental_parses += 1
+            else:
+                tree = self._parser.parse(data)
+                if use_cache:
+                    cache.full_parses += 1
             root = tree.root_node
 
             # Verificar errores de parsing
             if root.has_error:
                 result.parse_errors.append("El archivo contiene errores de sintaxis")
 
-            # Extraer información
-            result.imports = self.extract_imports(root, source)
-            result.classes = self.extract_classes(root, source)
-            result.functions = self.extract_top_level_functions(root, source)
-            result.calls = self.extract_calls(root, source)
-            result.strings = self.extract_strings(root, source)
+            # Extraer información (las posiciones de tree-sitter son de bytes)
+            if nodes is None:
+                nodes = self._extract_all(root, data)
+            result.imports = [item for _, _, item in nodes["imports"]]
+            result.classes = [item for _, _, item in nodes["classes"]]
+            result.functions = [item for _, _, item in nodes["functions"]]
+            result.calls = [item for _, _, item in nodes["calls"]]
+            result.strings = [item for _, _, item in nodes["strings"]]
+
+            if use_cache:
+                cache.put((self.language, document), _DocumentTree(data, tree, nodes, result))
 
         except Exception as e:
             result.parse_errors.append(f"Error de parsing: {str(e)}")
 
         return result
 
+    def _parse_incremental(self, data: bytes,
+                           previous: "_DocumentTree") -> Tuple[Any, Dict[str, list]]:
+        """
+        Reparsear a partir del árbol anterior y extraer solo lo afectado.
+
+        Un elemento anterior se conserva si su nodo no toca la edición ni los
+        rangos cambiados; los nodos nuevos que sí los tocan (incluidos sus
+        ancestros, p. ej. la clase que contiene un método editado) se
+        vuelven a extraer.
+        """
+        old = previous.data
+        start, old_end, new_end = _edit_span(old, data)
+        old_tree = previous.tree
+        old_tree.edit(
+            start_byte=start, old_end_byte=old_end, new_end_byte=new_end,
+            start_point=_point_at(old, start), old_end_point=_point_at(old, old_end),
+            new_end_point=_point_at(data, new_end),
+        )
+        tree = self._parser.parse(data, old_tree)
+
+        byte_delta = new_end - old_end
+        line_delta = data.count(b"\n", start, new_end) - old.count(b"\n", start, old_end)
+        affected = [(start, new_end)] + [
+            (r.start_byte, r.end_byte) for r in old_tree.changed_ranges(tree)
+        ]
+
+        def outside(node_start: int, node_end: int) -> bool:
+            return all(node_end < a_start or node_start > a_end for a_start, a_end in affected)
+
+        # Elementos anteriores fuera de la edición, con su posición ya desplazada
+        nodes: Dict[str, List[_Entry]] = {}
+        for category, entries in previous.nodes.items():
+            kept = nodes[category] = []
+            for entry in entries:
+                node_type, (node_start, node_end), item = entry
+                if node_end < start:
+                    if outside(node_start, node_end):
+                        kept.append(entry)
+                elif node_start > old_end:
+                    span = (node_start + byte_delta, node_end + byte_delta)
+                    if outside(*span):
+                        kept.append((node_type, span, _shift_lines(item, line_delta)))
+
+        # Nodos que tocan la edición o los rangos cambiados, extraídos de nuevo
+        fresh = self._extract_all(tree.root_node, data, affected)
+        for category, order in self._type_order().items():
+            merged = nodes[category] + fresh[category]
+            merged.sort(key=lambda e: (order[e[0]], e[1][0], -e[1][1]))
+            nodes[category] = merged
+        return tree, nodes
+
     def parse_file(self, file_path: Path) -> ParseResult:
         """
         Parsea un archivo y extrae información estructurada.
@@ -166,38 +254,102 @@ class TreeSitterBaseParser(ABC):
             result.parse_errors.append(f"Error leyendo archivo: {str(e)}")
             return result
 
-    # --- Métodos abstractos que deben implementar las subclases ---
+    # --- Extracción nodo a nodo ---
 
     @abstractmethod
+    def node_extractors(self) -> Dict[str, List[Tuple[str, Callable[[Node, bytes], Any]]]]:
+        """
+        Extractores por categoría de ParseResult (imports, classes, functions,
+        calls, strings): lista de (tipo de nodo, función nodo -> elemento o None).
+
+        Cada elemento debe depender solo del subárbol de su nodo (el reparseo
+        incremental reutiliza los elementos de los nodos no afectados). El
+        orden de la lista es el orden de los elementos en el resultado.
+        """
+
     def extract_imports(self, root: Node, source: str) -> List[ParsedImport]:
         """Extrae imports/using del AST."""
-        pass
+        return [item for _, _, item in self._extract_all(root, source)["imports"]]
 
-    @abstractmethod
     def extract_classes(self, root: Node, source: str) -> List[ParsedClass]:
         """Extrae clases del AST."""
-        pass
+        return [item for _, _, item in self._extract_all(root, source)["classes"]]
 
-    @abstractmethod
     def extract_top_level_functions(self, root: Node, source: str) -> List[ParsedFunction]:
         """Extrae funciones de nivel superior (no métodos de clase)."""
-        pass
+        return [item for _, _, item in self._extract_all(root, source)["functions"]]
 
-    @abstractmethod
     def extract_calls(self, root: Node, source: str) -> List[ParsedCall]:
         """Extrae llamadas a métodos del AST."""
-        pass
+        return [item for _, _, item in self._extract_all(root, source)["calls"]]
 
-    @abstractmethod
     def extract_strings(self, root: Node, source: str) -> List[ParsedString]:
         """Extrae strings literales del AST."""
-        pass
+        return [item for _, _, item in self._extract_all(root, source)["strings"]]
+
+    def _extract_all(self, root: Node, source: Union[str, bytes],
+                     ranges: Optional[List[Tuple[int, int]]] = None) -> Dict[str, List["_Entry"]]:
+        """
+        Recorrer el árbol una vez y extraer todas las categorías.
+
+        Args:
+            root: Nodo raíz
+            source: Código fuente (los extractores reciben sus bytes UTF-8)
+            ranges: Si se indica, solo se visitan los nodos que tocan alguno
+                de estos rangos de bytes (extremos incluidos)
+
+        Returns:
+            Categoría -> [(tipo de nodo, (byte inicial, byte final), elemento)]
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        extractors = self.node_extractors()
+        by_type: Dict[str, List[Node]] = {
+            node_type: [] for entries in extractors.values() for node_type, _ in entries
+        }
+
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if ranges is not None and not any(
+                node.start_byte <= r_end and node.end_byte >= r_start for r_start, r_end in ranges
+            ):
+                continue
+            if node.type in by_type:
+                by_type[node.type].append(node)
+            stack.extend(reversed(node.children))
+
+        result = {}
+        for category in CATEGORIES:
+            entries = result[category] = []
+            for node_type, extract in extractors.get(category, ()):
+                for node in by_type[node_type]:
+                    item = extract(node, source)
+                    if item is not None:
+                        entries.append((node_type, (node.start_byte, node.end_byte), item))
+        return result
+
+    def _type_order(self) -> Dict[str, Dict[str, int]]:
+        """Posición de cada tipo de nodo dentro de su categoría."""
+        extractors = self.node_extractors()
+        return {
+            category: {node_type: i for i, (node_type, _) in enumerate(extractors.get(category, ()))}
+            for category in CATEGORIES
+        }
 
     # --- Utilidades comunes ---
 
-    def get_node_text(self, node: Node, source: str) -> str:
-        """Obtiene el texto de un nodo del AST."""
-        return source[node.start_byte:node.end_byte]
+    def get_node_text(self, node: Node, source: Union[str, bytes]) -> str:
+        """
+        Obtiene el texto de un nodo del AST.
+
+        Las posiciones de tree-sitter son offsets de bytes UTF-8: con un str
+        cualquier carácter no ASCII anterior al nodo (ñ, é...) desplazaría
+        el texto, así que se cortan los bytes y se decodifica el trozo.
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        return source[node.start_byte:node.end_byte].decode("utf-8", errors="replace")
 
     def get_node_line(self, node: Node) -> int:
         """Obtiene el número de línea de un nodo (1-indexed)."""
@@ -241,6 +393,117 @@ class TreeSitterBaseParser(ABC):
         return cls.get_language_for_extension(extension) is not None
 
 
+# Categorías de ParseResult que se extraen nodo a nodo
+CATEGORIES = ("imports", "classes", "functions", "calls", "strings")
+
+# Elemento extraído: (tipo de nodo, (byte inicial, byte final), elemento)
+_Entry = Tuple[str, Tuple[int, int], Any]
+
+
+@dataclass
+class _DocumentTree:
+    """Estado de un documento tras su último parseo."""
+    data: bytes
+    tree: Any
+    nodes: Dict[str, List[_Entry]]
+    result: ParseResult
+
+
+class TreeCache:
+    """
+    Último árbol de cada documento, para reparseos incrementales (LRU).
+
+    Atributos:
+        max_documents: Documentos que se conservan como máximo
+        full_parses: Parseos sin árbol anterior
+        incremental_parses: Reparseos a partir del árbol anterior
+        unchanged_parses: Parseos evitados porque el contenido no cambió
+    """
+
+    def __init__(self, max_documents: int = 256):
+        self.max_documents = max_documents
+        self.full_parses = 0
+        self.incremental_parses = 0
+        self.unchanged_parses = 0
+        self._documents: "OrderedDict[Hashable, _DocumentTree]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, key: Hashable) -> Optional[_DocumentTree]:
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+        return document
+
+    def put(self, key: Hashable, document: _DocumentTree) -> None:
+        self._documents[key] = document
+        self._documents.move_to_end(key)
+        while len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._documents.pop(key, None)
+
+    def to_dict(self) -> dict:
+        return {
+            "documents": len(self._documents),
+            "full_parses": self.full_parses,
+            "incremental_parses": self.incremental_parses,
+            "unchanged_parses": self.unchanged_parses,
+        }
+
+
+def _edit_span(old: bytes, new: bytes) -> Tuple[int, int, int]:
+    """(inicio, fin antiguo, fin nuevo) de la única región que difiere entre old y new."""
+    limit = min(len(old), len(new))
+    old_view, new_view = memoryview(old), memoryview(new)
+
+    # Prefijo común por búsqueda binaria (comparaciones en C)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old_view[:mid] == new_view[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+
+    # Sufijo común sin solaparse con el prefijo
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old_view[len(old) - mid:] == new_view[len(new) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    suffix = lo
+
+    return prefix, len(old) - suffix, len(new) - suffix
+
+
+def _point_at(data: bytes, offset: int) -> Tuple[int, int]:
+    """(fila, columna en bytes) del offset, como los puntos de tree-sitter."""
+    row = data.count(b"\n", 0, offset)
+    return row, offset - (data.rfind(b"\n", 0, offset) + 1)
+
+
+def _shift_lines(item: Any, delta: int) -> Any:
+    """Copia del elemento con sus números de línea desplazados delta líneas."""
+    if delta == 0:
+        return item
+    if isinstance(item, ParsedClass):
+        return dataclasses.replace(
+            item, line_start=item.line_start + delta, line_end=item.line_end + delta,
+            methods=[_shift_lines(m, delta) for m in item.methods],
+        )
+    if isinstance(item, ParsedFunction):
+        return dataclasses.replace(
+            item, line_start=item.line_start + delta, line_end=item.line_end + delta,
+        )
+    return dataclasses.replace(item, line=item.line + delta)
+
+
 def get_parser_for_file(file_path: Path):
     """
     Factory function para obtener el parser correcto basado en la extensión.
@@ -4,12 +4,30 @@ Generador de reportes en formato HTML.
 Produce un dashboard visual autocontenido (HTML + CSS + SVG inline)
 con gráficos de distribución de violaciones, gauge de score y tabla detallada.
 Sin dependencias externas — todo generado con f-strings de Python.
+
+La tabla de violaciones tiene dos modos:
+- static: una fila <tr> por violación renderizada en Python (informes pequeños)
+- interactive: las violaciones se embeben una sola vez como JSON compacto
+  (opcionalmente gzip+base64), con descripciones y recomendaciones
+  deduplicadas por ViolationType; un script inline pagina y filtra la tabla
+  en el navegador. Pensado para informes con decenas de miles de violaciones.
+
+Para monorepos, generate_sharded() escribe un índice (resumen, score y
+agregados por directorio) más una página ligera por directorio o archivo
+con violaciones. Las páginas se escriben en paralelo y las que no cambiaron
+desde la ejecución anterior (mismo hash de sus violaciones) se omiten.
 """
 
+import base64
+import gzip
+import hashlib
 import html
+import json
+import re
 from collections import defaultdict
-from pathlib import Path
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
 
 from gtaa_validator.models import Report, Severity, Violation, ViolationType, get_score_label
 
@@ -25,22 +43,14 @@ class HtmlReporter:
         "LOW": "#2563eb",
     }
 
-    # Mapeo de ViolationType a nombre de checker legible
-    _CHECKER_NAMES: Dict[str, str] = {
-        "ADAPTATION_IN_DEFINITION": "DefinitionChecker — Separación de capas",
-        "MISSING_LAYER_STRUCTURE": "StructureChecker — Estructura del proyecto",
-        "HARDCODED_TEST_DATA": "QualityChecker — Calidad de tests",
-        "ASSERTION_IN_POM": "AdaptationChecker — Page Objects",
-        "FORBIDDEN_IMPORT": "AdaptationChecker — Page Objects",
-        "BUSINESS_LOGIC_IN_POM": "AdaptationChecker — Page Objects",
-        "DUPLICATE_LOCATOR": "AdaptationChecker — Page Objects",
-        "LONG_TEST_FUNCTION": "QualityChecker — Calidad de tests",
-        "POOR_TEST_NAMING": "QualityChecker — Calidad de tests",
-        # Semánticas (Fase 5)
-        "UNCLEAR_TEST_PURPOSE": "SemanticAnalyzer — Análisis AI",
-        "PAGE_OBJECT_DOES_TOO_MUCH": "SemanticAnalyzer — Análisis AI",
-        "IMPLICIT_TEST_DEPENDENCY": "SemanticAnalyzer — Análisis AI",
-        "MISSING_WAIT_STRATEGY": "SemanticAnalyzer — Análisis AI",
+    # Nombre legible de cada checker (ver ViolationType.get_checker)
+    _CHECKER_LABELS: Dict[str, str] = {
+        "StructureChecker": "StructureChecker — Estructura del proyecto",
+        "DefinitionChecker": "DefinitionChecker — Separación de capas",
+        "AdaptationChecker": "AdaptationChecker — Page Objects",
+        "QualityChecker": "QualityChecker — Calidad de tests",
+        "BDDChecker": "BDDChecker — BDD/Gherkin",
+        "SemanticAnalyzer": "SemanticAnalyzer — Análisis AI",
     }
 
     # Nombres de severidad en español
@@ -70,13 +80,33 @@ class HtmlReporter:
     }
 
     # Orden de los checkers para agrupación
-    _CHECKER_ORDER = [
-        "StructureChecker — Estructura del proyecto",
-        "DefinitionChecker — Separación de capas",
-        "AdaptationChecker — Page Objects",
-        "QualityChecker — Calidad de tests",
-        "SemanticAnalyzer — Análisis AI",
-    ]
+    _CHECKER_ORDER = list(_CHECKER_LABELS.values())
+
+    # Modos de la tabla de violaciones ("auto" elige según el volumen)
+    TABLE_MODES = ("auto", "static", "interactive")
+
+    # A partir de este número de violaciones el modo auto usa la tabla interactiva
+    INTERACTIVE_THRESHOLD = 1000
+
+    # Filas por página en la tabla interactiva
+    PAGE_SIZE = 100
+
+    _SEVERITY_ORDER = {Severity.CRITICAL: 0, Severity.HIGH: 1, Severity.MEDIUM: 2, Severity.LOW: 3}
+
+    def __init__(self, table_mode: str = "auto", compress: bool = False):
+        """
+        Args:
+            table_mode: "static", "interactive" o "auto" (interactiva si hay
+                        más de INTERACTIVE_THRESHOLD violaciones)
+            compress: Embeber los datos de la tabla interactiva como gzip+base64
+        """
+        if table_mode not in self.TABLE_MODES:
+            raise ValueError(
+                f"Modo de tabla no soportado: {table_mode!r} "
+                f"(opciones: {', '.join(self.TABLE_MODES)})"
+            )
+        self.table_mode = table_mode
+        self.compress = compress
 
     def generate(self, report: Report, output_path: Path) -> None:
         """
@@ -90,8 +120,17 @@ class HtmlReporter:
         output_path = Path(output_path)
         output_path.write_text(html_content, encoding="utf-8")
 
-    def _build_html(self, report: Report) -> str:
-        """Construir el documento HTML completo."""
+    def _build_html(self, report: Report, violations_html: Optional[str] = None) -> str:
+        """
+        Construir el documento HTML completo.
+
+        Args:
+            report: Resultado del análisis
+            violations_html: Sección que sustituye a la tabla de violaciones
+                             (el índice del modo sharded)
+        """
+        if violations_html is None:
+            violations_html = self._build_violations_section(report)
         severity_counts = report.get_violation_count_by_severity()
         score_color = self._get_score_color(report.score)
         score_label = self._get_score_label(report.score)
@@ -146,7 +185,7 @@ class HtmlReporter:
 
 {self._build_actionable_summary(report)}
 
-{self._build_violations_by_checker(report)}
+{violations_html}
 
         <footer>
             <p>Generado por <strong>gTAA AI Validator</strong> v{report.validator_version}</p>
@@ -180,6 +219,11 @@ class HtmlReporter:
             color: #94a3b8; font-size: 0.8125rem;
         }
         header .meta strong { color: #e2e8f0; }
+        header .meta a { color: #c7d2fe; text-decoration: none; }
+        header .meta a:hover { text-decoration: underline; }
+        td.num { text-align: right; font-variant-numeric: tabular-nums; }
+        td a { color: #4f46e5; text-decoration: none; }
+        td a:hover { text-decoration: underline; }
 
         /* --- Score section: hero gradient (only gradient in page) --- */
         .score-section {
@@ -294,6 +338,20 @@ class HtmlReporter:
         .violation-type { font-weight: 600; color: #334155; font-size: 0.875rem; }
         .violation-desc { font-size: 0.8125rem; color: #64748b; }
 
+        /* --- Interactive table (paging + filters) --- */
+        .table-controls { display: flex; flex-wrap: wrap; gap: 0.6rem; margin-bottom: 1rem; }
+        .table-controls select, .table-controls input {
+            padding: 0.4rem 0.6rem; border: 1px solid #cbd5e1; border-radius: 6px;
+            font-size: 0.8125rem; background: #fff; color: #1e293b;
+        }
+        .table-controls input { flex: 1; min-width: 200px; }
+        .pager { display: flex; justify-content: center; align-items: center; gap: 1rem; margin-top: 1rem; font-size: 0.8125rem; color: #475569; }
+        .pager button {
+            padding: 0.35rem 0.8rem; border: 1px solid #cbd5e1; border-radius: 6px;
+            background: #fff; color: #334155; cursor: pointer;
+        }
+        .pager button:disabled { opacity: 0.4; cursor: default; }
+
         /* --- Metrics section --- */
         .metrics-section {
             background: #ffffff; border-radius: 12px; padding: 1.5rem;
@@ -510,10 +568,8 @@ class HtmlReporter:
         if not report.violations:
             return ""
 
-        # Contar por tipo de violación
-        type_counts: Dict[ViolationType, int] = defaultdict(int)
-        for v in report.violations:
-            type_counts[v.violation_type] += 1
+        # Recuento por tipo desde la vista agrupada del informe
+        type_counts = {vtype: len(vs) for vtype, vs in report.violations_by_type().items()}
 
         # Ordenar por severidad y luego por cantidad
         severity_order = {Severity.CRITICAL: 0, Severity.HIGH: 1, Severity.MEDIUM: 2, Severity.LOW: 3}
@@ -539,13 +595,268 @@ class HtmlReporter:
 {items_html}
         </section>"""
 
-    def _group_violations_by_checker(self, violations: List[Violation]) -> Dict[str, List[Violation]]:
-        """Agrupar violaciones por checker."""
+    # ------------------------------------------------------------------
+    # Modo sharded (índice + una página por directorio o archivo)
+    # ------------------------------------------------------------------
+
+    SHARD_GRANULARITIES = ("directory", "file")
+
+    # Subdirectorio de las páginas y manifiesto con el hash de cada una
+    SHARDS_DIRNAME = "shards"
+    SHARD_MANIFEST = "shards.json"
+
+    # Nombres que genera _shard_filename (el manifiesto puede estar manipulado)
+    SHARD_FILENAME_PATTERN = re.compile(r"[A-Za-z0-9_.-]{1,60}-[0-9a-f]{8}\.html")
+
+    def generate_sharded(self, report: Report, output_dir: Path,
+                         shard_by: str = "directory",
+                         max_workers: Optional[int] = None) -> dict:
+        """
+        Generar un reporte HTML fragmentado en output_dir.
+
+        Escribe output_dir/index.html y una página por directorio (o archivo)
+        con violaciones en output_dir/shards/. Una página solo se reescribe si
+        el hash de sus violaciones difiere del registrado en el manifiesto; las
+        páginas de grupos que ya no tienen violaciones se eliminan.
+
+        Args:
+            report: Resultado del análisis
+            output_dir: Directorio de salida (se crea si no existe)
+            shard_by: "directory" o "file"
+            max_workers: Hilos de escritura (por defecto, los de ThreadPoolExecutor)
+
+        Returns:
+            Estadísticas: {"shards", "written", "skipped", "removed"}
+        """
+        if shard_by not in self.SHARD_GRANULARITIES:
+            raise ValueError(
+                f"Granularidad no soportada: {shard_by!r} "
+                f"(opciones: {', '.join(self.SHARD_GRANULARITIES)})"
+            )
+        output_dir = Path(output_dir)
+        shards_dir = output_dir / self.SHARDS_DIRNAME
+        shards_dir.mkdir(parents=True, exist_ok=True)
+
+        groups = self._group_violations_by_shard(report, shard_by)
+        shards = {
+            key: (self._shard_filename(key), self._shard_digest(report, shard_by, key, violations))
+            for key, violations in groups.items()
+        }
+
+        manifest_path = output_dir / self.SHARD_MANIFEST
+        previous = self._load_shard_manifest(manifest_path)
+        pending = [
+            key for key, (filename, digest) in shards.items()
+            if previous.get(filename) != digest or not (shards_dir / filename).exists()
+        ]
+
+        def write_shard(key: str) -> None:
+            page = self._build_shard_html(report, shard_by, key, groups[key])
+            (shards_dir / shards[key][0]).write_text(page, encoding="utf-8")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(write_shard, pending))
+
+        current = {filename: digest for filename, digest in shards.values()}
+        removed = 0
+        for filename in previous.keys() - current.keys():
+            stale = shards_dir / filename
+            # Solo páginas de shard dentro de shards/, nunca rutas arbitrarias
+            if stale.resolve().parent != shards_dir.resolve():
+                continue
+            if stale.is_file():
+                stale.unlink()
+                removed += 1
+
+        index_html = self._build_html(report, self._build_shard_index(report, shard_by, groups, shards))
+        (output_dir / "index.html").write_text(index_html, encoding="utf-8")
+        manifest_path.write_text(json.dumps(current, indent=2, sort_keys=True), encoding="utf-8")
+
+        return {
+            "shards": len(shards),
+            "written": len(pending),
+            "skipped": len(shards) - len(pending),
+            "removed": removed,
+        }
+
+    def _group_violations_by_shard(self, report: Report, shard_by: str) -> Dict[str, List[Violation]]:
+        """Agrupar violaciones por directorio o archivo relativo al proyecto (orden por clave)."""
         groups: Dict[str, List[Violation]] = defaultdict(list)
+        for violations in report.violations_by_file().values():
+            relative = PurePosixPath(Path(self._file_display(violations[0], report)).as_posix())
+            groups[str(relative if shard_by == "file" else relative.parent)].extend(violations)
+        return dict(sorted(groups.items()))
+
+    def _shard_filename(self, key: str) -> str:
+        """Nombre de archivo estable y seguro para una clave de shard."""
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", key).strip("._")[:60] or "root"
+        suffix = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{suffix}.html"
+
+    def _shard_digest(self, report: Report, shard_by: str, key: str,
+                      violations: List[Violation]) -> str:
+        """Hash de todo lo que determina el contenido de una página de shard."""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([
+            report.project_path.name, report.validator_version,
+            shard_by, key, self.table_mode, self.compress,
+        ]).encode("utf-8"))
         for v in violations:
-            checker_name = self._CHECKER_NAMES.get(v.violation_type.name, "Otro")
-            groups[checker_name].append(v)
-        return groups
+            digest.update(b"\n")
+            digest.update(json.dumps(
+                v.to_dict(project_path=report.project_path), sort_keys=True, ensure_ascii=False
+            ).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_shard_manifest(self, manifest_path: Path) -> Dict[str, str]:
+        """
+        Manifiesto de la ejecución anterior (vacío si no existe o está corrupto).
+
+        Solo se conservan las entradas con nombre de página de shard: el
+        resto (p. ej. "../index.html") no se reutiliza ni se elimina.
+        """
+        try:
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            name: digest for name, digest in data.items()
+            if isinstance(name, str) and self.SHARD_FILENAME_PATTERN.fullmatch(name)
+        }
+
+    def _build_shard_index(self, report: Report, shard_by: str,
+                           groups: Dict[str, List[Violation]],
+                           shards: Dict[str, Tuple[str, str]]) -> str:
+        """Tabla de agregados por directorio/archivo con enlace a cada página."""
+        if not groups:
+            return self._build_violations_by_checker(report)
+
+        def penalty(violations: List[Violation]) -> int:
+            return sum(v.severity.get_score_penalty() for v in violations)
+
+        column = "Directorio" if shard_by == "directory" else "Archivo"
+        rows = []
+        for key in sorted(groups, key=lambda k: (-penalty(groups[k]), k)):
+            violations = groups[key]
+            counts = defaultdict(int)
+            for v in violations:
+                counts[v.severity.value] += 1
+            cells = "".join(
+                f'<td class="num">{counts[sev]}</td>' for sev in ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+            )
+            href = f"{self.SHARDS_DIRNAME}/{shards[key][0]}"
+            rows.append(
+                f'                <tr><td><a href="{html.escape(href)}">{html.escape(key)}</a></td>'
+                f'<td class="num">{len(violations)}</td>{cells}'
+                f'<td class="num">&minus;{penalty(violations)}</td></tr>'
+            )
+
+        severity_headers = "".join(
+            f'<th style="width:80px">{self._SEVERITY_LABELS[sev]}</th>'
+            for sev in ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+        )
+        rows_html = "\n".join(rows)
+        return f"""        <section class="checker-group">
+            <h3>Violaciones por {column.lower()} ({len(groups)})</h3>
+            <p class="checker-subtitle">Ordenado por penalización sobre el score. Cada enlace abre el detalle.</p>
+            <table role="table" aria-label="Violaciones por {column.lower()}">
+                <thead>
+                    <tr>
+                        <th>{column}</th>
+                        <th style="width:80px">Total</th>
+                        {severity_headers}
+                        <th style="width:100px">Penalización</th>
+                    </tr>
+                </thead>
+                <tbody>
+{rows_html}
+                </tbody>
+            </table>
+        </section>"""
+
+    def _build_shard_html(self, report: Report, shard_by: str, key: str,
+                          violations: List[Violation]) -> str:
+        """
+        Página ligera de un shard: cabecera, contadores y tabla de violaciones.
+
+        No incluye fecha ni tiempos de ejecución: su contenido depende solo de
+        las entradas del hash, así una página omitida nunca queda desfasada.
+        """
+        shard_report = Report(project_path=report.project_path, violations=list(violations))
+        counts = shard_report.get_violation_count_by_severity()
+        column = "Directorio" if shard_by == "directory" else "Archivo"
+        project_name = html.escape(str(report.project_path.name))
+
+        return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>gTAA Validator — {html.escape(key)}</title>
+    <style>
+{self._get_css()}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>gTAA AI Validator</h1>
+            <p class="subtitle">{column}: {html.escape(key)}</p>
+            <div class="meta">
+                <span>Proyecto: <strong>{project_name}</strong></span>
+                <span>Versión: <strong>{report.validator_version}</strong></span>
+                <span><a href="../index.html">&larr; Volver al índice</a></span>
+            </div>
+        </header>
+
+        <section class="summary-cards">
+            <div class="card total">
+                <div class="card-value">{len(violations)}</div>
+                <div class="card-label">Violaciones</div>
+            </div>
+{self._build_severity_cards(counts)}
+        </section>
+
+{self._build_violations_section(shard_report)}
+    </div>
+</body>
+</html>"""
+
+    def _build_violations_section(self, report: Report) -> str:
+        """Tabla de violaciones en el modo configurado."""
+        interactive = self.table_mode == "interactive" or (
+            self.table_mode == "auto" and len(report.violations) > self.INTERACTIVE_THRESHOLD
+        )
+        if interactive and report.violations:
+            return self._build_interactive_violations(report)
+        return self._build_violations_by_checker(report)
+
+    def _violation_sort_key(self, v: Violation) -> Tuple[int, str]:
+        """Orden dentro de un grupo: severidad y luego archivo."""
+        return (self._SEVERITY_ORDER.get(v.severity, 99), str(v.file_path))
+
+    def _file_display(self, v: Violation, report: Report) -> str:
+        """Ruta del archivo relativa al proyecto (o solo el nombre si está fuera)."""
+        try:
+            return str(v.file_path.relative_to(report.project_path))
+        except ValueError:
+            return str(v.file_path.name)
+
+    def _group_violations_by_checker(self, report: Report) -> Dict[str, List[Violation]]:
+        """
+        Violaciones por checker (nombre legible), ordenadas por severidad.
+
+        Reutiliza la vista agrupada del informe; las listas devueltas son
+        copias ordenadas, las del índice no se modifican.
+        """
+        groups = report.violations_by_checker()
+        return {
+            label: sorted(groups[checker], key=self._violation_sort_key)
+            for checker, label in self._CHECKER_LABELS.items()
+            if checker in groups
+        }
 
     def _build_violations_by_checker(self, report: Report) -> str:
         """Violaciones agrupadas por checker con subtítulos descriptivos."""
@@ -555,41 +866,31 @@ class HtmlReporter:
             <div class="no-violations">Sin violaciones detectadas</div>
         </section>"""
 
-        groups = self._group_violations_by_checker(report.violations)
         sections = []
+        type_cells: Dict[ViolationType, str] = {}
 
-        for checker_name in self._CHECKER_ORDER:
-            if checker_name not in groups:
-                continue
-            violations = groups[checker_name]
+        for checker_name, violations in self._group_violations_by_checker(report).items():
             count = len(violations)
 
-            # Ordenar por severidad dentro del grupo
-            severity_order = {Severity.CRITICAL: 0, Severity.HIGH: 1, Severity.MEDIUM: 2, Severity.LOW: 3}
-            violations.sort(key=lambda v: (severity_order.get(v.severity, 99), str(v.file_path)))
-
             rows = []
             for v in violations:
                 sev_lower = v.severity.value.lower()
                 sev_es = self._SEVERITY_LABELS.get(v.severity.value, v.severity.value)
                 badge = f'<span class="severity-badge badge-{sev_lower}">{sev_es}</span>'
 
-                try:
-                    file_display = str(v.file_path.relative_to(report.project_path))
-                except ValueError:
-                    file_display = str(v.file_path.name)
-
-                location = html.escape(file_display)
+                location = html.escape(self._file_display(v, report))
                 if v.line_number:
                     location += f":{v.line_number}"
 
-                # Tipo legible con descripción
-                type_label = self._VIOLATION_TYPE_LABELS.get(v.violation_type.name, v.violation_type.name)
-                type_desc = html.escape(v.violation_type.get_description())
-                type_cell = (
-                    f'<span class="violation-type">{html.escape(type_label)}</span><br>'
-                    f'<span class="violation-desc">{type_desc}</span>'
-                )
+                # Tipo legible con descripción (se renderiza una vez por tipo)
+                type_cell = type_cells.get(v.violation_type)
+                if type_cell is None:
+                    type_label = self._VIOLATION_TYPE_LABELS.get(v.violation_type.name, v.violation_type.name)
+                    type_desc = html.escape(v.violation_type.get_description())
+                    type_cell = type_cells[v.violation_type] = (
+                        f'<span class="violation-type">{html.escape(type_label)}</span><br>'
+                        f'<span class="violation-desc">{type_desc}</span>'
+                    )
 
                 snippet = ""
                 if v.code_snippet:
@@ -633,3 +934,228 @@ class HtmlReporter:
         </section>""")
 
         return "\n\n".join(sections)
+
+    # ------------------------------------------------------------------
+    # Tabla interactiva (datos embebidos + paginación en el navegador)
+    # ------------------------------------------------------------------
+
+    def _build_table_data(self, report: Report) -> dict:
+        """
+        Datos compactos de la tabla interactiva.
+
+        Descripciones, recomendaciones, etiquetas y checker se guardan una
+        vez por ViolationType y las rutas una vez por archivo; cada fila es
+        [tipo, severidad, archivo, línea, mensaje, snippet, recomendación, ai].
+        La recomendación de la fila es null cuando coincide con la del tipo.
+        Las filas siguen el orden de la tabla estática (checker, severidad, archivo).
+        """
+        severities = [sev.value for sev in self._SEVERITY_ORDER]
+        severity_index = {sev: i for i, sev in enumerate(self._SEVERITY_ORDER)}
+
+        types: List[dict] = []
+        type_index: Dict[ViolationType, int] = {}
+        files: List[str] = []
+        file_index: Dict[str, int] = {}
+        rows: List[list] = []
+
+        # Cada ruta se convierte a texto una sola vez (pathlib es costoso por fila)
+        path_text = {path: str(path) for path in report.violations_by_file()}
+        path_index: Dict[Path, int] = {}
+
+        def row_key(v: Violation) -> Tuple[int, str]:
+            return (self._SEVERITY_ORDER.get(v.severity, 99), path_text[v.file_path])
+
+        groups = report.violations_by_checker()
+        ordered = [
+            (label, v)
+            for checker, label in self._CHECKER_LABELS.items()
+            for v in sorted(groups.get(checker, ()), key=row_key)
+        ]
+        for checker_label, v in ordered:
+            vtype = v.violation_type
+            t = type_index.get(vtype)
+            if t is None:
+                t = type_index[vtype] = len(types)
+                types.append({
+                    "label": self._VIOLATION_TYPE_LABELS.get(vtype.name, vtype.name),
+                    "description": vtype.get_description(),
+                    "recommendation": vtype.get_recommendation(),
+                    "checker": checker_label,
+                })
+            f = path_index.get(v.file_path)
+            if f is None:
+                file_display = self._file_display(v, report)
+                f = file_index.get(file_display)
+                if f is None:
+                    f = file_index[file_display] = len(files)
+                    files.append(file_display)
+                path_index[v.file_path] = f
+            recommendation = None if v.recommendation == types[t]["recommendation"] else v.recommendation
+            rows.append([
+                t, severity_index[v.severity], f, v.line_number, v.message,
+                v.code_snippet, recommendation, v.ai_suggestion,
+            ])
+
+        return {
+            "severities": severities,
+            "severity_labels": [self._SEVERITY_LABELS[sev] for sev in severities],
+            "types": types,
+            "files": files,
+            "rows": rows,
+        }
+
+    def _encode_table_data(self, data: dict) -> Tuple[str, str]:
+        """Serializar los datos para un <script type="application/json">: (encoding, payload)."""
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        if self.compress:
+            compressed = gzip.compress(payload.encode("utf-8"), mtime=0)
+            return "gzip+base64", base64.b64encode(compressed).decode("ascii")
+        # "</script" o "<!--" en los datos alterarían el <script> contenedor;
+        # "\u003c" es equivalente a "<" dentro de cadenas JSON
+        return "json", payload.replace("<", "\\u003c")
+
+    def _build_interactive_violations(self, report: Report) -> str:
+        """Tabla de violaciones paginada y filtrable en el navegador."""
+        data = self._build_table_data(report)
+        encoding, payload = self._encode_table_data(data)
+
+        severity_options = "".join(
+            f'<option value="{i}">{html.escape(label)}</option>'
+            for i, label in enumerate(data["severity_labels"])
+        )
+        checkers = [name for name in self._CHECKER_ORDER
+                    if any(t["checker"] == name for t in data["types"])]
+        checker_options = "".join(
+            f'<option value="{html.escape(name)}">{html.escape(name)}</option>'
+            for name in checkers
+        )
+
+        return f"""        <section class="checker-group" id="gtaa-violations">
+            <h3>Violaciones Detectadas (<span id="gtaa-count">{len(data["rows"])}</span>)</h3>
+            <div class="table-controls">
+                <select id="gtaa-severity" aria-label="Filtrar por severidad"><option value="">Todas las severidades</option>{severity_options}</select>
+                <select id="gtaa-checker" aria-label="Filtrar por checker"><option value="">Todos los checkers</option>{checker_options}</select>
+                <input id="gtaa-search" type="search" placeholder="Filtrar por archivo o mensaje" aria-label="Filtrar por archivo o mensaje">
+            </div>
+            <table role="table" aria-label="Violaciones detectadas">
+                <thead>
+                    <tr>
+                        <th style="width:90px">Severidad</th>
+                        <th style="width:240px">Tipo</th>
+                        <th style="width:160px">Ubicación</th>
+                        <th>Detalle</th>
+                        <th style="width:280px">Recomendación</th>
+                    </tr>
+                </thead>
+                <tbody id="gtaa-rows"></tbody>
+            </table>
+            <div class="pager">
+                <button type="button" id="gtaa-prev">&larr; Anterior</button>
+                <span id="gtaa-page"></span>
+                <button type="button" id="gtaa-next">Siguiente &rarr;</button>
+            </div>
+            <noscript><div class="no-violations">Activa JavaScript para ver la tabla de violaciones.</div></noscript>
+        </section>
+        <script type="application/json" id="gtaa-data" data-encoding="{encoding}">{payload}</script>
+        <script>
+{_TABLE_SCRIPT.replace("__PAGE_SIZE__", str(self.PAGE_SIZE))}
+        </script>"""
+
+
+# Script inline de la tabla interactiva. Construye las filas con textContent
+# (nunca innerHTML con datos del informe) para no abrir vectores XSS.
+_TABLE_SCRIPT = """(function () {
+    "use strict";
+    var PAGE_SIZE = __PAGE_SIZE__;
+    var node = document.getElementById("gtaa-data");
+
+    function load() {
+        if (node.getAttribute("data-encoding") !== "gzip+base64") {
+            return Promise.resolve(JSON.parse(node.textContent));
+        }
+        var binary = atob(node.textContent.trim());
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+        return new Response(stream).text().then(JSON.parse);
+    }
+
+    function el(tag, className, text) {
+        var e = document.createElement(tag);
+        if (className) e.className = className;
+        if (text !== undefined && text !== null) e.textContent = text;
+        return e;
+    }
+
+    load().then(function (data) {
+        var tbody = document.getElementById("gtaa-rows");
+        var severity = document.getElementById("gtaa-severity");
+        var checker = document.getElementById("gtaa-checker");
+        var search = document.getElementById("gtaa-search");
+        var prev = document.getElementById("gtaa-prev");
+        var next = document.getElementById("gtaa-next");
+        var filtered = data.rows;
+        var page = 0;
+
+        function renderRow(r) {
+            var type = data.types[r[0]];
+            var sev = data.severities[r[1]];
+            var tr = document.createElement("tr");
+
+            var badge = el("td");
+            badge.appendChild(el("span", "severity-badge badge-" + sev.toLowerCase(), data.severity_labels[r[1]]));
+            if (r[7]) badge.appendChild(el("span", "ai-badge", "AI"));
+            tr.appendChild(badge);
+
+            var typeCell = el("td");
+            typeCell.appendChild(el("span", "violation-type", type.label));
+            typeCell.appendChild(document.createElement("br"));
+            typeCell.appendChild(el("span", "violation-desc", type.description));
+            tr.appendChild(typeCell);
+
+            tr.appendChild(el("td", null, data.files[r[2]] + (r[3] ? ":" + r[3] : "")));
+
+            var detail = el("td", null, r[4]);
+            if (r[5]) detail.appendChild(el("span", "code-snippet", r[5]));
+            tr.appendChild(detail);
+
+            var recommendation = el("td", null, r[6] !== null ? r[6] : type.recommendation);
+            if (r[7]) recommendation.appendChild(el("div", "ai-suggestion", "🤖 " + r[7]));
+            tr.appendChild(recommendation);
+            return tr;
+        }
+
+        function render() {
+            var pages = Math.max(1, Math.ceil(filtered.length / PAGE_SIZE));
+            var fragment = document.createDocumentFragment();
+            filtered.slice(page * PAGE_SIZE, (page + 1) * PAGE_SIZE).forEach(function (r) {
+                fragment.appendChild(renderRow(r));
+            });
+            tbody.textContent = "";
+            tbody.appendChild(fragment);
+            document.getElementById("gtaa-count").textContent = filtered.length;
+            document.getElementById("gtaa-page").textContent = "Página " + (page + 1) + " de " + pages;
+            prev.disabled = page === 0;
+            next.disabled = page >= pages - 1;
+        }
+
+        function applyFilters() {
+            var s = severity.value, c = checker.value, q = search.value.toLowerCase();
+            filtered = data.rows.filter(function (r) {
+                return (s === "" || String(r[1]) === s)
+                    && (c === "" || data.types[r[0]].checker === c)
+                    && (q === "" || data.files[r[2]].toLowerCase().indexOf(q) !== -1
+                        || r[4].toLowerCase().indexOf(q) !== -1);
+            });
+            page = 0;
+            render();
+        }
+
+        severity.addEventListener("change", applyFilters);
+        checker.addEventListener("change", applyFilters);
+        search.addEventListener("input", applyFilters);
+        prev.addEventListener("click", function () { page--; render(); });
+        next.addEventListener("click", function () { page++; render(); });
+        render();
+    });
+})();"""
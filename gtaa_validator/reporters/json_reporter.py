@@ -3,16 +3,47 @@ Generador de reportes en formato JSON.
 
 Exporta los resultados de análisis a un fichero JSON estructurado
 con metadatos, resumen y lista detallada de violaciones.
+
+El fichero se escribe en streaming: primero metadata y summary, después
+cada violación serializada por separado directamente sobre un fichero con
+buffer. Nunca se construye el documento completo en memoria, por lo que el
+consumo se mantiene constante aunque el informe tenga cientos de miles de
+violaciones.
+
+Formatos:
+- json: documento JSON único (indentado por defecto, compacto opcional)
+- ndjson: una línea con metadata y summary, luego una línea por violación
 """
 
 import json
 from pathlib import Path
+from typing import IO
 
 from gtaa_validator.models import Report
 
+# Tamaño del buffer de escritura (bytes)
+WRITE_BUFFER_SIZE = 1 << 16
+
+JSON_FORMATS = ("json", "ndjson")
+
 
 class JsonReporter:
-    """Genera reportes de análisis en formato JSON."""
+    """
+    Genera reportes de análisis en formato JSON.
+
+    Args:
+        output_format: "json" (documento único) o "ndjson" (una línea por registro)
+        compact: Sin indentación ni espacios (formato json); pensado para CI
+    """
+
+    def __init__(self, output_format: str = "json", compact: bool = False):
+        if output_format not in JSON_FORMATS:
+            raise ValueError(
+                f"Formato JSON no soportado: {output_format!r} "
+                f"(opciones: {', '.join(JSON_FORMATS)})"
+            )
+        self.output_format = output_format
+        self.compact = compact
 
     def generate(self, report: Report, output_path: Path) -> None:
         """
@@ -22,9 +53,81 @@ class JsonReporter:
             report: Resultado del análisis estático
             output_path: Ruta del fichero JSON de salida
         """
-        data = report.to_dict()
         output_path = Path(output_path)
-        output_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as fh:
+            if self.output_format == "ndjson":
+                self._write_ndjson(report, fh)
+            elif self.compact:
+                self._write_compact(report, fh)
+            else:
+                self._write_indented(report, fh)
+
+    def _write_indented(self, report: Report, fh: IO[str]) -> None:
+        """
+        Documento indentado, idéntico byte a byte a json.dumps(indent=2).
+
+        Cada sección se serializa por separado y se reindenta al nivel que
+        ocupa en el documento (JSON nunca contiene saltos de línea literales
+        dentro de cadenas, así que basta con desplazar cada "\\n").
+        """
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+        def nested(value, level: int) -> str:
+            return encoder.encode(value).replace("\n", "\n" + "  " * level)
+
+        fh.write('{\n  "metadata": ')
+        fh.write(nested(report.metadata_dict(), 1))
+        fh.write(',\n  "summary": ')
+        fh.write(nested(report.summary_dict(), 1))
+        fh.write(',\n  "violations": ')
+
+        if not report.violations:
+            fh.write("[]\n}")
+            return
+
+        # Las violaciones son diccionarios planos de escalares: se indentan a
+        # mano con el codificador en C, que no deja ciclos de closures por
+        # violación pendientes del recolector (el pico de memoria no crece)
+        scalar = json.JSONEncoder(ensure_ascii=False).encode
+        separator = "[\n    "
+        for violation in report.violations:
+            fh.write(separator)
+            fh.write("{")
+            fh.write(",".join(
+                f"\n      {scalar(key)}: {scalar(value)}"
+                for key, value in violation.to_dict(project_path=report.project_path).items()
+            ))
+            fh.write("\n    }")
+            separator = ",\n    "
+        fh.write("\n  ]\n}")
+
+    def _write_compact(self, report: Report, fh: IO[str]) -> None:
+        """Documento en una sola línea, sin espacios."""
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+        fh.write('{"metadata":')
+        fh.write(encoder.encode(report.metadata_dict()))
+        fh.write(',"summary":')
+        fh.write(encoder.encode(report.summary_dict()))
+        fh.write(',"violations":[')
+        separator = ""
+        for violation in report.violations:
+            fh.write(separator)
+            fh.write(encoder.encode(violation.to_dict(project_path=report.project_path)))
+            separator = ","
+        fh.write("]}")
+
+    def _write_ndjson(self, report: Report, fh: IO[str]) -> None:
+        """Primera línea metadata+summary, luego una violación por línea."""
+        encoder = json.JSONEncoder(
+            separators=(",", ":") if self.compact else None, ensure_ascii=False
         )
+
+        fh.write(encoder.encode({
+            "metadata": report.metadata_dict(),
+            "summary": report.summary_dict(),
+        }))
+        fh.write("\n")
+        for violation in report.violations:
+            fh.write(encoder.encode(violation.to_dict(project_path=report.project_path)))
+            fh.write("\n")
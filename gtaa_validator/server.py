@@ -0,0 +1,377 @@
+"""
+Servidor de análisis de larga duración (--serve).
+
+Cada ejecución de la CLI paga el arranque de Python, la importación de los
+parsers y la carga de .gtaa.yaml. Las integraciones con editores y los hooks
+pre-commit la invocan muchas veces por minuto, así que el servidor mantiene
+en memoria un StaticAnalyzer por proyecto (checkers, prefiltro, caché de
+resúmenes por archivo y árboles tree-sitter para reparsear de forma
+incremental) y responde peticiones JSON por un socket Unix o por HTTP en
+localhost.
+
+Métodos:
+    analyze-file: Re-verifica un archivo del proyecto (modo incremental:
+        el estado entre archivos de los demás sale de la caché de resúmenes)
+    analyze-source: Igual, pero con el contenido enviado en la petición
+        (buffer del editor sin guardar), superpuesto al disco
+    analyze-project: Análisis completo del proyecto (informe como en --json)
+    status: Proyectos cargados en memoria
+
+Formato: una petición JSON {"method": ..., "project": ..., "file": ...,
+"source": ...} por línea en el socket Unix, o POST /<method> con el cuerpo
+JSON por HTTP. La respuesta lleva "ok": true, o "ok": false y "error".
+
+La configuración se recarga sola: si .gtaa.yaml cambia (firma de
+file_signature), el analizador del proyecto se reconstruye. Las peticiones
+se atienden de una en una porque los checkers guardan estado entre
+archivos; el uso de los archivos virtuales, globales al proceso, lo
+serializa use_virtual_files() también frente a otros hilos (p. ej. la API).
+
+Solo escucha en localhost o en un socket Unix con permisos 0600: el
+servidor lee cualquier archivo al que tenga acceso su usuario. Por HTTP se
+rechazan además las peticiones con Origin (páginas web abiertas en el
+navegador) o con un Host que no es el del servidor (DNS rebinding).
+"""
+
+import json
+import logging
+import os
+import socketserver
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from gtaa_validator.analyzers.incremental import SummaryCache
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.file_utils import (
+    MAX_FILE_SIZE_BYTES, VirtualFiles, file_signature, use_virtual_files,
+)
+from gtaa_validator.models import Report
+from gtaa_validator.parsers.treesitter_base import TreeCache
+
+logger = logging.getLogger(__name__)
+
+# Host del transporte HTTP (nunca se escucha fuera de localhost)
+SERVER_HOST = "127.0.0.1"
+
+# Tamaño máximo de una petición (el contenido de analyze-source incluido)
+MAX_REQUEST_BYTES = MAX_FILE_SIZE_BYTES + 64 * 1024
+
+METHODS = ("analyze-file", "analyze-source", "analyze-project", "status")
+
+
+class RequestError(Exception):
+    """Petición inválida (método desconocido, parámetro ausente, ruta fuera del proyecto)."""
+
+
+class _Project:
+    """Analizador en memoria de un proyecto y firma de la configuración con la que se creó."""
+
+    def __init__(self, project_path: Path, config_signature):
+        self.analyzer = StaticAnalyzer(project_path)
+        self.analyzer.summary_cache = SummaryCache(
+            self.analyzer.project_path, None, self.analyzer._cache_config_key()
+        )
+        self.analyzer.tree_cache = TreeCache()
+        self.config_signature = config_signature
+        self.requests = 0
+
+
+class AnalysisService:
+    """
+    Atiende peticiones de análisis con analizadores reutilizados entre peticiones.
+
+    Es independiente del transporte: handle() recibe y devuelve diccionarios.
+    """
+
+    def __init__(self):
+        self._projects: Dict[Path, _Project] = {}
+        # Analizadores con estado entre peticiones: una petición a la vez
+        self._lock = threading.Lock()
+
+    def handle(self, request: dict) -> dict:
+        """Procesar una petición; los errores se devuelven con "ok": false."""
+        start = time.perf_counter()
+        try:
+            if not isinstance(request, dict):
+                raise RequestError("La petición debe ser un objeto JSON")
+            method = request.get("method")
+            if method not in METHODS:
+                raise RequestError(f"Método desconocido: {method!r}")
+            with self._lock:
+                response = self._dispatch(method, request)
+        except RequestError as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            logger.exception("Error atendiendo la petición")
+            return {"ok": False, "error": f"Error interno: {e}"}
+        response["ok"] = True
+        response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return response
+
+    def _dispatch(self, method: str, request: dict) -> dict:
+        if method == "status":
+            return {"projects": [
+                {"project": str(path), "requests": project.requests}
+                for path, project in sorted(self._projects.items())
+            ]}
+
+        project = self._project(request.get("project"))
+        project.requests += 1
+        analyzer = project.analyzer
+
+        if method == "analyze-project":
+            with use_virtual_files(None):
+                return {"report": analyzer.analyze().to_dict()}
+
+        file_path = self._file(analyzer.project_path, request.get("file"))
+        documents = None
+        if method == "analyze-source":
+            source = request.get("source")
+            if not isinstance(source, str):
+                raise RequestError("analyze-source requiere 'source' (texto)")
+            documents = {file_path: source}
+        return _file_response(_analyze_file(analyzer, file_path, documents), file_path)
+
+    def analyze_file(self, project_path: Path, file_path: Path,
+                     documents: Optional[Dict[Path, str]] = None) -> Report:
+        """
+        Análisis incremental de un archivo con el analizador en memoria del proyecto.
+
+        Args:
+            project_path: Directorio raíz del proyecto
+            file_path: Archivo a verificar (ruta absoluta)
+            documents: Contenido sin guardar (ruta absoluta -> texto) que se
+                superpone al disco, p. ej. los documentos abiertos en el editor
+
+        Raises:
+            RequestError: Si el proyecto o el archivo no son válidos
+        """
+        with self._lock:
+            project = self._project(str(project_path))
+            project.requests += 1
+            file_path = self._file(project.analyzer.project_path, str(file_path))
+            return _analyze_file(project.analyzer, file_path, documents)
+
+    def _project(self, value) -> _Project:
+        """Analizador del proyecto, recreado si su .gtaa.yaml cambió."""
+        if not isinstance(value, str) or not value:
+            raise RequestError("Falta 'project' (ruta al directorio del proyecto)")
+        project_path = Path(value).resolve()
+        if not project_path.is_dir():
+            raise RequestError(f"{project_path} no es un directorio válido")
+
+        signature = file_signature(project_path / ".gtaa.yaml")
+        project = self._projects.get(project_path)
+        if project is None or project.config_signature != signature:
+            if project is not None:
+                logger.info("Configuración modificada, recargando %s", project_path)
+            project = self._projects[project_path] = _Project(project_path, signature)
+        return project
+
+    @staticmethod
+    def _file(project_path: Path, value) -> Path:
+        if not isinstance(value, str) or not value:
+            raise RequestError("Falta 'file' (ruta al archivo)")
+        file_path = Path(value)
+        if not file_path.is_absolute():
+            file_path = project_path / file_path
+        file_path = file_path.resolve()
+        if project_path not in file_path.parents:
+            raise RequestError(f"{file_path} no pertenece al proyecto {project_path}")
+        return file_path
+
+
+def _analyze_file(analyzer: StaticAnalyzer, file_path: Path,
+                  documents: Optional[Dict[Path, str]]) -> Report:
+    overlay = VirtualFiles.from_contents(documents, overlay=True) if documents else None
+    with use_virtual_files(overlay):
+        return analyzer.analyze(changed_files=[file_path])
+
+
+def _file_response(report: Report, file_path: Path) -> dict:
+    """Violaciones del archivo (y de proyecto) de un análisis incremental."""
+    project_path = report.project_path
+    return {
+        "file": str(file_path.relative_to(project_path).as_posix()),
+        "violations": [v.to_dict(project_path=project_path) for v in report.violations],
+        "summary": report.summary_dict(),
+    }
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+    """Una petición JSON por línea; una respuesta JSON por línea."""
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            if len(line) > MAX_REQUEST_BYTES:
+                self._reply({"ok": False, "error": "Petición demasiado grande"})
+                return
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {"ok": False, "error": "JSON inválido"}
+            else:
+                response = self.server.service.handle(request)
+            self._reply(response)
+
+    def _reply(self, response: dict) -> None:
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    """POST /<método> con cuerpo JSON; GET /status."""
+
+    def do_GET(self):
+        if not self._from_local_client():
+            return
+        if self.path.rstrip("/") != "/status":
+            self._reply(404, {"ok": False, "error": "No encontrado"})
+            return
+        self._reply(200, self.server.service.handle({"method": "status"}))
+
+    def do_POST(self):
+        if not self._from_local_client():
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._reply(400, {"ok": False, "error": "Content-Length inválido"})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self._reply(413, {"ok": False, "error": "Petición demasiado grande"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._reply(400, {"ok": False, "error": "JSON inválido"})
+            return
+        method = self.path.strip("/")
+        if method and isinstance(request, dict):
+            request["method"] = method
+        response = self.server.service.handle(request)
+        self._reply(200 if response["ok"] else 400, response)
+
+    def _from_local_client(self) -> bool:
+        """
+        Rechazar (403) las peticiones que no vienen de un cliente local.
+
+        Cualquier página abierta en el navegador puede enviar peticiones a
+        127.0.0.1: el navegador añade Origin, y con DNS rebinding el Host es
+        el dominio del atacante. Los editores, hooks y scripts no envían
+        Origin y usan el Host de la dirección del servidor.
+        """
+        port = self.server.server_address[1]
+        hosts = {f"{SERVER_HOST}:{port}", f"localhost:{port}"}
+        origin = self.headers.get("Origin")
+        if self.headers.get("Host") in hosts and (origin is None or origin in {f"http://{h}" for h in hosts}):
+            return True
+        self._reply(403, {"ok": False, "error": "Solo se aceptan peticiones de clientes locales"})
+        return False
+
+    def _reply(self, status: int, response: dict) -> None:
+        body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("HTTP %s", format % args)
+
+
+def create_server(service: AnalysisService, socket_path: Optional[Path] = None,
+                  port: Optional[int] = None) -> socketserver.BaseServer:
+    """
+    Crear el servidor (sin arrancarlo) en un socket Unix o en localhost:port.
+
+    Args:
+        service: Servicio que atiende las peticiones
+        socket_path: Ruta del socket Unix (un socket anterior en esa ruta se reemplaza)
+        port: Puerto HTTP en 127.0.0.1 (0: puerto libre)
+
+    Raises:
+        RequestError: Si no se indica transporte, la plataforma no tiene sockets
+            Unix o socket_path ya existe y no es un socket
+    """
+    if socket_path is not None:
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise RequestError("Sockets Unix no disponibles en esta plataforma; usa --port")
+        socket_path = Path(socket_path)
+        if socket_path.exists() or socket_path.is_symlink():
+            # Solo se reemplaza un socket (de una ejecución anterior), nunca otro archivo
+            if not stat.S_ISSOCK(socket_path.lstat().st_mode):
+                raise RequestError(f"{socket_path} ya existe y no es un socket")
+            socket_path.unlink()
+        old_umask = os.umask(0o177)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(str(socket_path), _UnixHandler)
+        finally:
+            os.umask(old_umask)
+    elif port is not None:
+        server = ThreadingHTTPServer((SERVER_HOST, port), _HTTPHandler)
+    else:
+        raise RequestError("Indica un socket Unix o un puerto")
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def server_address(server: socketserver.BaseServer) -> str:
+    """Dirección legible del servidor (ruta del socket o URL)."""
+    if isinstance(server, ThreadingHTTPServer):
+        host, port = server.server_address[:2]
+        return f"http://{host}:{port}"
+    return str(server.server_address)
+
+
+def serve(socket_path: Optional[Path] = None, port: Optional[int] = None,
+          warm: Tuple[Path, ...] = (),
+          on_ready: Optional[Callable[[str], None]] = None) -> None:
+    """
+    Atender peticiones hasta Ctrl+C.
+
+    Args:
+        socket_path: Ruta del socket Unix
+        port: Puerto HTTP en localhost
+        warm: Proyectos a analizar por completo antes de escuchar
+        on_ready: Se llama con la dirección cuando el servidor escucha
+    """
+    service = AnalysisService()
+    for project_path in warm:
+        response = service.handle({"method": "analyze-project", "project": str(project_path)})
+        if not response["ok"]:
+            raise RequestError(response["error"])
+    server = create_server(service, socket_path=socket_path, port=port)
+    try:
+        if on_ready is not None:
+            on_ready(server_address(server))
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if socket_path is not None:
+            Path(socket_path).unlink(missing_ok=True)
+
+
+def send_request(socket_path: Path, request: dict, timeout: float = 30.0) -> dict:
+    """Cliente mínimo del socket Unix (hooks y scripts): envía una petición y devuelve la respuesta."""
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            return json.loads(stream.readline())
@@ -6,6 +6,8 @@ Covers:
 - File discovery and exclusion
 - End-to-end analysis using examples/bad_project and examples/good_project
 - Report metadata correctness
+- Streaming analysis with iter_violations() and early stop
+- Time-budgeted analysis with prioritized file order
 """
 
 import pytest
@@ -17,7 +19,7 @@ from gtaa_validator.checkers.structure_checker import StructureChecker
 from gtaa_validator.checkers.adaptation_checker import AdaptationChecker
 from gtaa_validator.checkers.quality_checker import QualityChecker
 from gtaa_validator.checkers.bdd_checker import BDDChecker
-from gtaa_validator.models import Severity
+from gtaa_validator.models import Severity, ViolationType
 
 
 # =========================================================================
@@ -210,3 +212,217 @@ class TestReportMetadata:
         assert isinstance(d, dict)
         assert d["summary"]["total_violations"] >= 25
         assert d["summary"]["score"] == 0.0
+
+
+# =========================================================================
+# exclude_checks pruning
+# =========================================================================
+
+class TestExcludeChecks:
+    """exclude_checks prunes checkers and sub-checks before analysis."""
+
+    def _analyzer(self, path, excluded):
+        from gtaa_validator.config import ProjectConfig
+        return StaticAnalyzer(path, config=ProjectConfig(exclude_checks=excluded))
+
+    def test_fully_excluded_checker_is_skipped(self, bad_project_path):
+        analyzer = self._analyzer(bad_project_path, ["ADAPTATION_IN_DEFINITION"])
+        types = {type(c) for c in analyzer.checkers}
+        assert DefinitionChecker not in types
+        assert len(analyzer.checkers) == 4
+
+    def test_partially_excluded_checker_is_kept(self, bad_project_path):
+        analyzer = self._analyzer(bad_project_path, ["POOR_TEST_NAMING"])
+        quality = next(c for c in analyzer.checkers if isinstance(c, QualityChecker))
+        assert quality.is_rule_enabled(ViolationType.POOR_TEST_NAMING) is False
+        assert quality.is_rule_enabled(ViolationType.LONG_TEST_FUNCTION) is True
+
+    def test_excluded_types_absent_from_report(self, bad_project_path):
+        excluded = ["ADAPTATION_IN_DEFINITION", "HARDCODED_TEST_DATA", "MISSING_THEN_STEP"]
+        report = self._analyzer(bad_project_path, excluded).analyze()
+        found = {v.violation_type.name for v in report.violations}
+        assert not found & set(excluded)
+        assert found  # el resto de reglas sigue activo
+
+    def test_other_violations_unchanged(self, bad_project_path):
+        full = StaticAnalyzer(bad_project_path).analyze()
+        pruned = self._analyzer(bad_project_path, ["SHARED_MUTABLE_STATE"]).analyze()
+        expected = [v for v in full.violations
+                    if v.violation_type != ViolationType.SHARED_MUTABLE_STATE]
+        assert len(pruned.violations) == len(expected)
+
+    def test_unknown_names_are_ignored(self, bad_project_path):
+        analyzer = self._analyzer(bad_project_path, ["NOT_A_RULE", "poor_test_naming"])
+        assert analyzer.excluded_types == {ViolationType.POOR_TEST_NAMING}
+
+    def test_summary_lists_exclusions(self, bad_project_path):
+        analyzer = self._analyzer(bad_project_path, ["LONG_TEST_FUNCTION"])
+        assert analyzer.get_summary()["excluded_checks"] == ["LONG_TEST_FUNCTION"]
+
+
+# =========================================================================
+# Incremental mode (--changed-since / --staged)
+# =========================================================================
+
+def _violation_keys(violations):
+    return sorted(
+        (v.violation_type.name, str(v.file_path), v.line_number, v.message)
+        for v in violations
+    )
+
+
+class TestIncrementalAnalysis:
+    """Changed files get the same violations as in a full run."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        pages = tmp_path / "pages"
+        pages.mkdir()
+        (tmp_path / "tests").mkdir()
+        (pages / "a_page.py").write_text(
+            "class APage:\n"
+            "    def open(self):\n"
+            "        self.driver.find_element(By.ID, 'login-button')\n"
+        )
+        (pages / "b_page.py").write_text(
+            "class BPage:\n"
+            "    def open(self):\n"
+            "        self.driver.find_element(By.ID, 'login-button')\n"
+            "        if self.ready:\n"
+            "            pass\n"
+        )
+        (tmp_path / "tests" / "test_login.py").write_text(
+            "def test_1():\n"
+            "    driver.find_element(By.ID, 'user').send_keys('admin@example.com')\n"
+        )
+        return tmp_path.resolve()
+
+    def test_changed_file_matches_full_run(self, project, bad_project_path):
+        for path in (project, bad_project_path.resolve()):
+            full = StaticAnalyzer(path).analyze()
+            for changed in {v.file_path for v in full.violations if v.file_path != path}:
+                incremental = StaticAnalyzer(path).analyze(changed_files=[changed])
+                expected = [v for v in full.violations if v.file_path in (changed, path)]
+                assert _violation_keys(incremental.violations) == _violation_keys(expected)
+                assert incremental.files_analyzed == 1
+
+    def test_duplicate_locator_uses_unchanged_pages(self, project):
+        report = StaticAnalyzer(project).analyze(changed_files=[project / "pages" / "b_page.py"])
+        found = {v.violation_type for v in report.violations}
+        assert ViolationType.DUPLICATE_LOCATOR in found
+
+    def test_cached_summaries_avoid_rereading(self, project, tmp_path_factory):
+        cache_path = tmp_path_factory.mktemp("cache") / "incremental.json"
+        changed = [project / "pages" / "b_page.py"]
+        first = StaticAnalyzer(project).analyze(changed_files=changed, cache_path=cache_path)
+        assert first.incremental_stats["summary_misses"] >= 1
+        assert cache_path.exists()
+
+        second = StaticAnalyzer(project).analyze(changed_files=changed, cache_path=cache_path)
+        assert second.incremental_stats["summary_hits"] >= 1
+        assert second.incremental_stats["summary_misses"] == 0
+        assert _violation_keys(second.violations) == _violation_keys(first.violations)
+        assert second.to_dict()["metadata"]["incremental"]["changed_files"] == 1
+
+    def test_modified_summary_is_recomputed(self, project, tmp_path_factory):
+        cache_path = tmp_path_factory.mktemp("cache") / "incremental.json"
+        changed = [project / "pages" / "b_page.py"]
+        StaticAnalyzer(project).analyze(changed_files=changed, cache_path=cache_path)
+
+        (project / "pages" / "a_page.py").write_text("class APage:\n    pass\n")
+        report = StaticAnalyzer(project).analyze(changed_files=changed, cache_path=cache_path)
+        assert ViolationType.DUPLICATE_LOCATOR not in {v.violation_type for v in report.violations}
+
+    def test_non_analyzable_changes_are_ignored(self, project):
+        (project / "README.md").write_text("# docs\n")
+        report = StaticAnalyzer(project).analyze(changed_files=[project / "README.md"])
+        assert report.files_analyzed == 0
+        assert all(v.file_path == project for v in report.violations)
+
+
+class TestIterViolations:
+    """iter_violations() yields the same violations as analyze(), lazily."""
+
+    def test_matches_analyze(self, bad_project_path):
+        expected = StaticAnalyzer(bad_project_path).analyze()
+        analyzer = StaticAnalyzer(bad_project_path)
+        report = analyzer.new_report()
+        yielded = list(analyzer.iter_violations(report=report))
+        assert _violation_keys(yielded) == _violation_keys(expected.violations)
+        assert _violation_keys(report.violations) == _violation_keys(expected.violations)
+        assert report.score == expected.score
+        assert report.partial_stats is None
+
+    def test_stopping_early_skips_remaining_files(self, bad_project_path):
+        analyzer = StaticAnalyzer(bad_project_path)
+        report = analyzer.new_report()
+        violations = analyzer.iter_violations(report=report)
+        first_file = next(v for v in violations if v.file_path != analyzer.project_path)
+        violations.close()
+
+        discovered = len(analyzer._discover_python_files())
+        assert report.partial_stats == {"files_analyzed": report.files_analyzed,
+                                        "files_discovered": discovered}
+        assert report.files_analyzed < discovered
+        assert first_file in report.violations
+        assert report.score == max(0.0, 100.0 - report.violations.index.total_penalty)
+
+    def test_stopping_on_project_violation_reports_coverage(self, tmp_path):
+        # Sin directorios tests/ ni pages/: la primera violación es de estructura
+        (tmp_path / "test_login.py").write_text("def test_login():\n    assert True\n")
+        analyzer = StaticAnalyzer(tmp_path)
+        report = analyzer.new_report()
+        violations = analyzer.iter_violations(report=report)
+        assert next(violations).file_path == analyzer.project_path
+        violations.close()
+        assert report.partial_stats == {"files_analyzed": 0, "files_discovered": 1}
+
+    def test_excluded_types_are_not_yielded(self, bad_project_path):
+        from gtaa_validator.config import ProjectConfig
+        config = ProjectConfig(exclude_checks=["ADAPTATION_IN_DEFINITION"])
+        yielded = StaticAnalyzer(bad_project_path, config=config).iter_violations()
+        assert all(v.violation_type != ViolationType.ADAPTATION_IN_DEFINITION for v in yielded)
+
+
+class TestTimeBudget:
+    """time_budget: prioritized file order and clean stop with a partial report."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        files = {
+            "utils/helpers.py": "def helper():\n    return 1\n",
+            "pages/login_page.py": "class LoginPage:\n    def open(self):\n        pass\n",
+            "tests/test_small.py": "def test_a():\n    assert True\n",
+            "tests/test_big.py": "def test_b():\n    assert True\n" + "# padding\n" * 50,
+            "features/login.feature": "Feature: Login\n  Scenario: ok\n    Given x\n",
+        }
+        for relative, text in files.items():
+            (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / relative).write_text(text)
+        return tmp_path.resolve()
+
+    def test_prioritize_order(self, project):
+        analyzer = StaticAnalyzer(project)
+        ordered = analyzer.prioritize(analyzer._discover_python_files())
+        assert [str(p.relative_to(project)) for p in ordered] == [
+            "tests/test_big.py", "tests/test_small.py", "pages/login_page.py",
+            "features/login.feature", "utils/helpers.py",
+        ]
+
+    def test_stops_when_budget_runs_out(self, project, monkeypatch):
+        import gtaa_validator.analyzers.static_analyzer as module
+        clock = iter(range(1000))
+        monkeypatch.setattr(module.time, "monotonic", lambda: next(clock))
+        report = StaticAnalyzer(project).analyze(time_budget=2.5)
+        assert report.files_analyzed == 2
+        assert report.partial_stats == {"files_analyzed": 2, "files_discovered": 5,
+                                        "reason": "time_budget"}
+        assert report.to_dict()["metadata"]["partial"]["reason"] == "time_budget"
+
+    def test_enough_budget_gives_full_report(self, bad_project_path):
+        full = StaticAnalyzer(bad_project_path).analyze()
+        budgeted = StaticAnalyzer(bad_project_path).analyze(time_budget=3600)
+        assert budgeted.partial_stats is None
+        assert budgeted.files_analyzed == full.files_analyzed
+        assert len(budgeted.violations) == len(full.violations)
+        assert budgeted.score == full.score
@@ -0,0 +1,98 @@
+"""
+Tests for gtaa_validator.api
+
+Covers:
+- analyze_source() on a single in-memory file
+- analyze_batch() with mappings and generators, cross-file rules
+- No filesystem access (virtual root does not exist)
+- Path normalization and paths outside the virtual root
+- Explicit ProjectConfig is honored
+"""
+
+import pytest
+
+from gtaa_validator.api import VIRTUAL_ROOT, analyze_batch, analyze_source
+from gtaa_validator.config import ProjectConfig
+
+TEST_WITH_SELENIUM = (
+    "def test_login():\n"
+    "    driver.find_element(By.ID, 'user').click()\n"
+)
+CLEAN_TEST = "def test_login():\n    assert True\n"
+PAGE = (
+    "class {name}:\n"
+    "    def open(self):\n"
+    "        self.driver.find_element(By.ID, 'login-button')\n"
+)
+
+
+def _types(violations):
+    return {v.violation_type.name for v in violations}
+
+
+class TestAnalyzeSource:
+
+    def test_detects_violation_in_memory(self):
+        violations = analyze_source("tests/test_login.py", TEST_WITH_SELENIUM)
+        assert "ADAPTATION_IN_DEFINITION" in _types(violations)
+        assert all(v.file_path == VIRTUAL_ROOT / "tests" / "test_login.py" for v in violations)
+        assert violations[0].line_number == 2
+
+    def test_clean_source_and_bytes(self):
+        assert analyze_source("tests/test_login.py", CLEAN_TEST.encode("utf-8")) == []
+
+    def test_structure_violations_are_not_returned(self):
+        # Un archivo suelto no tiene pages/: la violación de proyecto no se devuelve
+        violations = analyze_source("tests/test_login.py", CLEAN_TEST)
+        assert "MISSING_LAYER_STRUCTURE" not in _types(violations)
+
+    def test_config_is_honored(self):
+        config = ProjectConfig(exclude_checks=["ADAPTATION_IN_DEFINITION"])
+        violations = analyze_source("tests/test_login.py", TEST_WITH_SELENIUM, config=config)
+        assert "ADAPTATION_IN_DEFINITION" not in _types(violations)
+
+
+class TestAnalyzeBatch:
+
+    def test_cross_file_rules(self):
+        report = analyze_batch({
+            "pages/a_page.py": PAGE.format(name="APage"),
+            "pages/b_page.py": PAGE.format(name="BPage"),
+            "tests/test_login.py": CLEAN_TEST,
+        })
+        assert report.files_analyzed == 3
+        assert "DUPLICATE_LOCATOR" in _types(report.violations)
+
+    def test_accepts_generator(self):
+        sources = ((f"tests/test_{i}.py", TEST_WITH_SELENIUM) for i in range(3))
+        report = analyze_batch(sources)
+        files = {v.file_path.name for v in report.violations
+                 if v.violation_type.name == "ADAPTATION_IN_DEFINITION"}
+        assert files == {"test_0.py", "test_1.py", "test_2.py"}
+
+    def test_report_paths_are_relative_to_root(self):
+        data = analyze_batch([("tests/test_login.py", TEST_WITH_SELENIUM)]).to_dict()
+        files = {v["file"] for v in data["violations"] if v["type"] == "ADAPTATION_IN_DEFINITION"}
+        assert files == {"tests/test_login.py"}
+
+    def test_does_not_touch_the_filesystem(self, tmp_path):
+        root = tmp_path / "does-not-exist"
+        report = analyze_batch([("tests/test_login.py", TEST_WITH_SELENIUM)], root=root)
+        assert "ADAPTATION_IN_DEFINITION" in _types(report.violations)
+        assert not root.exists()
+
+    def test_disk_files_are_ignored(self, tmp_path):
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_disk.py").write_text(TEST_WITH_SELENIUM, encoding="utf-8")
+        report = analyze_batch([("tests/test_login.py", CLEAN_TEST)], root=tmp_path)
+        assert report.files_analyzed == 1
+
+    def test_paths_are_normalized(self):
+        report = analyze_batch([("tests/../tests/./test_login.py", TEST_WITH_SELENIUM)])
+        assert {v.file_path for v in report.violations if v.line_number} == {
+            VIRTUAL_ROOT / "tests" / "test_login.py"}
+
+    @pytest.mark.parametrize("path", ["../outside.py", "/etc/test_x.py"])
+    def test_paths_outside_root_are_rejected(self, path):
+        with pytest.raises(ValueError):
+            analyze_batch([(path, CLEAN_TEST)])
@@ -0,0 +1,188 @@
+"""
+Tests for gtaa_validator.archive
+
+Covers:
+- is_archive() suffix detection
+- .zip, .tar and .tar.gz give the same report as the extracted project
+- Single top-level directory as project root, .gtaa.yaml inside the archive
+- EXCLUDED_DIRS, ignore_paths and unsafe member names are skipped
+- Bounded buffering for compressed tars (EXCLUDED_DIRS never buffered),
+  unreadable archives
+- .zip, .tar and .tar.gz agree on root, files and report without a common
+  root directory or with a root named like an EXCLUDED_DIRS entry
+- CLI accepts an archive as PROJECT_PATH
+"""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.archive import ArchiveError, is_archive, open_archive
+from gtaa_validator.config import ProjectConfig
+from gtaa_validator.file_utils import use_virtual_files
+
+FILES = {
+    "tests/test_login.py": "def test_login():\n    driver.find_element(By.ID, 'user').click()\n",
+    "pages/a_page.py": "class APage:\n    def open(self):\n        self.driver.find_element(By.ID, 'x')\n",
+    "pages/b_page.py": "class BPage:\n    def open(self):\n        self.driver.find_element(By.ID, 'x')\n",
+    "node_modules/lib/test_dep.py": "def test_dep():\n    driver.find_element(By.ID, 'y')\n",
+    "README.md": "# suite\n",
+}
+
+
+def _write_archive(path, files, prefix="suite/"):
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, text in files.items():
+                zf.writestr(prefix + name, text)
+        return path
+    mode = "w:gz" if path.name.endswith(".tar.gz") else "w"
+    with tarfile.open(path, mode) as tar:
+        for name, text in files.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(prefix + name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def _analyze(snapshot):
+    with snapshot.files, use_virtual_files(snapshot.files):
+        return StaticAnalyzer(snapshot.root, config=snapshot.config).analyze()
+
+
+def _summary(report):
+    return sorted((v.violation_type.name, str(v.file_path.relative_to(report.project_path)),
+                   v.line_number) for v in report.violations)
+
+
+class TestIsArchive:
+
+    @pytest.mark.parametrize("name", ["a.zip", "a.tar", "a.tar.gz", "a.TGZ", "a.tar.bz2", "a.tar.xz"])
+    def test_supported(self, name, tmp_path):
+        assert is_archive(tmp_path / name)
+
+    @pytest.mark.parametrize("name", ["a.gz", "a.py", "suite", ".zip"])
+    def test_not_supported(self, name, tmp_path):
+        assert not is_archive(tmp_path / name)
+
+
+class TestOpenArchive:
+
+    @pytest.mark.parametrize("name", ["suite.zip", "suite.tar", "suite.tar.gz"])
+    def test_same_report_as_extracted_project(self, name, tmp_path):
+        project = tmp_path / "suite"
+        for relative, text in FILES.items():
+            (project / relative).parent.mkdir(parents=True, exist_ok=True)
+            (project / relative).write_text(text, encoding="utf-8")
+        expected = StaticAnalyzer(project).analyze()
+
+        snapshot = open_archive(_write_archive(tmp_path / name, FILES))
+        report = _analyze(snapshot)
+        assert snapshot.root.name == "suite"
+        assert report.files_analyzed == expected.files_analyzed == 3
+        assert _summary(report) == _summary(expected)
+        assert report.score == expected.score
+
+    def test_members_are_filtered_by_name(self, tmp_path):
+        snapshot = open_archive(_write_archive(tmp_path / "suite.zip", FILES))
+        names = {str(p.relative_to(snapshot.root)) for p in snapshot.files}
+        assert names == {"tests/test_login.py", "pages/a_page.py", "pages/b_page.py"}
+        assert (snapshot.members, snapshot.skipped) == (5, 2)
+
+    def test_config_inside_archive(self, tmp_path):
+        files = dict(FILES, **{".gtaa.yaml": "ignore_paths:\n  - 'pages/*'\n"})
+        snapshot = open_archive(_write_archive(tmp_path / "suite.tar.gz", files))
+        assert snapshot.config.ignore_paths == ["pages/*"]
+        assert "DUPLICATE_LOCATOR" not in {v.violation_type.name for v in _analyze(snapshot).violations}
+
+    def test_explicit_config_wins(self, tmp_path):
+        files = dict(FILES, **{".gtaa.yaml": "ignore_paths:\n  - 'pages/*'\n"})
+        snapshot = open_archive(_write_archive(tmp_path / "suite.zip", files),
+                                config=ProjectConfig(ignore_paths=["tests/*"]))
+        assert {p.parent.name for p in snapshot.files} == {"pages"}
+
+    def test_archive_without_top_level_directory(self, tmp_path):
+        snapshot = open_archive(_write_archive(tmp_path / "flat.tar", FILES, prefix=""))
+        assert snapshot.root.name == "flat"
+        assert len(snapshot.files) == 3
+
+    def test_unsafe_member_names_are_skipped(self, tmp_path):
+        files = {"../evil/test_x.py": FILES["tests/test_login.py"],
+                 "tests/test_login.py": FILES["tests/test_login.py"]}
+        snapshot = open_archive(_write_archive(tmp_path / "suite.tar", files, prefix=""))
+        assert [p.name for p in snapshot.files] == ["test_login.py"]
+
+    def test_buffer_limit(self, tmp_path):
+        path = _write_archive(tmp_path / "suite.tar.gz", FILES)
+        with pytest.raises(ArchiveError):
+            open_archive(path, max_buffered=64)
+
+    @pytest.mark.parametrize("prefix", ["suite/", ""])
+    def test_excluded_dirs_not_buffered(self, tmp_path, prefix):
+        """Vendored dependencies are dropped by name, before the buffer limit applies."""
+        vendored = {f"node_modules/pkg{i}/index.js": "x" * 4096 for i in range(20)}
+        path = _write_archive(tmp_path / "suite.tar.gz", dict(FILES, **vendored), prefix=prefix)
+        snapshot = open_archive(path, max_buffered=16 * 1024)
+        assert len(snapshot.files) == 3
+
+    def test_excluded_dirs_released_when_root_changes(self, tmp_path):
+        """Buffered while node_modules/ could be the root, released once it cannot."""
+        vendored = {f"node_modules/pkg{i}/index.js": "x" * 4096 for i in range(4)}
+        path = _write_archive(tmp_path / "suite.tar.gz", dict(vendored, **FILES), prefix="")
+        snapshot = open_archive(path, max_buffered=16 * 1024)
+        assert len(snapshot.files) == 3
+
+    def test_unreadable_archive(self, tmp_path):
+        path = tmp_path / "broken.tar.gz"
+        path.write_bytes(b"not an archive")
+        with pytest.raises(ArchiveError):
+            open_archive(path)
+
+
+TREES = {
+    # README.md fuera de suite/: no hay directorio raíz común
+    "loose_readme": dict({"suite/" + name: text for name, text in FILES.items() if name != "README.md"},
+                         **{"README.md": "# suite\n"}),
+    # El directorio raíz se llama como una entrada de EXCLUDED_DIRS
+    "build_root": {"build/" + name: text for name, text in FILES.items()},
+}
+
+
+class TestReaderConsistency:
+
+    @pytest.mark.parametrize("tree", sorted(TREES))
+    def test_same_root_files_and_report(self, tree, tmp_path):
+        results = []
+        for name in ("suite.zip", "suite.tar", "suite.tar.gz"):
+            snapshot = open_archive(_write_archive(tmp_path / name, TREES[tree], prefix=""))
+            files = sorted(str(file.relative_to(snapshot.root)) for file in snapshot.files)
+            report = _analyze(snapshot)
+            results.append((snapshot.root, files, _summary(report), report.score))
+        assert results[0] == results[1] == results[2]
+        assert results[0][1]
+
+
+class TestCLIArchive:
+
+    def test_cli_accepts_archive(self, tmp_path):
+        path = _write_archive(tmp_path / "suite.zip", FILES)
+        json_path = tmp_path / "report.json"
+        result = CliRunner().invoke(main, [str(path), "--json", str(json_path)])
+        assert result.exit_code in (0, 1), result.output
+        assert "3 de 5 entrada(s) analizables" in result.output
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        files = {v["file"] for v in data["violations"]}
+        assert "tests/test_login.py" in files and "pages/b_page.py" in files
+
+    def test_cli_rejects_watch(self, tmp_path):
+        path = _write_archive(tmp_path / "suite.zip", FILES)
+        result = CliRunner().invoke(main, [str(path), "--watch"])
+        assert result.exit_code == 1
+        assert "--watch" in result.output
@@ -276,3 +276,31 @@ class TestGetConfigForExtension:
         """Unknown extension without 'default' key returns empty set()."""
         config = {"py": "python"}
         assert BaseChecker._get_config_for_extension(".unknown", config) == set()
+
+
+# =========================================================================
+# Excluded violation types
+# =========================================================================
+
+class TestExcludedTypes:
+    """Tests for BaseChecker exclusion helpers."""
+
+    def test_rules_enabled_by_default(self):
+        """No exclusions → every rule enabled."""
+        from gtaa_validator.models import ViolationType
+        checker = ConcreteChecker()
+        assert checker.is_rule_enabled(ViolationType.POOR_TEST_NAMING) is True
+
+    def test_excluded_rule_disabled(self):
+        """Excluded type → is_rule_enabled() False."""
+        from gtaa_validator.models import ViolationType
+        checker = ConcreteChecker()
+        checker.set_excluded_types([ViolationType.POOR_TEST_NAMING])
+        assert checker.is_rule_enabled(ViolationType.POOR_TEST_NAMING) is False
+
+    def test_checker_without_declared_types_never_fully_excluded(self):
+        """Empty VIOLATION_TYPES → cannot be pruned."""
+        from gtaa_validator.models import ViolationType
+        checker = ConcreteChecker()
+        checker.set_excluded_types(list(ViolationType))
+        assert checker.is_fully_excluded() is False
@@ -0,0 +1,177 @@
+"""
+Tests for gtaa_validator.baseline
+
+Covers:
+- Violation fingerprints: stable across line shifts and whitespace, sensitive to content
+- Baseline.load(): JSON, compact JSON, NDJSON and reports without fingerprints
+- Baseline.filter()/apply(): multiset semantics, score and metadata
+- SemanticAnalyzer: known semantic violations are neither added nor enriched
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from gtaa_validator.analyzers.semantic_analyzer import SemanticAnalyzer
+from gtaa_validator.baseline import Baseline
+from gtaa_validator.llm.client import MockLLMClient
+from gtaa_validator.models import Report, Severity, Violation, ViolationType
+from gtaa_validator.reporters.json_reporter import JsonReporter
+
+PROJECT = Path("/fake/project")
+
+
+def _violation(line=10, snippet='email = "a@b.com"', function="test_login",
+               vtype=ViolationType.HARDCODED_TEST_DATA, path="tests/test_login.py"):
+    return Violation(
+        violation_type=vtype,
+        severity=vtype.get_severity(),
+        file_path=PROJECT / path,
+        line_number=line,
+        code_snippet=snippet,
+        function_name=function,
+    )
+
+
+# =========================================================================
+# Fingerprints
+# =========================================================================
+
+class TestFingerprint:
+
+    def test_ignores_line_number(self):
+        assert _violation(line=10).fingerprint(PROJECT) == _violation(line=99).fingerprint(PROJECT)
+
+    def test_normalizes_snippet_whitespace(self):
+        a = _violation(snippet='email  =  "a@b.com"')
+        b = _violation(snippet='email = "a@b.com" ')
+        assert a.fingerprint(PROJECT) == b.fingerprint(PROJECT)
+
+    def test_depends_on_type_file_snippet_and_function(self):
+        base = _violation().fingerprint(PROJECT)
+        assert _violation(vtype=ViolationType.POOR_TEST_NAMING).fingerprint(PROJECT) != base
+        assert _violation(path="tests/test_other.py").fingerprint(PROJECT) != base
+        assert _violation(snippet='email = "c@d.com"').fingerprint(PROJECT) != base
+        assert _violation(function="test_logout").fingerprint(PROJECT) != base
+
+    def test_message_numbers_masked_without_snippet(self):
+        a = Violation(ViolationType.LONG_TEST_FUNCTION, Severity.MEDIUM, PROJECT / "t.py",
+                      message="Función de test demasiado larga (63 líneas)")
+        b = Violation(ViolationType.LONG_TEST_FUNCTION, Severity.MEDIUM, PROJECT / "t.py",
+                      message="Función de test demasiado larga (71 líneas)")
+        assert a.fingerprint(PROJECT) == b.fingerprint(PROJECT)
+
+    def test_included_in_to_dict(self):
+        v = _violation()
+        assert v.to_dict(project_path=PROJECT)["fingerprint"] == v.fingerprint(PROJECT)
+
+
+# =========================================================================
+# Loading
+# =========================================================================
+
+class TestBaselineLoad:
+
+    def _report(self):
+        return Report(project_path=PROJECT, violations=[_violation(), _violation(line=20)])
+
+    @pytest.mark.parametrize("reporter", [
+        JsonReporter(),
+        JsonReporter(compact=True),
+        JsonReporter(output_format="ndjson"),
+    ])
+    def test_loads_reporter_output(self, tmp_path, reporter):
+        path = tmp_path / "baseline.json"
+        reporter.generate(self._report(), path)
+        baseline = Baseline.load(path)
+        assert baseline.known == 2
+        assert baseline.to_dict()["file"] == "baseline.json"
+
+    def test_report_without_fingerprints(self, tmp_path):
+        """Older reports are fingerprinted from their fields (no enclosing function)."""
+        record = _violation(function=None).to_dict(project_path=PROJECT)
+        del record["fingerprint"]
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"metadata": {}, "summary": {}, "violations": [record]}))
+        assert Baseline.load(path).is_known(_violation(function=None), PROJECT)
+
+    def test_report_without_fingerprints_matches_any_function(self, tmp_path):
+        """Current violations carry a function name the old report never stored."""
+        records = [_violation().to_dict(project_path=PROJECT) for _ in range(2)]
+        for record in records:
+            del record["fingerprint"]
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"metadata": {}, "summary": {}, "violations": records}))
+        baseline = Baseline.load(path)
+        assert baseline.known == 2
+        current = [_violation(line=20, function="test_login"), _violation(function="test_other"),
+                   _violation(function="test_third")]
+        assert baseline.filter(current, PROJECT) == current[2:]
+        assert baseline.suppressed == 2
+
+    def test_legacy_report_suppresses_bad_project(self, tmp_path, bad_project_path):
+        from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+
+        report = StaticAnalyzer(bad_project_path).analyze()
+        document = report.to_dict()
+        for record in document["violations"]:
+            del record["fingerprint"]
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps(document))
+        fresh = StaticAnalyzer(bad_project_path).analyze()
+        assert Baseline.load(path).filter(fresh.violations, fresh.project_path) == []
+
+    @pytest.mark.parametrize("content", ["not json\nat all", "[1, 2]", '{"violations": [1]}'])
+    def test_invalid_content_raises(self, tmp_path, content):
+        path = tmp_path / "bad.json"
+        path.write_text(content)
+        with pytest.raises(ValueError):
+            Baseline.load(path)
+
+
+# =========================================================================
+# Filtering
+# =========================================================================
+
+class TestBaselineFilter:
+
+    def test_apply_keeps_only_new_violations(self):
+        known = _violation()
+        new = _violation(snippet='password = "secret"')
+        baseline = Baseline([known.fingerprint(PROJECT)])
+        report = Report(project_path=PROJECT, violations=[_violation(line=50), new])
+
+        baseline.apply(report)
+
+        assert report.violations == [new]
+        assert report.score == 100.0 - Severity.HIGH.get_score_penalty()
+        assert report.to_dict()["metadata"]["baseline"] == {
+            "file": None, "known_violations": 1, "suppressed": 1,
+        }
+
+    def test_duplicates_beyond_baseline_count_are_new(self):
+        baseline = Baseline([_violation().fingerprint(PROJECT)])
+        new = baseline.filter([_violation(), _violation(line=11)], PROJECT)
+        assert len(new) == 1
+        assert baseline.suppressed == 1
+
+
+class TestSemanticAnalyzerBaseline:
+
+    def test_known_semantic_violations_skipped(self, tmp_path):
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_login.py").write_text("def test_foo():\n    assert True\n", encoding="utf-8")
+
+        first = SemanticAnalyzer(tmp_path, MockLLMClient()).analyze(
+            Report(project_path=tmp_path)
+        )
+        assert first.violations
+        baseline = Baseline(v.fingerprint(tmp_path) for v in first.violations)
+
+        second = SemanticAnalyzer(tmp_path, MockLLMClient(), baseline=baseline).analyze(
+            Report(project_path=tmp_path)
+        )
+        assert second.violations == []
+        assert second.baseline_stats["suppressed"] == len(first.violations)
@@ -0,0 +1,138 @@
+"""
+Tests for gtaa_validator.batch
+
+Covers:
+- expand_projects(): plain paths and glob patterns, only directories, sorted
+- analyze_projects(): same reports as single-project analysis, in-process
+  and with a process pool, per-project .gtaa.yaml, errors do not stop the batch
+- BatchResult.names() and summary() aggregation
+- CLI --batch: per-project reports, combined summary, incompatible flags
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.batch import BatchResult, analyze_projects, expand_projects
+
+SELENIUM_TEST = "def test_login():\n    driver.find_element(By.ID, 'user').click()\n"
+PAGE = "class LoginPage:\n    def open(self):\n        return 1\n"
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    for name in ("billing", "checkout", "search"):
+        root = tmp_path / "services" / name / "tests"
+        (root / "tests").mkdir(parents=True)
+        (root / "pages").mkdir()
+        (root / "tests" / "test_login.py").write_text(SELENIUM_TEST)
+        (root / "pages" / "login_page.py").write_text(PAGE)
+    # Configuración propia: search ignora sus tests
+    (tmp_path / "services" / "search" / "tests" / ".gtaa.yaml").write_text(
+        "ignore_paths:\n  - 'tests/*'\n")
+    (tmp_path / "services" / "notes.txt").write_text("no es un proyecto")
+    return tmp_path.resolve()
+
+
+def _summary(report):
+    return sorted((v.violation_type.name, v.file_path.name, v.line_number) for v in report.violations)
+
+
+class TestExpandProjects:
+
+    def test_glob_and_plain_paths(self, monorepo):
+        services = monorepo / "services"
+        projects = expand_projects([str(services / "*" / "tests"), str(services / "billing" / "tests")])
+        assert [p.parent.name for p in projects] == ["billing", "checkout", "search"]
+
+    def test_only_directories(self, monorepo):
+        assert expand_projects([str(monorepo / "services" / "*")]) == sorted(
+            (monorepo / "services" / name) for name in ("billing", "checkout", "search"))
+
+
+class TestAnalyzeProjects:
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_same_reports_as_single_analysis(self, monorepo, jobs):
+        projects = expand_projects([str(monorepo / "services" / "*" / "tests")])
+        result = analyze_projects(projects, jobs=jobs)
+        assert not result.errors
+        for project in projects:
+            expected = StaticAnalyzer(project).analyze()
+            assert _summary(result.reports[project]) == _summary(expected)
+            assert result.reports[project].score == expected.score
+
+    def test_project_config_is_used(self, monorepo):
+        projects = expand_projects([str(monorepo / "services" / "*" / "tests")])
+        result = analyze_projects(projects, jobs=1)
+        by_name = {p.parent.name: r for p, r in result.reports.items()}
+        assert by_name["search"].files_analyzed == 1
+        assert by_name["billing"].files_analyzed == 2
+
+    def test_errors_do_not_stop_batch(self, monorepo, monkeypatch):
+        from gtaa_validator import batch
+
+        missing = monorepo / "services" / "missing"
+        projects = [monorepo / "services" / "billing" / "tests", missing]
+        analyze = batch._analyze_project
+
+        def fail_missing(path):
+            if path == str(missing):
+                raise OSError("no existe")
+            return analyze(path)
+
+        monkeypatch.setattr(batch, "_analyze_project", fail_missing)
+        seen = []
+        result = analyze_projects(projects, jobs=1, on_result=lambda p, r, e: seen.append(p))
+        assert list(result.reports) == [projects[0]]
+        assert result.errors == {missing: "no existe"}
+        assert seen == projects
+        assert result.summary()["details"][1] == {"project": "missing", "error": "no existe"}
+
+
+class TestBatchResult:
+
+    def test_names_relative_to_common_directory(self, tmp_path):
+        result = BatchResult(projects=[tmp_path / "a" / "tests", tmp_path / "b" / "tests"])
+        assert list(result.names().values()) == ["a/tests", "b/tests"]
+
+    def test_summary_aggregates(self, monorepo):
+        projects = expand_projects([str(monorepo / "services" / "*" / "tests")])
+        result = analyze_projects(projects, jobs=1)
+        summary = result.summary()
+        reports = list(result.reports.values())
+        assert summary["projects"] == 3 and summary["failed"] == 0
+        assert summary["total_violations"] == sum(len(r.violations) for r in reports)
+        assert summary["min_score"] == min(r.score for r in reports)
+        assert [d["project"] for d in summary["details"]] == [
+            "billing/tests", "checkout/tests", "search/tests"]
+
+
+class TestCLIBatch:
+
+    def test_reports_and_summary(self, monorepo, tmp_path_factory):
+        out = tmp_path_factory.mktemp("out")
+        result = CliRunner().invoke(main, ["--batch", str(monorepo / "services" / "*" / "tests"),
+                                           "--jobs", "1", "--output-dir", str(out)])
+        assert result.exit_code in (0, 1), result.output
+        assert "Lote: 3 de 3 proyecto(s)" in result.output
+        reports = sorted(p.name for p in out.glob("gtaa_report_*.json"))
+        assert len(reports) == 3 and reports[0].startswith("gtaa_report_billing_tests_")
+        summary = json.loads(next(out.glob("gtaa_batch_summary_*.json")).read_text(encoding="utf-8"))
+        assert summary["projects"] == 3
+        assert all("report" in detail for detail in summary["details"])
+
+    def test_summary_to_json_path(self, monorepo, tmp_path_factory):
+        path = tmp_path_factory.mktemp("out") / "batch.json"
+        result = CliRunner().invoke(main, ["--batch", str(monorepo / "services" / "billing" / "tests"),
+                                           "--jobs", "1", "--no-report", "--json", str(path)])
+        assert result.exit_code in (0, 1), result.output
+        assert json.loads(path.read_text(encoding="utf-8"))["details"][0]["project"] == "tests"
+
+    def test_rejects_incompatible_flags(self, monorepo):
+        result = CliRunner().invoke(main, ["--batch", str(monorepo), "--watch"])
+        assert result.exit_code == 1
+        assert "--batch" in result.output
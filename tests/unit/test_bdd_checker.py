@@ -13,11 +13,12 @@ Covers:
 """
 
 import ast
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
-from gtaa_validator.checkers.bdd_checker import BDDChecker
+from gtaa_validator.checkers.bdd_checker import BDDChecker, _match_sql_select
 from gtaa_validator.models import ViolationType, Severity
 
 
@@ -342,3 +343,162 @@ class TestFeatureFileEdgeCases:
         """Empty feature file produces no violations."""
         violations = self._check_feature(checker, "")
         assert violations == []
+
+
+# =========================================================================
+# Excluded rules
+# =========================================================================
+
+class TestExcludedRules:
+    """BDDChecker skips excluded sub-checks and whole file kinds."""
+
+    def test_feature_files_skipped_when_all_feature_rules_excluded(self):
+        checker = BDDChecker()
+        checker.set_excluded_types({
+            ViolationType.GHERKIN_IMPLEMENTATION_DETAIL, ViolationType.MISSING_THEN_STEP,
+        })
+        assert checker.can_check(Path("features/login.feature")) is False
+        assert checker.can_check(Path("steps/login_steps.py")) is True
+
+    def test_only_enabled_feature_rule_runs(self, tmp_path):
+        feature = tmp_path / "login.feature"
+        feature.write_text(
+            "Feature: Login\n"
+            "  Scenario: No then\n"
+            "    Given I open //div[@id='x']\n",
+            encoding="utf-8",
+        )
+        checker = BDDChecker()
+        checker.set_excluded_types({ViolationType.GHERKIN_IMPLEMENTATION_DETAIL})
+        types = {v.violation_type for v in checker.check(feature)}
+        assert types == {ViolationType.MISSING_THEN_STEP}
+
+    def test_duplicate_step_scan_skipped(self, tmp_path):
+        steps = tmp_path / "steps"
+        steps.mkdir()
+        for name in ("a_steps.py", "b_steps.py"):
+            (steps / name).write_text(
+                "@given('I am logged in')\ndef step(context):\n    pass\n", encoding="utf-8"
+            )
+        checker = BDDChecker()
+        checker.set_excluded_types({ViolationType.DUPLICATE_STEP_PATTERN})
+        assert checker.check_project(tmp_path) == []
+
+
+# =========================================================================
+# Combined implementation-detail scanner
+# =========================================================================
+
+class TestImplementationDetailScanner:
+    """Single-pass scanner over IMPLEMENTATION_PATTERNS."""
+
+    SAMPLES = [
+        "I click on //button[@type='submit']",
+        "I use css=.login",
+        "I type into #password-field",
+        "I click the .btn-primary button",
+        "I find By.id",
+        "I check [data-test=login]",
+        "I navigate to http://localhost:8080/login",
+        "I run SELECT * FROM users",
+        "I run select id from orders",
+        "I run INSERT INTO users",
+        "I see <div> content",
+        "I am on the login page",
+        "the user is logged in",
+        "I run SELECT\tFROM",
+        "SELECT a\nb FROM c",
+    ]
+
+    def _legacy_labels(self, checker, text):
+        return list(dict.fromkeys(
+            label
+            for (_, label, _, _), pattern in zip(
+                checker.IMPLEMENTATION_CATEGORIES, checker.IMPLEMENTATION_PATTERNS
+            )
+            if pattern.search(text)
+        ))
+
+    def test_categories_table_matches_patterns(self, checker):
+        assert len(checker.IMPLEMENTATION_CATEGORIES) == len(checker.IMPLEMENTATION_PATTERNS)
+
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_equivalent_to_individual_patterns(self, checker, text):
+        assert checker._detail_scanner.scan(text) == self._legacy_labels(checker, text)
+
+    def test_reports_all_matched_categories(self, checker):
+        labels = checker._detail_scanner.scan("I open http://localhost:8080 and click #submit-btn")
+        assert labels == ["XPath", "ID CSS", "URL", "localhost"]
+
+    def test_violation_message_lists_categories(self, checker, tmp_path):
+        feature = tmp_path / "admin.feature"
+        feature.write_text(
+            "Feature: Admin\n"
+            "  Scenario: SQL\n"
+            "    When I run SELECT * FROM users\n"
+            "    Then I see results\n",
+            encoding="utf-8",
+        )
+        violations = checker.check(feature)
+        assert "(SQL)" in violations[0].message
+
+    @pytest.mark.parametrize("text,expected", [
+        ("SELECT a FROM b", True),
+        ("select   a   from b", True),
+        ("SELECT    FROM", True),
+        ("SELECT FROM", False),
+        ("SELECT a\nb FROM c", False),
+        ("SELECT\n\n a FROM c", True),
+        ("SELECT " + "x" * 500 + " FROM t", True),
+        ("SELECT " + "x" * 501 + " FROM t", False),
+        ("SELECT x" + " " * 5000 + "FROM t", True),
+    ])
+    def test_sql_select_confirmation(self, checker, text, expected):
+        sql = [p for p in checker.IMPLEMENTATION_PATTERNS if "SELECT" in p.pattern][0]
+        assert bool(sql.match(text)) is expected
+        assert _match_sql_select(text, 0) is expected
+
+    def test_pathological_sql_line_is_linear(self, checker):
+        """Whitespace runs that make the SELECT regex backtrack scale linearly."""
+        def scan_seconds(spaces):
+            text = "When I run SELECT " + " " * spaces + "x"
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                assert checker._detail_scanner.scan(text) == []
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        small, large = scan_seconds(20_000), scan_seconds(200_000)
+        # 10x más entrada: lineal ~10x, cuadrático ~100x (margen para ruido de CI)
+        assert large < max(small, 1e-4) * 40
+
+    def test_benchmark_outline_with_thousands_of_rows(self, checker, tmp_path):
+        """Feature with thousands of Scenario Outline rows is checked quickly."""
+        lines = [
+            "Feature: Bulk login",
+            "  Scenario Outline: login as <user>",
+            "    Given I open http://localhost:8080/login",
+            "    When I log in as <user>",
+            "    Then I see the dashboard",
+            "    Examples:",
+            "      | user | email |",
+        ]
+        lines += [f"      | user{i} | user{i}@example.com |" for i in range(5000)]
+        for i in range(2000):
+            lines += [
+                f"  Scenario: plain {i}",
+                "    Given the user is logged in",
+                f"    When they open report number {i}",
+                "    Then they see the summary",
+            ]
+        feature = tmp_path / "bulk.feature"
+        feature.write_text("\n".join(lines), encoding="utf-8")
+
+        start = time.perf_counter()
+        violations = checker.check(feature)
+        elapsed = time.perf_counter() - start
+        print(f"\n5000 filas de Examples + 2000 escenarios: {elapsed * 1000:.1f} ms")
+
+        impl = [v for v in violations if v.violation_type == ViolationType.GHERKIN_IMPLEMENTATION_DETAIL]
+        assert [v.line_number for v in impl] == [3, 4]
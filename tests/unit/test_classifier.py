@@ -4,6 +4,7 @@ Tests for gtaa_validator.classifier
 Covers:
 - FileClassifier.classify(): file classification by imports, code patterns, and path
 - API detection, UI detection, mixed files, unknown files
+- classify_path(): path-only categories
 """
 
 import ast
@@ -267,6 +268,22 @@ class TestPageObjectPathDetection:
         assert result is True
 
 
+class TestClassifyPath:
+    """classify_path(): path-only category used to prioritize files."""
+
+    @pytest.mark.parametrize("path, expected", [
+        ("tests/test_login.py", "test"),
+        ("src/test/java/LoginTest.java", "test"),
+        ("e2e/login.spec.ts", "test"),
+        ("pages/login_page.py", "page_object"),
+        ("src/pages/LoginPage.cs", "page_object"),
+        ("features/login.feature", "feature"),
+        ("utils/helpers.py", "other"),
+    ])
+    def test_categories(self, classifier, path, expected):
+        assert classifier.classify_path(Path(path)) == expected
+
+
 # =========================================================================
 # Test file path detection (lines 364-401)
 # =========================================================================
@@ -3,7 +3,8 @@ Tests for the CLI entry point (__main__.py).
 
 Uses Click's CliRunner to invoke the CLI without spawning a subprocess.
 Covers: basic run, verbose flag, JSON/HTML export, invalid path, score display,
-        score labels, --config, --ai branch, file-as-argument, exit codes.
+        score labels, --config, --ai branch, file-as-argument, exit codes,
+        --fail-fast / --max-violations / --time-budget.
 """
 
 import json
@@ -56,6 +57,18 @@ class TestCLI:
         finally:
             os.unlink(json_path)
 
+    def test_json_ndjson_compact_export(self, tmp_path):
+        """--json-format ndjson --json-compact writes one record per line."""
+        json_path = tmp_path / "report.ndjson"
+        result = self.runner.invoke(
+            main, [self.bad_project, "--json", str(json_path), "--json-format", "ndjson", "--json-compact"]
+        )
+        assert result.exit_code in (0, 1)
+        lines = json_path.read_text(encoding="utf-8").splitlines()
+        header = json.loads(lines[0])
+        assert header["summary"]["total_violations"] == len(lines) - 1
+        assert all(", " not in line.split('"message"')[0] for line in lines)
+
     def test_html_export(self):
         """--html creates an HTML report file."""
         with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
@@ -70,6 +83,24 @@ class TestCLI:
         finally:
             os.unlink(html_path)
 
+    def test_html_interactive_compressed_export(self, tmp_path):
+        """--html-mode interactive --html-compress embeds gzip+base64 data."""
+        html_path = tmp_path / "report.html"
+        result = self.runner.invoke(
+            main, [self.bad_project, "--html", str(html_path), "--html-mode", "interactive", "--html-compress"]
+        )
+        assert result.exit_code in (0, 1)
+        assert 'data-encoding="gzip+base64"' in html_path.read_text(encoding="utf-8")
+
+    def test_html_sharded_export(self, tmp_path):
+        """--html-mode sharded writes an index plus one page per directory."""
+        html_dir = tmp_path / "report"
+        result = self.runner.invoke(main, [self.bad_project, "--html", str(html_dir), "--html-mode", "sharded"])
+        assert result.exit_code in (0, 1)
+        assert (html_dir / "index.html").exists()
+        assert list((html_dir / "shards").glob("*.html"))
+        assert "sin cambios" in result.output
+
     def test_invalid_path(self):
         """Non-existent path results in error exit code."""
         result = self.runner.invoke(main, ["/nonexistent/path/xyz"])
@@ -454,3 +485,158 @@ class TestAutoReports:
         assert len(json_files) == 1
         pattern = r"gtaa_report_bad_project_\d{4}-\d{2}-\d{2}\.json"
         assert re.match(pattern, json_files[0].name), f"Filename {json_files[0].name} doesn't match pattern"
+
+
+class TestCLIBaseline:
+    """Tests for --baseline: only violations missing from a previous report are reported."""
+
+    def setup_method(self):
+        self.runner = CliRunner()
+        self.bad_project = os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            "gtaa_validator", "examples", "bad_project"
+        )
+
+    def test_baseline_suppresses_known_violations(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        self.runner.invoke(main, [self.bad_project, "--json", str(baseline)])
+
+        report = tmp_path / "report.json"
+        result = self.runner.invoke(
+            main, [self.bad_project, "--baseline", str(baseline), "--json", str(report)]
+        )
+        assert result.exit_code == 0
+        assert "Violaciones totales: 0" in result.output
+        assert "CRÍTICA: 0" in result.output
+        data = json.loads(report.read_text(encoding="utf-8"))
+        assert data["violations"] == []
+        assert data["summary"]["score"] == 100.0
+        assert data["metadata"]["baseline"]["suppressed"] == data["metadata"]["baseline"]["known_violations"]
+
+    def test_invalid_baseline_exits_with_error(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text("[1, 2]", encoding="utf-8")
+        result = self.runner.invoke(main, [self.bad_project, "--baseline", str(baseline)])
+        assert result.exit_code == 1
+        assert "no es un informe JSON" in result.output
+
+
+class TestCLIEarlyStop:
+    """Tests for --fail-fast and --max-violations: partial reports on early stop."""
+
+    def setup_method(self):
+        self.runner = CliRunner()
+        self.bad_project = os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            "gtaa_validator", "examples", "bad_project"
+        )
+
+    def test_fail_fast_stops_at_first_critical(self, tmp_path):
+        report = tmp_path / "report.json"
+        result = self.runner.invoke(main, [self.bad_project, "--fail-fast", "--json", str(report)])
+        assert "Análisis detenido" in result.output
+        data = json.loads(report.read_text(encoding="utf-8"))
+        partial = data["metadata"]["partial"]
+        assert partial["reason"] == "fail_fast"
+        assert partial["files_analyzed"] < partial["files_discovered"]
+        assert data["summary"]["violations_by_severity"]["CRITICAL"] >= 1
+
+    def test_max_violations_truncates_report(self, tmp_path):
+        report = tmp_path / "report.json"
+        self.runner.invoke(main, [self.bad_project, "--max-violations", "3", "--json", str(report)])
+        data = json.loads(report.read_text(encoding="utf-8"))
+        assert data["summary"]["total_violations"] == 3
+        assert data["metadata"]["partial"]["reason"] == "max_violations"
+
+    def test_time_budget_reports_coverage(self, tmp_path):
+        report = tmp_path / "report.json"
+        with patch("gtaa_validator.analyzers.static_analyzer.time.monotonic",
+                   side_effect=iter(range(1000))):
+            result = self.runner.invoke(main, [self.bad_project, "--time-budget", "1.5",
+                                               "--json", str(report)])
+        assert "tiempo agotado" in result.output
+        partial = json.loads(report.read_text(encoding="utf-8"))["metadata"]["partial"]
+        assert partial["reason"] == "time_budget"
+        assert partial["files_analyzed"] == 1
+
+    def test_limit_not_reached_gives_full_report(self, tmp_path):
+        report = tmp_path / "report.json"
+        result = self.runner.invoke(main, [self.bad_project, "--max-violations", "100000",
+                                           "--json", str(report)])
+        assert "Análisis detenido" not in result.output
+        assert "partial" not in json.loads(report.read_text(encoding="utf-8"))["metadata"]
+
+
+class TestCLIChangedSince:
+    """Tests for --changed-since/--staged: only files changed in git are checked."""
+
+    def setup_method(self):
+        self.runner = CliRunner()
+
+    def _repo(self, tmp_path):
+        import subprocess
+        (tmp_path / "tests").mkdir(parents=True)
+        (tmp_path / "tests" / "test_login.py").write_text("def test_login():\n    pass\n")
+        git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+        return tmp_path
+
+    def test_changed_since_analyzes_only_changed_files(self, tmp_path):
+        repo = self._repo(tmp_path)
+        (repo / "tests" / "test_2.py").write_text("def test_2():\n    pass\n")
+        report = tmp_path / "report.json"
+        result = self.runner.invoke(main, [
+            str(repo), "--changed-since", "HEAD", "--json", str(report),
+            "--output-dir", str(tmp_path / "out"),
+        ])
+        assert result.exit_code in (0, 1)
+        assert "Archivos modificados: 1" in result.output
+        data = json.loads(report.read_text(encoding="utf-8"))
+        assert data["metadata"]["incremental"]["since"] == "HEAD"
+        assert data["summary"]["files_analyzed"] == 1
+        assert {v["file"] for v in data["violations"]} <= {"tests/test_2.py", "."}
+
+    def test_staged_analyzes_index_content(self, tmp_path):
+        import subprocess
+        repo = self._repo(tmp_path / "repo")
+        (repo / "pages").mkdir()
+        page = repo / "pages" / "login_page.py"
+        page.write_text("import pytest\n\nclass LoginPage:\n    pass\n")
+        subprocess.run(["git", "-C", str(repo), "add", "pages/login_page.py"], check=True)
+        page.write_text("class LoginPage:\n    pass\n")
+
+        report = tmp_path / "report.json"
+        result = self.runner.invoke(main, [
+            str(repo), "--staged", "--json", str(report), "--output-dir", str(tmp_path / "out"),
+        ])
+        assert result.exit_code in (0, 1)
+        data = json.loads(report.read_text(encoding="utf-8"))
+        assert data["metadata"]["incremental"]["staged"] is True
+        assert "FORBIDDEN_IMPORT" in {v["type"] for v in data["violations"]}
+
+    def test_staged_snapshot_closed_on_error(self, tmp_path, monkeypatch):
+        import gtaa_validator.__main__ as cli_module
+        repo = self._repo(tmp_path / "repo")
+        snapshots = []
+        index_snapshot = cli_module.index_snapshot
+
+        def tracked_snapshot(path):
+            snapshots.append(index_snapshot(path))
+            return snapshots[-1]
+
+        def failing_analysis(*args, **kwargs):
+            raise RuntimeError("fallo en el análisis")
+
+        monkeypatch.setattr(cli_module, "index_snapshot", tracked_snapshot)
+        monkeypatch.setattr(cli_module, "_run_static_analysis", failing_analysis)
+        result = self.runner.invoke(main, [str(repo), "--staged", "--no-report"])
+        assert isinstance(result.exception, RuntimeError)
+        assert len(snapshots) == 1 and snapshots[0]._close is None
+
+    def test_unknown_ref_exits_with_error(self, tmp_path):
+        repo = self._repo(tmp_path)
+        result = self.runner.invoke(main, [str(repo), "--changed-since", "no-such-ref"])
+        assert result.exit_code == 1
+        assert "ERROR" in result.output
@@ -0,0 +1,176 @@
+"""
+Tests for gtaa_validator.checkers.file_facts
+
+Covers:
+- language_key(): extension normalization
+- build_file_facts(): lines, test functions, page objects, setup/teardown
+- enclosing_function(): innermost function/method containing a line
+- python_ast: lazy, cached, None for non-Python or invalid syntax
+- resolve_file_facts(): reuse of provided facts and standalone construction
+- Checkers consume precomputed facts instead of re-reading the file
+"""
+
+from pathlib import Path
+
+from gtaa_validator.checkers.file_facts import (
+    build_file_facts, language_key, resolve_file_facts,
+)
+from gtaa_validator.checkers.definition_checker import DefinitionChecker
+from gtaa_validator.checkers.quality_checker import QualityChecker
+from gtaa_validator.checkers.bdd_checker import BDDChecker
+from gtaa_validator.models import ViolationType
+from gtaa_validator.parsers.python_parser import PythonParser
+
+
+PY_SOURCE = '''\
+import pytest
+
+class LoginPage:
+    def open(self):
+        pass
+
+class TestLogin:
+    def setup_method(self):
+        pass
+
+    def test_valid_login(self):
+        driver.find_element("id", "user")
+
+def test_logout():
+    pass
+
+def helper():
+    pass
+'''
+
+
+class TestLanguageKey:
+
+    def test_python(self):
+        assert language_key(".py") == "py"
+
+    def test_js_family(self):
+        for ext in (".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"):
+            assert language_key(ext) == "js"
+
+    def test_java_and_csharp(self):
+        assert language_key(".java") == "java"
+        assert language_key(".cs") == "cs"
+
+    def test_uppercase(self):
+        assert language_key(".TS") == "js"
+
+
+class TestBuildFileFacts:
+
+    def _facts(self):
+        result = PythonParser().parse(PY_SOURCE)
+        return build_file_facts(Path("tests/test_login.py"), PY_SOURCE, result, "ui")
+
+    def test_lines(self):
+        facts = self._facts()
+        assert facts.lines == PY_SOURCE.splitlines()
+
+    def test_language_and_extension(self):
+        facts = self._facts()
+        assert facts.extension == ".py"
+        assert facts.language == "py"
+        assert facts.file_type == "ui"
+
+    def test_test_functions(self):
+        facts = self._facts()
+        names = [f.name for f in facts.test_functions]
+        assert names == ["test_logout", "test_valid_login"]
+
+    def test_page_object_classes(self):
+        facts = self._facts()
+        assert [c.name for c in facts.page_object_classes] == ["LoginPage"]
+
+    def test_setup_teardown(self):
+        facts = self._facts()
+        assert [f.name for f in facts.setup_teardown_methods] == ["setup_method"]
+
+    def test_without_parse_result(self):
+        facts = build_file_facts(Path("a.feature"), "Feature: x\n")
+        assert facts.parse_result is None
+        assert facts.test_functions == []
+        assert facts.lines == ["Feature: x"]
+
+    def test_snippet(self):
+        facts = self._facts()
+        assert facts.snippet(3) == "class LoginPage:"
+        assert facts.snippet(999, "fallback") == "fallback"
+
+    def test_enclosing_function(self):
+        facts = self._facts()
+        assert facts.enclosing_function(12) == "TestLogin.test_valid_login"
+        assert facts.enclosing_function(15) == "test_logout"
+        assert facts.enclosing_function(1) is None
+
+    def test_enclosing_function_without_parse_result(self):
+        facts = build_file_facts(Path("a.feature"), "Feature: x\n")
+        assert facts.enclosing_function(1) is None
+
+
+class TestPythonAst:
+
+    def test_cached(self):
+        facts = build_file_facts(Path("test_a.py"), "x = 1\n")
+        assert facts.python_ast is facts.python_ast
+
+    def test_none_for_syntax_error(self):
+        facts = build_file_facts(Path("test_a.py"), "def (:\n")
+        assert facts.python_ast is None
+
+    def test_none_for_non_python(self):
+        facts = build_file_facts(Path("LoginTest.java"), "class LoginTest {}")
+        assert facts.python_ast is None
+
+
+class TestResolveFileFacts:
+
+    def test_returns_given_facts(self):
+        facts = build_file_facts(Path("test_a.py"), "x = 1\n")
+        assert resolve_file_facts(Path("test_a.py"), None, facts) is facts
+
+    def test_builds_from_disk(self, write_py_file):
+        path = write_py_file("test_disk.py", "def test_a():\n    pass\n")
+        facts = resolve_file_facts(path)
+        assert [f.name for f in facts.test_functions] == ["test_a"]
+
+    def test_empty_file_returns_none(self, write_py_file):
+        path = write_py_file("test_empty.py", "")
+        assert resolve_file_facts(path) is None
+
+
+class TestCheckersUseFacts:
+    """Checkers work from the provided facts without touching the filesystem."""
+
+    def test_definition_checker(self):
+        path = Path("/nonexistent/tests/test_login.py")
+        facts = build_file_facts(path, PY_SOURCE, PythonParser().parse(PY_SOURCE))
+        violations = DefinitionChecker().check(path, facts.parse_result, facts=facts)
+        assert [v.violation_type for v in violations] == [ViolationType.ADAPTATION_IN_DEFINITION]
+
+    def test_quality_checker(self):
+        path = Path("/nonexistent/tests/test_data.py")
+        source = 'def test_1():\n    email = "user@example.com"\n'
+        facts = build_file_facts(path, source, PythonParser().parse(source))
+        types = {v.violation_type for v in QualityChecker().check(path, facts=facts)}
+        assert ViolationType.HARDCODED_TEST_DATA in types
+        assert ViolationType.POOR_TEST_NAMING in types
+
+    def test_bdd_checker_step_definition(self):
+        path = Path("/nonexistent/steps/login_steps.py")
+        source = (
+            "from behave import when\n\n"
+            "@when('I log in')\n"
+            "def step_login(context):\n"
+            "    context.driver.find_element('id', 'user')\n"
+        )
+        result = PythonParser().parse(source)
+        facts = build_file_facts(path, source, result)
+        violations = BDDChecker().check(path, result, facts=facts)
+        assert [v.violation_type for v in violations] == [
+            ViolationType.STEP_DEF_DIRECT_BROWSER_CALL
+        ]
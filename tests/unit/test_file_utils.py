@@ -6,12 +6,19 @@ Covers:
 - safe_relative_path(): path within base, outside base, identical paths (SEC-03)
 - Boundary: exact size limit (> vs >=)
 - Unicode content handling
+- VirtualFiles: in-memory files for read_file_safe, find_files and subdir_names
+- use_virtual_files(): blocks from different threads run one at a time
+- file_size(): virtual and disk sizes without reading content
 """
 
+import threading
 from pathlib import Path
 from unittest.mock import patch, mock_open, MagicMock
 
-from gtaa_validator.file_utils import read_file_safe, safe_relative_path, MAX_FILE_SIZE_BYTES
+from gtaa_validator.file_utils import (
+    MAX_FILE_SIZE_BYTES, VirtualFiles, active_virtual_files, file_signature, file_size, find_files,
+    read_file_safe, safe_relative_path, subdir_names, use_virtual_files,
+)
 
 
 class TestReadFileSafe:
@@ -106,3 +113,114 @@ class TestSafeRelativePath:
         base = Path("/project")
         result = safe_relative_path(base, base)
         assert result == Path(".")
+
+
+class TestVirtualFiles:
+    """In-memory files used instead of the disk while active (--staged)."""
+
+    def _files(self, root):
+        return VirtualFiles.from_contents({
+            root / "tests" / "test_a.py": "def test_a():\n    pass\n",
+            root / "pages" / "login_page.py": b"class LoginPage:\n    pass\n",
+            root / "features" / "login.feature": "Feature: Login\n",
+        })
+
+    def test_read_file_safe_prefers_virtual_content(self, tmp_path):
+        on_disk = tmp_path / "tests" / "test_a.py"
+        on_disk.parent.mkdir()
+        on_disk.write_text("disk", encoding="utf-8")
+        with use_virtual_files(self._files(tmp_path)):
+            assert read_file_safe(on_disk) == "def test_a():\n    pass\n"
+        assert read_file_safe(on_disk) == "disk"
+
+    def test_size_limit_applies(self, tmp_path):
+        files = self._files(tmp_path)
+        with use_virtual_files(files):
+            assert read_file_safe(tmp_path / "tests" / "test_a.py", max_size=5) == ""
+
+    def test_find_files_and_subdirs(self, tmp_path):
+        with use_virtual_files(self._files(tmp_path)):
+            assert list(find_files(tmp_path, ".py")) == [
+                tmp_path / "pages" / "login_page.py", tmp_path / "tests" / "test_a.py",
+            ]
+            assert list(find_files(tmp_path / "tests", ".feature")) == []
+            assert subdir_names(tmp_path) == ["features", "pages", "tests"]
+
+    def test_signature_tracks_content(self, tmp_path):
+        path = tmp_path / "tests" / "test_a.py"
+        first = VirtualFiles.from_contents({path: "a"})
+        second = VirtualFiles.from_contents({path: "b"})
+        with use_virtual_files(first):
+            signature = file_signature(path)
+        with use_virtual_files(second):
+            assert file_signature(path) != signature
+            assert file_signature(tmp_path / "other.py") is None
+
+    def test_disk_signature_without_virtual_files(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n", encoding="utf-8")
+        assert file_signature(path)[1] == 6
+        assert active_virtual_files() is None
+
+    def test_nested_activation_restores_previous(self, tmp_path):
+        outer, inner = self._files(tmp_path), VirtualFiles.from_contents({})
+        with use_virtual_files(outer):
+            with use_virtual_files(inner):
+                assert active_virtual_files() is inner
+            assert active_virtual_files() is outer
+        assert active_virtual_files() is None
+
+    def test_blocks_from_other_threads_do_not_interleave(self, tmp_path):
+        outer, other = self._files(tmp_path), VirtualFiles.from_contents({})
+        seen = []
+
+        def activate_other():
+            with use_virtual_files(other):
+                seen.append(active_virtual_files())
+
+        with use_virtual_files(outer):
+            thread = threading.Thread(target=activate_other)
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive() and seen == []
+            assert active_virtual_files() is outer
+        thread.join(timeout=5)
+        assert seen == [other]
+        assert active_virtual_files() is None
+
+    def test_close_is_idempotent(self):
+        calls = []
+        files = VirtualFiles({}, lambda path: None, close=lambda: calls.append(1))
+        with files:
+            pass
+        files.close()
+        assert calls == [1]
+
+    def test_overlay_merges_with_disk(self, tmp_path):
+        for rel in ("tests/test_a.py", "tests/test_b.py"):
+            (tmp_path / rel).parent.mkdir(exist_ok=True)
+            (tmp_path / rel).write_text("disk", encoding="utf-8")
+        overlay = VirtualFiles.from_contents({
+            tmp_path / "tests" / "test_a.py": "buffer",
+            tmp_path / "pages" / "new_page.py": "class NewPage:\n    pass\n",
+        }, overlay=True)
+        with use_virtual_files(overlay):
+            assert read_file_safe(tmp_path / "tests" / "test_a.py") == "buffer"
+            assert read_file_safe(tmp_path / "tests" / "test_b.py") == "disk"
+            assert sorted(find_files(tmp_path, ".py")) == [
+                tmp_path / "pages" / "new_page.py",
+                tmp_path / "tests" / "test_a.py", tmp_path / "tests" / "test_b.py",
+            ]
+            assert subdir_names(tmp_path) == ["pages", "tests"]
+            assert file_signature(tmp_path / "tests" / "test_b.py")[1] == 4
+
+    def test_file_size(self, tmp_path):
+        disk = tmp_path / "a.py"
+        disk.write_text("12345", encoding="utf-8")
+        assert file_size(disk) == 5
+        assert file_size(tmp_path / "missing.py") == 0
+        files = VirtualFiles.from_contents({tmp_path / "b.py": "ab"})
+        with use_virtual_files(files):
+            assert file_size(tmp_path / "b.py") == 2
+        with use_virtual_files(VirtualFiles({tmp_path / "c.py": "oid"}, lambda path: b"x")):
+            assert file_size(tmp_path / "c.py") == 0
@@ -0,0 +1,155 @@
+"""
+Tests for gtaa_validator.git_utils
+
+Covers:
+- changed_files(): working tree vs HEAD/ref, untracked files, --staged
+- Paths relative to a project subdirectory, deleted files ignored
+- GitError: not a repository, unknown ref, refs that look like options
+- GitObjectReader: blobs through one long-lived `git cat-file --batch`
+- index_snapshot(): staged content as VirtualFiles, analyzed without touching the working tree
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.file_utils import find_files, read_file_safe, use_virtual_files
+from gtaa_validator.git_utils import GitError, GitObjectReader, changed_files, index_snapshot
+from gtaa_validator.models import ViolationType
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with one commit containing tests/ and pages/."""
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("def test_a():\n    pass\n")
+    (tmp_path / "tests" / "test_b.py").write_text("def test_b():\n    pass\n")
+    (tmp_path / "pages" / "login_page.py").write_text("class LoginPage:\n    pass\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestChangedFiles:
+
+    def test_clean_tree_has_no_changes(self, repo):
+        assert changed_files(repo, "HEAD") == set()
+
+    def test_modified_and_untracked_files(self, repo):
+        (repo / "tests" / "test_a.py").write_text("def test_a():\n    assert True\n")
+        (repo / "tests" / "test_new.py").write_text("def test_new():\n    pass\n")
+        result = changed_files(repo, "HEAD")
+        assert result == {
+            (repo / "tests" / "test_a.py").resolve(),
+            (repo / "tests" / "test_new.py").resolve(),
+        }
+
+    def test_committed_changes_since_ref(self, repo):
+        _git(repo, "branch", "base")
+        (repo / "pages" / "login_page.py").write_text("class LoginPage:\n    x = 1\n")
+        _git(repo, "commit", "-q", "-am", "change page")
+        assert changed_files(repo, "base") == {(repo / "pages" / "login_page.py").resolve()}
+
+    def test_staged_only_includes_index(self, repo):
+        (repo / "tests" / "test_a.py").write_text("def test_a():\n    assert 1\n")
+        (repo / "tests" / "test_b.py").write_text("def test_b():\n    assert 2\n")
+        _git(repo, "add", "tests/test_a.py")
+        assert changed_files(repo, staged=True) == {(repo / "tests" / "test_a.py").resolve()}
+
+    def test_deleted_files_are_ignored(self, repo):
+        (repo / "tests" / "test_b.py").unlink()
+        assert changed_files(repo, "HEAD") == set()
+
+    def test_subdirectory_paths_are_relative_to_project(self, repo):
+        (repo / "tests" / "test_a.py").write_text("def test_a():\n    assert True\n")
+        (repo / "pages" / "login_page.py").write_text("class LoginPage:\n    x = 2\n")
+        assert changed_files(repo / "tests", "HEAD") == {(repo / "tests" / "test_a.py").resolve()}
+
+    def test_staged_file_deleted_from_working_tree(self, repo):
+        (repo / "tests" / "test_new.py").write_text("def test_new():\n    pass\n")
+        _git(repo, "add", "tests/test_new.py")
+        (repo / "tests" / "test_new.py").unlink()
+        assert changed_files(repo, staged=True) == {(repo / "tests" / "test_new.py").resolve()}
+
+
+class TestGitErrors:
+
+    def test_not_a_repository(self, tmp_path):
+        with pytest.raises(GitError):
+            changed_files(tmp_path, "HEAD")
+
+    def test_unknown_ref(self, repo):
+        with pytest.raises(GitError):
+            changed_files(repo, "no-such-branch")
+
+    def test_option_like_ref_is_rejected(self, repo):
+        with pytest.raises(GitError, match="no válida"):
+            changed_files(repo, "--output=/tmp/x")
+
+
+class TestGitObjectReader:
+
+    def test_reads_blobs_with_a_single_process(self, repo):
+        with GitObjectReader(repo) as reader:
+            assert reader.read("HEAD:tests/test_a.py") == b"def test_a():\n    pass\n"
+            process = reader._process
+            assert reader.read("HEAD:pages/login_page.py") == b"class LoginPage:\n    pass\n"
+            assert reader._process is process
+        assert reader._process is None
+        assert process.poll() is not None
+
+    def test_missing_objects_return_none(self, repo):
+        with GitObjectReader(repo) as reader:
+            assert reader.read("HEAD:nope.py") is None
+            assert reader.read("HEAD:tests") is None  # árbol, no blob
+            assert reader.read("HEAD:tests/test_b.py") == b"def test_b():\n    pass\n"
+
+
+class TestIndexSnapshot:
+
+    def test_reads_staged_content_not_working_tree(self, repo):
+        path = repo.resolve() / "tests" / "test_a.py"
+        path.write_text("def test_a():\n    assert 'staged'\n")
+        _git(repo, "add", "tests/test_a.py")
+        path.write_text("def test_a():\n    assert 'unstaged'\n")
+        with index_snapshot(repo) as snapshot, use_virtual_files(snapshot):
+            assert "staged" in read_file_safe(path)
+            assert "unstaged" not in read_file_safe(path)
+
+    def test_untracked_files_are_not_listed(self, repo):
+        (repo / "tests" / "test_untracked.py").write_text("def test_u():\n    pass\n")
+        root = repo.resolve()
+        with index_snapshot(repo) as snapshot, use_virtual_files(snapshot):
+            assert set(find_files(root, ".py")) == {
+                root / "tests" / "test_a.py", root / "tests" / "test_b.py",
+                root / "pages" / "login_page.py",
+            }
+
+    def test_static_analysis_of_staged_content(self, repo):
+        root = repo.resolve()
+        page = root / "pages" / "login_page.py"
+        page.write_text("import pytest\n\nclass LoginPage:\n    pass\n")
+        _git(repo, "add", "pages/login_page.py")
+        page.write_text("class LoginPage:\n    pass\n")  # arreglado solo en disco
+
+        changed = changed_files(repo, staged=True)
+        with index_snapshot(repo) as snapshot, use_virtual_files(snapshot):
+            report = StaticAnalyzer(root).analyze(changed_files=changed)
+        found = {v.violation_type for v in report.violations}
+        assert ViolationType.FORBIDDEN_IMPORT in found
+        assert not ({v.violation_type for v in StaticAnalyzer(root).analyze().violations}
+                    & {ViolationType.FORBIDDEN_IMPORT})
@@ -1,5 +1,6 @@
 """Tests para HtmlReporter — generación de reportes HTML dashboard."""
 
+import json
 from pathlib import Path
 from datetime import datetime
 
@@ -332,3 +333,198 @@ class TestHtmlReporter:
         assert "<svg" in content
         assert "0" in content
         assert "<!DOCTYPE html>" in content
+
+
+def _embedded_data(content):
+    """Extrae y decodifica los datos embebidos de la tabla interactiva."""
+    import base64
+    import gzip
+    import json
+    import re
+
+    match = re.search(
+        r'<script type="application/json" id="gtaa-data" data-encoding="([^"]+)">(.*?)</script>',
+        content, re.S,
+    )
+    encoding, payload = match.groups()
+    if encoding == "gzip+base64":
+        payload = gzip.decompress(base64.b64decode(payload)).decode("utf-8")
+    return json.loads(payload)
+
+
+class TestHtmlReporterInteractive:
+    """Tests para la tabla interactiva con datos embebidos."""
+
+    def test_modo_invalido(self):
+        with pytest.raises(ValueError, match="no soportado"):
+            HtmlReporter(table_mode="pdf")
+
+    def test_auto_estatico_para_informes_pequenos(self, sample_report, tmp_path):
+        output = tmp_path / "report.html"
+        HtmlReporter().generate(sample_report, output)
+        content = output.read_text(encoding="utf-8")
+        assert "gtaa-data" not in content
+        assert "<tr>" in content
+
+    def test_auto_interactivo_por_encima_del_umbral(self, sample_report, tmp_path, monkeypatch):
+        monkeypatch.setattr(HtmlReporter, "INTERACTIVE_THRESHOLD", 2)
+        output = tmp_path / "report.html"
+        HtmlReporter().generate(sample_report, output)
+        assert 'id="gtaa-data"' in output.read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_datos_deduplicados_por_tipo(self, sample_report, tmp_path, compress):
+        """Descripción y recomendación se guardan una vez por tipo."""
+        sample_report.violations.append(Violation(
+            violation_type=ViolationType.HARDCODED_TEST_DATA,
+            severity=Severity.HIGH,
+            file_path=sample_report.project_path / "tests" / "test_login.py",
+            line_number=20,
+            message="Otro dato hardcodeado",
+        ))
+        output = tmp_path / "report.html"
+        HtmlReporter(table_mode="interactive", compress=compress).generate(sample_report, output)
+        content = output.read_text(encoding="utf-8")
+        data = _embedded_data(content)
+
+        assert len(data["rows"]) == 4
+        assert len(data["types"]) == 3
+        assert data["files"] == ["tests/test_login.py", "tests/test_misc.py"]
+        # Resumen de hallazgos + una sola vez en los datos (sin comprimir)
+        description = ViolationType.HARDCODED_TEST_DATA.get_description()
+        assert content.count(description) == (1 if compress else 2)
+        # Orden de la tabla estática: checker, severidad, archivo
+        assert [data["types"][r[0]]["checker"] for r in data["rows"]] == [
+            "DefinitionChecker — Separación de capas",
+            "QualityChecker — Calidad de tests",
+            "QualityChecker — Calidad de tests",
+            "QualityChecker — Calidad de tests",
+        ]
+        assert all(r[6] is None for r in data["rows"])
+
+    def test_script_no_puede_cerrarse_desde_los_datos(self, sample_report, tmp_path):
+        """Un '</script>' en los datos no cierra el bloque embebido."""
+        sample_report.violations[0].message = "</script><script>alert(1)</script>"
+        output = tmp_path / "report.html"
+        HtmlReporter(table_mode="interactive").generate(sample_report, output)
+        content = output.read_text(encoding="utf-8")
+
+        assert "<script>alert(1)" not in content
+        assert _embedded_data(content)["rows"][0][4] == "</script><script>alert(1)</script>"
+
+    def test_controles_de_paginacion_y_filtros(self, sample_report, tmp_path):
+        output = tmp_path / "report.html"
+        HtmlReporter(table_mode="interactive").generate(sample_report, output)
+        content = output.read_text(encoding="utf-8")
+
+        for element_id in ("gtaa-severity", "gtaa-checker", "gtaa-search", "gtaa-prev", "gtaa-next"):
+            assert f'id="{element_id}"' in content
+        assert "innerHTML" not in content
+        assert "PAGE_SIZE = 100" in content
+
+    def test_sin_violaciones_usa_mensaje_estatico(self, empty_report, tmp_path):
+        output = tmp_path / "report.html"
+        HtmlReporter(table_mode="interactive").generate(empty_report, output)
+        content = output.read_text(encoding="utf-8")
+        assert "Sin violaciones detectadas" in content
+        assert "gtaa-data" not in content
+
+
+class TestHtmlReporterSharded:
+    """Tests para el reporte fragmentado (índice + páginas por directorio/archivo)."""
+
+    def _add_page_violation(self, report):
+        report.violations.append(Violation(
+            violation_type=ViolationType.ASSERTION_IN_POM,
+            severity=Severity.HIGH,
+            file_path=report.project_path / "pages" / "login_page.py",
+            line_number=3,
+            message="Aserción en Page Object",
+        ))
+
+    def test_indice_y_paginas_por_directorio(self, reporter, sample_report, tmp_path):
+        self._add_page_violation(sample_report)
+        out = tmp_path / "report"
+        stats = reporter.generate_sharded(sample_report, out)
+
+        assert stats == {"shards": 2, "written": 2, "skipped": 0, "removed": 0}
+        index = (out / "index.html").read_text(encoding="utf-8")
+        assert "Violaciones por directorio (2)" in index
+        pages = sorted((out / "shards").glob("*.html"))
+        assert len(pages) == 2
+        for page in pages:
+            assert f'href="shards/{page.name}"' in index
+        tests_page = next(p for p in pages if p.name.startswith("tests-"))
+        content = tests_page.read_text(encoding="utf-8")
+        assert "Directorio: tests" in content
+        assert "tests/test_login.py:10" in content
+        assert "login_page.py" not in content
+        assert 'href="../index.html"' in content
+
+    def test_paginas_por_archivo(self, reporter, sample_report, tmp_path):
+        stats = reporter.generate_sharded(sample_report, tmp_path / "report", shard_by="file")
+        assert stats["shards"] == 2
+        index = (tmp_path / "report" / "index.html").read_text(encoding="utf-8")
+        assert "tests/test_login.py" in index
+        assert "tests/test_misc.py" in index
+
+    def test_segunda_ejecucion_omite_shards_sin_cambios(self, reporter, sample_report, tmp_path):
+        self._add_page_violation(sample_report)
+        out = tmp_path / "report"
+        reporter.generate_sharded(sample_report, out)
+
+        sample_report.violations[-1].message = "Aserción modificada"
+        stats = reporter.generate_sharded(sample_report, out)
+
+        assert stats["written"] == 1
+        assert stats["skipped"] == 1
+
+    def test_shards_obsoletos_se_eliminan(self, reporter, sample_report, tmp_path):
+        self._add_page_violation(sample_report)
+        out = tmp_path / "report"
+        reporter.generate_sharded(sample_report, out)
+
+        sample_report.violations.pop()
+        stats = reporter.generate_sharded(sample_report, out)
+
+        assert stats["removed"] == 1
+        assert len(list((out / "shards").glob("*.html"))) == 1
+
+    def test_shard_borrado_se_regenera(self, reporter, sample_report, tmp_path):
+        out = tmp_path / "report"
+        reporter.generate_sharded(sample_report, out)
+        for page in (out / "shards").glob("*.html"):
+            page.unlink()
+
+        stats = reporter.generate_sharded(sample_report, out)
+        assert stats["written"] == 1
+
+    def test_nombres_de_shard_seguros(self, reporter):
+        name = reporter._shard_filename("../../etc/<script>")
+        assert "/" not in name and "<" not in name
+        assert name != reporter._shard_filename("../../etc/_script_")
+
+    def test_manifiesto_manipulado_no_borra_fuera_de_shards(self, reporter, sample_report, tmp_path):
+        out = tmp_path / "report"
+        reporter.generate_sharded(sample_report, out)
+        victim = tmp_path / "notes.txt"
+        victim.write_text("no borrar")
+        (out / "shards" / "notes-0000abcd.txt").write_text("tampoco")
+        manifest = json.loads((out / "shards.json").read_text(encoding="utf-8"))
+        manifest.update({"../../notes.txt": "x", "../index.html": "x", "notes-0000abcd.txt": "x"})
+        (out / "shards.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+        stats = reporter.generate_sharded(sample_report, out)
+
+        assert stats["removed"] == 0
+        assert victim.exists() and (out / "index.html").exists()
+        assert (out / "shards" / "notes-0000abcd.txt").exists()
+
+    def test_sin_violaciones(self, reporter, empty_report, tmp_path):
+        stats = reporter.generate_sharded(empty_report, tmp_path / "report")
+        assert stats["shards"] == 0
+        assert "Sin violaciones detectadas" in (tmp_path / "report" / "index.html").read_text(encoding="utf-8")
+
+    def test_granularidad_invalida(self, reporter, sample_report, tmp_path):
+        with pytest.raises(ValueError, match="no soportada"):
+            reporter.generate_sharded(sample_report, tmp_path, shard_by="module")
@@ -205,3 +205,75 @@ class TestJsonReporter:
 
         assert "llm_provider" in data["metadata"]
         assert data["metadata"]["llm_provider"]["current_provider"] == "gemini"
+
+
+class TestJsonReporterStreaming:
+    """Tests para escritura en streaming, modo compacto y NDJSON."""
+
+    @pytest.mark.parametrize("report_fixture", ["sample_report", "empty_report"])
+    def test_indentado_identico_a_json_dumps(self, report_fixture, tmp_path, request):
+        """El modo por defecto produce exactamente json.dumps(indent=2)."""
+        report = request.getfixturevalue(report_fixture)
+        report.metrics = AnalysisMetrics(static_analysis_seconds=1.5, llm_api_calls=2)
+        report.prefilter_stats = {"files_skipped": 1, "eliminated_by_checker": {"X": 1}}
+        output = tmp_path / "report.json"
+        JsonReporter().generate(report, output)
+
+        expected = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+        assert output.read_text(encoding="utf-8") == expected
+
+    def test_compacto_sin_indentacion(self, sample_report, tmp_path):
+        """compact=True genera una sola línea equivalente a to_dict()."""
+        output = tmp_path / "report.json"
+        JsonReporter(compact=True).generate(sample_report, output)
+        content = output.read_text(encoding="utf-8")
+
+        assert "\n" not in content
+        assert json.loads(content) == json.loads(json.dumps(sample_report.to_dict()))
+
+    def test_compacto_sin_violaciones(self, empty_report, tmp_path):
+        output = tmp_path / "report.json"
+        JsonReporter(compact=True).generate(empty_report, output)
+        assert json.loads(output.read_text(encoding="utf-8"))["violations"] == []
+
+    def test_ndjson_una_violacion_por_linea(self, sample_report, tmp_path):
+        """NDJSON: primera línea metadata+summary, luego una violación por línea."""
+        output = tmp_path / "report.ndjson"
+        JsonReporter(output_format="ndjson").generate(sample_report, output)
+        lines = output.read_text(encoding="utf-8").splitlines()
+
+        header = json.loads(lines[0])
+        assert set(header) == {"metadata", "summary"}
+        assert header["summary"]["total_violations"] == 2
+        records = [json.loads(line) for line in lines[1:]]
+        assert [r["type"] for r in records] == ["ADAPTATION_IN_DEFINITION", "POOR_TEST_NAMING"]
+
+    def test_formato_invalido(self):
+        with pytest.raises(ValueError, match="no soportado"):
+            JsonReporter(output_format="xml")
+
+    def test_memoria_constante(self, tmp_path):
+        """El pico de memoria no crece con el número de violaciones."""
+        import tracemalloc
+
+        def peak_for(count):
+            report = Report(project_path=tmp_path / "p", timestamp=datetime(2026, 1, 29))
+            report.violations = [
+                Violation(
+                    violation_type=ViolationType.HARDCODED_TEST_DATA,
+                    severity=Severity.HIGH,
+                    file_path=tmp_path / "p" / "tests" / f"test_{i}.py",
+                    line_number=i,
+                    message="Email hardcodeado encontrado: 'user@example.com'",
+                    code_snippet='email = "user@example.com"',
+                )
+                for i in range(count)
+            ]
+            tracemalloc.start()
+            JsonReporter().generate(report, tmp_path / "report.json")
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        small, large = peak_for(1_000), peak_for(20_000)
+        assert large < small * 2
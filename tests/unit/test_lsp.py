@@ -0,0 +1,224 @@
+"""
+Tests for gtaa_validator.lsp
+
+Covers:
+- Content-Length framing (read_message / write_message)
+- initialize, didOpen/didChange/didClose diagnostics from in-memory text
+- Cross-file rules see other open (unsaved) documents
+- Debounced analysis only runs for the latest edit
+- Malformed params: InvalidParams for requests, ignored notifications
+- run_stdio() session over byte streams
+"""
+
+import io
+import time
+from pathlib import Path
+
+import pytest
+
+from gtaa_validator.lsp import (
+    LanguageServer, read_message, run_stdio, to_diagnostic, uri_to_path, write_message,
+)
+from gtaa_validator.models import Severity, Violation, ViolationType
+
+TEST_WITH_SELENIUM = (
+    "def test_login():\n"
+    "    driver.find_element(By.ID, 'user').click()\n"
+)
+CLEAN_TEST = "def test_login():\n    assert True\n"
+PAGE = (
+    "class {name}:\n"
+    "    def open(self):\n"
+    "        self.driver.find_element(By.ID, 'login-button')\n"
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path.resolve()
+    (root / "tests").mkdir()
+    (root / "tests" / "test_login.py").write_text(TEST_WITH_SELENIUM, encoding="utf-8")
+    (root / "pages").mkdir()
+    (root / "pages" / "a_page.py").write_text(PAGE.format(name="APage"), encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def server(project, sent):
+    server = LanguageServer(sent.append, debounce=None)
+    server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize",
+                   "params": {"rootUri": project.as_uri()}})
+    return server
+
+
+def _open(server, path: Path, text: str) -> str:
+    uri = path.as_uri()
+    server.handle({"jsonrpc": "2.0", "method": "textDocument/didOpen",
+                   "params": {"textDocument": {"uri": uri, "languageId": "python",
+                                               "version": 1, "text": text}}})
+    return uri
+
+
+def _change(server, uri: str, text: str) -> None:
+    server.handle({"jsonrpc": "2.0", "method": "textDocument/didChange",
+                   "params": {"textDocument": {"uri": uri, "version": 2},
+                              "contentChanges": [{"text": text}]}})
+
+
+def _codes(sent, uri):
+    published = [m for m in sent if m.get("method") == "textDocument/publishDiagnostics"
+                 and m["params"]["uri"] == uri]
+    return sorted(d["code"] for d in published[-1]["params"]["diagnostics"])
+
+
+class TestFraming:
+
+    def test_roundtrip(self):
+        stream = io.BytesIO()
+        write_message(stream, {"jsonrpc": "2.0", "method": "x", "params": {"t": "ñ"}})
+        write_message(stream, {"jsonrpc": "2.0", "id": 2})
+        stream.seek(0)
+        assert read_message(stream)["params"] == {"t": "ñ"}
+        assert read_message(stream)["id"] == 2
+        assert read_message(stream) is None
+
+    def test_uri_to_path(self, tmp_path):
+        path = (tmp_path / "a b.py").resolve()
+        assert uri_to_path(path.as_uri()) == path
+        # "%25" es un "%" literal del nombre: se decodifica una sola vez
+        literal = (tmp_path / "a%20b.py").resolve()
+        assert uri_to_path(literal.as_uri()) == literal
+        assert uri_to_path("untitled:Untitled-1") is None
+
+
+class TestLanguageServer:
+
+    def test_initialize_capabilities(self, server, sent, project):
+        assert server.root == project
+        assert sent[0]["id"] == 1
+        assert sent[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+
+    def test_did_open_uses_document_text(self, server, sent, project):
+        uri = _open(server, project / "tests" / "test_login.py", CLEAN_TEST)
+        assert "ADAPTATION_IN_DEFINITION" not in _codes(sent, uri)
+
+    def test_did_change_updates_diagnostics(self, server, sent, project):
+        uri = _open(server, project / "tests" / "test_login.py", CLEAN_TEST)
+        _change(server, uri, TEST_WITH_SELENIUM)
+        assert "ADAPTATION_IN_DEFINITION" in _codes(sent, uri)
+        diagnostic = [m for m in sent if m.get("method")][-1]["params"]["diagnostics"][0]
+        assert diagnostic["source"] == "gtaa" and diagnostic["range"]["start"]["line"] == 1
+
+    def test_only_edited_document_is_published(self, server, sent, project):
+        _open(server, project / "pages" / "a_page.py", PAGE.format(name="APage"))
+        sent.clear()
+        uri = _open(server, project / "tests" / "test_login.py", CLEAN_TEST)
+        assert {m["params"]["uri"] for m in sent} == {uri}
+
+    def test_cross_file_rule_sees_unsaved_documents(self, server, sent, project):
+        # b_page.py solo existe en el editor
+        uri = _open(server, project / "pages" / "b_page.py", PAGE.format(name="BPage"))
+        assert "DUPLICATE_LOCATOR" in _codes(sent, uri)
+        _change(server, uri, PAGE.format(name="BPage").replace("login-button", "other"))
+        assert "DUPLICATE_LOCATOR" not in _codes(sent, uri)
+
+    def test_did_close_clears_diagnostics(self, server, sent, project):
+        uri = _open(server, project / "tests" / "test_login.py", TEST_WITH_SELENIUM)
+        server.handle({"jsonrpc": "2.0", "method": "textDocument/didClose",
+                       "params": {"textDocument": {"uri": uri}}})
+        assert _codes(sent, uri) == []
+        assert uri not in server.documents
+
+    def test_files_outside_root_are_ignored(self, server, sent, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("other") / "test_x.py"
+        sent.clear()
+        _open(server, outside, TEST_WITH_SELENIUM)
+        assert sent == []
+
+    def test_unknown_request_returns_error(self, server, sent):
+        server.handle({"jsonrpc": "2.0", "id": 7, "method": "textDocument/hover", "params": {}})
+        assert sent[-1]["error"]["code"] == -32601
+        server.handle({"jsonrpc": "2.0", "method": "$/cancelRequest", "params": {}})
+        assert sent[-1]["id"] == 7
+
+    @pytest.mark.parametrize("method, params", [
+        ("textDocument/didOpen", {}),
+        ("textDocument/didChange", {"textDocument": {}}),
+        ("textDocument/didSave", []),
+        ("textDocument/didClose", {"textDocument": "file:///x.py"}),
+    ])
+    def test_malformed_notification_is_ignored(self, server, sent, method, params):
+        sent.clear()
+        server.handle({"jsonrpc": "2.0", "method": method, "params": params})
+        assert sent == []
+
+    def test_malformed_request_returns_invalid_params(self, server, sent):
+        server.handle({"jsonrpc": "2.0", "id": 3, "method": "initialize",
+                       "params": {"workspaceFolders": [{"name": "sin uri"}]}})
+        assert sent[-1]["id"] == 3 and sent[-1]["error"]["code"] == -32602
+
+    def test_debounce_analyzes_latest_text_once(self, project, sent):
+        server = LanguageServer(sent.append, debounce=0.05)
+        server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize",
+                       "params": {"rootUri": project.as_uri()}})
+        calls = []
+        analyze = server.service.analyze_file
+
+        def counting(*args):
+            calls.append(args)
+            return analyze(*args)
+
+        server.service.analyze_file = counting
+        uri = _open(server, project / "tests" / "test_login.py", CLEAN_TEST)
+        for _ in range(5):
+            _change(server, uri, CLEAN_TEST)
+        _change(server, uri, TEST_WITH_SELENIUM)
+        deadline = time.time() + 5
+        while not calls or server._timers:
+            assert time.time() < deadline
+            time.sleep(0.02)
+        time.sleep(0.1)
+        assert len(calls) == 1
+        assert "ADAPTATION_IN_DEFINITION" in _codes(sent, uri)
+
+
+class TestDiagnostic:
+
+    def test_severity_mapping(self, tmp_path):
+        violation = Violation(ViolationType.ADAPTATION_IN_DEFINITION, Severity.CRITICAL,
+                              tmp_path / "a.py", line_number=3, message="msg")
+        diagnostic = to_diagnostic(violation)
+        assert diagnostic["severity"] == 1
+        assert diagnostic["range"]["start"]["line"] == 2
+        assert diagnostic["code"] == "ADAPTATION_IN_DEFINITION"
+
+
+class TestRunStdio:
+
+    def test_session(self, project):
+        stdin = io.BytesIO()
+        for message in (
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize",
+             "params": {"rootUri": project.as_uri()}},
+            {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ):
+            write_message(stdin, message)
+        stdin.seek(0)
+        stdout = io.BytesIO()
+        assert run_stdio(stdin, stdout) == 0
+        stdout.seek(0)
+        replies = [read_message(stdout), read_message(stdout)]
+        assert [r["id"] for r in replies] == [1, 2]
+
+    def test_exit_without_shutdown(self):
+        stdin = io.BytesIO()
+        write_message(stdin, {"jsonrpc": "2.0", "method": "exit"})
+        stdin.seek(0)
+        assert run_stdio(stdin, io.BytesIO()) == 1
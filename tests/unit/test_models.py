@@ -6,13 +6,14 @@ Covers the core data model logic:
 - ViolationType: mappings to severity, description, recommendation
 - Violation: auto-population of fields, serialization
 - Report: score calculation, filtering, serialization
+- ViolationList: incremental aggregates by severity, type, file and checker
 """
 
 import pytest
 from pathlib import Path
 
 from gtaa_validator.models import (
-    Severity, ViolationType, Violation, Report, AnalysisMetrics
+    Severity, ViolationType, Violation, Report, AnalysisMetrics, ViolationList
 )
 
 
@@ -87,6 +88,12 @@ class TestViolationType:
             assert isinstance(rec, str)
             assert len(rec) > 10
 
+    def test_all_types_have_checker(self):
+        """Every ViolationType maps to the checker that reports it."""
+        for vtype in ViolationType:
+            assert vtype.get_checker().endswith(("Checker", "Analyzer"))
+        assert ViolationType.DUPLICATE_STEP_PATTERN.get_checker() == "BDDChecker"
+
 
 # =========================================================================
 # Violation
@@ -445,3 +452,66 @@ class TestReportToDict:
         ts = d["metadata"]["timestamp"]
         # Must parse without exception
         datetime.fromisoformat(ts)
+
+
+# =========================================================================
+# Incremental aggregates
+# =========================================================================
+
+def _violation(vtype, path="/fake/a.py", line=1):
+    return Violation(violation_type=vtype, severity=vtype.get_severity(),
+                     file_path=Path(path), line_number=line)
+
+
+class TestReportAggregates:
+    """Report keeps severity/type/file/checker aggregates up to date."""
+
+    def test_violations_always_wrapped(self):
+        """Constructor and reassignment both produce a ViolationList."""
+        report = Report(project_path=Path("/fake"))
+        assert isinstance(report.violations, ViolationList)
+        report.violations = [_violation(ViolationType.ADAPTATION_IN_DEFINITION)]
+        assert isinstance(report.violations, ViolationList)
+        assert report.calculate_score() == 90.0
+
+    def test_append_and_extend_update_aggregates(self):
+        report = Report(project_path=Path("/fake"))
+        report.violations.append(_violation(ViolationType.ADAPTATION_IN_DEFINITION, "/fake/p.py"))
+        report.violations.extend([
+            _violation(ViolationType.POOR_TEST_NAMING, "/fake/t.py"),
+            _violation(ViolationType.HARDCODED_TEST_DATA, "/fake/t.py", 2),
+        ])
+        report.violations += [_violation(ViolationType.MISSING_THEN_STEP, "/fake/f.feature")]
+
+        assert report.calculate_score() == 100 - 10 - 1 - 5 - 2
+        assert report.get_violation_count_by_severity() == {
+            "CRITICAL": 1, "HIGH": 1, "MEDIUM": 1, "LOW": 1,
+        }
+        assert [len(v) for v in report.violations_by_file().values()] == [1, 2, 1]
+        assert list(report.violations_by_checker()) == [
+            "DefinitionChecker", "QualityChecker", "BDDChecker",
+        ]
+        assert len(report.violations_by_type()[ViolationType.POOR_TEST_NAMING]) == 1
+
+    def test_other_mutations_rebuild_index(self):
+        critical = _violation(ViolationType.ADAPTATION_IN_DEFINITION)
+        low = _violation(ViolationType.POOR_TEST_NAMING)
+        report = Report(project_path=Path("/fake"), violations=[critical, low])
+
+        report.violations.remove(critical)
+        assert report.calculate_score() == 99.0
+        report.violations[0] = critical
+        assert report.get_violations_by_severity(Severity.CRITICAL) == [critical]
+        assert report.get_violations_by_severity(Severity.LOW) == []
+        del report.violations[:]
+        assert report.calculate_score() == 100.0
+        assert report.violations_by_type() == {}
+
+    def test_pickle_roundtrip(self):
+        """Reports cross process boundaries with their aggregates intact."""
+        import pickle
+        report = Report(project_path=Path("/fake"),
+                        violations=[_violation(ViolationType.FORBIDDEN_IMPORT)])
+        clone = pickle.loads(pickle.dumps(report))
+        assert isinstance(clone.violations, ViolationList)
+        assert clone.get_violation_count_by_severity()["HIGH"] == 1
@@ -0,0 +1,291 @@
+"""
+Tests for gtaa_validator.analyzers.parallel
+
+Covers:
+- estimate_costs(): size and language estimate, historical timings and
+  scaling of files without history
+- WorkStealingScheduler: LPT assignment, largest-first order, stealing the
+  cheapest task of the most loaded queue; language affinity (workers per
+  grammar, whole groups when there are fewer workers, same-language
+  stealing first) and round-robin
+- analyze_parallel(): same report as the sequential analysis (duplicate
+  locators and step patterns included) with every schedule, worker
+  utilization, languages per worker, timing cache
+- CLI --jobs and --language-affinity for a single project
+- Benchmark: language affinity vs round-robin on a mixed repository
+  (tree-sitter grammars actually loaded by each worker process, peak
+  memory and files per second per schedule)
+"""
+
+import shutil
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main
+from gtaa_validator.analyzers.incremental import SummaryCache
+from gtaa_validator.analyzers.parallel import (
+    TIMING_KEY, WorkStealingScheduler, analyze_parallel, estimate_costs, language_group,
+)
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+
+PAGE = ("class {name}Page:\n"
+        "    def open(self):\n"
+        "        self.driver.find_element(By.ID, 'shared')\n"
+        "        self.driver.find_element(By.ID, '{name}')\n")
+STEPS = ("from behave import given\n\n"
+         "@given('the user is logged in')\n"
+         "def step_login(context):\n"
+         "    context.page.open()\n")
+TEST = "def test_{i}():\n    driver.find_element(By.ID, 'user{i}').click()\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "suite"
+    (root / "tests").mkdir(parents=True)
+    (root / "pages").mkdir()
+    (root / "steps").mkdir()
+    for i in range(8):
+        (root / "tests" / f"test_{i}.py").write_text(TEST.format(i=i) * (i + 1))
+    for name in ("Login", "Cart", "Home"):
+        (root / "pages" / f"{name.lower()}_page.py").write_text(PAGE.format(name=name))
+    for name in ("auth", "cart"):
+        (root / "steps" / f"{name}_steps.py").write_text(STEPS)
+    return root.resolve()
+
+
+@pytest.fixture
+def mixed_project(project_root, tmp_path):
+    """Repositorio mixto: los proyectos de ejemplo de cada lenguaje, copiados varias veces."""
+    examples = project_root / "gtaa_validator" / "examples"
+    root = tmp_path / "mixed"
+    for name in ("good_project", "java_project", "js_project", "csharp_project"):
+        for source in sorted((examples / name).rglob("*")):
+            if source.suffix not in (".py", ".java", ".ts", ".cs") or source.name == "__init__.py":
+                continue
+            for copy in range(4):
+                target = root / name / f"copy{copy}" / source.relative_to(examples / name)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy(source, target)
+    return root.resolve()
+
+
+def _key(report):
+    return [(v.violation_type.name, str(v.file_path), v.line_number, v.message,
+             v.fingerprint(report.project_path)) for v in report.violations]
+
+
+class TestEstimateCosts:
+
+    def test_size_and_language(self, tmp_path):
+        small, large, feature = tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.feature"
+        small.write_text("x" * 100)
+        large.write_text("x" * 10_000)
+        feature.write_text("x" * 10_000)
+        costs, historical = estimate_costs([small, large, feature])
+        assert historical == 0
+        assert costs[large] > costs[feature] > costs[small]
+
+    def test_history_and_scaling(self, tmp_path):
+        known, unknown = tmp_path / "a.py", tmp_path / "b.py"
+        known.write_text("x" * 1000)
+        unknown.write_text("x" * 1000)
+        baseline, _ = estimate_costs([known, unknown])
+        timings = SummaryCache(tmp_path)
+        timings.store(known, TIMING_KEY, baseline[known] * 10)
+        costs, historical = estimate_costs([known, unknown], timings)
+        assert historical == 1
+        # Sin historial: misma estimación, escalada como la del archivo medido
+        assert costs[unknown] == pytest.approx(costs[known])
+        assert costs[known] == pytest.approx(baseline[known] * 10)
+
+
+class TestScheduler:
+
+    def test_lpt_assignment(self, tmp_path):
+        costs = {tmp_path / f"f{i}": cost for i, cost in enumerate([8, 7, 6, 5, 4, 3, 2, 1])}
+        scheduler = WorkStealingScheduler(costs, 2)
+        assert scheduler.remaining == [18, 18]
+        first = scheduler.queues[0][0]
+        assert scheduler.next_task(0) == first and costs[first] == 8
+
+    def test_steals_cheapest_from_most_loaded(self, tmp_path):
+        costs = {tmp_path / "big": 10.0, tmp_path / "a": 3.0, tmp_path / "b": 2.0, tmp_path / "c": 1.0}
+        scheduler = WorkStealingScheduler(costs, 2)
+        # Trabajador 0: big; trabajador 1: a, b, c
+        assert scheduler.next_task(0) == tmp_path / "big"
+        assert scheduler.next_task(0, steal=False) is None
+        assert scheduler.next_task(0) == tmp_path / "c"
+        assert scheduler.stolen == 1
+        assert [scheduler.next_task(1) for _ in range(3)] == [tmp_path / "a", tmp_path / "b", None]
+
+    def test_language_group(self, tmp_path):
+        assert [language_group(tmp_path / name) for name in ("a.py", "B.java", "c.ts", "d.tsx", "e.js", "f.cs")] == [
+            "py", "java", "typescript", "typescript", "javascript", "c_sharp"]
+
+
+class TestLanguageAffinity:
+
+    @pytest.fixture
+    def costs(self, tmp_path):
+        # Java el doble de caro que cada uno de los demás lenguajes
+        costs = {tmp_path / f"f{i}.java": 2.0 for i in range(8)}
+        for extension in ("py", "ts", "cs"):
+            costs.update({tmp_path / f"f{i}.{extension}": 1.0 for i in range(8)})
+        return costs
+
+    def _languages(self, scheduler):
+        return [{language_group(f) for f in queue} for queue in scheduler.queues]
+
+    def test_one_grammar_per_worker(self, costs):
+        scheduler = WorkStealingScheduler(costs, 5, schedule="language")
+        languages = self._languages(scheduler)
+        assert all(len(group) == 1 for group in languages)
+        # El trabajador extra va al grupo más caro
+        assert sorted(g for group in languages for g in group) == [
+            "c_sharp", "java", "java", "py", "typescript"]
+        assert scheduler.groups == languages
+
+    def test_fewer_workers_than_groups(self, costs):
+        scheduler = WorkStealingScheduler(costs, 2, schedule="language")
+        languages = self._languages(scheduler)
+        # Grupos enteros: ningún lenguaje repartido entre dos trabajadores
+        assert not languages[0] & languages[1]
+        assert scheduler.remaining == [24.0, 16.0]
+
+    def test_steals_same_language_first(self, costs):
+        scheduler = WorkStealingScheduler(costs, 5, schedule="language")
+        java = [w for w, group in enumerate(scheduler.groups) if group == {"java"}]
+        thief, partner = java
+        while scheduler.next_task(thief, steal=False) is not None:
+            pass
+        # La cola de Java tiene menos coste pendiente que otras, pero comparte gramática
+        scheduler.next_task(partner)
+        stolen = scheduler.next_task(thief)
+        assert stolen.suffix == ".java" and scheduler.stolen == 1
+
+    def test_round_robin(self, costs):
+        scheduler = WorkStealingScheduler(costs, 3, schedule="round_robin")
+        files = sorted(costs)
+        assert list(scheduler.queues[1]) == files[1::3]
+        while scheduler.next_task(0) is not None:
+            pass
+        assert scheduler.stolen == 0
+
+    def test_unknown_schedule(self, costs):
+        with pytest.raises(ValueError):
+            WorkStealingScheduler(costs, 2, schedule="random")
+
+
+class TestAnalyzeParallel:
+
+    @pytest.mark.parametrize("jobs", [2, 3])
+    def test_same_report_as_sequential(self, project, jobs):
+        full = StaticAnalyzer(project).analyze()
+        assert {"DUPLICATE_LOCATOR", "DUPLICATE_STEP_PATTERN"} <= {
+            v.violation_type.name for v in full.violations}
+        report = analyze_parallel(StaticAnalyzer(project), jobs)
+        assert _key(report) == _key(full)
+        assert report.score == full.score
+        assert report.files_analyzed == full.files_analyzed
+        assert report.prefilter_stats == full.prefilter_stats
+
+    def test_utilization_metadata(self, project):
+        stats = analyze_parallel(StaticAnalyzer(project), 2).to_dict()["metadata"]["parallel"]
+        assert stats["jobs"] == 2 and stats["schedule"] == "lpt"
+        assert 0 < stats["utilization"] <= 1
+        assert sum(w["files"] for w in stats["workers"]) == 13
+        assert all(0 <= w["utilization"] <= 1 for w in stats["workers"])
+
+    def test_timing_cache(self, project, tmp_path_factory):
+        cache_path = tmp_path_factory.mktemp("cache") / "timings.json"
+        first = analyze_parallel(StaticAnalyzer(project), 2, cache_path=cache_path)
+        assert first.parallel_stats["files_with_history"] == 0
+        second = analyze_parallel(StaticAnalyzer(project), 2, cache_path=cache_path)
+        assert second.parallel_stats["files_with_history"] == 13
+        (project / "tests" / "test_0.py").write_text(TEST.format(i=0) * 3)
+        third = analyze_parallel(StaticAnalyzer(project), 2, cache_path=cache_path)
+        assert third.parallel_stats["files_with_history"] == 12
+
+    @pytest.mark.parametrize("schedule", ["language", "round_robin"])
+    def test_mixed_project_schedules(self, mixed_project, schedule):
+        full = StaticAnalyzer(mixed_project).analyze()
+        report = analyze_parallel(StaticAnalyzer(mixed_project), 4, schedule=schedule)
+        assert _key(report) == _key(full)
+        assert report.score == full.score
+        stats = report.parallel_stats
+        assert stats["schedule"] == schedule
+        assert all({"languages", "grammars", "max_rss_kb"} <= set(w) for w in stats["workers"])
+        if schedule == "language":
+            assert stats["stolen_tasks"] > 0 or all(len(w["languages"]) == 1 for w in stats["workers"])
+
+    def test_exclude_checks(self, project):
+        (project / ".gtaa.yaml").write_text("exclude_checks:\n  - DUPLICATE_LOCATOR\n")
+        full = StaticAnalyzer(project).analyze()
+        assert _key(analyze_parallel(StaticAnalyzer(project), 2)) == _key(full)
+
+
+class TestCLIJobs:
+
+    def test_jobs_output(self, project, tmp_path_factory):
+        out = tmp_path_factory.mktemp("out")
+        result = CliRunner().invoke(main, [str(project), "--jobs", "2", "--output-dir", str(out)])
+        assert result.exit_code in (0, 1), result.output
+        assert "Procesos: 2 (utilización" in result.output
+        assert (out / ".cache" / "timings_suite.json").exists()
+
+    def test_rejects_incompatible_flags(self, project):
+        result = CliRunner().invoke(main, [str(project), "--jobs", "2", "--fail-fast"])
+        assert result.exit_code == 1
+        assert "--jobs" in result.output
+
+    def test_language_affinity(self, mixed_project, tmp_path_factory):
+        out = tmp_path_factory.mktemp("out")
+        result = CliRunner().invoke(main, [str(mixed_project), "--jobs", "4", "--language-affinity",
+                                           "--verbose", "--output-dir", str(out)])
+        assert result.exit_code in (0, 1), result.output
+        assert "lenguajes: " in result.output
+
+    def test_language_affinity_requires_jobs(self, project):
+        result = CliRunner().invoke(main, [str(project), "--language-affinity"])
+        assert result.exit_code == 1
+        assert "--language-affinity" in result.output
+
+
+class TestBenchmark:
+    """Afinidad por lenguaje frente a round-robin en un repositorio mixto."""
+
+    def test_benchmark_language_affinity_vs_round_robin(self, mixed_project):
+        # spawn: procesos sin las gramáticas que ya cargó el proceso de pytest
+        results = {}
+        for schedule in ("round_robin", "language"):
+            started = time.perf_counter()
+            report = analyze_parallel(StaticAnalyzer(mixed_project), 4,
+                                      schedule=schedule, start_method="spawn")
+            elapsed = time.perf_counter() - started
+            workers = report.parallel_stats["workers"]
+            results[schedule] = {
+                # Gramáticas que cada proceso cargó de verdad (_create_parser), no su asignación
+                "grammars": sum(len(w["grammars"]) for w in workers),
+                "max_grammars": max(len(w["grammars"]) for w in workers),
+                "rss_kb": sum(w["max_rss_kb"] or 0 for w in workers),
+                "files_per_second": report.files_analyzed / report.parallel_stats["wall_seconds"],
+                "elapsed": elapsed,
+                "key": _key(report),
+            }
+
+        print()
+        for schedule, r in results.items():
+            print(f"  {schedule:12s} gramáticas cargadas: {r['grammars']:2d} "
+                  f"(máx. {r['max_grammars']} por proceso)  "
+                  f"memoria (suma de picos): {r['rss_kb'] / 1024:7.1f} MB  "
+                  f"{r['files_per_second']:7.1f} archivos/s  total {r['elapsed']:.2f}s")
+
+        affinity, round_robin = results["language"], results["round_robin"]
+        assert affinity["key"] == round_robin["key"]
+        # 3 gramáticas de tree-sitter (Java, TypeScript, C#) y Python, 4 procesos:
+        # con round-robin cada proceso carga las tres
+        assert round_robin["max_grammars"] == 3
+        assert affinity["grammars"] < round_robin["grammars"]
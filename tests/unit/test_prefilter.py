@@ -0,0 +1,150 @@
+"""
+Tests for gtaa_validator.analyzers.prefilter
+
+Covers:
+- BaseChecker.get_trigger_patterns(): per-language, per-rule triggers
+- TriggerPrefilter.select(): eliminates checkers whose triggers are absent
+- Statistics: files_skipped, eliminated_by_checker, reset_stats()
+- StaticAnalyzer integration: prefiltered files are not parsed, results unchanged
+"""
+
+from unittest.mock import patch
+
+from gtaa_validator.analyzers.prefilter import TriggerPrefilter
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.checkers.adaptation_checker import AdaptationChecker
+from gtaa_validator.checkers.bdd_checker import BDDChecker
+from gtaa_validator.checkers.definition_checker import DefinitionChecker
+from gtaa_validator.checkers.quality_checker import QualityChecker
+from gtaa_validator.checkers.structure_checker import StructureChecker
+from gtaa_validator.models import ViolationType
+
+
+# =========================================================================
+# get_trigger_patterns()
+# =========================================================================
+
+class TestTriggerPatterns:
+    """Tests for BaseChecker.get_trigger_patterns()."""
+
+    def test_checker_without_triggers_returns_none(self):
+        """StructureChecker declares no triggers → never prefiltered."""
+        assert StructureChecker().get_trigger_patterns("py") is None
+
+    def test_excluded_rule_triggers_dropped(self):
+        """Triggers of excluded rules are not included."""
+        checker = QualityChecker()
+        checker.set_excluded_types({ViolationType.BROAD_EXCEPTION_HANDLING})
+        assert "except" not in checker.get_trigger_patterns("py")
+
+    def test_python_only_rules_skip_other_languages(self):
+        """QualityChecker AST rules contribute no triggers for Java."""
+        patterns = QualityChecker().get_trigger_patterns("java")
+        assert "except" not in patterns
+        assert "global" not in patterns
+
+    def test_bdd_feature_triggers_only_for_feature_files(self):
+        """Gherkin triggers apply to .feature, step-def triggers to .py."""
+        checker = BDDChecker()
+        assert "(?i:scenario)" in checker.get_trigger_patterns("feature")
+        assert "(?i:scenario)" not in checker.get_trigger_patterns("py")
+        assert checker.get_trigger_patterns("java") == ()
+
+
+# =========================================================================
+# TriggerPrefilter.select()
+# =========================================================================
+
+class TestTriggerPrefilter:
+    """Tests for TriggerPrefilter selection and statistics."""
+
+    def test_file_without_triggers_is_skipped(self):
+        """No trigger present → no checker selected, file counted as skipped."""
+        checker = DefinitionChecker()
+        prefilter = TriggerPrefilter([checker])
+        selected = prefilter.select("py", "def helper():\n    return 1\n", [checker])
+        assert selected == []
+        assert prefilter.files_skipped == 1
+        assert prefilter.to_dict()["eliminated_by_checker"] == {"DefinitionChecker": 1}
+
+    def test_checker_with_trigger_is_kept(self):
+        """Trigger present → checker selected."""
+        checker = DefinitionChecker()
+        prefilter = TriggerPrefilter([checker])
+        source = "def test_x(driver):\n    driver.find_element('id', 'x')\n"
+        assert prefilter.select("py", source, [checker]) == [checker]
+        assert prefilter.files_skipped == 0
+
+    def test_only_matching_checkers_selected(self):
+        """Each checker is kept or dropped independently."""
+        definition, adaptation = DefinitionChecker(), AdaptationChecker()
+        prefilter = TriggerPrefilter([definition, adaptation])
+        source = "class LoginPage:\n    def go(self):\n        if True:\n            return 1\n"
+        selected = prefilter.select("py", source, [definition, adaptation])
+        assert selected == [adaptation]
+        assert prefilter.files_skipped == 0
+
+    def test_unfiltered_checker_always_selected(self):
+        """Checkers without triggers are never eliminated."""
+        structure = StructureChecker()
+        prefilter = TriggerPrefilter([structure])
+        assert prefilter.select("py", "x = 1\n", [structure]) == [structure]
+
+    def test_reset_stats(self):
+        """reset_stats() clears counters."""
+        checker = DefinitionChecker()
+        prefilter = TriggerPrefilter([checker])
+        prefilter.select("py", "x = 1\n", [checker])
+        prefilter.reset_stats()
+        assert prefilter.to_dict() == {"files_skipped": 0, "eliminated_by_checker": {}}
+
+
+# =========================================================================
+# StaticAnalyzer integration
+# =========================================================================
+
+class TestStaticAnalyzerPrefilter:
+    """The analyzer skips parsing prefiltered files without changing results."""
+
+    def test_prefiltered_file_not_parsed(self, tmp_path):
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "helpers.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+
+        analyzer = StaticAnalyzer(tmp_path)
+        with patch("gtaa_validator.analyzers.static_analyzer.get_parser_for_file") as get_parser:
+            report = analyzer.analyze()
+
+        get_parser.assert_not_called()
+        assert report.prefilter_stats["files_skipped"] == 1
+        assert report.to_dict()["metadata"]["prefilter"]["files_skipped"] == 1
+
+    def test_results_match_unfiltered_run(self, bad_project_path):
+        analyzer = StaticAnalyzer(bad_project_path)
+        filtered = analyzer.analyze()
+
+        with patch.object(TriggerPrefilter, "select", lambda self, lang, src, app: list(app)):
+            unfiltered = StaticAnalyzer(bad_project_path).analyze()
+
+        def key(v):
+            return (str(v.file_path), v.line_number, v.violation_type.name)
+
+        assert sorted(map(key, filtered.violations)) == sorted(map(key, unfiltered.violations))
+        assert filtered.score == unfiltered.score
+
+    def test_verify_assertion_in_page_object_not_prefiltered(self, tmp_path):
+        """A Page Object whose only assertion is verify_*() is still checked."""
+        pages_dir = tmp_path / "pages"
+        pages_dir.mkdir()
+        (pages_dir / "login_page.py").write_text(
+            "class LoginPage:\n"
+            "    def open(self):\n"
+            "        self.verify_title(\"Home\")\n",
+            encoding="utf-8",
+        )
+
+        report = StaticAnalyzer(tmp_path).analyze()
+
+        assert report.prefilter_stats["files_skipped"] == 0
+        assert [(v.violation_type, v.line_number) for v in report.violations
+                if v.file_path.name == "login_page.py"] == [(ViolationType.ASSERTION_IN_POM, 3)]
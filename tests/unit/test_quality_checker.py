@@ -6,6 +6,7 @@ Covers:
 - Hardcoded data: emails, URLs, phone numbers, passwords
 - Long test functions (>50 lines)
 - Poor test naming (generic names)
+- Combined hardcoded-data and configuration scanners
 """
 
 import pytest
@@ -429,3 +430,86 @@ class TestLongFunctionBoundary:
         long = [v for v in violations if v.violation_type == ViolationType.LONG_TEST_FUNCTION]
         assert len(long) == 1
         assert long[0].severity == Severity.MEDIUM
+
+
+# =========================================================================
+# Combined scanners
+# =========================================================================
+
+def _legacy_value_kind(value):
+    """Reference: one search per pattern, in priority order."""
+    for kind, pattern in (("email", QualityChecker.EMAIL_PATTERN),
+                          ("url", QualityChecker.URL_PATTERN),
+                          ("phone", QualityChecker.PHONE_PATTERN)):
+        if pattern.search(value):
+            return kind
+    if any(kw in value.lower() for kw in QualityChecker.PASSWORD_KEYWORDS):
+        return "password"
+    return None
+
+
+def _legacy_config_hits(source):
+    """Reference: each configuration pattern searched line by line."""
+    hits = []
+    for i, line in enumerate(source.splitlines(), start=1):
+        if line.strip().startswith(("#", "//")):
+            continue
+        for pattern in (QualityChecker.LOCALHOST_PATTERN, QualityChecker.SLEEP_PATTERN,
+                        QualityChecker.ABSOLUTE_PATH_PATTERN):
+            if pattern.search(line):
+                hits.append(i)
+    return hits
+
+
+class TestCombinedScanners:
+
+    @pytest.mark.parametrize("value", [
+        "https://user@example.com/path",   # email inside a URL keeps priority
+        "call 555-123-4567 or x@y.com",    # email after a phone
+        "555-123-4567 https://a.io",       # URL after a phone
+        "id 5551234567x",                  # no word boundary → not a phone
+        "my secret token",
+        "plain value",
+    ])
+    def test_value_priority_matches_separate_patterns(self, checker, value):
+        assert checker._classify_hardcoded_value(value) == _legacy_value_kind(value)
+
+    def test_email_in_url_reported_as_email(self, checker, write_py_file):
+        path = write_py_file("test_example.py", '''\
+def test_api():
+    url = "https://admin@example.com/login"
+''')
+        hc = [v for v in checker.check(path) if v.violation_type == ViolationType.HARDCODED_TEST_DATA]
+        assert len(hc) == 1
+        assert hc[0].message.startswith("Email hardcodeado")
+
+    @pytest.mark.parametrize("source", [
+        'x = "http://proxy/?u=http://localhost:80"\n',
+        "time.sleep(\n    5)\n",
+        "sleep(1); Thread.sleep (2)\n",
+        "a = '/tmp/x'\r\n# '/home/y'\r\nb = \"C:\\\\data\"\n",
+        "x = 1\x0csleep(3)\u2028'/usr/z'\n",
+    ])
+    def test_config_lines_match_line_by_line_search(self, checker, source):
+        violations = checker._check_hardcoded_configuration(Path("test_x.py"), source)
+        assert [v.line_number for v in violations] == _legacy_config_hits(source)
+
+    def test_multiple_kinds_on_one_line(self, checker):
+        source = "open('/tmp/a'); time.sleep(2); get('http://127.0.0.1:5000/')\n"
+        messages = [v.message for v in checker._check_hardcoded_configuration(Path("t.py"), source)]
+        assert [m.split()[0] for m in messages] == ["URL", "sleep()", "Path"]
+
+    def test_strings_routed_to_nested_and_disjoint_test_ranges(self, checker, write_py_file):
+        path = write_py_file("test_example.py", '''\
+def test_outer():
+    def test_inner():
+        a = "inner@example.com"
+    b = "outer@example.com"
+
+c = "module@example.com"
+
+def test_other():
+    d = "other@example.com"
+''')
+        hc = [v for v in checker.check(path) if v.violation_type == ViolationType.HARDCODED_TEST_DATA]
+        assert sorted(v.line_number for v in hc) == [3, 4, 9]
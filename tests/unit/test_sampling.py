@@ -0,0 +1,134 @@
+"""
+Tests for gtaa_validator.analyzers.sampling
+
+Covers:
+- Proportional allocation with at least one file per stratum
+- draw_sample(): strata by language and path category, deterministic choice
+- estimate(): exact with a full sample, extrapolation of uniform strata,
+  project-level violations are not extrapolated, interval bounds
+- CLI --sample parsing and output
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main
+from gtaa_validator.analyzers.sampling import _allocate, draw_sample
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+
+SELENIUM_TEST = "def test_{i}():\n    driver.find_element(By.ID, 'user{i}').click()\n"
+CLEAN_PAGE = "class Page{i}:\n    def open(self):\n        return {i}\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "pages").mkdir()
+    for i in range(20):
+        (tmp_path / "tests" / f"test_{i}.py").write_text(SELENIUM_TEST.format(i=i))
+    for i in range(10):
+        (tmp_path / "pages" / f"page_{i}_page.py").write_text(CLEAN_PAGE.format(i=i))
+    return tmp_path.resolve()
+
+
+def _sampled_report(project, size, seed=0):
+    analyzer = StaticAnalyzer(project)
+    plan = draw_sample(analyzer, size, seed=seed)
+    analyzer.file_inventory = plan.files
+    report = analyzer.analyze()
+    return plan, report, plan.estimate(report)
+
+
+class TestAllocate:
+
+    def test_proportional(self):
+        assert _allocate(10, {"a": 60, "b": 30, "c": 10}) == {"a": 6, "b": 3, "c": 1}
+
+    def test_at_least_one_per_stratum(self):
+        assert _allocate(4, {"a": 100, "b": 1, "c": 1}) == {"a": 2, "b": 1, "c": 1}
+
+    def test_fewer_files_than_strata(self):
+        assert _allocate(1, {"a": 5, "b": 50}) == {"a": 0, "b": 1}
+
+    def test_total_matches_size(self):
+        allocation = _allocate(17, {"a": 13, "b": 29, "c": 7, "d": 2})
+        assert sum(allocation.values()) == 17
+
+
+class TestDrawSample:
+
+    def test_strata_and_size(self, project):
+        plan = draw_sample(StaticAnalyzer(project), 6)
+        assert {name: len(files) for name, files in plan.strata.items()} == {
+            "py/test": 20, "py/page_object": 10}
+        assert {name: len(files) for name, files in plan.sampled.items()} == {
+            "py/test": 4, "py/page_object": 2}
+        assert len(plan.files) == 6 and plan.files == sorted(plan.files)
+
+    def test_fraction(self, project):
+        assert len(draw_sample(StaticAnalyzer(project), 0.5).files) == 15
+
+    def test_deterministic_per_seed(self, project):
+        first = draw_sample(StaticAnalyzer(project), 6).files
+        assert draw_sample(StaticAnalyzer(project), 6).files == first
+        assert draw_sample(StaticAnalyzer(project), 6, seed=1).files != first
+
+
+class TestEstimate:
+
+    def test_full_sample_is_exact(self, project):
+        full = StaticAnalyzer(project).analyze()
+        _, _, stats = _sampled_report(project, 1.0)
+        estimate = stats["estimate"]
+        assert estimate["total_violations"] == {"value": len(full.violations),
+                                                "low": len(full.violations),
+                                                "high": len(full.violations)}
+        assert estimate["score"]["value"] == full.score
+
+    def test_uniform_strata_extrapolate_exactly(self, project):
+        full = StaticAnalyzer(project).analyze()
+        plan, report, stats = _sampled_report(project, 6)
+        assert report.files_analyzed == 6
+        assert len(report.violations) < len(full.violations)
+        # Todos los tests tienen las mismas violaciones: varianza 0, estimación exacta
+        assert stats["estimate"]["total_violations"]["value"] == len(full.violations)
+        counts = full.get_violation_count_by_severity()
+        for name, interval in stats["estimate"]["violations_by_severity"].items():
+            assert interval["value"] == counts[name]
+        assert stats["files_sampled"] == 6 and stats["files_discovered"] == 30
+        assert stats["strata"]["py/test"] == {"files": 20, "sampled": 4}
+
+    def test_interval_contains_estimate(self, project):
+        (project / "tests" / "test_0.py").write_text("def test_0():\n    assert True\n")
+        _, report, stats = _sampled_report(project, 8)
+        total = stats["estimate"]["total_violations"]
+        assert total["low"] <= total["value"] <= total["high"]
+        assert total["low"] >= len(report.violations)
+
+    def test_project_violations_are_not_extrapolated(self, tmp_path):
+        # Sin pages/: violación de estructura a nivel de proyecto
+        (tmp_path / "tests").mkdir()
+        for i in range(10):
+            (tmp_path / "tests" / f"test_{i}.py").write_text("def test_x():\n    assert True\n")
+        full = StaticAnalyzer(tmp_path).analyze()
+        _, _, stats = _sampled_report(tmp_path, 2)
+        assert stats["estimate"]["total_violations"]["value"] == len(full.violations)
+
+
+class TestCLISample:
+
+    def test_sample_output_and_metadata(self, project, tmp_path_factory):
+        report_path = tmp_path_factory.mktemp("out") / "report.json"
+        result = CliRunner().invoke(main, [str(project), "--sample", "0.2", "--json", str(report_path)])
+        assert "Muestreo: 6 de 30 archivos" in result.output
+        assert "Puntuación estimada" in result.output
+        sample = json.loads(report_path.read_text(encoding="utf-8"))["metadata"]["sample"]
+        assert sample["files_sampled"] == 6
+        assert set(sample["estimate"]) == {"score", "total_violations", "violations_by_severity"}
+
+    @pytest.mark.parametrize("value", ["0", "1.5", "abc", "-3"])
+    def test_invalid_sample(self, project, value):
+        result = CliRunner().invoke(main, [str(project), "--sample", value])
+        assert result.exit_code == 2
@@ -0,0 +1,263 @@
+"""
+Tests for gtaa_validator.server
+
+Covers:
+- AnalysisService: analyze-file, analyze-source (unsaved buffer), analyze-project, status
+- Request validation (unknown method, missing params, files outside the project)
+- Config hot-reload when .gtaa.yaml changes
+- Unix socket and HTTP transports; an existing non-socket path is never removed
+- HTTP request validation: Content-Length, Origin and Host checks
+- CLI --serve option validation
+"""
+
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main
+from gtaa_validator.server import (
+    AnalysisService, RequestError, create_server, send_request, server_address,
+)
+
+TEST_WITH_SELENIUM = (
+    "def test_login():\n"
+    "    driver.find_element(By.ID, 'user').click()\n"
+)
+CLEAN_TEST = "def test_login():\n    assert True\n"
+PAGE = (
+    "class {name}:\n"
+    "    def open(self):\n"
+    "        self.driver.find_element(By.ID, 'login-button')\n"
+)
+
+
+def _write(path: Path, text: str) -> None:
+    """Write and bump mtime so cached summaries are always invalidated."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text, encoding="utf-8")
+    mtime = max(previous + 1_000_000, path.stat().st_mtime_ns)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def _types(response):
+    return sorted(v["type"] for v in response["violations"] if v["file"] != ".")
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path.resolve()
+    _write(root / "tests" / "test_login.py", TEST_WITH_SELENIUM)
+    _write(root / "pages" / "a_page.py", PAGE.format(name="APage"))
+    return root
+
+
+@pytest.fixture
+def service():
+    return AnalysisService()
+
+
+class TestAnalysisService:
+
+    def test_analyze_file(self, service, project):
+        response = service.handle({"method": "analyze-file", "project": str(project),
+                                   "file": "tests/test_login.py"})
+        assert response["ok"]
+        assert response["file"] == "tests/test_login.py"
+        assert "ADAPTATION_IN_DEFINITION" in _types(response)
+        assert all(v["file"] in ("tests/test_login.py", ".") for v in response["violations"])
+
+    def test_analyze_file_sees_saved_changes(self, service, project):
+        request = {"method": "analyze-file", "project": str(project), "file": "tests/test_login.py"}
+        assert "ADAPTATION_IN_DEFINITION" in _types(service.handle(request))
+        _write(project / "tests" / "test_login.py", CLEAN_TEST)
+        assert "ADAPTATION_IN_DEFINITION" not in _types(service.handle(request))
+
+    def test_analyze_source_uses_buffer_not_disk(self, service, project):
+        response = service.handle({"method": "analyze-source", "project": str(project),
+                                   "file": str(project / "tests" / "test_login.py"),
+                                   "source": CLEAN_TEST})
+        assert response["ok"]
+        assert "ADAPTATION_IN_DEFINITION" not in _types(response)
+        # El disco no cambia y la siguiente petición lo vuelve a leer
+        response = service.handle({"method": "analyze-file", "project": str(project),
+                                   "file": "tests/test_login.py"})
+        assert "ADAPTATION_IN_DEFINITION" in _types(response)
+
+    def test_analyze_source_cross_file_state_includes_disk(self, service, project):
+        response = service.handle({"method": "analyze-source", "project": str(project),
+                                   "file": "pages/b_page.py",
+                                   "source": PAGE.format(name="BPage")})
+        assert "ADAPTATION_IN_DEFINITION" not in _types(response)
+        assert any(v["type"] == "DUPLICATE_LOCATOR" for v in response["violations"])
+
+    def test_analyze_project(self, service, project):
+        response = service.handle({"method": "analyze-project", "project": str(project)})
+        assert response["ok"]
+        assert response["report"]["summary"]["files_analyzed"] == 2
+
+    def test_status_lists_warm_projects(self, service, project):
+        service.handle({"method": "analyze-project", "project": str(project)})
+        response = service.handle({"method": "status"})
+        assert response["projects"] == [{"project": str(project), "requests": 1}]
+
+    def test_analyzer_is_reused(self, service, project):
+        request = {"method": "analyze-file", "project": str(project), "file": "tests/test_login.py"}
+        service.handle(request)
+        analyzer = service._projects[project].analyzer
+        service.handle(request)
+        assert service._projects[project].analyzer is analyzer
+
+    def test_config_hot_reload(self, service, project):
+        pytest.importorskip("yaml")
+        request = {"method": "analyze-file", "project": str(project), "file": "tests/test_login.py"}
+        assert "ADAPTATION_IN_DEFINITION" in _types(service.handle(request))
+        _write(project / ".gtaa.yaml", "exclude_checks:\n  - ADAPTATION_IN_DEFINITION\n")
+        assert "ADAPTATION_IN_DEFINITION" not in _types(service.handle(request))
+
+    @pytest.mark.parametrize("request_, error", [
+        ({"method": "explode"}, "Método desconocido"),
+        ([], "objeto JSON"),
+        ({"method": "analyze-file"}, "Falta 'project'"),
+        ({"method": "analyze-source", "file": "a.py"}, "Falta 'project'"),
+    ])
+    def test_invalid_requests(self, service, request_, error):
+        response = service.handle(request_)
+        assert not response["ok"] and error in response["error"]
+
+    def test_rejects_file_outside_project(self, service, project, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("other") / "x.py"
+        response = service.handle({"method": "analyze-file", "project": str(project),
+                                   "file": str(outside)})
+        assert not response["ok"] and "no pertenece" in response["error"]
+
+    def test_rejects_missing_source(self, service, project):
+        response = service.handle({"method": "analyze-source", "project": str(project),
+                                   "file": "tests/test_login.py"})
+        assert not response["ok"] and "source" in response["error"]
+
+
+def _run(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestTransports:
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Sockets Unix")
+    def test_unix_socket(self, service, project, tmp_path_factory):
+        socket_path = tmp_path_factory.mktemp("sock") / "gtaa.sock"
+        server = create_server(service, socket_path=socket_path)
+        _run(server)
+        try:
+            assert (socket_path.stat().st_mode & 0o777) == 0o600
+            response = send_request(socket_path, {"method": "analyze-file",
+                                                  "project": str(project),
+                                                  "file": "tests/test_login.py"})
+            assert response["ok"]
+            assert "ADAPTATION_IN_DEFINITION" in _types(response)
+            assert not send_request(socket_path, {"method": "nope"})["ok"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Sockets Unix")
+    def test_unix_socket_does_not_replace_other_files(self, service, tmp_path):
+        notes = tmp_path / "notes.txt"
+        notes.write_text("no borrar")
+        with pytest.raises(RequestError, match="no es un socket"):
+            create_server(service, socket_path=notes)
+        assert notes.read_text() == "no borrar"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Sockets Unix")
+    def test_unix_socket_replaces_stale_socket(self, service, tmp_path_factory):
+        socket_path = tmp_path_factory.mktemp("sock") / "gtaa.sock"
+        create_server(service, socket_path=socket_path).server_close()
+        assert socket_path.exists()
+        create_server(service, socket_path=socket_path).server_close()
+
+    def test_http(self, service, project):
+        server = create_server(service, port=0)
+        _run(server)
+        url = server_address(server)
+        try:
+            assert url.startswith("http://127.0.0.1:")
+            body = json.dumps({"project": str(project), "file": "tests/test_login.py"}).encode()
+            with urllib.request.urlopen(f"{url}/analyze-file", data=body) as resp:
+                response = json.loads(resp.read())
+            assert response["ok"]
+            assert "ADAPTATION_IN_DEFINITION" in _types(response)
+            with urllib.request.urlopen(f"{url}/status") as resp:
+                assert json.loads(resp.read())["projects"][0]["project"] == str(project)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def _http_status(url, method="POST", body=b"{}", headers=None):
+    request = urllib.request.Request(url, data=body if method == "POST" else None,
+                                     method=method, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as resp:
+            return resp.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+class TestHTTPValidation:
+
+    @pytest.fixture
+    def url(self, service):
+        server = create_server(service, port=0)
+        _run(server)
+        yield server_address(server)
+        server.shutdown()
+        server.server_close()
+
+    @pytest.mark.parametrize("length, status", [("-1", 400), ("abc", 400), ("999999999", 413)])
+    def test_content_length(self, url, length, status):
+        import http.client
+
+        host, port = url[len("http://"):].split(":")
+        connection = http.client.HTTPConnection(host, int(port), timeout=5)
+        try:
+            connection.putrequest("POST", "/status")
+            connection.putheader("Content-Length", length)
+            connection.endheaders()
+            assert connection.getresponse().status == status
+        finally:
+            connection.close()
+
+    def test_rejects_browser_origin(self, url):
+        assert _http_status(f"{url}/status", headers={"Origin": "https://evil.example"}) == 403
+        assert _http_status(f"{url}/status", method="GET", headers={"Origin": "null"}) == 403
+
+    def test_rejects_foreign_host(self, url):
+        # DNS rebinding: el navegador envía el dominio del atacante como Host
+        assert _http_status(f"{url}/status", headers={"Host": "evil.example:80"}) == 403
+
+    def test_local_clients_accepted(self, url):
+        assert _http_status(f"{url}/status") == 200
+        port = url.rsplit(":", 1)[1]
+        assert _http_status(f"{url}/status", method="GET", headers={"Host": f"localhost:{port}"}) == 200
+
+
+class TestServeCli:
+
+    def test_requires_one_transport(self):
+        result = CliRunner().invoke(main, ["--serve"])
+        assert result.exit_code == 1
+        assert "--socket o --port" in result.output
+
+    def test_rejects_both_transports(self, tmp_path):
+        result = CliRunner().invoke(main, ["--serve", "--port", "0",
+                                           "--socket", str(tmp_path / "s.sock")])
+        assert result.exit_code == 1
@@ -0,0 +1,159 @@
+"""
+Tests for gtaa_validator.analyzers.sharding
+
+Covers:
+- partition(): balanced by size, deterministic, every file exactly once
+- run_shard() + merge_partials(): same violations, fingerprints and score as
+  a single run, including duplicate locators and step patterns across shards
+- Candidate duplicate locators do not count in the shard's own report
+- merge validation: missing, repeated and mismatched partials
+- CLI --shard and the merge command
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main, merge
+from gtaa_validator.analyzers.sharding import ShardError, merge_partials, partition, run_shard
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+
+PAGE = ("class {name}Page:\n"
+        "    def open(self):\n"
+        "        self.driver.find_element(By.ID, 'shared')\n"
+        "        self.driver.find_element(By.ID, '{name}')\n")
+STEPS = ("from behave import given\n\n"
+         "@given('the user is logged in')\n"
+         "def step_login(context):\n"
+         "    context.page.open()\n")
+TEST = "def test_{i}():\n    driver.find_element(By.ID, 'user{i}').click()\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "suite"
+    (root / "tests").mkdir(parents=True)
+    (root / "pages").mkdir()
+    (root / "steps").mkdir()
+    for i in range(6):
+        (root / "tests" / f"test_{i}.py").write_text(TEST.format(i=i) * (i + 1))
+    for name in ("Login", "Cart", "Home", "Search"):
+        (root / "pages" / f"{name.lower()}_page.py").write_text(PAGE.format(name=name))
+    for name in ("auth", "cart"):
+        (root / "steps" / f"{name}_steps.py").write_text(STEPS)
+    return root.resolve()
+
+
+def _shards(project, count):
+    # Ida y vuelta por JSON, como entre jobs de CI
+    return [json.loads(json.dumps(run_shard(StaticAnalyzer(project), i, count)[1]))
+            for i in range(1, count + 1)]
+
+
+def _key(report):
+    return [(v.violation_type.name, str(v.file_path), v.line_number, v.message,
+             v.fingerprint(report.project_path)) for v in report.violations]
+
+
+class TestPartition:
+
+    def test_every_file_once_and_balanced(self, tmp_path):
+        sizes = {tmp_path / f"f{i}.py": size for i, size in enumerate([90, 50, 40, 30, 30, 20, 10])}
+        shards = partition(list(sizes), 3, size=sizes.get)
+        assert sorted(f for shard in shards for f in shard) == sorted(sizes)
+        loads = [sum(sizes[f] for f in shard) for shard in shards]
+        assert max(loads) - min(loads) <= 10
+        assert all(shard == sorted(shard) for shard in shards)
+
+    def test_deterministic(self, tmp_path):
+        files = [tmp_path / f"f{i}.py" for i in range(20)]
+        assert partition(files, 4, size=lambda f: 1) == partition(list(reversed(files)), 4, size=lambda f: 1)
+
+    def test_more_shards_than_files(self, tmp_path):
+        shards = partition([tmp_path / "a.py"], 3, size=lambda f: 1)
+        assert [len(s) for s in shards] == [1, 0, 0]
+
+
+class TestMerge:
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 5])
+    def test_same_report_as_single_run(self, project, count):
+        full = StaticAnalyzer(project).analyze()
+        types = {v.violation_type.name for v in full.violations}
+        assert {"DUPLICATE_LOCATOR", "DUPLICATE_STEP_PATTERN"} <= types
+
+        merged = merge_partials(_shards(project, count), project)
+        assert _key(merged) == _key(full)
+        assert merged.score == full.score
+        assert merged.files_analyzed == full.files_analyzed
+        assert merged.shard_stats["count"] == count
+
+    def test_partials_in_any_order(self, project):
+        full = StaticAnalyzer(project).analyze()
+        merged = merge_partials(list(reversed(_shards(project, 3))), project)
+        assert _key(merged) == _key(full)
+
+    def test_candidates_not_in_shard_report(self, project):
+        report, partial = run_shard(StaticAnalyzer(project), 1, 1)
+        assert "DUPLICATE_LOCATOR" not in {v.violation_type.name for v in report.violations}
+        deferred = [r for r in partial["violations"] if r.get("deferred")]
+        # Una candidata por localizador distinto de cada Page Object
+        assert len(deferred) == 8
+        assert partial["summary"]["total_violations"] == len(report.violations)
+
+
+class TestValidation:
+
+    def test_missing_shard(self, project):
+        with pytest.raises(ShardError, match="faltan"):
+            merge_partials(_shards(project, 3)[:2], project)
+
+    def test_repeated_shard(self, project):
+        first, second = _shards(project, 2)
+        with pytest.raises(ShardError, match=r"repetidos \[1\]"):
+            merge_partials([first, first, second], project)
+
+    def test_different_inventory(self, project):
+        first, _ = _shards(project, 2)
+        (project / "tests" / "test_new.py").write_text(TEST.format(i=99))
+        _, second = _shards(project, 2)
+        with pytest.raises(ShardError, match="inventory"):
+            merge_partials([first, second], project)
+
+    def test_not_a_partial(self, project):
+        with pytest.raises(ShardError):
+            merge_partials([StaticAnalyzer(project).analyze().to_dict()], project)
+
+
+class TestCLIShard:
+
+    def test_shard_then_merge(self, project, tmp_path_factory):
+        out = tmp_path_factory.mktemp("out")
+        runner = CliRunner()
+        for i in (1, 2):
+            result = runner.invoke(main, [str(project), "--shard", f"{i}/2", "--output-dir", str(out)])
+            assert result.exit_code in (0, 1), result.output
+            assert f"Shard {i}/2" in result.output
+        partials = sorted(str(p) for p in out.glob("gtaa_partial_suite_*of2_*.json"))
+        assert len(partials) == 2
+
+        merged_path = out / "merged.json"
+        result = runner.invoke(merge, [*partials, "--project-root", str(project), "--json", str(merged_path)])
+        assert result.exit_code in (0, 1), result.output
+        data = json.loads(merged_path.read_text(encoding="utf-8"))
+        full = StaticAnalyzer(project).analyze()
+        assert data["summary"]["score"] == full.score
+        assert data["summary"]["total_violations"] == len(full.violations)
+        assert data["metadata"]["shard"]["count"] == 2
+
+    def test_merge_reports_missing_shard(self, project, tmp_path_factory):
+        path = tmp_path_factory.mktemp("out") / "partial.json"
+        CliRunner().invoke(main, [str(project), "--shard", "1/2", "--json", str(path)])
+        result = CliRunner().invoke(merge, [str(path)])
+        assert result.exit_code == 1
+        assert "faltan [2]" in result.output
+
+    @pytest.mark.parametrize("value", ["0/2", "3/2", "2", "a/b"])
+    def test_invalid_shard(self, project, value):
+        assert CliRunner().invoke(main, [str(project), "--shard", value]).exit_code == 2
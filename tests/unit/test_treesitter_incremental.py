@@ -0,0 +1,241 @@
+"""
+Tests for incremental tree-sitter reparsing (TreeCache)
+
+Covers:
+- Edit span and point computation
+- Incremental reparse + extraction matches a full parse (Java, JS, C#),
+  also with non-ASCII text (byte offsets vs str indexes)
+- Items after the edit are reused with shifted line numbers
+- Unchanged content, LRU eviction and cache statistics
+- StaticAnalyzer reuses trees when tree_cache is set
+- Benchmark: edit-to-result latency on a 5k-line Java file (reported;
+  the assertion counts re-extracted items, not wall-clock time)
+"""
+
+import random
+import time
+
+import pytest
+
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.parsers.csharp_parser import CSharpParser
+from gtaa_validator.parsers.java_parser import JavaParser
+from gtaa_validator.parsers.js_parser import JSParser
+from gtaa_validator.parsers.treesitter_base import TreeCache, _edit_span, _point_at
+
+JAVA = """import org.openqa.selenium.WebDriver;
+import org.junit.Test;
+
+public class LoginTest {
+    @Test
+    public void testLogin() {
+        driver.findElement(By.id("user")).sendKeys("admin");
+    }
+
+    @Test
+    public void testLogout() {
+        driver.findElement(By.id("logout")).click();
+    }
+}
+"""
+
+JS = """const { test } = require('@playwright/test');
+import { LoginPage } from './pages/login';
+
+class LoginPage {
+  async open() { await page.goto(`https://example.com/${path}`); }
+}
+
+const helper = async (user) => { return user; };
+
+test('login', async ({ page }) => {
+  await page.locator('#user').fill('admin');
+});
+"""
+
+CSHARP = """using OpenQA.Selenium;
+using NUnit.Framework;
+
+public class LoginTests
+{
+    [Test]
+    public void Login()
+    {
+        driver.FindElement(By.Id("user")).SendKeys($"admin{suffix}");
+    }
+
+    [SetUp]
+    public void Init() { }
+}
+"""
+
+SNIPPETS = ["x", "\n", '"', "(", ")", "{", "}", ";", "foo();", "// c\n", "  ", "@Test\n"]
+NON_ASCII = ["ñ", "é", "// ñññ\n", '"añadir"', "🚀", "/* café */"]
+
+
+def _full(parser_class, source):
+    return parser_class().parse(source)
+
+
+class TestEditSpan:
+
+    def test_insertion(self):
+        assert _edit_span(b"abcdef", b"abcXYdef") == (3, 3, 5)
+
+    def test_deletion(self):
+        assert _edit_span(b"abcdef", b"abef") == (2, 4, 2)
+
+    def test_replacement_and_repeated_chars(self):
+        assert _edit_span(b"aaaa", b"aaaaa") == (4, 4, 5)
+        assert _edit_span(b"abc", b"xyz") == (0, 3, 3)
+
+    def test_identical(self):
+        assert _edit_span(b"same", b"same") == (4, 4, 4)
+
+    def test_point_at(self):
+        data = b"ab\ncd\nef"
+        assert _point_at(data, 0) == (0, 0)
+        assert _point_at(data, 4) == (1, 1)
+        assert _point_at(data, len(data)) == (2, 2)
+
+
+@pytest.mark.parametrize("parser_class, source", [
+    (JavaParser, JAVA),
+    (JSParser, JS),
+    (CSharpParser, CSHARP),
+])
+class TestIncrementalMatchesFullParse:
+
+    def test_random_edits(self, parser_class, source):
+        rnd = random.Random(42)
+        parser, cache = parser_class(), TreeCache()
+        parser.parse(source, cache=cache, document="doc")
+        for _ in range(60):
+            if rnd.random() < 0.5 and len(source) > 2:
+                start = rnd.randrange(len(source))
+                source = source[:start] + source[start + rnd.randrange(1, 15):]
+            else:
+                start = rnd.randrange(len(source) + 1)
+                source = source[:start] + rnd.choice(SNIPPETS) + source[start:]
+            assert parser.parse(source, cache=cache, document="doc") == _full(parser_class, source)
+        assert cache.incremental_parses > 0
+
+    def test_random_non_ascii_edits(self, parser_class, source):
+        rnd = random.Random(7)
+        parser, cache = parser_class(), TreeCache()
+        parser.parse(source, cache=cache, document="doc")
+        for _ in range(120):
+            start = rnd.randrange(len(source) + 1)
+            if rnd.random() < 0.3 and len(source) > 2:
+                source = source[:start] + source[start + rnd.randrange(1, 6):]
+            else:
+                source = source[:start] + rnd.choice(NON_ASCII + SNIPPETS) + source[start:]
+            assert parser.parse(source, cache=cache, document="doc") == _full(parser_class, source)
+
+    def test_text_after_non_ascii(self, parser_class, source):
+        calls = _full(parser_class, "// ñññ é\n" + source).calls
+        assert calls == [c for c in calls if c.full_text.startswith(c.object_name)]
+        assert {c.object_name for c in calls} == {c.object_name for c in _full(parser_class, source).calls}
+
+    def test_extractors_match_result(self, parser_class, source):
+        parser = parser_class()
+        tree = parser._parser.parse(source.encode("utf-8"))
+        result = parser.parse(source)
+        assert parser.extract_calls(tree.root_node, source) == result.calls
+        assert parser.extract_strings(tree.root_node, source) == result.strings
+
+
+class TestTreeCache:
+
+    def test_lines_shift_after_edit(self):
+        parser, cache = JavaParser(), TreeCache()
+        before = parser.parse(JAVA, cache=cache, document="doc")
+        edited = JAVA.replace("public class LoginTest {\n", "public class LoginTest {\n\n\n")
+        after = parser.parse(edited, cache=cache, document="doc")
+        assert cache.incremental_parses == 1
+        assert [c.line + 2 for c in before.calls] == [c.line for c in after.calls]
+        assert after.classes[0].methods[1].line_start == before.classes[0].methods[1].line_start + 2
+        assert after == _full(JavaParser, edited)
+
+    def test_unchanged_content_returns_previous_result(self):
+        parser, cache = JavaParser(), TreeCache()
+        first = parser.parse(JAVA, cache=cache, document="doc")
+        assert parser.parse(JAVA, cache=cache, document="doc") is first
+        assert cache.to_dict() == {"documents": 1, "full_parses": 1,
+                                   "incremental_parses": 0, "unchanged_parses": 1}
+
+    def test_documents_are_independent_and_evicted(self):
+        parser, cache = JavaParser(), TreeCache(max_documents=2)
+        for name in ("a", "b", "c"):
+            parser.parse(JAVA, cache=cache, document=name)
+        assert len(cache) == 2
+        assert cache.get(("java", "a")) is None
+        assert cache.get(("java", "c")) is not None
+
+    def test_without_cache_nothing_is_kept(self):
+        cache = TreeCache()
+        JavaParser().parse(JAVA, document="doc")
+        JavaParser().parse(JAVA, cache=cache)
+        assert len(cache) == 0
+
+
+class TestAnalyzerTreeCache:
+
+    def test_reparse_uses_previous_tree(self, tmp_path):
+        test_file = tmp_path / "src" / "test" / "LoginTest.java"
+        test_file.parent.mkdir(parents=True)
+        test_file.write_text(JAVA, encoding="utf-8")
+        analyzer = StaticAnalyzer(tmp_path)
+        analyzer.tree_cache = TreeCache()
+        first = analyzer.analyze(changed_files=[test_file])
+
+        test_file.write_text(JAVA.replace('"logout"', '"logout-button"'), encoding="utf-8")
+        second = analyzer.analyze(changed_files=[test_file])
+        assert analyzer.tree_cache.incremental_parses == 1
+        assert len(second.violations) == len(first.violations)
+
+
+class TestBenchmark:
+
+    def test_benchmark_edit_latency_5k_lines(self, monkeypatch):
+        """Un cambio en un archivo de ~5.000 líneas: reparseo incremental frente a completo."""
+        method = (
+            "    @Test\n"
+            "    public void testLogin{i}() {{\n"
+            "        driver.findElement(By.id(\"user{i}\")).sendKeys(\"admin@test.com\");\n"
+            "        String url = \"https://example.com/login/{i}\";\n"
+            "        assertEquals(\"Welcome\", driver.getTitle());\n"
+            "    }}\n"
+        )
+        source = ("import org.openqa.selenium.WebDriver;\npublic class LoginTest {\n"
+                  + "".join(method.format(i=i) for i in range(850)) + "}\n")
+        assert source.count("\n") > 5000
+        parser, cache = JavaParser(), TreeCache()
+        parser.parse(source, cache=cache, document="doc")
+
+        extracted = []
+        extract_all = JavaParser._extract_all
+
+        def counting_extract_all(self, *args, **kwargs):
+            result = extract_all(self, *args, **kwargs)
+            extracted.append(sum(len(entries) for entries in result.values()))
+            return result
+
+        monkeypatch.setattr(JavaParser, "_extract_all", counting_extract_all)
+
+        edited = source.replace('"user400"', '"user400-edited"')
+        start = time.perf_counter()
+        incremental = parser.parse(edited, cache=cache, document="doc")
+        incremental_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        full = JavaParser().parse(edited)
+        full_secs = time.perf_counter() - start
+
+        # El tiempo solo se informa: compararlo haría el test inestable
+        print(f"\n5k líneas: completo {full_secs * 1000:.1f} ms, "
+              f"incremental {incremental_secs * 1000:.1f} ms")
+        assert incremental == full
+        assert cache.incremental_parses == 1
+        incremental_entries, full_entries = extracted
+        assert incremental_entries * 100 < full_entries
@@ -0,0 +1,156 @@
+"""
+Tests for gtaa_validator.analyzers.watch
+
+Covers:
+- PollingWatcher: modified, new and deleted files between scans
+- WatchSession.refresh(): delta of new/resolved violations for the changed file
+- Dependents through cross-file rules (duplicate locators, duplicate step patterns)
+- Results after a sequence of changes match a fresh full analysis
+- watch() loop and CLI --watch option validation
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from gtaa_validator.__main__ import main
+from gtaa_validator.analyzers.static_analyzer import StaticAnalyzer
+from gtaa_validator.analyzers.watch import PollingWatcher, WatchSession
+from gtaa_validator.models import ViolationType
+
+PAGE = (
+    "class {name}:\n"
+    "    def open(self):\n"
+    "        self.driver.find_element(By.ID, '{locator}')\n"
+)
+
+
+def _write(path: Path, text: str) -> None:
+    """Write and bump mtime so the change is always visible to the watcher."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text, encoding="utf-8")
+    mtime = max(previous + 1_000_000, path.stat().st_mtime_ns)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def _keys(violations):
+    return sorted((v.violation_type.name, str(v.file_path), v.line_number) for v in violations)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path.resolve()
+    _write(root / "pages" / "a_page.py", PAGE.format(name="APage", locator="login-button"))
+    _write(root / "pages" / "b_page.py", PAGE.format(name="BPage", locator="login-button"))
+    _write(root / "tests" / "test_login.py", "def test_login():\n    pass\n")
+    return root
+
+
+@pytest.fixture
+def session(project):
+    session = WatchSession(StaticAnalyzer(project))
+    session.start()
+    return session
+
+
+class TestPollingWatcher:
+
+    def test_detects_modified_new_and_deleted(self, project):
+        watcher = PollingWatcher(StaticAnalyzer(project)._discover_python_files)
+        changed, removed = watcher.scan()
+        assert len(changed) == 3 and not removed
+
+        _write(project / "tests" / "test_login.py", "def test_login():\n    assert True\n")
+        _write(project / "tests" / "test_new.py", "def test_new():\n    pass\n")
+        (project / "pages" / "b_page.py").unlink()
+        changed, removed = watcher.scan()
+        assert changed == {project / "tests" / "test_login.py", project / "tests" / "test_new.py"}
+        assert removed == {project / "pages" / "b_page.py"}
+        assert watcher.scan() == (set(), set())
+
+
+class TestWatchSession:
+
+    def test_no_changes_returns_none(self, session):
+        assert session.poll() is None
+
+    def test_new_violation_in_changed_file(self, session, project):
+        test_file = project / "tests" / "test_login.py"
+        _write(test_file, "def test_login():\n    email = 'admin@example.com'\n")
+        delta = session.poll()
+        assert delta.changed == [test_file]
+        assert ViolationType.HARDCODED_TEST_DATA in {v.violation_type for v in delta.added}
+        assert not delta.resolved
+
+        _write(test_file, "def test_login():\n    pass\n")
+        delta = session.poll()
+        assert ViolationType.HARDCODED_TEST_DATA in {v.violation_type for v in delta.resolved}
+        assert not delta.added
+
+    def test_removing_locator_resolves_dependent_duplicate(self, session, project):
+        a_page, b_page = project / "pages" / "a_page.py", project / "pages" / "b_page.py"
+        _write(a_page, PAGE.format(name="APage", locator="other-button"))
+        delta = session.poll()
+        assert delta.dependents == [b_page]
+        resolved = [v for v in delta.resolved if v.violation_type == ViolationType.DUPLICATE_LOCATOR]
+        assert [v.file_path for v in resolved] == [b_page]
+
+    def test_adding_locator_flags_later_page(self, session, project):
+        a_page, b_page = project / "pages" / "a_page.py", project / "pages" / "b_page.py"
+        _write(b_page, PAGE.format(name="BPage", locator="unique"))
+        session.poll()
+        _write(a_page, PAGE.format(name="APage", locator="unique"))
+        delta = session.poll()
+        assert b_page in delta.dependents
+        added = [v for v in delta.added if v.violation_type == ViolationType.DUPLICATE_LOCATOR]
+        assert [v.file_path for v in added] == [b_page]
+
+    def test_duplicate_step_dependents(self, project):
+        step = "from pytest_bdd import given\n\n@given('{text}')\ndef step_{name}():\n    pass\n"
+        _write(project / "steps" / "a_steps.py", step.format(text="a user", name="a"))
+        _write(project / "steps" / "b_steps.py", step.format(text="a user", name="b"))
+        session = WatchSession(StaticAnalyzer(project))
+        session.start()
+
+        _write(project / "steps" / "a_steps.py", step.format(text="another user", name="a"))
+        delta = session.poll()
+        assert project / "steps" / "b_steps.py" in delta.dependents
+        assert ViolationType.DUPLICATE_STEP_PATTERN in {v.violation_type for v in delta.resolved}
+
+    def test_state_matches_full_analysis_after_changes(self, session, project):
+        _write(project / "pages" / "c_page.py", PAGE.format(name="CPage", locator="login-button"))
+        session.poll()
+        (project / "pages" / "a_page.py").unlink()
+        session.poll()
+        _write(project / "tests" / "test_login.py", "def test_login():\n    x = 'a@b.com'\n")
+        delta = session.poll()
+
+        current = [v for group in session._violations.values() for v in group]
+        full = StaticAnalyzer(project).analyze()
+        assert _keys(current) == _keys(full.violations)
+        assert delta.total_violations == len(full.violations)
+
+    def test_watch_loop_reports_deltas(self, session, project):
+        deltas = []
+        _write(project / "tests" / "test_login.py", "def test_login():\n    assert 1\n")
+        session.watch(deltas.append, interval=0, cycles=2)
+        assert len(deltas) == 1
+
+
+class TestCLIWatch:
+
+    def test_watch_rejects_incompatible_options(self, project):
+        result = CliRunner().invoke(main, [str(project), "--watch", "--staged"])
+        assert result.exit_code == 1
+        assert "--watch no se puede combinar" in result.output
+
+    def test_delta_display(self, session, project, capsys):
+        from gtaa_validator.__main__ import _display_watch_delta
+        _write(project / "pages" / "a_page.py", PAGE.format(name="APage", locator="other"))
+        _display_watch_delta(session.poll(), project)
+        output = capsys.readouterr().out
+        assert "pages/a_page.py (+1 dependiente(s)" in output
+        assert "  - MEDIUM DUPLICATE_LOCATOR pages/b_page.py:3" in output